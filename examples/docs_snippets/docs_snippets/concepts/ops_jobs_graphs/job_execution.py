@@ -75,3 +75,26 @@ def forkserver_job():
 
 
 # end_mp_cfg
+
+
+# start_worker_pool_cfg
+@job(
+    config={
+        "execution": {
+            "config": {
+                "multiprocess": {
+                    "worker_pool": {
+                        "enabled": True,
+                        "max_steps_per_worker": 50,
+                    },
+                    "max_concurrent": 4,
+                },
+            }
+        }
+    }
+)
+def worker_pool_job():
+    multi_three(add_two(return_one()))
+
+
+# end_worker_pool_cfg
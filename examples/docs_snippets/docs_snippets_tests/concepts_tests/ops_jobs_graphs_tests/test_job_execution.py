@@ -6,6 +6,7 @@
     forkserver_job,
     ip_yaml,
     my_job,
+    worker_pool_job,
 )
 
 
@@ -24,3 +25,7 @@ def test_yaml():
 
 def test_forkserver():
     assert forkserver_job  # just assert definition created
+
+
+def test_worker_pool():
+    assert worker_pool_job  # just assert definition created
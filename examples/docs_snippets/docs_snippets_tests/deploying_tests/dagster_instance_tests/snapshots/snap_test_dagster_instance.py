@@ -7,14 +7,17 @@
 snapshots = Snapshot()
 
 snapshots["test_instance_yaml 1"] = [
+    "backfills",
     "code_servers",
     "compute_logs",
+    "event_log_buffering",
     "local_artifact_storage",
     "retention",
     "run_coordinator",
     "run_launcher",
     "run_monitoring",
     "run_retries",
+    "schedules",
     "sensors",
     "storage",
     "telemetry",
@@ -10,7 +10,6 @@
 from dagster._core.storage.tags import (
     PARTITION_NAME_TAG,
     PARTITION_SET_TAG,
-    REPOSITORY_LABEL_TAG,
     TagType,
     get_tag_type,
 )
@@ -182,11 +181,9 @@ def get_partition_set_partition_statuses(
     check.str_param(partition_set_name, "partition_set_name")
     check.str_param(job_name, "job_name")
 
-    run_partition_data = graphene_info.context.instance.run_storage.get_run_partition_data(
-        runs_filter=RunsFilter(
-            pipeline_name=job_name,
-            tags={REPOSITORY_LABEL_TAG: repository_handle.get_external_origin().get_label()},
-        )
+    run_partition_data = graphene_info.context.instance.run_storage.get_latest_run_partition_data(
+        pipeline_name=job_name,
+        repository_label=repository_handle.get_external_origin().get_label(),
     )
     names_result = graphene_info.context.get_external_partition_names(
         repository_handle, partition_set_name
@@ -30,7 +30,7 @@
 from dagster._core.execution.backfill import (
     BulkActionStatus,
     PartitionBackfill,
-    create_backfill_run,
+    create_backfill_runs,
 )
 from dagster._core.host_representation import (
     ExternalPipeline,
@@ -875,16 +875,19 @@ def _execute_backfill_command_at_location(
 
         assert isinstance(partition_execution_data, ExternalPartitionSetExecutionParamData)
 
-        for partition_data in partition_execution_data.partition_data:
-            pipeline_run = create_backfill_run(
+        from dagster._daemon.backfill import CHECKPOINT_COUNT
+
+        # create the runs a chunk at a time, as the backfill daemon does
+        partition_data_list = partition_execution_data.partition_data
+        for i in range(0, len(partition_data_list), CHECKPOINT_COUNT):
+            for pipeline_run in create_backfill_runs(
                 instance,
                 repo_location,
                 external_pipeline,
                 partition_set,
                 backfill_job,
-                partition_data,
-            )
-            if pipeline_run:
+                partition_data_list[i : i + CHECKPOINT_COUNT],
+            ):
                 instance.submit_run(pipeline_run.run_id, workspace)
 
         instance.add_backfill(backfill_job.with_status(BulkActionStatus.COMPLETED))
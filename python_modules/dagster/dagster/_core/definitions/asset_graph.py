@@ -0,0 +1,238 @@
+from typing import AbstractSet, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Union
+
+import dagster._check as check
+
+from .assets import AssetsDefinition
+from .events import AssetKey
+from .source_asset import SourceAsset
+
+
+def _iter_bits(bits: int) -> Iterator[int]:
+    while bits:
+        lowest_bit = bits & -bits
+        yield lowest_bit.bit_length() - 1
+        bits ^= lowest_bit
+
+
+class AssetGraph:
+    """An immutable dependency graph over a set of assets, indexed for fast traversal.
+
+    Every asset key in the graph is assigned an integer index, following a topological order of
+    the graph when it is acyclic. Sets of assets are represented as bitsets, python ints in which
+    bit ``i`` is set for the asset with index ``i``, so that the upstream or downstream closure of
+    many assets at once takes a handful of integer operations rather than a walk per asset.
+
+    Build one with :py:meth:`AssetGraph.from_assets` and reuse it for every selection resolved
+    against the same set of assets.
+
+    Args:
+        upstream_keys_by_key (Mapping[AssetKey, AbstractSet[AssetKey]]): The keys of the assets
+            that each asset produced by an AssetsDefinition depends on.
+        source_asset_keys (AbstractSet[AssetKey]): The keys of the source assets in the graph.
+        group_names_by_key (Mapping[AssetKey, str]): The group of each asset produced by an
+            AssetsDefinition.
+    """
+
+    def __init__(
+        self,
+        upstream_keys_by_key: Mapping[AssetKey, AbstractSet[AssetKey]],
+        source_asset_keys: AbstractSet[AssetKey],
+        group_names_by_key: Mapping[AssetKey, str],
+    ):
+        check.mapping_param(upstream_keys_by_key, "upstream_keys_by_key", key_type=AssetKey)
+        check.set_param(source_asset_keys, "source_asset_keys", of_type=AssetKey)
+        check.mapping_param(
+            group_names_by_key, "group_names_by_key", key_type=AssetKey, value_type=str
+        )
+
+        # include upstream keys that are neither produced nor sourced, so that selections can
+        # traverse through them
+        all_keys: Dict[AssetKey, None] = {}
+        for key, upstream_keys in upstream_keys_by_key.items():
+            all_keys[key] = None
+            for upstream_key in upstream_keys:
+                all_keys[upstream_key] = None
+        for key in source_asset_keys:
+            all_keys[key] = None
+
+        toposorted_keys = _toposort(list(all_keys), upstream_keys_by_key)
+        self._is_acyclic = toposorted_keys is not None
+        self._keys: Sequence[AssetKey] = toposorted_keys if toposorted_keys else list(all_keys)
+        self._index_by_key: Mapping[AssetKey, int] = {
+            key: index for index, key in enumerate(self._keys)
+        }
+
+        parent_bits = [0] * len(self._keys)
+        child_bits = [0] * len(self._keys)
+        for key, upstream_keys in upstream_keys_by_key.items():
+            index = self._index_by_key[key]
+            for upstream_key in upstream_keys:
+                upstream_index = self._index_by_key[upstream_key]
+                parent_bits[index] |= 1 << upstream_index
+                child_bits[upstream_index] |= 1 << index
+        self._parent_bits: Sequence[int] = parent_bits
+        self._child_bits: Sequence[int] = child_bits
+
+        self._materializable_bits = self.to_bits(upstream_keys_by_key.keys())
+        self._source_asset_keys = frozenset(source_asset_keys)
+        self._group_names_by_key = dict(group_names_by_key)
+
+        # full closures of each asset, computed on first use
+        self._ancestor_bits: Optional[Sequence[int]] = None
+        self._descendant_bits: Optional[Sequence[int]] = None
+
+    @staticmethod
+    def from_assets(all_assets: Sequence[Union[AssetsDefinition, SourceAsset]]) -> "AssetGraph":
+        from .resolved_asset_deps import ResolvedAssetDependencies
+
+        assets_defs = []
+        source_assets = []
+        for asset in all_assets:
+            if isinstance(asset, SourceAsset):
+                source_assets.append(asset)
+            elif isinstance(asset, AssetsDefinition):
+                assets_defs.append(asset)
+            else:
+                check.failed(f"Expected SourceAsset or AssetsDefinition, got {type(asset)}")
+
+        resolved_asset_deps = ResolvedAssetDependencies(assets_defs, source_assets)
+        upstream_keys_by_key: Dict[AssetKey, AbstractSet[AssetKey]] = {}
+        group_names_by_key: Dict[AssetKey, str] = {}
+        for assets_def in assets_defs:
+            for asset_key in assets_def.keys:
+                upstream_keys_by_key[
+                    asset_key
+                ] = resolved_asset_deps.get_resolved_upstream_asset_keys(assets_def, asset_key)
+            group_names_by_key.update(assets_def.group_names_by_key)
+
+        return AssetGraph(
+            upstream_keys_by_key=upstream_keys_by_key,
+            source_asset_keys={source_asset.key for source_asset in source_assets},
+            group_names_by_key=group_names_by_key,
+        )
+
+    @property
+    def materializable_asset_keys(self) -> AbstractSet[AssetKey]:
+        """The keys of the assets produced by AssetsDefinitions in the graph."""
+        return self.to_keys(self._materializable_bits)
+
+    @property
+    def source_asset_keys(self) -> AbstractSet[AssetKey]:
+        return self._source_asset_keys
+
+    @property
+    def group_names_by_key(self) -> Mapping[AssetKey, str]:
+        return self._group_names_by_key
+
+    @property
+    def toposorted_asset_keys(self) -> Sequence[AssetKey]:
+        """All the asset keys in the graph, with each asset ordered after its upstream assets.
+
+        Raises an error if the graph contains a cycle.
+        """
+        check.invariant(self._is_acyclic, "Asset graph contains a cycle")
+        return self._keys
+
+    def has(self, asset_key: AssetKey) -> bool:
+        return asset_key in self._index_by_key
+
+    def to_bits(self, asset_keys: Iterable[AssetKey]) -> int:
+        bits = 0
+        for asset_key in asset_keys:
+            bits |= 1 << self._index_by_key[asset_key]
+        return bits
+
+    def to_keys(self, bits: int) -> AbstractSet[AssetKey]:
+        return {self._keys[index] for index in _iter_bits(bits)}
+
+    def get_parents(self, asset_key: AssetKey) -> AbstractSet[AssetKey]:
+        return self.to_keys(self._parent_bits[self._index_by_key[asset_key]])
+
+    def get_children(self, asset_key: AssetKey) -> AbstractSet[AssetKey]:
+        return self.to_keys(self._child_bits[self._index_by_key[asset_key]])
+
+    def get_upstream_bits(self, bits: int, depth: Optional[int] = None) -> int:
+        """Returns the assets upstream of the given assets, to the given depth if provided. The
+        given assets are only included if they are upstream of one another.
+        """
+        if depth is None and self._is_acyclic:
+            if self._ancestor_bits is None:
+                self._ancestor_bits = self._build_closures(
+                    self._parent_bits, range(len(self._keys))
+                )
+            return self._union_bits(self._ancestor_bits, bits)
+        return self._traverse(self._parent_bits, bits, depth)
+
+    def get_downstream_bits(self, bits: int, depth: Optional[int] = None) -> int:
+        """Returns the assets downstream of the given assets, to the given depth if provided. The
+        given assets are only included if they are downstream of one another.
+        """
+        if depth is None and self._is_acyclic:
+            if self._descendant_bits is None:
+                self._descendant_bits = self._build_closures(
+                    self._child_bits, reversed(range(len(self._keys)))
+                )
+            return self._union_bits(self._descendant_bits, bits)
+        return self._traverse(self._child_bits, bits, depth)
+
+    def get_upstream(
+        self, asset_keys: Iterable[AssetKey], depth: Optional[int] = None
+    ) -> AbstractSet[AssetKey]:
+        return self.to_keys(self.get_upstream_bits(self.to_bits(asset_keys), depth))
+
+    def get_downstream(
+        self, asset_keys: Iterable[AssetKey], depth: Optional[int] = None
+    ) -> AbstractSet[AssetKey]:
+        return self.to_keys(self.get_downstream_bits(self.to_bits(asset_keys), depth))
+
+    @staticmethod
+    def _union_bits(bits_by_index: Sequence[int], bits: int) -> int:
+        result = 0
+        for index in _iter_bits(bits):
+            result |= bits_by_index[index]
+        return result
+
+    @staticmethod
+    def _build_closures(neighbor_bits: Sequence[int], indices: Iterable[int]) -> Sequence[int]:
+        # visits each asset after its neighbors, so that their closures are already complete
+        closures = [0] * len(neighbor_bits)
+        for index in indices:
+            closure = neighbor_bits[index]
+            for neighbor_index in _iter_bits(neighbor_bits[index]):
+                closure |= closures[neighbor_index]
+            closures[index] = closure
+        return closures
+
+    def _traverse(self, neighbor_bits: Sequence[int], bits: int, depth: Optional[int]) -> int:
+        result = 0
+        frontier = bits
+        curr_depth = 0
+        while frontier and (depth is None or curr_depth < depth):
+            reached = self._union_bits(neighbor_bits, frontier)
+            frontier = reached & ~result
+            result |= reached
+            curr_depth += 1
+        return result
+
+
+def _toposort(
+    keys: Sequence[AssetKey], upstream_keys_by_key: Mapping[AssetKey, AbstractSet[AssetKey]]
+) -> Optional[List[AssetKey]]:
+    """Orders the keys so that every key comes after its upstream keys. Returns None if the graph
+    contains a cycle.
+    """
+    downstream_keys_by_key: Dict[AssetKey, List[AssetKey]] = {key: [] for key in keys}
+    num_upstream_by_key: Dict[AssetKey, int] = {key: 0 for key in keys}
+    for key, upstream_keys in upstream_keys_by_key.items():
+        num_upstream_by_key[key] = len(upstream_keys)
+        for upstream_key in upstream_keys:
+            downstream_keys_by_key[upstream_key].append(key)
+
+    toposorted_keys = [key for key in keys if num_upstream_by_key[key] == 0]
+    for key in toposorted_keys:
+        for downstream_key in downstream_keys_by_key[key]:
+            num_upstream_by_key[downstream_key] -= 1
+            if num_upstream_by_key[downstream_key] == 0:
+                toposorted_keys.append(downstream_key)
+
+    return toposorted_keys if len(toposorted_keys) == len(keys) else None
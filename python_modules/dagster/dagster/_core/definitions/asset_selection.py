@@ -1,17 +1,11 @@
-import operator
 from abc import ABC
-from functools import reduce
-from typing import AbstractSet, FrozenSet, Optional, Sequence, Union
+from typing import FrozenSet, Optional, Sequence, Union
 
 import dagster._check as check
 from dagster._annotations import public
 from dagster._core.errors import DagsterInvalidSubsetError
-from dagster._core.selector.subset_selector import (
-    fetch_connected,
-    generate_asset_dep_graph,
-    generate_asset_name_to_definition_map,
-)
 
+from .asset_graph import AssetGraph
 from .assets import AssetsDefinition
 from .events import AssetKey, CoercibleToAssetKey
 from .source_asset import SourceAsset
@@ -102,10 +96,15 @@ def __and__(self, other: "AssetSelection") -> "AndAssetSelection":
         return AndAssetSelection(self, other)
 
     def resolve(
-        self, all_assets: Sequence[Union[AssetsDefinition, SourceAsset]]
+        self, all_assets: Union[Sequence[Union[AssetsDefinition, SourceAsset]], AssetGraph]
     ) -> FrozenSet[AssetKey]:
-        check.sequence_param(all_assets, "all_assets", (AssetsDefinition, SourceAsset))
-        return Resolver(all_assets).resolve(self)
+        if isinstance(all_assets, AssetGraph):
+            asset_graph = all_assets
+        else:
+            check.sequence_param(all_assets, "all_assets", (AssetsDefinition, SourceAsset))
+            asset_graph = AssetGraph.from_assets(all_assets)
+
+        return Resolver(asset_graph).resolve(self)
 
 
 class AllAssetSelection(AssetSelection):
@@ -150,98 +149,63 @@ def __init__(self, child: AssetSelection, *, depth: Optional[int] = None):
 
 
 class Resolver:
-    def __init__(self, all_assets: Sequence[Union[AssetsDefinition, SourceAsset]]):
-        assets_defs = []
-        source_assets = []
-        for asset in all_assets:
-            if isinstance(asset, SourceAsset):
-                source_assets.append(asset)
-            elif isinstance(asset, AssetsDefinition):
-                assets_defs.append(asset)
-            else:
-                check.failed(f"Expected SourceAsset or AssetsDefinition, got {type(asset)}")
-
-        self.assets_defs = assets_defs
-        self.asset_dep_graph = generate_asset_dep_graph(assets_defs, source_assets)
-        self.all_assets_by_key_str = generate_asset_name_to_definition_map(assets_defs)
-        self.source_asset_key_strs = {
-            source_asset.key.to_user_string() for source_asset in source_assets
+    def __init__(self, asset_graph: AssetGraph):
+        self.asset_graph = check.inst_param(asset_graph, "asset_graph", AssetGraph)
+        self._keys_by_user_string = {
+            key.to_user_string(): key
+            for key in [*asset_graph.materializable_asset_keys, *asset_graph.source_asset_keys]
         }
 
     def resolve(self, root_node: AssetSelection) -> FrozenSet[AssetKey]:
-        return frozenset(
-            {AssetKey.from_user_string(asset_name) for asset_name in self._resolve(root_node)}
-        )
+        return frozenset(self.asset_graph.to_keys(self._resolve(root_node)))
 
-    def _resolve(self, node: AssetSelection) -> AbstractSet[str]:
+    def _resolve(self, node: AssetSelection) -> int:
+        # selections are resolved to bitsets of the assets in the asset graph
         if isinstance(node, AllAssetSelection):
-            return set(self.all_assets_by_key_str.keys())
+            return self.asset_graph.to_bits(self.asset_graph.materializable_asset_keys)
         elif isinstance(node, AndAssetSelection):
             child_1, child_2 = [self._resolve(child) for child in node.children]
             return child_1 & child_2
         elif isinstance(node, DownstreamAssetSelection):
             child = self._resolve(node.children[0])
-            return reduce(
-                operator.or_,
-                [
-                    {asset_name}
-                    | fetch_connected(
-                        item=asset_name,
-                        graph=self.asset_dep_graph,
-                        direction="downstream",
-                        depth=node.depth,
-                    )
-                    for asset_name in child
-                ],
-            )
+            return child | self.asset_graph.get_downstream_bits(child, depth=node.depth)
         elif isinstance(node, GroupsAssetSelection):
-            return reduce(
-                operator.or_,
-                [_match_groups(assets_def, set(node.children)) for assets_def in self.assets_defs],
+            groups = set(node.children)
+            return self.asset_graph.to_bits(
+                asset_key
+                for asset_key, group in self.asset_graph.group_names_by_key.items()
+                if group in groups
             )
         elif isinstance(node, KeysAssetSelection):
-            specified_key_strs = set([child.to_user_string() for child in node.children])
-            invalid_key_strs = specified_key_strs - set(self.all_assets_by_key_str.keys())
-            selected_source_asset_key_strs = specified_key_strs & self.source_asset_key_strs
-            if selected_source_asset_key_strs:
+            # keys are matched by their user strings, so that "a/b" selects AssetKey(["a", "b"])
+            specified_keys = {
+                self._keys_by_user_string.get(key.to_user_string(), key) for key in node.children
+            }
+            selected_source_asset_keys = specified_keys & self.asset_graph.source_asset_keys
+            if selected_source_asset_keys:
+                selected_source_asset_key_strs = {
+                    key.to_user_string() for key in selected_source_asset_keys
+                }
                 raise DagsterInvalidSubsetError(
                     f"AssetKey(s) {selected_source_asset_key_strs} were selected, but these keys are "
                     "supplied by SourceAsset objects, not AssetsDefinition objects. You don't need "
                     "to include source assets in a selection for downstream assets to be able to "
                     "read them."
                 )
-            if invalid_key_strs:
+            invalid_keys = specified_keys - self.asset_graph.materializable_asset_keys
+            if invalid_keys:
+                invalid_key_strs = {key.to_user_string() for key in invalid_keys}
                 raise DagsterInvalidSubsetError(
                     f"AssetKey(s) {invalid_key_strs} were selected, but no AssetsDefinition objects supply "
                     "these keys. Make sure all keys are spelled correctly, and all AssetsDefinitions "
                     "are correctly added to the repository."
                 )
-            return specified_key_strs
+            return self.asset_graph.to_bits(specified_keys)
         elif isinstance(node, OrAssetSelection):
             child_1, child_2 = [self._resolve(child) for child in node.children]
             return child_1 | child_2
         elif isinstance(node, UpstreamAssetSelection):
             child = self._resolve(node.children[0])
-            return reduce(
-                operator.or_,
-                [
-                    {asset_name}
-                    | fetch_connected(
-                        item=asset_name,
-                        graph=self.asset_dep_graph,
-                        direction="upstream",
-                        depth=node.depth,
-                    )
-                    for asset_name in child
-                ],
-            )
+            return child | self.asset_graph.get_upstream_bits(child, depth=node.depth)
         else:
             check.failed(f"Unknown node type: {type(node)}")
-
-
-def _match_groups(assets_def: AssetsDefinition, groups: AbstractSet[str]) -> AbstractSet[str]:
-    return {
-        asset_key.to_user_string()
-        for asset_key, group in assets_def.group_names_by_key.items()
-        if group in groups
-    }
@@ -17,7 +17,7 @@
 
 import dagster._check as check
 from dagster._annotations import public
-from dagster._builtins import Int
+from dagster._builtins import Bool, Int
 from dagster._config import Field, Selector, UserConfigSchema
 from dagster._core.definitions.configurable import (
     ConfiguredDefinitionConfigSchema,
@@ -266,6 +266,20 @@ def _core_in_process_executor_creation(config: ExecutorConfig) -> "InProcessExec
         # shouldn't need to .get() here - issue with defaults in config setup
         retries=RetryMode.from_config(check.dict_elem(config, "retries")),
         marker_to_close=config.get("marker_to_close"),
+        release_outputs=config.get("release_outputs", False),
+    )
+
+
+def get_release_outputs_config():
+    return Field(
+        Bool,
+        default_value=False,
+        description=(
+            "Release each step output through its IO manager's `release_output` method once every "
+            "step that consumes it has succeeded or been skipped, for example deleting its file "
+            "with the `fs_io_manager`. Released outputs can not be loaded by later re-executions "
+            "of the run."
+        ),
     )
 
 
@@ -277,6 +291,7 @@ def _core_in_process_executor_creation(config: ExecutorConfig) -> "InProcessExec
             is_required=False,
             description="[DEPRECATED]",
         ),
+        "release_outputs": get_release_outputs_config(),
     },
     description="Execute all steps in a single process.",
 )
@@ -297,6 +312,10 @@ def in_process_executor(init_context):
         execution:
           in_process:
 
+    To free the memory or storage held by intermediate outputs during the run, set
+    ``release_outputs: true``. Each output is then passed to the ``release_output`` method of its
+    IO manager once every step that consumes it has succeeded.
+
     Execution priority can be configured using the ``dagster/priority`` tag via solid/op metadata,
     where the higher the number the higher the priority. 0 is the default and both positive
     and negative numbers can be used.
@@ -330,11 +349,16 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
     if start_selector:
         start_method, start_cfg = list(start_selector.items())[0]
 
+    worker_pool_cfg = check.opt_dict_elem(config, "worker_pool")
+
     return MultiprocessExecutor(
         max_concurrent=check.int_elem(config, "max_concurrent"),
         retries=RetryMode.from_config(check.dict_elem(config, "retries")),  # type: ignore
         start_method=start_method,
         explicit_forkserver_preload=check.opt_list_elem(start_cfg, "preload_modules", of_type=str),
+        use_worker_pool=worker_pool_cfg.get("enabled", False),
+        max_steps_per_worker=worker_pool_cfg.get("max_steps_per_worker"),
+        release_outputs=config.get("release_outputs", False),
     )
 
 
@@ -387,6 +411,30 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
             ),
         ),
         "retries": get_retries_config(),
+        "worker_pool": Field(
+            {
+                "enabled": Field(
+                    Bool,
+                    default_value=False,
+                    description=(
+                        "Execute steps in a pool of up to `max_concurrent` worker processes that "
+                        "are kept for the life of the run, rather than starting a new process for "
+                        "each step. Each worker loads the job and opens the Dagster instance once."
+                    ),
+                ),
+                "max_steps_per_worker": Field(
+                    Int,
+                    default_value=100,
+                    description=(
+                        "The number of steps a worker process executes before it is replaced "
+                        "with a new one. Workers are also replaced after a step fails in them."
+                    ),
+                ),
+            },
+            is_required=False,
+            description="Configure the multiprocess executor to reuse worker processes between steps.",
+        ),
+        "release_outputs": get_release_outputs_config(),
     },
     description="Execute each step in an individual process.",
 )
@@ -415,6 +463,16 @@ def multiprocess_executor(init_context):
     concurrently. By default, or if you set ``max_concurrent`` to be 0, this is the return value of
     :py:func:`python:multiprocessing.cpu_count`.
 
+    For jobs with many small ops, where starting a process for each step dominates, set
+    ``worker_pool: {enabled: true}`` to execute steps in worker processes that are reused for
+    the life of the run. A worker is replaced after ``max_steps_per_worker`` steps, or after a step
+    fails in it.
+
+    To free the storage held by intermediate outputs during the run, set ``release_outputs: true``.
+    Each output is then passed to the ``release_output`` method of its IO manager once every step
+    that consumes it has succeeded, which for example deletes its file with the
+    :py:func:`fs_io_manager`. The IO managers are initialized in the parent process to do so.
+
     Execution priority can be configured using the ``dagster/priority`` tag via solid/op metadata,
     where the higher the number the higher the priority. 0 is the default and both positive
     and negative numbers can be used.
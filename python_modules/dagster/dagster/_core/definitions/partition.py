@@ -83,7 +83,8 @@ class Partition(Generic[T]):
 
     def __init__(self, value: T, name: Optional[str] = None):
         self._value = value
-        self._name = cast(str, check.opt_str_param(name, "name", str(value)))
+        check.opt_str_param(name, "name")
+        self._name = name if name is not None else str(value)
 
     @property
     def value(self) -> T:
@@ -210,6 +211,18 @@ def __str__(self) -> str:
     def get_partition_keys(self, current_time: Optional[datetime] = None) -> Sequence[str]:
         return [partition.name for partition in self.get_partitions(current_time)]
 
+    def get_num_partitions(self, current_time: Optional[datetime] = None) -> int:
+        return len(self.get_partitions(current_time))
+
+    def get_partition(
+        self, partition_key: str, current_time: Optional[datetime] = None
+    ) -> Partition[T]:
+        for partition in self.get_partitions(current_time):
+            if partition.name == partition_key:
+                return partition
+
+        raise DagsterUnknownPartitionError(f"Could not find a partition with key `{partition_key}`")
+
     def get_last_partition_key(self, current_time: Optional[datetime] = None) -> str:
         return self.get_partitions(current_time)[-1].name
 
@@ -571,11 +584,7 @@ def get_partitions(self, current_time: Optional[datetime] = None) -> Sequence[Pa
         return self._partitions_def.get_partitions(current_time)
 
     def get_partition(self, name: str) -> Partition[T]:
-        for partition in self.get_partitions():
-            if partition.name == name:
-                return partition
-
-        raise DagsterUnknownPartitionError(f"Could not find a partition with key `{name}`")
+        return self._partitions_def.get_partition(name)
 
     def get_partition_names(self, current_time: Optional[datetime] = None) -> Sequence[str]:
         return [part.name for part in self.get_partitions(current_time)]
@@ -836,11 +845,11 @@ def get_run_config_for_partition_key(self, partition_key: str) -> Mapping[str, A
         Args:
             partition_key (str): the key for a partition that should be used to generate a run config.
         """
-        partitions = self.partitions_def.get_partitions()
-        partition = [p for p in partitions if p.name == partition_key]
-        if len(partition) == 0:
+        try:
+            partition = self.partitions_def.get_partition(partition_key)
+        except DagsterUnknownPartitionError:
             raise DagsterInvalidInvocationError(f"No partition for partition key {partition_key}.")
-        return self.run_config_for_partition_fn(partition[0])
+        return self.run_config_for_partition_fn(partition)
 
     def __call__(self, *args, **kwargs):
         if self._decorated_fn is None:
@@ -168,6 +168,7 @@ def adder_resource(init_context):
     _parent_pipeline_def: Optional["PipelineDefinition"]
     _cached_run_config_schemas: Dict[str, "RunConfigSchema"]
     _cached_external_pipeline: Any
+    _cached_pipeline_index: Optional["PipelineIndex"]
     _version_strategy: VersionStrategy
 
     def __init__(
@@ -287,6 +288,7 @@ def __init__(
         )
         self._cached_run_config_schemas = {}
         self._cached_external_pipeline = None
+        self._cached_pipeline_index = None
 
         self.version_strategy = check.opt_inst_param(
             version_strategy, "version_strategy", VersionStrategy
@@ -520,9 +522,13 @@ def get_pipeline_index(self) -> "PipelineIndex":
         from dagster._core.host_representation import PipelineIndex
         from dagster._core.snap import PipelineSnapshot
 
-        return PipelineIndex(
-            PipelineSnapshot.from_pipeline_def(self), self.get_parent_pipeline_snapshot()
-        )
+        # Built once per definition, so that the snapshot and its id are not recomputed for each
+        # run of the pipeline
+        if self._cached_pipeline_index is None:
+            self._cached_pipeline_index = PipelineIndex(
+                PipelineSnapshot.from_pipeline_def(self), self.get_parent_pipeline_snapshot()
+            )
+        return self._cached_pipeline_index
 
     def get_config_schema_snapshot(self) -> "ConfigSchemaSnapshot":
         return self.get_pipeline_snapshot().config_schema_snapshot
@@ -660,6 +660,7 @@ def from_list(
                 definitions.
         """
         from dagster._core.definitions import AssetGroup, AssetsDefinition
+        from dagster._core.definitions.asset_graph import AssetGraph
 
         pipelines_or_jobs: Dict[str, Union[PipelineDefinition, JobDefinition]] = {}
         coerced_graphs: Dict[str, JobDefinition] = {}
@@ -784,17 +785,24 @@ def from_list(
                     schedule_def, coerced_graphs, unresolved_jobs, pipelines_or_jobs, target
                 )
 
-        # resolve all the UnresolvedAssetJobDefinitions using the full set of assets
+        # resolve all the UnresolvedAssetJobDefinitions using the full set of assets, sharing a
+        # single asset graph across all of their selections
+        asset_graph = None
         for name, unresolved_job_def in unresolved_jobs.items():
             if not combined_asset_group:
                 raise DagsterInvalidDefinitionError(
                     f"UnresolvedAssetJobDefinition {name} specified, but no AssetsDefinitions exist "
                     "on the repository."
                 )
+            if asset_graph is None:
+                asset_graph = AssetGraph.from_assets(
+                    [*combined_asset_group.assets, *combined_asset_group.source_assets]
+                )
             resolved_job = unresolved_job_def.resolve(
                 assets=combined_asset_group.assets,
                 source_assets=combined_asset_group.source_assets,
                 default_executor_def=default_executor_def,
+                asset_graph=asset_graph,
             )
             pipelines_or_jobs[name] = resolved_job
 
@@ -1,6 +1,20 @@
+import threading
+import time
 import warnings
 from datetime import datetime
-from typing import Any, Callable, List, NamedTuple, Optional, Sequence, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 
 import pendulum
 
@@ -11,9 +25,15 @@
     RunStatusSensorExecutionError,
     user_code_error_boundary,
 )
-from dagster._core.events import PIPELINE_RUN_STATUS_TO_EVENT_TYPE, DagsterEvent
+from dagster._core.events import PIPELINE_RUN_STATUS_TO_EVENT_TYPE, DagsterEvent, DagsterEventType
 from dagster._core.instance import DagsterInstance
-from dagster._core.storage.pipeline_run import DagsterRun, DagsterRunStatus, PipelineRun, RunsFilter
+from dagster._core.storage.pipeline_run import (
+    DagsterRun,
+    DagsterRunStatus,
+    PipelineRun,
+    RunRecord,
+    RunsFilter,
+)
 from dagster._serdes import (
     deserialize_json_to_dagster_namedtuple,
     serialize_dagster_namedtuple,
@@ -42,6 +62,18 @@
 )
 from .unresolved_asset_job_definition import UnresolvedAssetJobDefinition
 
+if TYPE_CHECKING:
+    from dagster._core.storage.event_log.base import EventLogRecord
+
+# the maximum number of run status events that a sensor visits per tick
+RUN_STATUS_SENSOR_EVENT_LIMIT = 5
+
+# the number of run status events fetched at a time into the shared run status event feed
+RUN_STATUS_EVENT_FEED_PAGE_SIZE = 100
+
+# how long a feed page that reached the end of the event stream can be served before refetching
+RUN_STATUS_EVENT_FEED_TTL_SECONDS = 5
+
 
 @whitelist_for_serdes
 class RunStatusSensorCursor(
@@ -263,6 +295,115 @@ def _run_failure_sensor(context: RunStatusSensorContext):
     return inner
 
 
+class _RunStatusEventPage(NamedTuple):
+    after_storage_id: int
+    records: List[Tuple["EventLogRecord", Optional[RunRecord]]]
+    is_exhaustive: bool
+    fetched_at: float
+
+
+def _fetch_run_status_events(
+    instance: DagsterInstance,
+    event_type: DagsterEventType,
+    record_id: int,
+    update_timestamp: str,
+    limit: int,
+) -> List[Tuple["EventLogRecord", Optional[RunRecord]]]:
+    from dagster._core.storage.event_log.base import EventRecordsFilter, RunShardedEventsCursor
+
+    # Note: this is a cross-run query which requires extra handling in sqlite, see details in
+    # SqliteEventLogStorage.
+    event_records = instance.get_event_records(
+        EventRecordsFilter(
+            after_cursor=RunShardedEventsCursor(
+                id=record_id,
+                run_updated_after=cast(datetime, pendulum.parse(update_timestamp)),
+            ),
+            event_type=event_type,
+        ),
+        ascending=True,
+        limit=limit,
+    )
+
+    # load the runs for all of the events at once, instead of one query per event
+    run_ids = list({event_record.event_log_entry.run_id for event_record in event_records})
+    run_records_by_id = (
+        {
+            run_record.pipeline_run.run_id: run_record
+            for run_record in instance.get_run_records(filters=RunsFilter(run_ids=run_ids))
+        }
+        if run_ids
+        else {}
+    )
+    return [
+        (event_record, run_records_by_id.get(event_record.event_log_entry.run_id))
+        for event_record in event_records
+    ]
+
+
+class RunStatusEventFeed:
+    """Shares the run status events read by the run status sensors evaluated in this process.
+
+    Each run status sensor reads the same stream of events for its run status, each from its own
+    cursor. Instead of every sensor querying the event log and then the run storage once per
+    event, a page of events is fetched along with the runs for those events, and any sensor whose
+    cursor falls within the page is served from it.
+
+    Pages are only shared for event log storages that support cross-run queries by storage id,
+    since ids in run-sharded storages are not comparable across runs.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pages: Dict[Tuple[str, DagsterEventType], _RunStatusEventPage] = {}
+
+    def get_records(
+        self,
+        context: SensorEvaluationContext,
+        event_type: DagsterEventType,
+        record_id: int,
+        update_timestamp: str,
+        limit: int,
+    ) -> List[Tuple["EventLogRecord", Optional[RunRecord]]]:
+        instance = context.instance
+        instance_ref = context._instance_ref  # pylint: disable=protected-access
+        if instance_ref is None or not instance.event_log_storage.supports_event_consumer_queries():
+            return _fetch_run_status_events(
+                instance, event_type, record_id, update_timestamp, limit
+            )
+
+        key = (serialize_dagster_namedtuple(instance_ref), event_type)
+        with self._lock:
+            page = self._pages.get(key)
+
+        if page and page.after_storage_id <= record_id:
+            records = [record for record in page.records if record[0].storage_id > record_id]
+            if len(records) >= limit:
+                return records[:limit]
+            if (
+                page.is_exhaustive
+                and time.monotonic() - page.fetched_at < RUN_STATUS_EVENT_FEED_TTL_SECONDS
+            ):
+                return records
+
+        page_size = max(limit, RUN_STATUS_EVENT_FEED_PAGE_SIZE)
+        fetched_at = time.monotonic()
+        records = _fetch_run_status_events(
+            instance, event_type, record_id, update_timestamp, page_size
+        )
+        with self._lock:
+            self._pages[key] = _RunStatusEventPage(
+                after_storage_id=record_id,
+                records=records,
+                is_exhaustive=len(records) < page_size,
+                fetched_at=fetched_at,
+            )
+        return records[:limit]
+
+
+_RUN_STATUS_EVENT_FEED = RunStatusEventFeed()
+
+
 class RunStatusSensorDefinition(SensorDefinition):
     """
     Define a sensor that reacts to a given status of pipeline execution, where the decorated
@@ -303,7 +444,7 @@ def __init__(
         request_jobs: Optional[Sequence[Union[GraphDefinition, JobDefinition]]] = None,
     ):
 
-        from dagster._core.storage.event_log.base import EventRecordsFilter, RunShardedEventsCursor
+        from dagster._core.storage.event_log.base import EventRecordsFilter
 
         check.str_param(name, "name")
         check.inst_param(run_status, "run_status", DagsterRunStatus)
@@ -321,6 +462,7 @@ def __init__(
             run_status_sensor_fn, "run_status_sensor_fn"
         )
         event_type = PIPELINE_RUN_STATUS_TO_EVENT_TYPE[run_status]
+        monitored_job_names = {job.name for job in monitored_jobs} if monitored_jobs else None
 
         def _wrapped_fn(context: SensorEvaluationContext):
             # initiate the cursor to (most recent event id, current timestamp) when:
@@ -352,30 +494,22 @@ def _wrapped_fn(context: SensorEvaluationContext):
             # * we move the cursor forward to the latest visited event's id to avoid revisits
             # * when the daemon is down, bc we persist the cursor info, we can go back to where we
             #   left and backfill alerts for the qualified events (up to 5 at a time) during the downtime
-            # Note: this is a cross-run query which requires extra handling in sqlite, see details in SqliteEventLogStorage.
-            event_records = context.instance.get_event_records(
-                EventRecordsFilter(
-                    after_cursor=RunShardedEventsCursor(
-                        id=record_id,
-                        run_updated_after=cast(datetime, pendulum.parse(update_timestamp)),
-                    ),
-                    event_type=event_type,
-                ),
-                ascending=True,
-                limit=5,
+            # * the events, and the runs they belong to, are shared with the other run status
+            #   sensors evaluated in this process, see RunStatusEventFeed
+            records = _RUN_STATUS_EVENT_FEED.get_records(
+                context,
+                event_type,
+                record_id,
+                update_timestamp,
+                RUN_STATUS_SENSOR_EVENT_LIMIT,
             )
 
-            for event_record in event_records:
+            for event_record, run_record in records:
                 event_log_entry = event_record.event_log_entry
                 storage_id = event_record.storage_id
 
-                # get run info
-                run_records = context.instance.get_run_records(
-                    filters=RunsFilter(run_ids=[event_log_entry.run_id])
-                )
-
                 # skip if we couldn't find the right run
-                if len(run_records) != 1:
+                if run_record is None:
                     # bc we couldn't find the run, we use the event timestamp as the approximate
                     # run update timestamp
                     approximate_update_timestamp = utc_datetime_from_timestamp(
@@ -389,8 +523,8 @@ def _wrapped_fn(context: SensorEvaluationContext):
                     )
                     continue
 
-                pipeline_run = run_records[0].pipeline_run
-                update_timestamp = run_records[0].update_timestamp
+                pipeline_run = run_record.pipeline_run
+                update_timestamp = run_record.update_timestamp
 
                 # skip if any of of the followings happens:
                 if (
@@ -402,10 +536,7 @@ def _wrapped_fn(context: SensorEvaluationContext):
                     != context.repository_name
                     or
                     # if job not selected
-                    (
-                        monitored_jobs
-                        and pipeline_run.pipeline_name not in map(lambda x: x.name, monitored_jobs)
-                    )
+                    (monitored_job_names and pipeline_run.pipeline_name not in monitored_job_names)
                 ):
                     context.update_cursor(
                         RunStatusSensorCursor(
@@ -1,10 +1,25 @@
 from datetime import datetime, time
-from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Union, cast
+from functools import lru_cache
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Union,
+    cast,
+    overload,
+)
 
 import pendulum
 
 import dagster._check as check
 from dagster._annotations import PublicAttr
+from dagster._core.errors import DagsterUnknownPartitionError
 from dagster._utils.partitions import DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE
 from dagster._utils.schedules import schedule_execution_time_iterator
 
@@ -73,32 +88,37 @@ def __new__(  # pylint: disable=arguments-differ
     def get_partitions(
         self, current_time: Optional[datetime] = None
     ) -> Sequence[Partition[TimeWindow]]:
+        """Returns the partitions that exist as of the given time, as a lazy sequence: partitions
+        are only created when accessed, and len, indexing and slicing take constant time."""
+        return TimeWindowPartitionSequence(self, 0, self.get_num_partitions(current_time))
+
+    def get_num_partitions(self, current_time: Optional[datetime] = None) -> int:
         current_timestamp = (
             pendulum.instance(current_time, tz=self.timezone)
             if current_time
             else pendulum.now(self.timezone)
         ).timestamp()
 
-        partitions_past_current_time = 0
-        partitions: List[Partition[TimeWindow]] = []
-        for time_window in self._iterate_time_windows(self.start):
-            if (
-                time_window.end.timestamp() <= current_timestamp
-                or partitions_past_current_time < self.end_offset
-            ):
-                partitions.append(
-                    Partition(value=time_window, name=time_window.start.strftime(self.fmt))
-                )
+        # the partitions that end before the current time, which are those before the partition
+        # that contains it
+        num_ended_partitions = max(self._index_for_timestamp(current_timestamp), 0)
+        return max(num_ended_partitions + self.end_offset, 0)
 
-                if time_window.end.timestamp() > current_timestamp:
-                    partitions_past_current_time += 1
-            else:
-                break
+    def get_partition(
+        self, partition_key: str, current_time: Optional[datetime] = None
+    ) -> Partition[TimeWindow]:
+        try:
+            index = self._index_for_partition_key(partition_key)
+        except ValueError:
+            # the partition key is not in the format of this partitions definition
+            index = None
 
-        if self.end_offset < 0:
-            partitions = partitions[: self.end_offset]
+        if index is not None and index < self.get_num_partitions(current_time):
+            partition = self._partition_for_index(index)
+            if partition.name == partition_key:
+                return partition
 
-        return partitions
+        raise DagsterUnknownPartitionError(f"Could not find a partition with key `{partition_key}`")
 
     def __str__(self) -> str:
         partition_def_str = f"{self.schedule_type.value.capitalize()}, starting {self.start.strftime(self.fmt)} {self.timezone}."
@@ -107,8 +127,7 @@ def __str__(self) -> str:
         return partition_def_str
 
     def time_window_for_partition_key(self, partition_key: str) -> TimeWindow:
-        start = self.start_time_for_partition_key(partition_key)
-        return next(iter(self._iterate_time_windows(start)))
+        return self._time_window_for_index(self._index_for_partition_key(partition_key))
 
     def start_time_for_partition_key(self, partition_key: str) -> datetime:
         return pendulum.instance(datetime.strptime(partition_key, self.fmt), tz=self.timezone)
@@ -121,17 +140,137 @@ def get_default_partition_mapping(self):
         return TimeWindowPartitionMapping()
 
     def get_partition_keys_in_range(self, partition_key_range: PartitionKeyRange) -> Sequence[str]:
-        start_time = self.start_time_for_partition_key(partition_key_range.start)
+        start_index = self._index_for_partition_key(partition_key_range.start)
         end_time = self.start_time_for_partition_key(partition_key_range.end)
+        end_index = self._index_for_timestamp(end_time.timestamp())
+
+        return [
+            time_window.start.strftime(self.fmt)
+            for time_window in self._iterate_time_windows_for_indexes(start_index, end_index + 1)
+        ]
+
+    # The partitions of a TimeWindowPartitionsDefinition are addressed by their index: partition 0
+    # is the first time window starting at or after self.start. The start time of each partition is
+    # computed in closed form from the start of partition 0, using the same pendulum arithmetic
+    # as schedule_execution_time_iterator, rather than by iterating through the cron schedule.
+
+    def _has_closed_form(self) -> bool:
+        # Monthly partitions on days that do not exist in every month are clamped to the end of
+        # shorter months and then stay on the clamped day, which is only reproducible by iterating
+        return not (self.schedule_type == ScheduleType.MONTHLY and (self.day_offset or 1) > 28)
+
+    def _start_time_for_index(self, index: int) -> datetime:
+        first_start = _first_partition_start(self)
+
+        if not self._has_closed_form():
+            check.invariant(index >= 0, "Partition index must be non-negative")
+            return next(islice(self._iterate_time_windows(self.start), index, None)).start
+
+        if self.schedule_type == ScheduleType.HOURLY:
+            return first_start.add(hours=index)
+        elif self.schedule_type == ScheduleType.DAILY:
+            start = first_start.add(days=index)
+        elif self.schedule_type == ScheduleType.WEEKLY:
+            start = first_start.add(weeks=index)
+        elif self.schedule_type == ScheduleType.MONTHLY:
+            start = first_start.add(months=index)
+        else:
+            check.assert_never(self.schedule_type)
+
+        if start.hour != first_start.hour:
+            # the partition start falls in a time that doesn't exist due to a DST transition, so
+            # starts at the first time that does exist, as in schedule_execution_time_iterator
+            return start.replace(minute=0)
+
+        return start
+
+    def _time_window_for_index(self, index: int) -> TimeWindow:
+        return TimeWindow(self._start_time_for_index(index), self._start_time_for_index(index + 1))
 
-        result: List[str] = []
-        for time_window in self._iterate_time_windows(start_time):
-            if time_window.start <= end_time:
-                result.append(time_window.start.strftime(self.fmt))
+    def _iterate_time_windows_for_indexes(
+        self, start_index: int, end_index: int
+    ) -> Iterator[TimeWindow]:
+        """
+        Yields the time windows of the partitions from start_index up to, but not including,
+        end_index.
+        """
+        if not self._has_closed_form():
+            # iterate through the cron schedule once, rather than from the start for every index
+            yield from islice(self._iterate_time_windows(self.start), start_index, end_index)
+            return
+
+        # the end of each time window is the start of the next, so compute each boundary once
+        start = self._start_time_for_index(start_index)
+        for index in range(start_index, end_index):
+            end = self._start_time_for_index(index + 1)
+            yield TimeWindow(start, end)
+            start = end
+
+    def _partition_for_index(self, index: int) -> Partition[TimeWindow]:
+        time_window = self._time_window_for_index(index)
+        return Partition(value=time_window, name=time_window.start.strftime(self.fmt))
+
+    def _index_for_timestamp(self, timestamp: float) -> int:
+        """
+        Returns the index of the partition whose time window contains the given timestamp, which is
+        -1 if the timestamp is before the first partition.
+        """
+        first_start = _first_partition_start(self)
+        if timestamp < first_start.timestamp():
+            return -1
+
+        if not self._has_closed_form():
+            index = 0
+            for time_window in self._iterate_time_windows(self.start):
+                if time_window.end.timestamp() > timestamp:
+                    return index
+                index += 1
+
+        if self.schedule_type == ScheduleType.HOURLY:
+            index = int((timestamp - first_start.timestamp()) // 3600)
+        else:
+            local_time = pendulum.from_timestamp(timestamp, tz=self.timezone)
+            if self.schedule_type == ScheduleType.DAILY:
+                index = (local_time.date() - first_start.date()).days
+            elif self.schedule_type == ScheduleType.WEEKLY:
+                index = (local_time.date() - first_start.date()).days // 7
+            elif self.schedule_type == ScheduleType.MONTHLY:
+                index = (local_time.year - first_start.year) * 12 + (
+                    local_time.month - first_start.month
+                )
             else:
-                break
+                check.assert_never(self.schedule_type)
+
+        # the estimate is off by at most one, around partition boundaries and DST transitions
+        while index > 0 and self._start_time_for_index(index).timestamp() > timestamp:
+            index -= 1
+        while self._start_time_for_index(index + 1).timestamp() <= timestamp:
+            index += 1
 
-        return result
+        return index
+
+    def _index_for_partition_key(self, partition_key: str) -> int:
+        """
+        Returns the index of the first partition that starts at or after the time represented by
+        the given partition key.
+        """
+        start_timestamp = self.start_time_for_partition_key(partition_key).timestamp()
+        index = self._index_for_timestamp(start_timestamp)
+        if index < 0:
+            return 0
+
+        # a partition key that is ambiguous due to a DST transition may parse to the later of the
+        # two times it represents, but refers to the first partition with that key
+        if index > 0 and self._start_time_for_index(index - 1).strftime(self.fmt) == partition_key:
+            return index - 1
+
+        start_time = self._start_time_for_index(index)
+        if (
+            start_time.timestamp() < start_timestamp
+            and start_time.strftime(self.fmt) != partition_key
+        ):
+            return index + 1
+        return index
 
     def _iterate_time_windows(self, start: datetime) -> Iterable[TimeWindow]:
         """
@@ -160,6 +299,82 @@ def _iterate_time_windows(self, start: datetime) -> Iterable[TimeWindow]:
             prev_time = next_time
 
 
+# bounded, as long-lived processes may see many distinct partitions definitions over time
+@lru_cache(maxsize=128)
+def _first_partition_start(partitions_def: TimeWindowPartitionsDefinition) -> datetime:
+    time_windows = partitions_def._iterate_time_windows(  # pylint: disable=protected-access
+        partitions_def.start
+    )
+    return next(iter(time_windows)).start
+
+
+class TimeWindowPartitionSequence(Sequence[Partition[TimeWindow]]):
+    """
+    The partitions of a TimeWindowPartitionsDefinition between two indexes. Partitions are created
+    when accessed, so that consumers that only need a count or a few partitions do not pay for the
+    whole history.
+    """
+
+    def __init__(
+        self, partitions_def: TimeWindowPartitionsDefinition, start_index: int, end_index: int
+    ):
+        self._partitions_def = partitions_def
+        self._start_index = start_index
+        self._end_index = max(start_index, end_index)
+
+    def __len__(self) -> int:
+        return self._end_index - self._start_index
+
+    @overload
+    def __getitem__(self, index: int) -> Partition[TimeWindow]:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[Partition[TimeWindow]]:
+        ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            return TimeWindowPartitionSequence(
+                self._partitions_def, self._start_index + start, self._start_index + stop
+            )
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("partition index out of range")
+        return self._partitions_def._partition_for_index(  # pylint: disable=protected-access
+            self._start_index + index
+        )
+
+    def __iter__(self) -> Iterator[Partition[TimeWindow]]:
+        partitions_def = self._partitions_def
+        time_windows = (
+            partitions_def._iterate_time_windows_for_indexes(  # pylint: disable=protected-access
+                self._start_index, self._end_index
+            )
+        )
+        for time_window in time_windows:
+            yield Partition(value=time_window, name=time_window.start.strftime(partitions_def.fmt))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, TimeWindowPartitionSequence):
+            return (
+                self._partitions_def == other._partitions_def
+                and self._start_index == other._start_index
+                and len(self) == len(other)
+            )
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return False
+
+    def __repr__(self) -> str:
+        return f"TimeWindowPartitionSequence({self._partitions_def}, {self._start_index}, {self._end_index})"
+
+
 class DailyPartitionsDefinition(TimeWindowPartitionsDefinition):
     def __new__(
         cls,
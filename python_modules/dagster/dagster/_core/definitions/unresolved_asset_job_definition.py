@@ -20,6 +20,7 @@
         PartitionsDefinition,
         SourceAsset,
     )
+    from dagster._core.definitions.asset_graph import AssetGraph
 
 
 class UnresolvedAssetJobDefinition(
@@ -116,9 +117,13 @@ def resolve(
         assets: Sequence["AssetsDefinition"],
         source_assets: Sequence["SourceAsset"],
         default_executor_def: Optional["ExecutorDefinition"] = None,
+        asset_graph: Optional["AssetGraph"] = None,
     ) -> "JobDefinition":
         """
         Resolve this UnresolvedAssetJobDefinition into a JobDefinition.
+
+        If provided, the selection is resolved against ``asset_graph``, which should be built from
+        ``assets`` and ``source_assets``, so that it can be shared across jobs.
         """
         return build_asset_selection_job(
             name=self.name,
@@ -127,7 +132,7 @@ def resolve(
             source_assets=source_assets,
             description=self.description,
             tags=self.tags,
-            asset_selection=self.selection.resolve([*assets, *source_assets]),
+            asset_selection=self.selection.resolve(asset_graph or [*assets, *source_assets]),
             partitions_def=self.partitions_def,
             executor_def=self.executor_def or default_executor_def,
         )
@@ -1,3 +1,4 @@
+import concurrent.futures
 from enum import Enum
 from typing import Dict, List, NamedTuple, Optional
 
@@ -139,11 +140,26 @@ def with_error(self, error):
         )
 
 
-def submit_backfill_runs(instance, workspace, repo_location, backfill_job, partition_names=None):
+def submit_backfill_runs(
+    instance,
+    workspace,
+    repo_location,
+    backfill_job,
+    partition_names=None,
+    threadpool_executor=None,
+):
+    """Create and submit the runs for the given partitions of a backfill, yielding the id of each
+    submitted run.
+
+    If a threadpool executor is given, the runs are created and submitted concurrently using it.
+    """
     check.inst_param(instance, "instance", DagsterInstance)
     check.inst_param(workspace, "workspace", IWorkspace)
     check.inst_param(repo_location, "repo_location", RepositoryLocation)
     check.inst_param(backfill_job, "backfill_job", PartitionBackfill)
+    check.opt_inst_param(
+        threadpool_executor, "threadpool_executor", concurrent.futures.ThreadPoolExecutor
+    )
 
     repository_origin = backfill_job.partition_set_origin.external_repository_origin
     repo_name = repository_origin.repository_name
@@ -168,35 +184,108 @@ def submit_backfill_runs(instance, workspace, repo_location, backfill_job, parti
     external_pipeline = external_repo.get_full_external_pipeline(
         external_partition_set.pipeline_name
     )
-    for partition_data in result.partition_data:
-        pipeline_run = create_backfill_run(
-            instance,
-            repo_location,
-            external_pipeline,
-            external_partition_set,
-            backfill_job,
-            partition_data,
+    # we skip runs in certain cases, e.g. we are running a `from_failure` backfill job and the
+    # partition has had a successful run since the time the backfill was scheduled
+    pipeline_runs = create_backfill_runs(
+        instance,
+        repo_location,
+        external_pipeline,
+        external_partition_set,
+        backfill_job,
+        result.partition_data,
+        threadpool_executor=threadpool_executor,
+    )
+
+    if threadpool_executor:
+        submitted_runs = threadpool_executor.map(
+            lambda pipeline_run: instance.submit_run(pipeline_run.run_id, workspace),
+            pipeline_runs,
         )
-        if pipeline_run:
-            # we skip runs in certain cases, e.g. we are running a `from_failure` backfill job
-            # and the partition has had a successful run since the time the backfill was
-            # scheduled
-            instance.submit_run(pipeline_run.run_id, workspace)
-            yield pipeline_run.run_id
-        yield None
+    else:
+        submitted_runs = (
+            instance.submit_run(pipeline_run.run_id, workspace) for pipeline_run in pipeline_runs
+        )
+
+    for pipeline_run in submitted_runs:
+        yield pipeline_run.run_id
 
 
 def create_backfill_run(
     instance, repo_location, external_pipeline, external_partition_set, backfill_job, partition_data
 ):
-    from dagster._daemon.daemon import get_telemetry_daemon_session_id
+    pipeline_runs = create_backfill_runs(
+        instance,
+        repo_location,
+        external_pipeline,
+        external_partition_set,
+        backfill_job,
+        [partition_data],
+    )
+    return pipeline_runs[0] if pipeline_runs else None
 
+
+def create_backfill_runs(
+    instance,
+    repo_location,
+    external_pipeline,
+    external_partition_set,
+    backfill_job,
+    partition_data_list,
+    threadpool_executor=None,
+):
+    """Create the runs of a backfill for the given partitions, skipping partitions that do not need
+    a run.
+
+    The execution plan of each partition is fetched from the repository location concurrently if a
+    threadpool executor is given, and the runs are then added to run storage together.
+    """
     check.inst_param(instance, "instance", DagsterInstance)
     check.inst_param(repo_location, "repo_location", RepositoryLocation)
     check.inst_param(external_pipeline, "external_pipeline", ExternalPipeline)
     check.inst_param(external_partition_set, "external_partition_set", ExternalPartitionSet)
     check.inst_param(backfill_job, "backfill_job", PartitionBackfill)
-    check.inst_param(partition_data, "partition_data", ExternalPartitionExecutionParamData)
+    check.list_param(
+        partition_data_list, "partition_data_list", of_type=ExternalPartitionExecutionParamData
+    )
+    check.opt_inst_param(
+        threadpool_executor, "threadpool_executor", concurrent.futures.ThreadPoolExecutor
+    )
+
+    map_fn = threadpool_executor.map if threadpool_executor else map
+
+    if backfill_job.from_failure:
+        # each run re-executes a different failed run, so they are created one at a time
+        pipeline_runs = map_fn(
+            lambda partition_data: _create_run_from_failure(
+                instance,
+                repo_location,
+                external_pipeline,
+                external_partition_set,
+                backfill_job,
+                partition_data,
+            ),
+            partition_data_list,
+        )
+        return [pipeline_run for pipeline_run in pipeline_runs if pipeline_run]
+
+    runs_to_create = list(
+        map_fn(
+            lambda partition_data: _get_backfill_run_kwargs(
+                instance,
+                repo_location,
+                external_pipeline,
+                external_partition_set,
+                backfill_job,
+                partition_data,
+            ),
+            partition_data_list,
+        )
+    )
+    return instance.create_runs(runs_to_create)
+
+
+def _log_backfill_run_created(instance, repo_location, external_pipeline):
+    from dagster._daemon.daemon import get_telemetry_daemon_session_id
 
     log_action(
         instance,
@@ -208,16 +297,46 @@ def create_backfill_run(
         },
     )
 
-    tags = merge_dicts(
+
+def _get_backfill_run_tags(external_pipeline, backfill_job, partition_data):
+    return merge_dicts(
         external_pipeline.tags,
         partition_data.tags,
         PipelineRun.tags_for_backfill_id(backfill_job.backfill_id),
         backfill_job.tags,
     )
 
+
+def _create_run_from_failure(
+    instance, repo_location, external_pipeline, external_partition_set, backfill_job, partition_data
+):
+    _log_backfill_run_created(instance, repo_location, external_pipeline)
+
+    last_run = _fetch_last_run(instance, external_partition_set, partition_data.name)
+    if not last_run or last_run.status != PipelineRunStatus.FAILURE:
+        return None
+    return instance.create_reexecuted_run(
+        last_run,
+        repo_location,
+        external_pipeline,
+        ReexecutionStrategy.FROM_FAILURE,
+        extra_tags=_get_backfill_run_tags(external_pipeline, backfill_job, partition_data),
+        run_config=partition_data.run_config,
+        mode=external_partition_set.mode,
+        use_parent_run_tags=False,  # don't inherit tags from the previous run
+    )
+
+
+def _get_backfill_run_kwargs(
+    instance, repo_location, external_pipeline, external_partition_set, backfill_job, partition_data
+):
+    _log_backfill_run_created(instance, repo_location, external_pipeline)
+
+    tags = _get_backfill_run_tags(external_pipeline, backfill_job, partition_data)
+
     solids_to_execute = None
     solid_selection = None
-    if not backfill_job.from_failure and not backfill_job.reexecution_steps:
+    if not backfill_job.reexecution_steps:
         step_keys_to_execute = None
         parent_run_id = None
         root_run_id = None
@@ -226,22 +345,7 @@ def create_backfill_run(
             solids_to_execute = frozenset(external_partition_set.solid_selection)
             solid_selection = external_partition_set.solid_selection
 
-    elif backfill_job.from_failure:
-        last_run = _fetch_last_run(instance, external_partition_set, partition_data.name)
-        if not last_run or last_run.status != PipelineRunStatus.FAILURE:
-            return None
-        return instance.create_reexecuted_run(
-            last_run,
-            repo_location,
-            external_pipeline,
-            ReexecutionStrategy.FROM_FAILURE,
-            extra_tags=tags,
-            run_config=partition_data.run_config,
-            mode=external_partition_set.mode,
-            use_parent_run_tags=False,  # don't inherit tags from the previous run
-        )
-
-    elif backfill_job.reexecution_steps:
+    else:
         last_run = _fetch_last_run(instance, external_partition_set, partition_data.name)
         parent_run_id = last_run.run_id if last_run else None
         root_run_id = (last_run.root_run_id or last_run.run_id) if last_run else None
@@ -271,8 +375,9 @@ def create_backfill_run(
         instance=instance,
     )
 
-    return instance.create_run(
+    return dict(
         pipeline_snapshot=external_pipeline.pipeline_snapshot,
+        pipeline_snapshot_id=external_pipeline.computed_pipeline_snapshot_id,
         execution_plan_snapshot=external_execution_plan.execution_plan_snapshot,
         parent_pipeline_snapshot=external_pipeline.parent_pipeline_snapshot,
         pipeline_name=external_pipeline.name,
@@ -1,5 +1,8 @@
+import heapq
+import itertools
 import time
-from typing import Callable, Dict, Iterator, List, Optional, Set, cast
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, cast
 
 import dagster._check as check
 from dagster._core.errors import (
@@ -31,6 +34,7 @@ def __init__(
         execution_plan: ExecutionPlan,
         retry_mode: RetryMode,
         sort_key_fn: Optional[Callable[[ExecutionStep], float]] = None,
+        release_outputs: bool = False,
     ):
         self._plan: ExecutionPlan = check.inst_param(
             execution_plan, "execution_plan", ExecutionPlan
@@ -52,7 +56,22 @@ def __init__(
         self._step_outputs: Set[StepOutputHandle] = set(self._plan.known_state.ready_outputs)
 
         # All steps to be executed start out here in _pending
-        self._pending: Dict[str, Set[str]] = self._plan.get_executable_step_deps()
+        self._pending: Dict[str, Set[str]] = {}
+
+        # Rather than re-checking every pending step against every completed step on each
+        # _update, each pending step counts how many of its upstream steps have yet to succeed
+        # or skip, and a reverse index from each step to its pending downstream steps means that
+        # completing a step only touches its direct downstream steps. Steps that may have become
+        # executable, skippable or abandonable are collected in _ready_to_resolve.
+        self._step_deps: Dict[str, Set[str]] = {}
+        self._downstream_steps: Dict[str, Set[str]] = defaultdict(set)
+        self._remaining_upstream_count: Dict[str, int] = {}
+        self._ready_to_resolve: Set[str] = set()
+
+        # insertion order, used to break ties between steps so that they are resolved and
+        # executed in the order they became pending
+        self._sequence = itertools.count()
+        self._pending_order: Dict[str, int] = {}
 
         # track mapping keys from DynamicOutputs, step_key, output_name -> list of keys
         # to _gathering while in flight
@@ -63,8 +82,9 @@ def __init__(
         )
         self._new_dynamic_mappings: bool = False
 
-        # steps move in to these buckets as a result of _update calls
-        self._executable: List[str] = []
+        # steps move in to these buckets as a result of _update calls. _executable is a heap
+        # ordered by (sort key, insertion order)
+        self._executable: List[Tuple[float, int, str]] = []
         self._pending_skip: List[str] = []
         self._pending_retry: List[str] = []
         self._pending_abandon: List[str] = []
@@ -84,6 +104,22 @@ def __init__(
 
         self._interrupted: bool = False
 
+        # When releasing outputs, each output counts the steps that will consume it and have yet
+        # to succeed or be skipped, and is queued in _outputs_to_release once that count drops to
+        # zero. See get_outputs_to_release
+        self._release_outputs = check.bool_param(release_outputs, "release_outputs")
+        self._consumed_outputs: Dict[str, Set[StepOutputHandle]] = {}
+        self._remaining_consumer_count: Dict[StepOutputHandle, int] = {}
+        self._outputs_to_release: List[StepOutputHandle] = []
+
+        executable_step_deps = self._plan.get_executable_step_deps()
+
+        if self._release_outputs:
+            self._count_output_consumers(executable_step_deps)
+
+        for step_key, deps in executable_step_deps.items():
+            self._add_pending(step_key, deps)
+
         # Start the show by loading _executable with the set of _pending steps that have no deps
         self._update()
 
@@ -100,7 +136,10 @@ def __exit__(self, exc_type, exc_value, traceback):
 
         if not self.is_complete:
             pending_action = (
-                self._executable + self._pending_abandon + self._pending_retry + self._pending_skip
+                [step_key for _, _, step_key in self._executable]
+                + self._pending_abandon
+                + self._pending_retry
+                + self._pending_skip
             )
             state_str = "{pending_str}{in_flight_str}{action_str}{retry_str}".format(
                 in_flight_str="\nSteps still in flight: {}".format(self._in_flight)
@@ -145,74 +184,153 @@ def _update(self) -> None:
         """Moves steps from _pending to _executable / _pending_skip / _pending_retry
         as a function of what has been _completed
         """
-        new_steps_to_execute = []
-        new_steps_to_skip = []
-        new_steps_to_abandon = []
-
-        successful_or_skipped_steps = self._success | self._skipped
-        failed_or_abandoned_steps = self._failed | self._abandoned
-
         if self._new_dynamic_mappings:
             new_step_deps = self._plan.resolve(self._successful_dynamic_outputs)
             for step_key, deps in new_step_deps.items():
-                self._pending[step_key] = deps
+                self._add_pending(step_key, deps)
 
             self._new_dynamic_mappings = False
 
-        for step_key, requirements in self._pending.items():
-            # If any upstream deps failed - this is not executable
-            if requirements.intersection(failed_or_abandoned_steps):
-                new_steps_to_abandon.append(step_key)
+        if self._ready_to_resolve:
+            failed_or_abandoned_steps = self._failed | self._abandoned
+            ready_to_resolve = sorted(self._ready_to_resolve, key=self._pending_order.__getitem__)
+            self._ready_to_resolve = set()
+
+            for step_key in ready_to_resolve:
+                requirements = self._pending[step_key]
+
+                # If any upstream deps failed - this is not executable
+                if not failed_or_abandoned_steps.isdisjoint(requirements):
+                    self._pending_abandon.append(step_key)
+                    self._remove_pending(step_key)
+
+                # If all the upstream steps of a step are complete or skipped
+                elif self._remaining_upstream_count[step_key] == 0:
+                    if self._should_skip(step_key, requirements):
+                        self._pending_skip.append(step_key)
+                    else:
+                        self._push_executable(step_key)
+                    self._remove_pending(step_key)
+
+        if self._waiting_to_retry:
+            ready_to_retry = []
+            tick_time = time.time()
+            for key, at_time in self._waiting_to_retry.items():
+                if tick_time >= at_time:
+                    ready_to_retry.append(key)
+
+            for key in ready_to_retry:
+                self._push_executable(key)
+                del self._waiting_to_retry[key]
+
+    def _should_skip(self, step_key: str, requirements: Set[str]) -> bool:
+        step = self.get_step_by_key(step_key)
+
+        # If there is at least one of the step's inputs, none of whose upstream steps has
+        # yielded an output, we should skip that step.
+        for step_input in step.step_inputs:
+            source_handles = step_input.get_step_output_handle_dependencies()
+            missing_source_handles = [
+                source_handle
+                for source_handle in source_handles
+                if source_handle.step_key in requirements
+                and source_handle not in self._step_outputs
+            ]
+            if missing_source_handles and len(missing_source_handles) == len(source_handles):
+                return True
+
+        # The base case is downstream step won't skip
+        return False
+
+    def _count_output_consumers(self, executable_step_deps: Dict[str, Set[str]]) -> None:
+        # Outputs of steps that unresolved dynamic steps depend on may gain consumers once those
+        # steps are resolved, so they are never released. Neither are outputs of steps that are
+        # not executed by this plan.
+        kept_step_keys: Set[str] = set()
+        for step in self._plan.step_dict.values():
+            if not isinstance(step, ExecutionStep):
+                kept_step_keys.update(step.get_all_dependency_keys())
+
+        for step_key in executable_step_deps:
+            step = self.get_step_by_key(step_key)
+            consumed_outputs = {
+                step_output_handle
+                for step_input in step.step_inputs
+                for step_output_handle in step_input.get_step_output_handle_dependencies()
+                if step_output_handle.step_key in executable_step_deps
+                and step_output_handle.step_key not in kept_step_keys
+            }
+            if not consumed_outputs:
+                continue
+
+            self._consumed_outputs[step_key] = consumed_outputs
+            for step_output_handle in consumed_outputs:
+                self._remaining_consumer_count[step_output_handle] = (
+                    self._remaining_consumer_count.get(step_output_handle, 0) + 1
+                )
 
-            # If all the upstream steps of a step are complete or skipped
-            elif requirements.issubset(successful_or_skipped_steps):
-                step = self.get_step_by_key(step_key)
+    def _release_consumed_outputs(self, step_key: str) -> None:
+        for step_output_handle in self._consumed_outputs.pop(step_key, set()):
+            self._remaining_consumer_count[step_output_handle] -= 1
+            if (
+                self._remaining_consumer_count[step_output_handle] == 0
+                and step_output_handle in self._step_outputs
+            ):
+                self._outputs_to_release.append(step_output_handle)
+
+    def get_outputs_to_release(self) -> List[StepOutputHandle]:
+        """Returns the outputs that no step left to execute consumes, since the last call.
+
+        Only outputs that are consumed by at least one step of the plan are returned, once all of
+        those steps have succeeded or been skipped. Outputs consumed by a step that fails are kept,
+        so that the step can be re-executed. Always empty unless release_outputs is set.
+        """
+        outputs_to_release = self._outputs_to_release
+        self._outputs_to_release = []
+        return outputs_to_release
+
+    def _add_pending(self, step_key: str, deps: Set[str]) -> None:
+        self._pending[step_key] = deps
+        self._step_deps[step_key] = deps
+        self._pending_order[step_key] = next(self._sequence)
+
+        remaining_upstream_count = 0
+        has_failed_upstream = False
+        for dep in deps:
+            self._downstream_steps[dep].add(step_key)
+            if dep in self._failed or dep in self._abandoned:
+                has_failed_upstream = True
+            elif dep not in self._success and dep not in self._skipped:
+                remaining_upstream_count += 1
+
+        self._remaining_upstream_count[step_key] = remaining_upstream_count
+        if has_failed_upstream or remaining_upstream_count == 0:
+            self._ready_to_resolve.add(step_key)
+
+    def _remove_pending(self, step_key: str) -> None:
+        del self._pending[step_key]
+        del self._remaining_upstream_count[step_key]
+        del self._pending_order[step_key]
+        for dep in self._step_deps[step_key]:
+            self._downstream_steps[dep].discard(step_key)
+
+    def _push_executable(self, step_key: str) -> None:
+        heapq.heappush(
+            self._executable,
+            (self._sort_key_fn(self.get_step_by_key(step_key)), next(self._sequence), step_key),
+        )
 
-                # The base case is downstream step won't skip
-                should_skip = False
+    def _pending_downstream_steps(self, step_key: str) -> Iterable[str]:
+        return self._downstream_steps.get(step_key, ())
 
-                # If there is at least one of the step's inputs, none of whose upstream steps has
-                # yielded an output, we should skip that step.
-                for step_input in step.step_inputs:
-                    missing_source_handles = [
-                        source_handle
-                        for source_handle in step_input.get_step_output_handle_dependencies()
-                        if source_handle.step_key in requirements
-                        and source_handle not in self._step_outputs
-                    ]
-                    if missing_source_handles:
-                        if len(missing_source_handles) == len(
-                            step_input.get_step_output_handle_dependencies()
-                        ):
-                            should_skip = True
-                            break
-
-                if should_skip:
-                    new_steps_to_skip.append(step_key)
-                else:
-                    new_steps_to_execute.append(step_key)
-
-        for key in new_steps_to_execute:
-            self._executable.append(key)
-            del self._pending[key]
-
-        for key in new_steps_to_skip:
-            self._pending_skip.append(key)
-            del self._pending[key]
-
-        for key in new_steps_to_abandon:
-            self._pending_abandon.append(key)
-            del self._pending[key]
-
-        ready_to_retry = []
-        tick_time = time.time()
-        for key, at_time in self._waiting_to_retry.items():
-            if tick_time >= at_time:
-                ready_to_retry.append(key)
-
-        for key in ready_to_retry:
-            self._executable.append(key)
-            del self._waiting_to_retry[key]
+    def _mark_upstream_succeeded_or_skipped(self, step_key: str) -> None:
+        for downstream_key in self._pending_downstream_steps(step_key):
+            self._remaining_upstream_count[downstream_key] -= 1
+            if self._remaining_upstream_count[downstream_key] == 0:
+                self._ready_to_resolve.add(downstream_key)
+
+    def _mark_upstream_failed_or_abandoned(self, step_key: str) -> None:
+        self._ready_to_resolve.update(self._pending_downstream_steps(step_key))
 
     def sleep_til_ready(self) -> None:
         now = time.time()
@@ -247,17 +365,14 @@ def get_steps_to_execute(self, limit: Optional[int] = None) -> List[ExecutionSte
         check.opt_int_param(limit, "limit")
         self._update()
 
-        steps = sorted(
-            [self.get_step_by_key(key) for key in self._executable],
-            key=self._sort_key_fn,
-        )
+        count = len(self._executable) if limit is None else min(limit, len(self._executable))
 
-        if limit is not None:
-            steps = steps[:limit]
-
-        for step in steps:
-            self._in_flight.add(step.key)
-            self._executable.remove(step.key)
+        steps = []
+        for _ in range(count):
+            _, _, step_key = heapq.heappop(self._executable)
+            step = self.get_step_by_key(step_key)
+            steps.append(step)
+            self._in_flight.add(step_key)
             self._prep_for_dynamic_outputs(step)
 
         return steps
@@ -340,20 +455,26 @@ def plan_events_iterator(self, pipeline_context) -> Iterator[DagsterEvent]:
     def mark_failed(self, step_key: str) -> None:
         self._failed.add(step_key)
         self._mark_complete(step_key)
+        self._mark_upstream_failed_or_abandoned(step_key)
 
     def mark_success(self, step_key: str) -> None:
         self._success.add(step_key)
         self._mark_complete(step_key)
+        self._mark_upstream_succeeded_or_skipped(step_key)
         self._resolve_any_dynamic_outputs(step_key)
+        self._release_consumed_outputs(step_key)
 
     def mark_skipped(self, step_key: str) -> None:
         self._skipped.add(step_key)
         self._mark_complete(step_key)
+        self._mark_upstream_succeeded_or_skipped(step_key)
         self._resolve_any_dynamic_outputs(step_key)
+        self._release_consumed_outputs(step_key)
 
     def mark_abandoned(self, step_key: str) -> None:
         self._abandoned.add(step_key)
         self._mark_complete(step_key)
+        self._mark_upstream_failed_or_abandoned(step_key)
 
     def mark_interrupted(self) -> None:
         self._interrupted = True
@@ -373,11 +494,12 @@ def mark_up_for_retry(self, step_key: str, at_time: Optional[float] = None) -> N
             if at_time:
                 self._waiting_to_retry[step_key] = at_time
             else:
-                self._pending[step_key] = self._plan.get_executable_step_deps()[step_key]
+                self._add_pending(step_key, self._step_deps[step_key])
 
         elif self._retry_mode.deferred:
             # do not attempt to execute again
             self._abandoned.add(step_key)
+            self._mark_upstream_failed_or_abandoned(step_key)
 
         self._retry_state.mark_attempt(step_key)
 
@@ -21,21 +21,25 @@
     UserFailureData,
     step_failure_event_from_exc_info,
 )
+from dagster._core.execution.plan.outputs import StepOutputHandle
 from dagster._core.execution.plan.plan import ExecutionPlan
+from dagster._core.execution.plan.step import ExecutionStep
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 
 
 def inner_plan_execution_iterator(
-    pipeline_context: PlanExecutionContext, execution_plan: ExecutionPlan
+    pipeline_context: PlanExecutionContext,
+    execution_plan: ExecutionPlan,
+    release_outputs: bool = False,
 ) -> Iterator[DagsterEvent]:
     check.inst_param(pipeline_context, "pipeline_context", PlanExecutionContext)
     check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
+    check.bool_param(release_outputs, "release_outputs")
 
-    with execution_plan.start(retry_mode=pipeline_context.retry_mode) as active_execution:
+    with execution_plan.start(
+        retry_mode=pipeline_context.retry_mode, release_outputs=release_outputs
+    ) as active_execution:
 
-        # It would be good to implement a reference tracking algorithm here to
-        # garbage collect results that are no longer needed by any steps
-        # https://github.com/dagster-io/dagster/issues/811
         while not active_execution.is_complete:
             step = active_execution.get_next_step()
             step_context = cast(
@@ -109,6 +113,38 @@ def inner_plan_execution_iterator(
             for hook_event in _trigger_hook(step_context, step_event_list):
                 yield hook_event
 
+            yield from release_outputs_iterator(
+                pipeline_context, active_execution.get_outputs_to_release()
+            )
+
+
+def release_outputs_iterator(
+    pipeline_context: PlanExecutionContext, step_output_handles: List[StepOutputHandle]
+) -> Iterator[DagsterEvent]:
+    """Releases outputs that no step left to execute consumes, using the IO managers that handled
+    them. See ActiveExecution.get_outputs_to_release."""
+    for step_output_handle in step_output_handles:
+        step = pipeline_context.execution_plan.get_step_by_key(step_output_handle.step_key)
+        step_context = cast(
+            StepExecutionContext,
+            pipeline_context.for_step(cast(ExecutionStep, step)),
+        )
+        try:
+            step_context.get_io_manager(step_output_handle).release_output(
+                step_context.get_output_context(step_output_handle)
+            )
+        except Exception:
+            yield DagsterEvent.engine_event(
+                plan_context=step_context,
+                message=(
+                    f'Exception while releasing output "{step_output_handle.output_name}" of step '
+                    f'"{step_output_handle.step_key}"'
+                ),
+                event_specific_data=EngineEventData(
+                    error=serializable_error_info_from_exc_info(sys.exc_info())
+                ),
+            )
+
 
 def _trigger_hook(
     step_context: StepExecutionContext, step_event_list: List[DagsterEvent]
@@ -914,7 +914,13 @@ def build_memoized_plan(
             resource_config=resource_config,
             log_manager=log_manager,
         ) as resources:
+            # check the outputs of each io manager in a single batch, so that io managers backed by
+            # remote storage can check them concurrently
+            output_handles_by_io_manager_key = defaultdict(list)
             for step_output_handle, io_manager_key in io_manager_keys.items():
+                output_handles_by_io_manager_key[io_manager_key].append(step_output_handle)
+
+            for io_manager_key, step_output_handles in output_handles_by_io_manager_key.items():
                 io_manager = getattr(resources, io_manager_key)
                 if not isinstance(io_manager, MemoizableIOManager):
                     raise DagsterInvariantViolationError(
@@ -924,19 +930,29 @@ def build_memoized_plan(
                         "Learn more about MemoizableIOManagers here: "
                         "https://docs.dagster.io/_apidocs/internals#memoizable-io-manager-experimental."
                     )
-                context = get_output_context(
-                    execution_plan=self,
-                    pipeline_def=pipeline_def,
-                    resolved_run_config=resolved_run_config,
-                    step_output_handle=step_output_handle,
-                    run_id=None,
-                    log_manager=log_manager,
-                    step_context=None,
-                    resources=resources,
-                    version=step_output_versions[step_output_handle],
+                contexts = [
+                    get_output_context(
+                        execution_plan=self,
+                        pipeline_def=pipeline_def,
+                        resolved_run_config=resolved_run_config,
+                        step_output_handle=step_output_handle,
+                        run_id=None,
+                        log_manager=log_manager,
+                        step_context=None,
+                        resources=resources,
+                        version=step_output_versions[step_output_handle],
+                    )
+                    for step_output_handle in step_output_handles
+                ]
+                has_outputs = list(io_manager.has_outputs(contexts))
+                check.invariant(
+                    len(has_outputs) == len(contexts),
+                    f"IO manager '{io_manager_key}' returned {len(has_outputs)} results from "
+                    f"has_outputs when checking {len(contexts)} outputs.",
                 )
-                if not io_manager.has_output(context):
-                    unmemoized_step_keys.add(step_output_handle.step_key)
+                for step_output_handle, has_output in zip(step_output_handles, has_outputs):
+                    if not has_output:
+                        unmemoized_step_keys.add(step_output_handle.step_key)
 
         if selected_step_keys is not None:
             # Take the intersection unmemoized steps and selected steps
@@ -954,6 +970,7 @@ def start(
         self,
         retry_mode: RetryMode,
         sort_key_fn: Optional[Callable[[ExecutionStep], float]] = None,
+        release_outputs: bool = False,
     ) -> "ActiveExecution":
         from .active import ActiveExecution
 
@@ -961,6 +978,7 @@ def start(
             self,
             retry_mode,
             sort_key_fn,
+            release_outputs=release_outputs,
         )
 
     def step_handle_for_single_step_plans(
@@ -2,10 +2,10 @@
 
 
 import os
-import queue
 import sys
 from abc import ABC, abstractmethod
-from typing import NamedTuple
+from multiprocessing.connection import wait
+from typing import Dict, Hashable, NamedTuple, Optional
 
 import dagster._check as check
 from dagster._core.errors import DagsterExecutionInterruptedError
@@ -56,64 +56,108 @@ def __init__(self, exit_code=None):
         super().__init__()
 
 
-def _execute_command_in_child_process(event_queue, command):
+def _execute_command_in_child_process(event_conn, command):
     """Wraps the execution of a ChildProcessCommand.
 
-    Handles errors and communicates across a queue with the parent process."""
+    Handles errors and communicates across a pipe with the parent process."""
 
     check.inst_param(command, "command", ChildProcessCommand)
 
     with capture_interrupts():
         pid = os.getpid()
-        event_queue.put(ChildProcessStartEvent(pid=pid))
+        event_conn.send(ChildProcessStartEvent(pid=pid))
         try:
             for step_event in command.execute():
-                event_queue.put(step_event)
-            event_queue.put(ChildProcessDoneEvent(pid=pid))
+                event_conn.send(step_event)
+            event_conn.send(ChildProcessDoneEvent(pid=pid))
 
         except (
             Exception,
             KeyboardInterrupt,
             DagsterExecutionInterruptedError,
         ):
-            event_queue.put(
+            event_conn.send(
                 ChildProcessSystemErrorEvent(
                     pid=pid, error_info=serializable_error_info_from_exc_info(sys.exc_info())
                 )
             )
+        finally:
+            event_conn.close()
 
 
 TICK = 20.0 * 1.0 / 1000.0
-"""The minimum interval at which to check for child process liveness -- default 20ms."""
+"""The maximum interval at which a child process iterator that is not driven by a
+ChildProcessEventWaiter yields None while waiting for its child -- default 20ms."""
 
 PROCESS_DEAD_AND_QUEUE_EMPTY = "PROCESS_DEAD_AND_QUEUE_EMPTY"
 """Sentinel value."""
 
 
-def _poll_for_event(process, event_queue):
-    try:
-        return event_queue.get(block=True, timeout=TICK)
-    except queue.Empty:
-        if not process.is_alive():
-            # There is a possibility that after the last queue.get the
-            # process created another event and then died. In that case
-            # we want to continue draining the queue.
+class ChildProcessEventWaiter:
+    """Blocks until any one of a set of child processes has an event ready for the parent, or has
+    exited.
+
+    Child processes send their events over the write end of a one-way pipe. Rather than polling
+    each child's pipe in turn with a timeout, a parent driving several child process iterators
+    registers each child's read end and process sentinel here, advances the iterators without
+    blocking, and calls `wait` once all of them are idle. The parent then only wakes up when there
+    is an event (or an exit) to handle, however many children it is running.
+    """
+
+    def __init__(self):
+        self._waitables: Dict[Hashable, list] = {}
+
+    def register(self, key: Hashable, event_conn, process):
+        self._waitables[key] = [event_conn, process.sentinel]
+
+    def unregister(self, key: Hashable):
+        self._waitables.pop(key, None)
+
+    def wait(self, timeout: Optional[float] = None):
+        waitables = [waitable for pair in self._waitables.values() for waitable in pair]
+        if waitables:
+            wait(waitables, timeout=timeout)
+
+
+def _poll_for_event(process, event_conn, timeout: Optional[float] = None):
+    """Returns the next event sent by the process, None if there is none yet, or
+    PROCESS_DEAD_AND_QUEUE_EMPTY once the process has exited and all of its events have been read.
+
+    If timeout is set, blocks for up to that long waiting for an event or for the process to exit.
+    """
+    if timeout:
+        wait([event_conn, process.sentinel], timeout=timeout)
+
+    if event_conn.poll():
+        try:
+            return event_conn.recv()
+        except EOFError:
+            # every copy of the write end is closed - the process has exited
+            return PROCESS_DEAD_AND_QUEUE_EMPTY
+
+    if not process.is_alive():
+        # There is a possibility that after the last poll the process sent another event and
+        # then died. In that case we want to continue draining the pipe.
+        if event_conn.poll():
             try:
-                return event_queue.get(block=False)
-            except queue.Empty:
-                # If the queue empty we know that there are no more events
-                # and that the process has died.
-                return PROCESS_DEAD_AND_QUEUE_EMPTY
+                return event_conn.recv()
+            except EOFError:
+                pass
+        # If the pipe is empty we know that there are no more events and that the process has
+        # died.
+        return PROCESS_DEAD_AND_QUEUE_EMPTY
 
     return None
 
 
-def execute_child_process_command(multiprocessing_ctx, command):
+def execute_child_process_command(
+    multiprocessing_ctx, command, event_waiter: Optional[ChildProcessEventWaiter] = None
+):
     """Execute a ChildProcessCommand in a new process.
 
     This function starts a new process whose execution target is a ChildProcessCommand wrapped by
-    _execute_command_in_child_process; polls the queue for events yielded by the child process
-    until the process dies and the queue is empty.
+    _execute_command_in_child_process; reads the events sent by the child process over a pipe
+    until the process dies and the pipe is empty.
 
     This function yields a complex set of objects to enable having multiple child process
     executions in flight:
@@ -131,24 +175,34 @@ def execute_child_process_command(multiprocessing_ctx, command):
     Args:
         multiprocessing_ctx: The multiprocessing context to execute in (spawn, forkserver, fork)
         command (ChildProcessCommand): The command to execute in the child process.
+        event_waiter (Optional[ChildProcessEventWaiter]): If set, the child process is registered
+            with the waiter, and this iterator yields None without blocking when no event is
+            ready - the caller is expected to block in ``event_waiter.wait``. Otherwise, this
+            iterator blocks for up to TICK waiting for each event.
 
     Warning: if the child process is in an infinite loop, this will
     also infinitely loop.
     """
 
     check.inst_param(command, "command", ChildProcessCommand)
+    check.opt_inst_param(event_waiter, "event_waiter", ChildProcessEventWaiter)
 
-    event_queue = multiprocessing_ctx.Queue()
+    event_conn, child_event_conn = multiprocessing_ctx.Pipe(duplex=False)
     try:
         process = multiprocessing_ctx.Process(
-            target=_execute_command_in_child_process, args=(event_queue, command)
+            target=_execute_command_in_child_process, args=(child_event_conn, command)
         )
         process.start()
+        # close our copy of the write end, so that reads fail once the child has exited
+        child_event_conn.close()
+
+        if event_waiter:
+            event_waiter.register(command, event_conn, process)
 
         completed_properly = False
 
         while not completed_properly:
-            event = _poll_for_event(process, event_queue)
+            event = _poll_for_event(process, event_conn, timeout=None if event_waiter else TICK)
 
             if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
                 break
@@ -159,9 +213,14 @@ def execute_child_process_command(multiprocessing_ctx, command):
                 completed_properly = True
 
         if not completed_properly:
+            # the pipe can be closed before the process has been reaped
+            process.join()
             # TODO Figure out what to do about stderr/stdout
             raise ChildProcessCrashException(exit_code=process.exitcode)
 
         process.join()
     finally:
-        event_queue.close()
+        if event_waiter:
+            event_waiter.unregister(command)
+        child_event_conn.close()
+        event_conn.close()
@@ -1,7 +1,8 @@
 import multiprocessing
 import os
 import sys
-from typing import List, Optional
+from contextlib import ExitStack
+from typing import ContextManager, Iterator, List, Optional, Set
 
 from dagster import MetadataEntry
 from dagster import _check as check
@@ -12,27 +13,50 @@
 )
 from dagster._core.events import DagsterEvent, EngineEventData
 from dagster._core.execution.api import create_execution_plan, execute_plan_iterator
-from dagster._core.execution.context.system import PlanOrchestrationContext
-from dagster._core.execution.context_creation_pipeline import create_context_free_log_manager
+from dagster._core.execution.context.system import PlanExecutionContext, PlanOrchestrationContext
+from dagster._core.execution.context_creation_pipeline import (
+    create_context_free_log_manager,
+    scoped_pipeline_context,
+)
+from dagster._core.execution.plan.execute_plan import release_outputs_iterator
 from dagster._core.execution.plan.objects import StepFailureData
 from dagster._core.execution.plan.plan import ExecutionPlan
+from dagster._core.execution.plan.state import KnownExecutionState
+from dagster._core.execution.resources_init import (
+    get_transitive_required_resource_keys,
+    resource_initialization_manager,
+)
 from dagster._core.execution.retries import RetryMode
 from dagster._core.executor.base import Executor
-from dagster._core.instance import DagsterInstance
+from dagster._core.instance import DagsterInstance, InstanceRef
+from dagster._core.storage.pipeline_run import PipelineRun
 from dagster._utils import start_termination_thread
 from dagster._utils.error import serializable_error_info_from_exc_info
+from dagster._utils.interrupts import capture_interrupts
 from dagster._utils.timing import format_duration, time_execution_scope
 
 from .child_process_executor import (
+    PROCESS_DEAD_AND_QUEUE_EMPTY,
+    TICK,
     ChildProcessCommand,
     ChildProcessCrashException,
+    ChildProcessDoneEvent,
     ChildProcessEvent,
+    ChildProcessEventWaiter,
+    ChildProcessStartEvent,
     ChildProcessSystemErrorEvent,
+    _poll_for_event,
     execute_child_process_command,
 )
 
 DELEGATE_MARKER = "multiprocess_subprocess_init"
 
+DEFAULT_MAX_STEPS_PER_WORKER = 100
+
+# While every child process is busy, the parent blocks until one of them sends an event or exits.
+# It also wakes up this often to check for interrupts and for steps that are due to be retried.
+MAX_WAIT_FOR_CHILD_EVENTS_SECONDS = 1.0
+
 
 class MultiprocessExecutorChildProcessCommand(ChildProcessCommand):
     def __init__(
@@ -56,37 +80,275 @@ def __init__(
         self.known_state = known_state
 
     def execute(self):
-        pipeline = self.recon_pipeline
         with DagsterInstance.from_ref(self.instance_ref) as instance:
             start_termination_thread(self.term_event)
-            execution_plan = create_execution_plan(
-                pipeline=pipeline,
-                run_config=self.run_config,
-                mode=self.pipeline_run.mode,
-                step_keys_to_execute=[self.step_key],
-                known_state=self.known_state,
+            yield from _execute_step_in_subprocess(
+                instance,
+                self.recon_pipeline,
+                self.pipeline_run,
+                self.run_config,
+                self.retry_mode,
+                self.step_key,
+                self.known_state,
             )
 
-            log_manager = create_context_free_log_manager(instance, self.pipeline_run)
 
-            yield DagsterEvent.step_worker_started(
-                log_manager,
-                self.pipeline_run.pipeline_name,
-                message='Executing step "{}" in subprocess.'.format(self.step_key),
-                metadata_entries=[
-                    MetadataEntry("pid", value=str(os.getpid())),
-                ],
-                step_key=self.step_key,
-            )
+def _execute_step_in_subprocess(
+    instance: DagsterInstance,
+    recon_pipeline,
+    pipeline_run: PipelineRun,
+    run_config,
+    retry_mode: RetryMode,
+    step_key: str,
+    known_state: Optional[KnownExecutionState],
+) -> Iterator[DagsterEvent]:
+    execution_plan = create_execution_plan(
+        pipeline=recon_pipeline,
+        run_config=run_config,
+        mode=pipeline_run.mode,
+        step_keys_to_execute=[step_key],
+        known_state=known_state,
+    )
 
-            yield from execute_plan_iterator(
-                execution_plan,
-                pipeline,
-                self.pipeline_run,
-                run_config=self.run_config,
-                retry_mode=self.retry_mode.for_inner_plan(),
-                instance=instance,
+    log_manager = create_context_free_log_manager(instance, pipeline_run)
+
+    yield DagsterEvent.step_worker_started(
+        log_manager,
+        pipeline_run.pipeline_name,
+        message='Executing step "{}" in subprocess.'.format(step_key),
+        metadata_entries=[
+            MetadataEntry("pid", value=str(os.getpid())),
+        ],
+        step_key=step_key,
+    )
+
+    yield from execute_plan_iterator(
+        execution_plan,
+        recon_pipeline,
+        pipeline_run,
+        run_config=run_config,
+        retry_mode=retry_mode.for_inner_plan(),
+        instance=instance,
+    )
+
+
+def _execute_steps_in_worker_process(
+    command_queue,
+    event_conn,
+    term_event,
+    recon_pipeline,
+    pipeline_run: PipelineRun,
+    run_config,
+    instance_ref: InstanceRef,
+    retry_mode: RetryMode,
+):
+    """Target of a worker process in a MultiprocessExecutorWorkerPool.
+
+    Opens the instance once and executes the steps sent over command_queue, one at a time, until
+    it receives None. The loaded pipeline definition is cached on recon_pipeline, and so is also
+    shared between steps. The events for each step are sent over event_conn, followed by a
+    ChildProcessDoneEvent, or a ChildProcessSystemErrorEvent if the step raised.
+    """
+    with capture_interrupts():
+        pid = os.getpid()
+        event_conn.send(ChildProcessStartEvent(pid=pid))
+        try:
+            with DagsterInstance.from_ref(instance_ref) as instance:
+                start_termination_thread(term_event)
+                while True:
+                    request = command_queue.get()
+                    if request is None:
+                        return
+
+                    step_key, known_state = request
+                    try:
+                        for step_event in _execute_step_in_subprocess(
+                            instance,
+                            recon_pipeline,
+                            pipeline_run,
+                            run_config,
+                            retry_mode,
+                            step_key,
+                            known_state,
+                        ):
+                            event_conn.send(step_event)
+                        event_conn.send(ChildProcessDoneEvent(pid=pid))
+                    except (
+                        Exception,
+                        KeyboardInterrupt,
+                        DagsterExecutionInterruptedError,
+                    ):
+                        event_conn.send(
+                            ChildProcessSystemErrorEvent(
+                                pid=pid,
+                                error_info=serializable_error_info_from_exc_info(sys.exc_info()),
+                            )
+                        )
+        except (
+            Exception,
+            KeyboardInterrupt,
+            DagsterExecutionInterruptedError,
+        ):
+            # failed to set up the worker - reported against the first step sent to it
+            event_conn.send(
+                ChildProcessSystemErrorEvent(
+                    pid=pid, error_info=serializable_error_info_from_exc_info(sys.exc_info())
+                )
             )
+        finally:
+            event_conn.close()
+
+
+class MultiprocessExecutorWorker:
+    """Parent process handle on a long-lived worker process, which executes one step at a time."""
+
+    def __init__(
+        self,
+        multiproc_ctx,
+        recon_pipeline,
+        pipeline_run: PipelineRun,
+        run_config,
+        instance_ref: InstanceRef,
+        retry_mode: RetryMode,
+    ):
+        self.term_event = multiproc_ctx.Event()
+        self.steps_executed = 0
+        self._command_queue = multiproc_ctx.Queue()
+        self._event_conn, child_event_conn = multiproc_ctx.Pipe(duplex=False)
+        self._process = multiproc_ctx.Process(
+            target=_execute_steps_in_worker_process,
+            args=(
+                self._command_queue,
+                child_event_conn,
+                self.term_event,
+                recon_pipeline,
+                pipeline_run,
+                run_config,
+                instance_ref,
+                retry_mode,
+            ),
+        )
+        self._process.start()
+        child_event_conn.close()
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self._process.pid
+
+    def execute_step(
+        self,
+        step_key: str,
+        known_state: Optional[KnownExecutionState],
+        event_waiter: Optional[ChildProcessEventWaiter] = None,
+    ):
+        """Sends a step to the worker, and reads its events until the worker reports that the
+        step has completed. Yields the same set of objects as execute_child_process_command, and
+        uses event_waiter in the same way.
+        """
+        self.steps_executed += 1
+        self._command_queue.put((step_key, known_state))
+
+        if event_waiter:
+            event_waiter.register(self, self._event_conn, self._process)
+        try:
+            while True:
+                event = _poll_for_event(
+                    self._process, self._event_conn, timeout=None if event_waiter else TICK
+                )
+
+                if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
+                    self._process.join()
+                    raise ChildProcessCrashException(exit_code=self._process.exitcode)
+
+                yield event
+
+                if isinstance(event, (ChildProcessDoneEvent, ChildProcessSystemErrorEvent)):
+                    return
+        finally:
+            if event_waiter:
+                event_waiter.unregister(self)
+
+    def shutdown(self):
+        if self._process.is_alive():
+            self._command_queue.put(None)
+            self._process.join()
+        self._command_queue.close()
+        self._event_conn.close()
+
+    def terminate(self):
+        if self._process.is_alive():
+            self._process.terminate()
+        self._process.join()
+        self._command_queue.close()
+        self._event_conn.close()
+
+
+class MultiprocessExecutorWorkerPool:
+    """Worker processes that are kept warm between steps for the life of a run.
+
+    A worker is shut down and replaced, rather than returned to the pool, once it has executed
+    max_steps_per_worker steps, after a step fails or raises in it, or once it has been asked to
+    terminate.
+    """
+
+    def __init__(
+        self,
+        multiproc_ctx,
+        max_steps_per_worker: int,
+        recon_pipeline,
+        pipeline_run: PipelineRun,
+        run_config,
+        instance_ref: InstanceRef,
+        retry_mode: RetryMode,
+    ):
+        self._multiproc_ctx = multiproc_ctx
+        self._max_steps_per_worker = check.int_param(max_steps_per_worker, "max_steps_per_worker")
+        self._recon_pipeline = recon_pipeline
+        self._pipeline_run = pipeline_run
+        self._run_config = run_config
+        self._instance_ref = instance_ref
+        self._retry_mode = retry_mode
+
+        self._workers: Set[MultiprocessExecutorWorker] = set()
+        self._idle_workers: List[MultiprocessExecutorWorker] = []
+
+    def acquire(self) -> MultiprocessExecutorWorker:
+        if self._idle_workers:
+            return self._idle_workers.pop()
+
+        worker = MultiprocessExecutorWorker(
+            self._multiproc_ctx,
+            self._recon_pipeline,
+            self._pipeline_run,
+            self._run_config,
+            self._instance_ref,
+            self._retry_mode,
+        )
+        self._workers.add(worker)
+        return worker
+
+    def release(self, worker: MultiprocessExecutorWorker, recycle: bool = False):
+        if (
+            recycle
+            or worker.term_event.is_set()
+            or worker.steps_executed >= self._max_steps_per_worker
+        ):
+            self._workers.discard(worker)
+            worker.shutdown()
+        else:
+            self._idle_workers.append(worker)
+
+    def discard(self, worker: MultiprocessExecutorWorker):
+        self._workers.discard(worker)
+        worker.terminate()
+
+    def shutdown(self):
+        for worker in self._idle_workers:
+            worker.shutdown()
+        for worker in self._workers.difference(self._idle_workers):
+            worker.terminate()
+        self._workers = set()
+        self._idle_workers = []
 
 
 class MultiprocessExecutor(Executor):
@@ -96,6 +358,9 @@ def __init__(
         max_concurrent: int,
         start_method: Optional[str] = None,
         explicit_forkserver_preload: Optional[List[str]] = None,
+        use_worker_pool: bool = False,
+        max_steps_per_worker: Optional[int] = None,
+        release_outputs: bool = False,
     ):
         self._retries = check.inst_param(retries, "retries", RetryMode)
         max_concurrent = max_concurrent if max_concurrent else multiprocessing.cpu_count()
@@ -113,6 +378,12 @@ def __init__(
             )
         self._start_method = start_method
         self._explicit_forkserver_preload = explicit_forkserver_preload
+        self._use_worker_pool = check.bool_param(use_worker_pool, "use_worker_pool")
+        self._max_steps_per_worker = check.opt_int_param(
+            max_steps_per_worker, "max_steps_per_worker", DEFAULT_MAX_STEPS_PER_WORKER
+        )
+        check.invariant(self._max_steps_per_worker > 0, "max_steps_per_worker must be positive")
+        self._release_outputs = check.bool_param(release_outputs, "release_outputs")
 
     @property
     def retries(self):
@@ -145,8 +416,6 @@ def execute(self, plan_context, execution_plan):
 
             multiproc_ctx.set_forkserver_preload(preload)
 
-        limit = self._max_concurrent
-
         yield DagsterEvent.engine_event(
             plan_context,
             "Executing steps using multiprocess executor: parent process (pid: {pid})".format(
@@ -157,40 +426,97 @@ def execute(self, plan_context, execution_plan):
             ),
         )
 
-        # It would be good to implement a reference tracking algorithm here so we could
-        # garbage collect results that are no longer needed by any steps
-        # https://github.com/dagster-io/dagster/issues/811
+        worker_pool = (
+            MultiprocessExecutorWorkerPool(
+                multiproc_ctx,
+                max_steps_per_worker=self._max_steps_per_worker,
+                recon_pipeline=pipeline,
+                pipeline_run=plan_context.pipeline_run,
+                run_config=plan_context.run_config,
+                instance_ref=plan_context.instance.get_ref(),
+                retry_mode=self.retries,
+            )
+            if self._use_worker_pool
+            else None
+        )
+
         with time_execution_scope() as timer_result:
-            with execution_plan.start(retry_mode=self.retries) as active_execution:
-                active_iters = {}
-                errors = {}
-                term_events = {}
-                stopping = False
-
-                while (not stopping and not active_execution.is_complete) or active_iters:
-                    if active_execution.check_for_interrupts():
-                        yield DagsterEvent.engine_event(
-                            plan_context,
-                            "Multiprocess executor: received termination signal - "
-                            "forwarding to active child processes",
-                            EngineEventData.interrupted(list(term_events.keys())),
-                        )
-                        stopping = True
-                        active_execution.mark_interrupted()
-                        for key, event in term_events.items():
-                            event.set()
-
-                    # start iterators
-                    while len(active_iters) < limit and not stopping:
-                        steps = active_execution.get_steps_to_execute(
-                            limit=(limit - len(active_iters))
-                        )
+            try:
+                yield from self._execute_plan(
+                    plan_context, execution_plan, pipeline, multiproc_ctx, worker_pool
+                )
+            finally:
+                if worker_pool:
+                    worker_pool.shutdown()
+
+        yield DagsterEvent.engine_event(
+            plan_context,
+            "Multiprocess executor: parent process exiting after {duration} (pid: {pid})".format(
+                duration=format_duration(timer_result.millis), pid=os.getpid()
+            ),
+            event_specific_data=EngineEventData.multiprocess(os.getpid()),
+        )
 
-                        if not steps:
-                            break
+    def _execute_plan(
+        self,
+        plan_context: PlanOrchestrationContext,
+        execution_plan: ExecutionPlan,
+        pipeline,
+        multiproc_ctx,
+        worker_pool: Optional[MultiprocessExecutorWorkerPool],
+    ) -> Iterator[DagsterEvent]:
+        limit = self._max_concurrent
 
-                        for step in steps:
-                            step_context = plan_context.for_step(step)
+        with execution_plan.start(
+            retry_mode=self.retries, release_outputs=self._release_outputs
+        ) as active_execution, ExitStack() as release_stack:
+            active_iters = {}
+            errors = {}
+            term_events = {}
+            stopping = False
+            event_waiter = ChildProcessEventWaiter()
+            # opened the first time an output is released, see _open_release_context
+            release_context: Optional[PlanExecutionContext] = None
+            can_release = self._release_outputs
+
+            while (not stopping and not active_execution.is_complete) or active_iters:
+                made_progress = False
+
+                if active_execution.check_for_interrupts():
+                    yield DagsterEvent.engine_event(
+                        plan_context,
+                        "Multiprocess executor: received termination signal - "
+                        "forwarding to active child processes",
+                        EngineEventData.interrupted(list(term_events.keys())),
+                    )
+                    stopping = True
+                    active_execution.mark_interrupted()
+                    for key, event in term_events.items():
+                        event.set()
+
+                # start iterators
+                while len(active_iters) < limit and not stopping:
+                    steps = active_execution.get_steps_to_execute(limit=(limit - len(active_iters)))
+
+                    if not steps:
+                        break
+
+                    made_progress = True
+                    for step in steps:
+                        step_context = plan_context.for_step(step)
+                        if worker_pool:
+                            worker = worker_pool.acquire()
+                            term_events[step.key] = worker.term_event
+                            active_iters[step.key] = execute_step_in_worker(
+                                worker_pool,
+                                worker,
+                                step_context,
+                                step,
+                                errors,
+                                active_execution.get_known_state(),
+                                event_waiter,
+                            )
+                        else:
                             term_events[step.key] = multiproc_ctx.Event()
                             active_iters[step.key] = execute_step_out_of_process(
                                 multiproc_ctx,
@@ -201,98 +527,149 @@ def execute(self, plan_context, execution_plan):
                                 term_events,
                                 self.retries,
                                 active_execution.get_known_state(),
+                                event_waiter,
                             )
 
-                    # process active iterators
-                    empty_iters = []
-                    for key, step_iter in active_iters.items():
-                        try:
-                            event_or_none = next(step_iter)
-                            if event_or_none is None:
-                                continue
-                            else:
-                                yield event_or_none
-                                active_execution.handle_event(event_or_none)
-
-                        except ChildProcessCrashException as crash:
-                            serializable_error = serializable_error_info_from_exc_info(
-                                sys.exc_info()
-                            )
-                            step_context = plan_context.for_step(
+                # process active iterators
+                empty_iters = []
+                for key, step_iter in active_iters.items():
+                    try:
+                        event_or_none = next(step_iter)
+                        if event_or_none is None:
+                            continue
+                        else:
+                            made_progress = True
+                            yield event_or_none
+                            active_execution.handle_event(event_or_none)
+
+                    except ChildProcessCrashException as crash:
+                        made_progress = True
+                        serializable_error = serializable_error_info_from_exc_info(sys.exc_info())
+                        step_context = plan_context.for_step(active_execution.get_step_by_key(key))
+                        yield DagsterEvent.engine_event(
+                            step_context,
+                            (
+                                "Multiprocess executor: child process for step {step_key} "
+                                "unexpectedly exited with code {exit_code}"
+                            ).format(step_key=key, exit_code=crash.exit_code),
+                            EngineEventData.engine_error(serializable_error),
+                        )
+                        step_failure_event = DagsterEvent.step_failure_event(
+                            step_context=plan_context.for_step(
                                 active_execution.get_step_by_key(key)
+                            ),
+                            step_failure_data=StepFailureData(
+                                error=serializable_error, user_failure_data=None
+                            ),
+                        )
+                        active_execution.handle_event(step_failure_event)
+                        yield step_failure_event
+                        empty_iters.append(key)
+                    except StopIteration:
+                        made_progress = True
+                        empty_iters.append(key)
+
+                # clear and mark complete finished iterators
+                for key in empty_iters:
+                    del active_iters[key]
+                    del term_events[key]
+                    active_execution.verify_complete(plan_context, key)
+
+                # process skipped and abandoned steps
+                yield from active_execution.plan_events_iterator(plan_context)
+
+                outputs_to_release = active_execution.get_outputs_to_release()
+                if outputs_to_release and can_release:
+                    if release_context is None:
+                        try:
+                            release_context = release_stack.enter_context(
+                                _open_release_context(plan_context, execution_plan)
                             )
+                        except Exception:
+                            can_release = False
                             yield DagsterEvent.engine_event(
-                                step_context,
-                                (
-                                    "Multiprocess executor: child process for step {step_key} "
-                                    "unexpectedly exited with code {exit_code}"
-                                ).format(step_key=key, exit_code=crash.exit_code),
-                                EngineEventData.engine_error(serializable_error),
-                            )
-                            step_failure_event = DagsterEvent.step_failure_event(
-                                step_context=plan_context.for_step(
-                                    active_execution.get_step_by_key(key)
-                                ),
-                                step_failure_data=StepFailureData(
-                                    error=serializable_error, user_failure_data=None
+                                plan_context,
+                                "Multiprocess executor: exception while initializing the IO "
+                                "managers to release outputs with, outputs will not be released",
+                                EngineEventData.engine_error(
+                                    serializable_error_info_from_exc_info(sys.exc_info())
                                 ),
                             )
-                            active_execution.handle_event(step_failure_event)
-                            yield step_failure_event
-                            empty_iters.append(key)
-                        except StopIteration:
-                            empty_iters.append(key)
-
-                    # clear and mark complete finished iterators
-                    for key in empty_iters:
-                        del active_iters[key]
-                        del term_events[key]
-                        active_execution.verify_complete(plan_context, key)
-
-                    # process skipped and abandoned steps
-                    yield from active_execution.plan_events_iterator(plan_context)
-
-                errs = {pid: err for pid, err in errors.items() if err}
-
-                # After termination starts, raise an interrupted exception once all subprocesses
-                # have finished cleaning up (and the only errors were from being interrupted)
-                if (
-                    stopping
-                    and (not active_iters)
-                    and all(
-                        [
-                            err_info.cls_name == "DagsterExecutionInterruptedError"
-                            for err_info in errs.values()
-                        ]
-                    )
-                ):
-                    yield DagsterEvent.engine_event(
-                        plan_context,
-                        "Multiprocess executor: interrupted all active child processes",
-                        event_specific_data=EngineEventData(),
-                    )
-                    raise DagsterExecutionInterruptedError()
-                elif errs:
-                    raise DagsterSubprocessError(
-                        "During multiprocess execution errors occurred in child processes:\n{error_list}".format(
-                            error_list="\n".join(
-                                [
-                                    "In process {pid}: {err}".format(pid=pid, err=err.to_string())
-                                    for pid, err in errs.items()
-                                ]
-                            )
-                        ),
-                        subprocess_error_infos=list(errs.values()),
-                    )
-
-        yield DagsterEvent.engine_event(
-            plan_context,
-            "Multiprocess executor: parent process exiting after {duration} (pid: {pid})".format(
-                duration=format_duration(timer_result.millis), pid=os.getpid()
+                    if release_context is not None:
+                        yield from release_outputs_iterator(release_context, outputs_to_release)
+
+                # nothing to do until a child process sends an event or exits
+                if active_iters and not made_progress:
+                    event_waiter.wait(timeout=MAX_WAIT_FOR_CHILD_EVENTS_SECONDS)
+
+            errs = {pid: err for pid, err in errors.items() if err}
+
+            # After termination starts, raise an interrupted exception once all subprocesses
+            # have finished cleaning up (and the only errors were from being interrupted)
+            if (
+                stopping
+                and (not active_iters)
+                and all(
+                    [
+                        err_info.cls_name == "DagsterExecutionInterruptedError"
+                        for err_info in errs.values()
+                    ]
+                )
+            ):
+                yield DagsterEvent.engine_event(
+                    plan_context,
+                    "Multiprocess executor: interrupted all active child processes",
+                    event_specific_data=EngineEventData(),
+                )
+                raise DagsterExecutionInterruptedError()
+            elif errs:
+                raise DagsterSubprocessError(
+                    "During multiprocess execution errors occurred in child processes:\n{error_list}".format(
+                        error_list="\n".join(
+                            [
+                                "In process {pid}: {err}".format(pid=pid, err=err.to_string())
+                                for pid, err in errs.items()
+                            ]
+                        )
+                    ),
+                    subprocess_error_infos=list(errs.values()),
+                )
+
+
+def _open_release_context(
+    plan_context: PlanOrchestrationContext, execution_plan: ExecutionPlan
+) -> ContextManager[PlanExecutionContext]:
+    """Builds a context in the parent process that has the IO managers of the plan's step outputs,
+    and the resources they require, but none of the other resources of the job."""
+    pipeline_def = plan_context.pipeline.get_definition()
+    io_manager_keys = set()
+    for step_key in execution_plan.get_executable_step_deps():
+        step = execution_plan.get_step_by_key(step_key)
+        solid = pipeline_def.get_solid(step.solid_handle)
+        for step_output in step.step_outputs:
+            io_manager_keys.add(solid.output_def_named(step_output.name).io_manager_key)
+
+    def _io_manager_initialization_manager(
+        resource_defs, resource_keys_to_init, **kwargs
+    ):  # pylint: disable=unused-argument
+        return resource_initialization_manager(
+            resource_defs=resource_defs,
+            resource_keys_to_init=get_transitive_required_resource_keys(
+                io_manager_keys, resource_defs
             ),
-            event_specific_data=EngineEventData.multiprocess(os.getpid()),
+            **kwargs,
         )
 
+    return scoped_pipeline_context(
+        execution_plan,
+        plan_context.pipeline,
+        plan_context.run_config,
+        plan_context.pipeline_run,
+        plan_context.instance,
+        scoped_resources_builder_cm=_io_manager_initialization_manager,
+        raise_on_error=True,
+    )
+
 
 def execute_step_out_of_process(
     multiproc_ctx,
@@ -303,6 +680,7 @@ def execute_step_out_of_process(
     term_events,
     retries,
     known_state,
+    event_waiter=None,
 ):
     command = MultiprocessExecutorChildProcessCommand(
         run_config=step_context.run_config,
@@ -321,7 +699,7 @@ def execute_step_out_of_process(
         metadata_entries=[],
     )
 
-    for ret in execute_child_process_command(multiproc_ctx, command):
+    for ret in execute_child_process_command(multiproc_ctx, command, event_waiter):
         if ret is None or isinstance(ret, DagsterEvent):
             yield ret
         elif isinstance(ret, ChildProcessEvent):
@@ -329,3 +707,39 @@ def execute_step_out_of_process(
                 errors[ret.pid] = ret.error_info
         else:
             check.failed("Unexpected return value from child process {}".format(type(ret)))
+
+
+def execute_step_in_worker(
+    worker_pool: MultiprocessExecutorWorkerPool,
+    worker: MultiprocessExecutorWorker,
+    step_context,
+    step,
+    errors,
+    known_state,
+    event_waiter=None,
+):
+    yield DagsterEvent.step_worker_starting(
+        step_context,
+        'Sending "{}" to worker process (pid: {}).'.format(step.key, worker.pid),
+        metadata_entries=[],
+    )
+
+    step_failed = False
+    try:
+        for ret in worker.execute_step(step.key, known_state, event_waiter):
+            if ret is None or isinstance(ret, DagsterEvent):
+                if ret is not None and ret.is_step_failure:
+                    step_failed = True
+                yield ret
+            elif isinstance(ret, ChildProcessEvent):
+                if isinstance(ret, ChildProcessSystemErrorEvent):
+                    errors[ret.pid] = ret.error_info
+                    step_failed = True
+            else:
+                check.failed("Unexpected return value from child process {}".format(type(ret)))
+    except ChildProcessCrashException:
+        worker_pool.discard(worker)
+        raise
+
+    # recycle workers after a failure, in case the step left the process in a bad state
+    worker_pool.release(worker, recycle=step_failed)
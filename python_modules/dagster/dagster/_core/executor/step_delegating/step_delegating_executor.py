@@ -1,18 +1,24 @@
 import os
 import sys
-import time
-from typing import Dict, List, Optional, cast
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Sequence, cast
 
 import pendulum
 
 import dagster._check as check
 from dagster._core.events import DagsterEvent, DagsterEventType, EngineEventData, MetadataEntry
+from dagster._core.events.log import EventLogEntry
 from dagster._core.execution.context.system import PlanOrchestrationContext
 from dagster._core.execution.plan.objects import StepFailureData
 from dagster._core.execution.plan.plan import ExecutionPlan
 from dagster._core.execution.plan.step import ExecutionStep
 from dagster._core.execution.retries import RetryMode
-from dagster._core.executor.step_delegating.step_handler.base import StepHandler, StepHandlerContext
+from dagster._core.executor.step_delegating.step_handler.base import (
+    CheckStepHealthResult,
+    StepHandler,
+    StepHandlerContext,
+)
 from dagster._grpc.types import ExecuteStepArgs
 from dagster._utils.error import serializable_error_info_from_exc_info
 
@@ -22,6 +28,15 @@
     os.environ.get("DAGSTER_STEP_DELEGATING_EXECUTOR_SLEEP_SECONDS", "1.0")
 )
 
+# Events that change which steps the executor launches next. The executor wakes up early when one
+# of these is written, and otherwise picks up new events every sleep_seconds.
+STEP_LIFECYCLE_EVENT_TYPES = {
+    DagsterEventType.STEP_OUTPUT,
+    DagsterEventType.STEP_UP_FOR_RETRY,
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.STEP_FAILURE,
+}
+
 
 class StepDelegatingExecutor(Executor):
     """This executor tails the event log for events from the steps that it spins up. It also
@@ -56,18 +71,49 @@ def __init__(
             ),
         )
         self._should_verify_step = should_verify_step
+        self._step_event_written = threading.Event()
 
     @property
     def retries(self):
         return self._retries
 
     def _pop_events(self, instance, run_id) -> List[DagsterEvent]:
-        events = instance.logs_after(run_id, self._event_cursor, of_type=set(DagsterEventType))
-        self._event_cursor += len(events)
-        dagster_events = [event.dagster_event for event in events]
+        connection = instance.get_records_for_run(
+            run_id, self._event_cursor, of_type=set(DagsterEventType)
+        )
+        self._event_cursor = connection.cursor
+        dagster_events = [record.event_log_entry.dagster_event for record in connection.records]
         check.invariant(None not in dagster_events, "Query should not return a non dagster event")
         return dagster_events
 
+    def _on_event_written(self, event_log_entry: EventLogEntry, _cursor: str):
+        if (
+            event_log_entry.dagster_event
+            and event_log_entry.dagster_event.event_type in STEP_LIFECYCLE_EVENT_TYPES
+        ):
+            self._step_event_written.set()
+
+    @contextmanager
+    def _watch_events(self, instance, run_id):
+        """Wakes up the executor when a step lifecycle event is written to the event log, if the
+        event log storage supports watching runs."""
+        self._step_event_written.clear()
+
+        try:
+            instance.watch_event_logs(run_id, self._event_cursor, self._on_event_written)
+        except NotImplementedError:
+            yield
+            return
+
+        try:
+            yield
+        finally:
+            instance.end_watch_event_logs(run_id, self._on_event_written)
+
+    def _wait_for_events(self):
+        self._step_event_written.wait(self._sleep_seconds)
+        self._step_event_written.clear()
+
     def _get_step_handler_context(
         self, plan_context, steps, active_execution
     ) -> StepHandlerContext:
@@ -91,7 +137,7 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
         check.inst_param(plan_context, "plan_context", PlanOrchestrationContext)
         check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
 
-        self._event_cursor = -1  # pylint: disable=attribute-defined-outside-init
+        self._event_cursor: Optional[str] = None  # pylint: disable=attribute-defined-outside-init
 
         DagsterEvent.engine_event(
             plan_context,
@@ -99,7 +145,9 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
             EngineEventData(),
         )
 
-        with execution_plan.start(retry_mode=self.retries) as active_execution:
+        with execution_plan.start(retry_mode=self.retries) as active_execution, self._watch_events(
+            plan_context.instance, plan_context.run_id
+        ):
             running_steps: Dict[str, ExecutionStep] = {}
 
             if plan_context.resume_from_failure:
@@ -231,15 +279,30 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
                     curr_time - last_check_step_health_time
                 ).total_seconds() >= self._check_step_health_interval_seconds:
                     last_check_step_health_time = curr_time
-                    for _, step in running_steps.items():
+                    steps_to_check = list(running_steps.values())
+                    step_handler_contexts = [
+                        self._get_step_handler_context(plan_context, [step], active_execution)
+                        for step in steps_to_check
+                    ]
+
+                    try:
+                        health_check_results: Optional[
+                            Sequence[CheckStepHealthResult]
+                        ] = self._step_handler.check_step_health_batch(step_handler_contexts)
+                    except Exception:
+                        # check each step separately instead, so that any error is reported on
+                        # the step that raised it
+                        health_check_results = None
+
+                    for i, step in enumerate(steps_to_check):
 
                         step_context = plan_context.for_step(step)
 
                         try:
-                            health_check_result = self._step_handler.check_step_health(
-                                self._get_step_handler_context(
-                                    plan_context, [step], active_execution
-                                )
+                            health_check_result = (
+                                health_check_results[i]
+                                if health_check_results is not None
+                                else self._step_handler.check_step_health(step_handler_contexts[i])
                             )
                             if not health_check_result.is_healthy:
                                 DagsterEvent.step_failure_event(
@@ -280,4 +343,5 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
                         )
                     )
 
-                time.sleep(self._sleep_seconds)
+                if not active_execution.is_complete:
+                    self._wait_for_events()
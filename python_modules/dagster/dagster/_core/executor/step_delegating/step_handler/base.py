@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Iterator, List, NamedTuple, Optional
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence
 
 from dagster import DagsterInstance
 from dagster import _check as check
@@ -88,6 +88,17 @@ def launch_step(self, step_handler_context: StepHandlerContext) -> Iterator[Dags
     def check_step_health(self, step_handler_context: StepHandlerContext) -> CheckStepHealthResult:
         pass
 
+    def check_step_health_batch(
+        self, step_handler_contexts: Sequence[StepHandlerContext]
+    ) -> Sequence[CheckStepHealthResult]:
+        """Check the health of several running steps at once, returning a result for each context
+        in order. Step handlers that can look up many steps with a single request should override
+        this - by default, each step is checked separately."""
+        return [
+            self.check_step_health(step_handler_context)
+            for step_handler_context in step_handler_contexts
+        ]
+
     @abstractmethod
     def terminate_step(self, step_handler_context: StepHandlerContext) -> Iterator[DagsterEvent]:
         pass
@@ -1,6 +1,6 @@
 import warnings
 from collections import OrderedDict
-from typing import TYPE_CHECKING, List, Optional, Sequence, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Union
 
 import dagster._check as check
 from dagster._core.definitions.events import AssetKey
@@ -47,17 +47,17 @@ def __init__(
         self.external_repository_data = check.inst_param(
             external_repository_data, "external_repository_data", ExternalRepositoryData
         )
-        self._pipeline_index_map = OrderedDict()
-        self._job_index_map = OrderedDict()
-        for external_pipeline_data in external_repository_data.external_pipeline_datas:
-            key = external_pipeline_data.pipeline_snapshot.name
-            index = PipelineIndex(
-                external_pipeline_data.pipeline_snapshot,
-                external_pipeline_data.parent_pipeline_snapshot,
-            )
-            self._pipeline_index_map[key] = index
-            if external_pipeline_data.is_job:
-                self._job_index_map[key] = index
+        self._pipeline_data_map: Dict[str, ExternalPipelineData] = OrderedDict(
+            (external_pipeline_data.pipeline_snapshot.name, external_pipeline_data)
+            for external_pipeline_data in external_repository_data.external_pipeline_datas
+        )
+        self._job_names = [
+            name
+            for name, external_pipeline_data in self._pipeline_data_map.items()
+            if external_pipeline_data.is_job
+        ]
+        # PipelineIndexes are only built for the pipelines that are used
+        self._pipeline_index_map: Dict[str, PipelineIndex] = {}
 
         self._handle = check.inst_param(repository_handle, "repository_handle", RepositoryHandle)
 
@@ -85,26 +85,39 @@ def __init__(
         # pylint: disable=unsubscriptable-object
         self._asset_jobs: OrderedDict[str, Sequence[ExternalAssetNode]] = OrderedDict(_asset_jobs)
 
+        self._asset_node_map: Dict[AssetKey, ExternalAssetNode] = {}
+        for asset_node in external_repository_data.external_asset_graph_data:
+            self._asset_node_map.setdefault(asset_node.asset_key, asset_node)
+
     @property
     def name(self):
         return self.external_repository_data.name
 
     def get_pipeline_index(self, pipeline_name):
-        return self._pipeline_index_map[pipeline_name]
+        index = self._pipeline_index_map.get(pipeline_name)
+        if index is None:
+            external_pipeline_data = self._pipeline_data_map[pipeline_name]
+            index = PipelineIndex(
+                external_pipeline_data.pipeline_snapshot,
+                external_pipeline_data.parent_pipeline_snapshot,
+            )
+            self._pipeline_index_map[pipeline_name] = index
+        return index
 
     def has_pipeline(self, pipeline_name):
-        return pipeline_name in self._pipeline_index_map
+        return pipeline_name in self._pipeline_data_map
 
     def get_pipeline_indices(self):
-        return self._pipeline_index_map.values()
+        return [self.get_pipeline_index(pipeline_name) for pipeline_name in self._pipeline_data_map]
 
     def has_external_pipeline(self, pipeline_name):
-        return pipeline_name in self._pipeline_index_map
+        return pipeline_name in self._pipeline_data_map
 
     def get_external_schedule(self, schedule_name):
-        return ExternalSchedule(
-            self.external_repository_data.get_external_schedule_data(schedule_name), self._handle
-        )
+        external_schedule_data = self._instigation_map.get(schedule_name)
+        if not isinstance(external_schedule_data, ExternalScheduleData):
+            check.failed("Could not find external schedule data named " + schedule_name)
+        return ExternalSchedule(external_schedule_data, self._handle)
 
     def get_external_schedules(self):
         return [
@@ -113,9 +126,10 @@ def get_external_schedules(self):
         ]
 
     def get_external_sensor(self, sensor_name):
-        return ExternalSensor(
-            self.external_repository_data.get_external_sensor_data(sensor_name), self._handle
-        )
+        external_sensor_data = self._instigation_map.get(sensor_name)
+        if not isinstance(external_sensor_data, ExternalSensorData):
+            check.failed("Could not find sensor data named " + sensor_name)
+        return ExternalSensor(external_sensor_data, self._handle)
 
     def get_external_sensors(self):
         return [
@@ -133,10 +147,10 @@ def has_external_partition_set(self, partition_set_name):
         return partition_set_name in self._partition_set_map
 
     def get_external_partition_set(self, partition_set_name):
-        return ExternalPartitionSet(
-            self.external_repository_data.get_external_partition_set_data(partition_set_name),
-            self._handle,
-        )
+        external_partition_set_data = self._partition_set_map.get(partition_set_name)
+        if external_partition_set_data is None:
+            check.failed("Could not find external partition set data named " + partition_set_name)
+        return ExternalPartitionSet(external_partition_set_data, self._handle)
 
     def get_external_partition_sets(self):
         return [
@@ -147,16 +161,17 @@ def get_external_partition_sets(self):
     def get_full_external_pipeline(self, pipeline_name: str) -> "ExternalPipeline":
         check.str_param(pipeline_name, "pipeline_name")
         return ExternalPipeline(
-            self.external_repository_data.get_external_pipeline_data(pipeline_name),
+            self._pipeline_data_map[pipeline_name],
             repository_handle=self.handle,
             pipeline_index=self.get_pipeline_index(pipeline_name),
         )
 
     def get_all_external_pipelines(self):
-        return [self.get_full_external_pipeline(pn) for pn in self._pipeline_index_map]
+        return [self.get_full_external_pipeline(pn) for pn in self._pipeline_data_map]
 
     def has_external_job(self, job_name):
-        return job_name in self._job_index_map
+        external_pipeline_data = self._pipeline_data_map.get(job_name)
+        return external_pipeline_data is not None and external_pipeline_data.is_job
 
     def get_external_job(self, job_name) -> "ExternalPipeline":
         check.str_param(job_name, "job_name")
@@ -165,13 +180,13 @@ def get_external_job(self, job_name) -> "ExternalPipeline":
             check.failed(f"Could not find job data for {job_name}")
 
         return ExternalPipeline(
-            self.external_repository_data.get_external_pipeline_data(job_name),
+            self._pipeline_data_map[job_name],
             repository_handle=self.handle,
             pipeline_index=self.get_pipeline_index(job_name),
         )
 
     def get_external_jobs(self) -> List["ExternalPipeline"]:
-        return [self.get_external_job(pn) for pn in self._job_index_map]
+        return [self.get_external_job(pn) for pn in self._job_names]
 
     @property
     def handle(self):
@@ -204,12 +219,7 @@ def get_external_asset_nodes(self, job_name=None) -> Sequence[ExternalAssetNode]
         )
 
     def get_external_asset_node(self, asset_key: AssetKey) -> Optional[ExternalAssetNode]:
-        matching = [
-            asset_node
-            for asset_node in self.external_repository_data.external_asset_graph_data
-            if asset_node.asset_key == asset_key
-        ]
-        return matching[0] if matching else None
+        return self._asset_node_map.get(asset_key)
 
     def get_display_metadata(self):
         return self.handle.display_metadata
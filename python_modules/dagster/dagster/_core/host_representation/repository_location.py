@@ -1,9 +1,10 @@
 import datetime
 import sys
 import threading
+import time
 from abc import abstractmethod
 from contextlib import AbstractContextManager
-from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Tuple, Union, cast
 
 import dagster._check as check
 from dagster._api.get_server_id import sync_get_server_id
@@ -71,6 +72,11 @@
     )
     from dagster._core.host_representation.external_data import ExternalSensorExecutionErrorData
 
+# How long the partition names of a partition set are reused before they are fetched from the
+# server again. Partition names can change without the repository being reloaded, e.g. as time
+# window partitions are added, so they are only cached for a short period.
+PARTITION_NAMES_CACHE_TTL_SECONDS = 60
+
 
 class RepositoryLocation(AbstractContextManager):
     """
@@ -531,6 +537,11 @@ def __init__(
         self.server_id = None
         self._external_repositories_data = None
 
+        # (repository name, partition set name) -> (fetch time, partition names)
+        self._partition_names_cache: Dict[
+            Tuple[str, str], Tuple[float, "ExternalPartitionNamesData"]
+        ] = {}
+
         self._executable_path = None
         self._container_image = None
         self._container_context = None
@@ -753,9 +764,18 @@ def get_external_partition_names(
         check.inst_param(repository_handle, "repository_handle", RepositoryHandle)
         check.str_param(partition_set_name, "partition_set_name")
 
-        return sync_get_external_partition_names_grpc(
+        # the partition names are cached on the location, so they are reused across requests until
+        # the location is reloaded with a new repository snapshot, or the cache entry expires
+        cache_key = (repository_handle.repository_name, partition_set_name)
+        cached = self._partition_names_cache.get(cache_key)
+        if cached and time.time() - cached[0] < PARTITION_NAMES_CACHE_TTL_SECONDS:
+            return cached[1]
+
+        partition_names = sync_get_external_partition_names_grpc(
             self.client, repository_handle, partition_set_name
         )
+        self._partition_names_cache[cache_key] = (time.time(), partition_names)
+        return partition_names
 
     def get_external_schedule_execution_data(
         self,
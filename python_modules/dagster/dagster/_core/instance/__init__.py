@@ -104,6 +104,7 @@
     from dagster._core.storage.event_log.base import AssetRecord, EventLogRecord, EventRecordsFilter
     from dagster._core.storage.root import LocalArtifactStorage
     from dagster._core.storage.runs import RunStorage
+    from dagster._core.storage.runs.base import QueuedRunIdsConnection
     from dagster._core.storage.schedules import ScheduleStorage
     from dagster._core.workspace.workspace import IWorkspace
     from dagster._daemon.types import DaemonHeartbeat, DaemonStatus
@@ -330,6 +331,19 @@ def __init__(
 
         self._subscribers: Dict[str, List[Callable]] = defaultdict(list)
 
+        self._event_log_write_buffer = None
+        if self.event_log_buffering_settings.get("enabled", False):
+            from dagster._core.storage.event_log import EventLogWriteBuffer
+
+            self._event_log_write_buffer = EventLogWriteBuffer(
+                self._event_storage,
+                max_batch_size=self.event_log_buffering_settings.get("max_batch_size"),
+                flush_interval_seconds=self.event_log_buffering_settings.get(
+                    "flush_interval_seconds"
+                ),
+                max_buffered_events=self.event_log_buffering_settings.get("max_buffered_events"),
+            )
+
         run_monitoring_enabled = self.run_monitoring_settings.get("enabled", False)
         if run_monitoring_enabled and not self.run_launcher.supports_check_run_worker_health:
             run_monitoring_enabled = False
@@ -694,6 +708,12 @@ def run_retries_enabled(self) -> bool:
     def run_retries_max_retries(self) -> int:
         return self.get_settings("run_retries").get("max_retries")
 
+    # event log buffering
+
+    @property
+    def event_log_buffering_settings(self) -> Dict:
+        return self.get_settings("event_log_buffering")
+
     # python logs
 
     @property
@@ -741,6 +761,8 @@ def reindex(self, print_fn=lambda _: None):
         print_fn("Done.")
 
     def dispose(self):
+        if self._event_log_write_buffer:
+            self._event_log_write_buffer.dispose()
         self._run_storage.dispose()
         self.run_coordinator.dispose()
         self._run_launcher.dispose()
@@ -892,6 +914,7 @@ def create_run_for_pipeline(
             parent_pipeline_snapshot=pipeline_def.get_parent_pipeline_snapshot(),
             external_pipeline_origin=external_pipeline_origin,
             pipeline_code_origin=pipeline_code_origin,
+            pipeline_snapshot_id=pipeline_def.get_pipeline_snapshot_id(),
         )
 
     def _construct_run_with_snapshots(
@@ -913,6 +936,8 @@ def _construct_run_with_snapshots(
         solid_selection=None,
         external_pipeline_origin=None,
         pipeline_code_origin=None,
+        pipeline_snapshot_id=None,
+        persisted_snapshot_ids=None,
     ):
 
         # https://github.com/dagster-io/dagster/issues/2403
@@ -928,14 +953,22 @@ def _construct_run_with_snapshots(
         )
 
         pipeline_snapshot_id = (
-            self._ensure_persisted_pipeline_snapshot(pipeline_snapshot, parent_pipeline_snapshot)
+            self._ensure_persisted_pipeline_snapshot(
+                pipeline_snapshot,
+                parent_pipeline_snapshot,
+                persisted_snapshot_ids,
+                pipeline_snapshot_id,
+            )
             if pipeline_snapshot
             else None
         )
 
         execution_plan_snapshot_id = (
             self._ensure_persisted_execution_plan_snapshot(
-                execution_plan_snapshot, pipeline_snapshot_id, step_keys_to_execute
+                execution_plan_snapshot,
+                pipeline_snapshot_id,
+                step_keys_to_execute,
+                persisted_snapshot_ids,
             )
             if execution_plan_snapshot and pipeline_snapshot_id
             else None
@@ -960,15 +993,27 @@ def _construct_run_with_snapshots(
             pipeline_code_origin=pipeline_code_origin,
         )
 
-    def _ensure_persisted_pipeline_snapshot(self, pipeline_snapshot, parent_pipeline_snapshot):
+    def _ensure_persisted_pipeline_snapshot(
+        self,
+        pipeline_snapshot,
+        parent_pipeline_snapshot,
+        persisted_snapshot_ids=None,
+        pipeline_snapshot_id=None,
+    ):
         from dagster._core.snap import PipelineSnapshot, create_pipeline_snapshot_id
 
         check.inst_param(pipeline_snapshot, "pipeline_snapshot", PipelineSnapshot)
         check.opt_inst_param(parent_pipeline_snapshot, "parent_pipeline_snapshot", PipelineSnapshot)
+        check.opt_set_param(persisted_snapshot_ids, "persisted_snapshot_ids", of_type=str)
+        check.opt_str_param(pipeline_snapshot_id, "pipeline_snapshot_id")
+
+        if persisted_snapshot_ids is None:
+            persisted_snapshot_ids = set()
 
         if pipeline_snapshot.lineage_snapshot:
-            if not self._run_storage.has_pipeline_snapshot(
-                pipeline_snapshot.lineage_snapshot.parent_snapshot_id
+            parent_snapshot_id = pipeline_snapshot.lineage_snapshot.parent_snapshot_id
+            if parent_snapshot_id not in persisted_snapshot_ids and (
+                not self._run_storage.has_pipeline_snapshot(parent_snapshot_id)
             ):
                 check.invariant(
                     create_pipeline_snapshot_id(parent_pipeline_snapshot)
@@ -977,24 +1022,35 @@ def _ensure_persisted_pipeline_snapshot(self, pipeline_snapshot, parent_pipeline
                 )
 
                 returned_pipeline_snapshot_id = self._run_storage.add_pipeline_snapshot(
-                    parent_pipeline_snapshot
+                    parent_pipeline_snapshot, parent_snapshot_id
                 )
                 check.invariant(
                     pipeline_snapshot.lineage_snapshot.parent_snapshot_id
                     == returned_pipeline_snapshot_id
                 )
-
-        pipeline_snapshot_id = create_pipeline_snapshot_id(pipeline_snapshot)
-        if not self._run_storage.has_pipeline_snapshot(pipeline_snapshot_id):
+            persisted_snapshot_ids.add(parent_snapshot_id)
+
+        # callers that hold the snapshot id already, e.g. on the pipeline index of a definition, pass
+        # it in so that the snapshot is not serialized and hashed again for every run
+        if pipeline_snapshot_id is None:
+            pipeline_snapshot_id = create_pipeline_snapshot_id(pipeline_snapshot)
+        if pipeline_snapshot_id not in persisted_snapshot_ids and (
+            not self._run_storage.has_pipeline_snapshot(pipeline_snapshot_id)
+        ):
             returned_pipeline_snapshot_id = self._run_storage.add_pipeline_snapshot(
-                pipeline_snapshot
+                pipeline_snapshot, pipeline_snapshot_id
             )
             check.invariant(pipeline_snapshot_id == returned_pipeline_snapshot_id)
+        persisted_snapshot_ids.add(pipeline_snapshot_id)
 
         return pipeline_snapshot_id
 
     def _ensure_persisted_execution_plan_snapshot(
-        self, execution_plan_snapshot, pipeline_snapshot_id, step_keys_to_execute
+        self,
+        execution_plan_snapshot,
+        pipeline_snapshot_id,
+        step_keys_to_execute,
+        persisted_snapshot_ids=None,
     ):
         from dagster._core.snap.execution_plan_snapshot import (
             ExecutionPlanSnapshot,
@@ -1004,6 +1060,10 @@ def _ensure_persisted_execution_plan_snapshot(
         check.inst_param(execution_plan_snapshot, "execution_plan_snapshot", ExecutionPlanSnapshot)
         check.str_param(pipeline_snapshot_id, "pipeline_snapshot_id")
         check.opt_nullable_list_param(step_keys_to_execute, "step_keys_to_execute", of_type=str)
+        check.opt_set_param(persisted_snapshot_ids, "persisted_snapshot_ids", of_type=str)
+
+        if persisted_snapshot_ids is None:
+            persisted_snapshot_ids = set()
 
         check.invariant(
             execution_plan_snapshot.pipeline_snapshot_id == pipeline_snapshot_id,
@@ -1019,12 +1079,15 @@ def _ensure_persisted_execution_plan_snapshot(
 
         execution_plan_snapshot_id = create_execution_plan_snapshot_id(execution_plan_snapshot)
 
-        if not self._run_storage.has_execution_plan_snapshot(execution_plan_snapshot_id):
+        if execution_plan_snapshot_id not in persisted_snapshot_ids and (
+            not self._run_storage.has_execution_plan_snapshot(execution_plan_snapshot_id)
+        ):
             returned_execution_plan_snapshot_id = self._run_storage.add_execution_plan_snapshot(
-                execution_plan_snapshot
+                execution_plan_snapshot, execution_plan_snapshot_id
             )
 
             check.invariant(execution_plan_snapshot_id == returned_execution_plan_snapshot_id)
+        persisted_snapshot_ids.add(execution_plan_snapshot_id)
 
         return execution_plan_snapshot_id
 
@@ -1063,6 +1126,7 @@ def create_run(
         solid_selection=None,
         external_pipeline_origin=None,
         pipeline_code_origin=None,
+        pipeline_snapshot_id=None,
     ):
 
         pipeline_run = self._construct_run_with_snapshots(
@@ -1083,6 +1147,7 @@ def create_run(
             parent_pipeline_snapshot=parent_pipeline_snapshot,
             external_pipeline_origin=external_pipeline_origin,
             pipeline_code_origin=pipeline_code_origin,
+            pipeline_snapshot_id=pipeline_snapshot_id,
         )
 
         pipeline_run = self._run_storage.add_run(pipeline_run)
@@ -1092,6 +1157,32 @@ def create_run(
 
         return pipeline_run
 
+    def create_runs(self, runs_to_create: Sequence[Mapping[str, Any]]) -> List[DagsterRun]:
+        """Create several runs at once, each described by the keyword arguments that
+        :py:meth:`create_run` accepts.
+
+        Snapshots shared by the runs are only checked and persisted once, and the runs are added to
+        run storage together.
+        """
+        check.sequence_param(runs_to_create, "runs_to_create", of_type=Mapping)
+
+        persisted_snapshot_ids: Set[str] = set()
+        pipeline_runs = [
+            self._construct_run_with_snapshots(
+                **run_kwargs, persisted_snapshot_ids=persisted_snapshot_ids
+            )
+            for run_kwargs in runs_to_create
+        ]
+        pipeline_runs = self._run_storage.add_runs(pipeline_runs)
+
+        for pipeline_run, run_kwargs in zip(pipeline_runs, runs_to_create):
+            if run_kwargs.get("execution_plan_snapshot"):
+                self._log_asset_materialization_planned_events(
+                    pipeline_run, run_kwargs["execution_plan_snapshot"]
+                )
+
+        return pipeline_runs
+
     def create_reexecuted_run(
         self,
         parent_run: DagsterRun,
@@ -1281,6 +1372,21 @@ def get_runs(
     ) -> Iterable[PipelineRun]:
         return self._run_storage.get_runs(filters, cursor, limit, bucket_by)
 
+    @traced
+    def get_run_ids(
+        self,
+        filters: Optional[RunsFilter] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[str]:
+        return self._run_storage.get_run_ids(filters, cursor, limit)
+
+    @traced
+    def get_queued_run_ids(
+        self, cursor: Optional[str] = None, limit: Optional[int] = None
+    ) -> "QueuedRunIdsConnection":
+        return self._run_storage.get_queued_run_ids(cursor=cursor, limit=limit)
+
     @traced
     def get_runs_count(self, filters: Optional[RunsFilter] = None) -> int:
         return self._run_storage.get_runs_count(filters)
@@ -1349,6 +1455,7 @@ def logs_after(
         of_type: Optional["DagsterEventType"] = None,
         limit: Optional[int] = None,
     ):
+        self.flush_buffered_events()
         return self._event_storage.get_logs_for_run(
             run_id,
             cursor=cursor,
@@ -1360,6 +1467,7 @@ def logs_after(
     def all_logs(
         self, run_id, of_type: Optional[Union["DagsterEventType", Set["DagsterEventType"]]] = None
     ):
+        self.flush_buffered_events()
         return self._event_storage.get_logs_for_run(run_id, of_type=of_type)
 
     @traced
@@ -1370,6 +1478,7 @@ def get_records_for_run(
         of_type: Optional[Union["DagsterEventType", Set["DagsterEventType"]]] = None,
         limit: Optional[int] = None,
     ):
+        self.flush_buffered_events()
         return self._event_storage.get_records_for_run(run_id, cursor, of_type, limit)
 
     def watch_event_logs(self, run_id, cursor, cb):
@@ -1420,6 +1529,7 @@ def get_event_records(
         Returns:
             List[EventLogRecord]: List of event log records stored in the event log storage.
         """
+        self.flush_buffered_events()
         return self._event_storage.get_event_records(event_records_filter, limit, ascending)
 
     @public
@@ -1447,6 +1557,12 @@ def get_materialization_count_by_partition(
     ) -> Mapping[AssetKey, Mapping[str, int]]:
         return self._event_storage.get_materialization_count_by_partition(asset_keys)
 
+    @traced
+    def get_latest_materialization_by_partition(
+        self, asset_key: AssetKey, partitions: Optional[Sequence[str]] = None
+    ) -> Mapping[str, "EventLogRecord"]:
+        return self._event_storage.get_latest_materialization_by_partition(asset_key, partitions)
+
     # event subscriptions
 
     def _get_yaml_python_handlers(self):
@@ -1492,7 +1608,10 @@ def store_event(self, event):
     def handle_new_event(self, event):
         run_id = event.run_id
 
-        self._event_storage.store_event(event)
+        if self._event_log_write_buffer:
+            self._event_log_write_buffer.write(event)
+        else:
+            self._event_storage.store_event(event)
 
         if event.is_dagster_event and event.dagster_event.is_pipeline_event:
             self._run_storage.handle_run_event(run_id, event.dagster_event)
@@ -1500,6 +1619,11 @@ def handle_new_event(self, event):
         for sub in self._subscribers[run_id]:
             sub(event)
 
+    def flush_buffered_events(self):
+        """Write any events held back by event log buffering to the event log storage."""
+        if self._event_log_write_buffer:
+            self._event_log_write_buffer.flush()
+
     def add_event_listener(self, run_id, cb):
         self._subscribers[run_id].append(cb)
 
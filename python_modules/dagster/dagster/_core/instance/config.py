@@ -225,6 +225,40 @@ def sensors_daemon_config():
     )
 
 
+def schedules_daemon_config():
+    return Field(
+        {
+            "use_threads": Field(Bool, is_required=False, default_value=False),
+            "num_workers": Field(int, is_required=False),
+            "num_workers_per_location": Field(int, is_required=False),
+        },
+        is_required=False,
+    )
+
+
+def backfills_daemon_config():
+    return Field(
+        {
+            "use_threads": Field(Bool, is_required=False, default_value=False),
+            "num_workers": Field(int, is_required=False),
+            "num_submit_workers": Field(int, is_required=False),
+        },
+        is_required=False,
+    )
+
+
+def event_log_buffering_config_schema():
+    return Field(
+        {
+            "enabled": Field(Bool, is_required=False, default_value=False),
+            "max_batch_size": Field(int, is_required=False),
+            "flush_interval_seconds": Field(float, is_required=False),
+            "max_buffered_events": Field(int, is_required=False),
+        },
+        is_required=False,
+    )
+
+
 def dagster_instance_config_schema():
     return {
         "local_artifact_storage": config_field_for_configurable_class(),
@@ -264,4 +298,7 @@ def dagster_instance_config_schema():
         ),
         "retention": retention_config_schema(),
         "sensors": sensors_daemon_config(),
+        "schedules": schedules_daemon_config(),
+        "backfills": backfills_daemon_config(),
+        "event_log_buffering": event_log_buffering_config_schema(),
     }
@@ -376,6 +376,9 @@ def from_dir(base_dir, config_filename=DAGSTER_CONFIG_YAML_FILENAME, overrides=N
             "code_servers",
             "retention",
             "sensors",
+            "schedules",
+            "backfills",
+            "event_log_buffering",
         }
         settings = {key: config_value.get(key) for key in settings_keys if config_value.get(key)}
 
@@ -0,0 +1,25 @@
+"""add asset partitions table
+
+Revision ID: b4f47d573dcd
+Revises: 5e139331e376
+Create Date: 2022-06-14 10:21:07.193471
+
+"""
+from dagster._core.storage.migration.utils import (
+    create_asset_partitions_table,
+    drop_asset_partitions_table,
+)
+
+# revision identifiers, used by Alembic.
+revision = "b4f47d573dcd"
+down_revision = "5e139331e376"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    create_asset_partitions_table()
+
+
+def downgrade():
+    drop_asset_partitions_table()
@@ -0,0 +1,25 @@
+"""add partition statuses table
+
+Revision ID: 0f2e6d5e437e
+Revises: b4f47d573dcd
+Create Date: 2022-06-16 14:02:38.512908
+
+"""
+from dagster._core.storage.migration.utils import (
+    create_partition_statuses_table,
+    drop_partition_statuses_table,
+)
+
+# revision identifiers, used by Alembic.
+revision = "0f2e6d5e437e"
+down_revision = "b4f47d573dcd"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    create_partition_statuses_table()
+
+
+def downgrade():
+    drop_partition_statuses_table()
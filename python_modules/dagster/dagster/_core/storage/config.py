@@ -32,4 +32,17 @@ def pg_config():
             is_required=False,
         ),
         "should_autocreate_tables": Field(bool, is_required=False, default_value=True),
+        "pool": Field(
+            {
+                "pool_size": Field(IntSource, is_required=False, default_value=5),
+                "max_overflow": Field(IntSource, is_required=False, default_value=0),
+                "pool_recycle": Field(IntSource, is_required=False, default_value=3600),
+                "pool_timeout": Field(IntSource, is_required=False, default_value=30),
+            },
+            is_required=False,
+            description=(
+                "Hold a bounded pool of open connections per process, instead of opening a new "
+                "connection for each query."
+            ),
+        ),
     }
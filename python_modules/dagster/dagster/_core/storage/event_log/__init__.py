@@ -11,3 +11,4 @@
 from .schema import AssetKeyTable, SqlEventLogStorageMetadata, SqlEventLogStorageTable
 from .sql_event_log import SqlEventLogStorage
 from .sqlite import ConsolidatedSqliteEventLogStorage, SqliteEventLogStorage
+from .write_buffer import EventLogWriteBuffer
@@ -2,7 +2,18 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
 from enum import Enum
-from typing import Callable, Iterable, List, Mapping, NamedTuple, Optional, Sequence, Set, Union
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Union,
+)
 
 import dagster._check as check
 from dagster._annotations import PublicAttr
@@ -275,6 +286,16 @@ def store_event(self, event: EventLogEntry):
             event (EventLogEntry): The event to store.
         """
 
+    def store_events(self, events: Sequence[EventLogEntry]):
+        """Store a batch of events, in order. Storages that can write several events in a single
+        round-trip should override this method; by default, each event is stored individually.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        for event in check.sequence_param(events, "events", of_type=EventLogEntry):
+            self.store_event(event)
+
     @abstractmethod
     def delete_events(self, run_id: str):
         """Remove events for a given run id"""
@@ -397,5 +418,32 @@ def get_materialization_count_by_partition(
     ) -> Mapping[AssetKey, Mapping[str, int]]:
         pass
 
+    def get_latest_materialization_by_partition(
+        self, asset_key: AssetKey, partitions: Optional[Sequence[str]] = None
+    ) -> Mapping[str, EventLogRecord]:
+        """Fetch the latest materialization record of each partition of an asset.
+
+        Args:
+            asset_key (AssetKey): The asset to fetch materializations for.
+            partitions (Optional[Sequence[str]]): The partitions to fetch materializations for. If
+                not provided, fetches the latest materialization of every materialized partition.
+
+        Returns:
+            Mapping[str, EventLogRecord]: The latest materialization record by partition, for the
+                partitions that have been materialized since the asset was last wiped.
+        """
+        latest_by_partition: Dict[str, EventLogRecord] = {}
+        for record in self.get_event_records(
+            EventRecordsFilter(
+                event_type=DagsterEventType.ASSET_MATERIALIZATION,
+                asset_key=asset_key,
+                asset_partitions=list(partitions) if partitions is not None else None,
+            )
+        ):
+            partition = record.event_log_entry.dagster_event.partition
+            if partition is not None and partition not in latest_by_partition:
+                latest_by_partition[partition] = record
+        return latest_by_partition
+
     def alembic_version(self):
         return None
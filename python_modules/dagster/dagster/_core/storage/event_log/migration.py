@@ -2,17 +2,28 @@
 from tqdm import tqdm
 
 from dagster import AssetKey
+from dagster._core.errors import DagsterInvariantViolationError
 from dagster._core.events.log import EventLogEntry
 from dagster._serdes import deserialize_json_to_dagster_namedtuple
 from dagster._utils import utc_datetime_from_timestamp
 
 SECONDARY_INDEX_ASSET_KEY = "asset_key_table"  # builds the asset key table from the event log
 ASSET_KEY_INDEX_COLS = "asset_key_index_columns"  # extracts index columns from the asset_keys table
+ASSET_PARTITIONS_INDEX = (
+    "asset_partitions_index"  # builds the asset partitions table from the event log
+)
+
+# Upper bound on the number of rows written by a single multi-row insert when building the asset
+# partitions index, which keeps the number of bound parameters under the SQLite default limit of 999
+ASSET_PARTITIONS_INSERT_BATCH_SIZE = 300
 
 EVENT_LOG_DATA_MIGRATIONS = {
     SECONDARY_INDEX_ASSET_KEY: lambda: migrate_asset_key_data,
 }
-ASSET_DATA_MIGRATIONS = {ASSET_KEY_INDEX_COLS: lambda: migrate_asset_keys_index_columns}
+ASSET_DATA_MIGRATIONS = {
+    ASSET_KEY_INDEX_COLS: lambda: migrate_asset_keys_index_columns,
+    ASSET_PARTITIONS_INDEX: lambda: migrate_asset_partitions_data,
+}
 
 
 def migrate_event_log_data(instance=None):
@@ -163,6 +174,91 @@ def migrate_asset_keys_index_columns(event_log_storage, print_fn=None):
                 )
 
 
+def migrate_asset_partitions_data(event_log_storage, print_fn=None):
+    """
+    Utility method to build the index of the latest materialization of each asset partition from
+    the data in existing event log records, ignoring materializations that precede an asset wipe.
+    Takes in event_log_storage, and a print_fn to keep track of progress.
+    """
+    from dagster._core.events import DagsterEventType
+    from dagster._core.storage.event_log.sql_event_log import SqlEventLogStorage
+
+    from .schema import AssetPartitionsTable, SqlEventLogStorageTable
+
+    if not isinstance(event_log_storage, SqlEventLogStorage):
+        return
+
+    with event_log_storage.index_connection() as conn:
+        if AssetPartitionsTable.name not in db.inspect(conn).get_table_names():
+            raise DagsterInvariantViolationError(
+                f"Cannot run data migration {ASSET_PARTITIONS_INDEX}: the "
+                f"{AssetPartitionsTable.name} table does not exist. Run `dagster instance migrate` "
+                "to update the schema of your event log storage."
+            )
+
+        if print_fn:
+            print_fn("Querying asset partition materializations.")
+
+        materialization_filter = db.and_(
+            SqlEventLogStorageTable.c.dagster_event_type
+            == DagsterEventType.ASSET_MATERIALIZATION.value,
+            SqlEventLogStorageTable.c.asset_key != None,
+            SqlEventLogStorageTable.c.partition != None,
+        )
+        asset_keys = list(
+            {
+                AssetKey.from_db_string(asset_key_str)
+                for (asset_key_str,) in conn.execute(
+                    db.select([SqlEventLogStorageTable.c.asset_key])
+                    .where(materialization_filter)
+                    .group_by(SqlEventLogStorageTable.c.asset_key)
+                ).fetchall()
+            }
+        )
+
+    query = (
+        db.select(
+            [
+                SqlEventLogStorageTable.c.asset_key,
+                SqlEventLogStorageTable.c.partition,
+                db.func.max(SqlEventLogStorageTable.c.id),
+            ]
+        )
+        .where(materialization_filter)
+        .group_by(SqlEventLogStorageTable.c.asset_key, SqlEventLogStorageTable.c.partition)
+    )
+    query = event_log_storage._add_assets_wipe_filter_to_query(  # pylint: disable=protected-access
+        query,
+        event_log_storage._get_assets_details(asset_keys),  # pylint: disable=protected-access
+        asset_keys,
+    )
+
+    with event_log_storage.index_connection() as conn:
+        # legacy and current serializations of the same asset key are grouped separately
+        latest_by_partition = {}
+        for asset_key_str, partition, storage_id in conn.execute(query).fetchall():
+            key = (AssetKey.from_db_string(asset_key_str).to_string(), partition)
+            latest_by_partition[key] = max(storage_id, latest_by_partition.get(key, storage_id))
+
+        if print_fn:
+            print_fn(f"Found {len(latest_by_partition)} asset partitions to index.")
+
+        conn.execute(AssetPartitionsTable.delete())  # pylint: disable=no-value-for-parameter
+        rows = [
+            dict(asset_key=asset_key_str, partition=partition, last_materialization_storage_id=id_)
+            for (asset_key_str, partition), id_ in latest_by_partition.items()
+        ]
+        batches = range(0, len(rows), ASSET_PARTITIONS_INSERT_BATCH_SIZE)
+        if print_fn:
+            batches = tqdm(batches)
+        for i in batches:
+            conn.execute(
+                AssetPartitionsTable.insert().values(  # pylint: disable=no-value-for-parameter
+                    rows[i : i + ASSET_PARTITIONS_INSERT_BATCH_SIZE]
+                )
+            )
+
+
 def sql_asset_event_generator(conn, cursor=None, batch_size=1000):
     from .schema import SqlEventLogStorageTable
 
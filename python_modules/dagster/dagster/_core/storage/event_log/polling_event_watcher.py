@@ -1,14 +1,27 @@
+import logging
 import threading
-from typing import Callable, List, MutableMapping, NamedTuple, Optional
+import time
+from collections import defaultdict
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence
 
 import dagster._check as check
+from dagster._core.events import DagsterEventType
 from dagster._core.events.log import EventLogEntry
-from dagster._core.storage.event_log.base import EventLogCursor
+from dagster._core.storage.event_log.base import EventLogCursor, EventLogRecord
 
 from .sql_event_log import SqlEventLogStorage
 
 POLLING_CADENCE = 0.1  # 100 ms
 
+# Runs that have finished are polled with exponential backoff, up to this interval
+MAX_FINISHED_RUN_POLLING_CADENCE = 5.0
+
+RUN_TERMINAL_EVENT_TYPES = {
+    DagsterEventType.RUN_SUCCESS,
+    DagsterEventType.RUN_FAILURE,
+    DagsterEventType.RUN_CANCELED,
+}
+
 
 class CallbackAfterCursor(NamedTuple):
     """Callback passed from Observer class in event polling
@@ -23,13 +36,15 @@ class CallbackAfterCursor(NamedTuple):
 
 
 class SqlPollingEventWatcher:
-    """Event Log Watcher that uses a multithreaded polling approach to retrieving new events for run_ids
-    This class' job is to manage a collection of threads that each poll the event log for a given run_id
-    Uses one thread (SqlPollingRunIdEventWatcherThread) per watched run_id
+    """Event Log Watcher that polls the event log for new events for every watched run_id from a
+    single thread (SqlPollingEventWatcherThread).
+
+    Each tick issues one query for all of the runs that are due to be polled, and fans the
+    resulting records out to the callbacks registered for each run.
 
     LOCKING INFO:
-        ORDER: _dict_lock -> run_id_thread.callback_fn_list_lock
-        INVARIANTS: _dict_lock protects _run_id_to_watcher_dict
+        INVARIANTS: _dict_lock protects _run_id_to_watched_run_dict, the callback lists of the
+            watched runs, and _watcher_thread
     """
 
     def __init__(self, event_log_storage: SqlEventLogStorage):
@@ -37,15 +52,16 @@ def __init__(self, event_log_storage: SqlEventLogStorage):
             event_log_storage, "event_log_storage", SqlEventLogStorage
         )
 
-        # INVARIANT: dict_lock protects _run_id_to_watcher_dict
+        # INVARIANT: dict_lock protects _run_id_to_watched_run_dict
         self._dict_lock: threading.Lock = threading.Lock()
-        self._run_id_to_watcher_dict: MutableMapping[str, SqlPollingRunIdEventWatcherThread] = {}
+        self._run_id_to_watched_run_dict: Dict[str, SqlPollingWatchedRun] = {}
+        self._watcher_thread: Optional[SqlPollingEventWatcherThread] = None
         self._disposed = False
 
     def has_run_id(self, run_id: str) -> bool:
         run_id = check.str_param(run_id, "run_id")
         with self._dict_lock:
-            _has_run_id = run_id in self._run_id_to_watcher_dict
+            _has_run_id = run_id in self._run_id_to_watched_run_dict
         return _has_run_id
 
     def watch_run(
@@ -55,65 +71,97 @@ def watch_run(
         cursor = check.opt_str_param(cursor, "cursor")
         callback = check.callable_param(callback, "callback")
         with self._dict_lock:
-            if run_id not in self._run_id_to_watcher_dict:
-                self._run_id_to_watcher_dict[run_id] = SqlPollingRunIdEventWatcherThread(
-                    self._event_log_storage, run_id
-                )
-                self._run_id_to_watcher_dict[run_id].daemon = True
-                self._run_id_to_watcher_dict[run_id].start()
-            self._run_id_to_watcher_dict[run_id].add_callback(cursor, callback)
+            if run_id not in self._run_id_to_watched_run_dict:
+                self._run_id_to_watched_run_dict[run_id] = SqlPollingWatchedRun(run_id, cursor)
+            self._run_id_to_watched_run_dict[run_id].add_callback(cursor, callback)
+
+            if self._watcher_thread is None:
+                self._watcher_thread = SqlPollingEventWatcherThread(self)
+                self._watcher_thread.daemon = True
+                self._watcher_thread.start()
 
     def unwatch_run(self, run_id: str, handler: Callable[[EventLogEntry, str], None]):
         run_id = check.str_param(run_id, "run_id")
         handler = check.callable_param(handler, "handler")
         with self._dict_lock:
-            if run_id in self._run_id_to_watcher_dict:
-                self._run_id_to_watcher_dict[run_id].remove_callback(handler)
-                if self._run_id_to_watcher_dict[run_id].should_thread_exit.is_set():
-                    del self._run_id_to_watcher_dict[run_id]
+            if run_id in self._run_id_to_watched_run_dict:
+                self._run_id_to_watched_run_dict[run_id].remove_callback(handler)
+                if not self._run_id_to_watched_run_dict[run_id].callbacks:
+                    del self._run_id_to_watched_run_dict[run_id]
+
+    def poll(self):
+        """Fetch new events for every watched run that is due to be polled, and fire the callbacks
+        registered for each run on them.
+        """
+        now = time.time()
+        with self._dict_lock:
+            due_runs = [
+                watched_run
+                for watched_run in self._run_id_to_watched_run_dict.values()
+                if watched_run.next_poll_time <= now
+            ]
+        if not due_runs:
+            return
+
+        records_by_run_id: Dict[str, List[EventLogRecord]] = defaultdict(list)
+        for record in self._event_log_storage.get_records_for_run_ids(
+            [watched_run.run_id for watched_run in due_runs],
+            after_cursor=min(watched_run.storage_id for watched_run in due_runs),
+        ):
+            records_by_run_id[record.event_log_entry.run_id].append(record)
+
+        for watched_run in due_runs:
+            with self._dict_lock:
+                callbacks = list(watched_run.callbacks)
+            watched_run.handle_records(records_by_run_id[watched_run.run_id], callbacks, now)
+
+    def should_watcher_thread_exit(self, watcher_thread: "SqlPollingEventWatcherThread") -> bool:
+        """Called by the watcher thread between ticks; detaches it once no runs are watched, so
+        that the next call to `watch_run` starts a new thread.
+        """
+        with self._dict_lock:
+            if self._disposed or not self._run_id_to_watched_run_dict:
+                if self._watcher_thread is watcher_thread:
+                    self._watcher_thread = None
+                return True
+            return False
 
     def __del__(self):
         self.close()
 
     def close(self):
         if not self._disposed:
-            self._disposed = True
             with self._dict_lock:
-                for watcher_thread in self._run_id_to_watcher_dict.values():
-                    if not watcher_thread.should_thread_exit.is_set():
-                        watcher_thread.should_thread_exit.set()
-                for run_id in self._run_id_to_watcher_dict:
-                    self._run_id_to_watcher_dict[run_id].join()
-                del self._run_id_to_watcher_dict
+                self._disposed = True
+                watcher_thread = self._watcher_thread
+                self._watcher_thread = None
+                self._run_id_to_watched_run_dict = {}
 
+            if watcher_thread:
+                watcher_thread.should_thread_exit.set()
+                if watcher_thread is not threading.current_thread():
+                    watcher_thread.join()
 
-class SqlPollingRunIdEventWatcherThread(threading.Thread):
-    """subclass of Thread that watches a given run_id for new Events by polling every POLLING_CADENCE
 
-    Holds a list of callbacks (_callback_fn_list) each passed in by an `Observer`. Note that
-        the callbacks have a cursor associated; this means that the callbacks should be
-        only executed on EventLogEntrys with an associated id >= callback.cursor
-    Exits when `self.should_thread_exit` is set.
-
-    LOCKING INFO:
-        INVARIANTS: _callback_fn_list_lock protects _callback_fn_list
+class SqlPollingWatchedRun:
+    """The polling state of a watched run_id: the callbacks registered for it, the storage id of
+    the last record fetched, and when it should next be polled.
 
+    Holds a list of callbacks (callbacks) each passed in by an `Observer`. Note that the callbacks
+        have a cursor associated; this means that the callbacks should be only executed on
+        EventLogEntrys with an associated id >= callback.cursor
     """
 
-    def __init__(self, event_log_storage: SqlEventLogStorage, run_id: str):
-        super(SqlPollingRunIdEventWatcherThread, self).__init__()
-        self._event_log_storage = check.inst_param(
-            event_log_storage, "event_log_storage", SqlEventLogStorage
-        )
-        self._run_id = check.str_param(run_id, "run_id")
-        self._callback_fn_list_lock: threading.Lock = threading.Lock()
-        self._callback_fn_list: List[CallbackAfterCursor] = []
-        self._should_thread_exit = threading.Event()
-        self.name = f"mysql-event-watch-run-id-{self._run_id}"
+    def __init__(self, run_id: str, cursor: Optional[str]):
+        self.run_id = check.str_param(run_id, "run_id")
+        self.callbacks: List[CallbackAfterCursor] = []
 
-    @property
-    def should_thread_exit(self) -> threading.Event:
-        return self._should_thread_exit
+        # start from the first watcher's cursor, rather than re-reading the whole run
+        self.storage_id = EventLogCursor.parse(cursor).storage_id() if cursor is not None else -1
+        self.next_poll_time = 0.0
+        self._has_polled = False
+        self._is_finished = False
+        self._polling_interval = POLLING_CADENCE
 
     def add_callback(self, cursor: Optional[str], callback: Callable[[EventLogEntry, str], None]):
         """Observer has started watching this run.
@@ -125,48 +173,102 @@ def add_callback(self, cursor: Optional[str], callback: Callable[[EventLogEntry,
         """
         cursor = check.opt_str_param(cursor, "cursor")
         callback = check.callable_param(callback, "callback")
-        with self._callback_fn_list_lock:
-            self._callback_fn_list.append(CallbackAfterCursor(cursor, callback))
+        self.callbacks.append(CallbackAfterCursor(cursor, callback))
+
+        if not self._has_polled:
+            self.storage_id = min(
+                self.storage_id,
+                EventLogCursor.parse(cursor).storage_id() if cursor is not None else -1,
+            )
+
+        # pick up the new watcher's events on the next tick
+        self.next_poll_time = 0.0
+        self._polling_interval = POLLING_CADENCE
 
     def remove_callback(self, callback: Callable[[EventLogEntry, str], None]):
         """Observer has stopped watching this run;
             Remove a callback from the list of callbacks to execute on new EventLogEntrys
 
-            Also kill thread if no callbacks remaining (i.e. no Observers are watching this run_id)
-
         Args:
             callback (Callable[[EventLogEntry, str], None]): callback to remove from list of callbacks
         """
         callback = check.callable_param(callback, "callback")
-        with self._callback_fn_list_lock:
-            self._callback_fn_list = [
-                callback_with_cursor
-                for callback_with_cursor in self._callback_fn_list
-                if callback_with_cursor.callback != callback
-            ]
-            if not self._callback_fn_list:
-                self._should_thread_exit.set()
+        self.callbacks = [
+            callback_with_cursor
+            for callback_with_cursor in self.callbacks
+            if callback_with_cursor.callback != callback
+        ]
+
+    def handle_records(
+        self,
+        records: Sequence[EventLogRecord],
+        callbacks: Sequence[CallbackAfterCursor],
+        poll_time: float,
+    ):
+        """Fire each callback (taking into account the callback.cursor) on the records fetched for
+        this run, and schedule the next poll.
+        """
+        self._has_polled = True
+        new_records = [record for record in records if record.storage_id > self.storage_id]
+        for event_record in new_records:
+            for callback_with_cursor in callbacks:
+                if (
+                    callback_with_cursor.cursor is None
+                    or EventLogCursor.parse(callback_with_cursor.cursor).storage_id()
+                    < event_record.storage_id
+                ):
+                    try:
+                        callback_with_cursor.callback(
+                            event_record.event_log_entry,
+                            str(EventLogCursor.from_storage_id(event_record.storage_id)),
+                        )
+                    except Exception:
+                        logging.exception(
+                            "Exception in callback for event watch on run %s.", self.run_id
+                        )
+
+            self.storage_id = event_record.storage_id
+            if event_record.event_log_entry.dagster_event_type in RUN_TERMINAL_EVENT_TYPES:
+                self._is_finished = True
+
+        if new_records or not self._is_finished:
+            self._polling_interval = POLLING_CADENCE
+        else:
+            # nothing new for a finished run; back off
+            self._polling_interval = min(
+                self._polling_interval * 2, MAX_FINISHED_RUN_POLLING_CADENCE
+            )
+        self.next_poll_time = poll_time + self._polling_interval
+
+
+class SqlPollingEventWatcherThread(threading.Thread):
+    """subclass of Thread that polls the event log for all of the runs watched by a
+    SqlPollingEventWatcher every POLLING_CADENCE
+
+    Exits when `self.should_thread_exit` is set, or when no runs remain watched.
+    """
+
+    def __init__(self, event_watcher: SqlPollingEventWatcher):
+        super(SqlPollingEventWatcherThread, self).__init__()
+        self._event_watcher = check.inst_param(
+            event_watcher, "event_watcher", SqlPollingEventWatcher
+        )
+        self._should_thread_exit = threading.Event()
+        self.name = "sql-event-watch"
+
+    @property
+    def should_thread_exit(self) -> threading.Event:
+        return self._should_thread_exit
 
     def run(self):
         """Polling function to update Observers with EventLogEntrys from Event Log DB.
-        Wakes every POLLING_CADENCE &
-            1. executes a SELECT query to get new EventLogEntrys
-            2. fires each callback (taking into account the callback.cursor) on the new EventLogEntrys
-        Uses max_index_so_far as a cursor in the DB to make sure that only new records are retrieved
+        Wakes every POLLING_CADENCE & polls every watched run that is due
         """
-        cursor = None
         while not self._should_thread_exit.wait(POLLING_CADENCE):
-            conn = self._event_log_storage.get_records_for_run(self._run_id, cursor=cursor)
-            cursor = conn.cursor if conn.cursor else cursor
-            for event_record in conn.records:
-                with self._callback_fn_list_lock:
-                    for callback_with_cursor in self._callback_fn_list:
-                        if (
-                            callback_with_cursor.cursor is None
-                            or EventLogCursor.parse(callback_with_cursor.cursor).storage_id()
-                            < event_record.storage_id
-                        ):
-                            callback_with_cursor.callback(
-                                event_record.event_log_entry,
-                                str(EventLogCursor.from_storage_id(event_record.storage_id)),
-                            )
+            if self._event_watcher.should_watcher_thread_exit(self):
+                break
+
+            try:
+                self._event_watcher.poll()
+            except Exception:
+                logging.exception("Exception while polling the event log for watched runs.")
@@ -52,6 +52,19 @@
     db.Column("create_timestamp", db.DateTime, server_default=get_current_timestamp()),
 )
 
+# Index of the latest materialization of each asset partition, pointing at the storage id of the
+# materialization event. Maintained on write and backfilled by a data migration, so that the latest
+# materialization of many partitions can be fetched without scanning every materialization.
+AssetPartitionsTable = db.Table(
+    "asset_partitions",
+    SqlEventLogStorageMetadata,
+    db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+    db.Column("asset_key", db.Text, nullable=False),
+    db.Column("partition", db.Text, nullable=False),
+    db.Column("last_materialization_storage_id", db.Integer, nullable=False),
+    db.Column("create_timestamp", db.DateTime, server_default=get_current_timestamp()),
+)
+
 db.Index("idx_run_id", SqlEventLogStorageTable.c.run_id)
 db.Index(
     "idx_step_key",
@@ -75,3 +88,9 @@
     SqlEventLogStorageTable.c.id,
     mysql_length={"dagster_event_type": 64},
 )
+db.Index(
+    "idx_asset_partitions",
+    AssetPartitionsTable.c.asset_key,
+    AssetPartitionsTable.c.partition,
+    mysql_length=64,
+)
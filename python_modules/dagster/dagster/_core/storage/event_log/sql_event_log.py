@@ -2,6 +2,7 @@
 from abc import abstractmethod
 from collections import OrderedDict
 from datetime import datetime
+from itertools import groupby
 from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Union, cast
 
 import pendulum
@@ -34,11 +35,28 @@
     EventRecordsFilter,
     RunShardedEventsCursor,
 )
-from .migration import ASSET_DATA_MIGRATIONS, ASSET_KEY_INDEX_COLS, EVENT_LOG_DATA_MIGRATIONS
-from .schema import AssetKeyTable, SecondaryIndexMigrationTable, SqlEventLogStorageTable
+from .migration import (
+    ASSET_DATA_MIGRATIONS,
+    ASSET_KEY_INDEX_COLS,
+    ASSET_PARTITIONS_INDEX,
+    EVENT_LOG_DATA_MIGRATIONS,
+)
+from .schema import (
+    AssetKeyTable,
+    AssetPartitionsTable,
+    SecondaryIndexMigrationTable,
+    SqlEventLogStorageTable,
+)
 
 MIN_ASSET_ROWS = 25
 
+# Upper bound on the number of rows written by a single multi-row insert, which keeps the number of
+# bound parameters under the SQLite default limit of 999
+EVENT_INSERT_BATCH_SIZE = 100
+
+# Upper bound on the number of storage ids bound into a single `IN` clause when fetching events by id
+EVENT_FETCH_BATCH_SIZE = 500
+
 
 class SqlEventLogStorage(EventLogStorage):
     """Base class for SQL backed event log storages.
@@ -78,7 +96,21 @@ def prepare_insert_event(self, event):
         the `dagster-postgres` implementation which overrides the generic SQL implementation of
         `store_event`.
         """
+        # https://stackoverflow.com/a/54386260/324449
+        return SqlEventLogStorageTable.insert().values(  # pylint: disable=no-value-for-parameter
+            **self.prepare_insert_event_values(event)
+        )
 
+    def prepare_insert_event_batch(self, events):
+        """Helper method for preparing a multi-row event log SQL insertion statement, used by
+        `store_events` to write a batch of events in a single round-trip.
+        """
+        return SqlEventLogStorageTable.insert().values(  # pylint: disable=no-value-for-parameter
+            [self.prepare_insert_event_values(event) for event in events]
+        )
+
+    def prepare_insert_event_values(self, event):
+        """Helper method for mapping an event to the column values of its event log row."""
         dagster_event_type = None
         asset_key_str = None
         partition = None
@@ -93,8 +125,7 @@ def prepare_insert_event(self, event):
             if event.dagster_event.partition:
                 partition = event.dagster_event.partition
 
-        # https://stackoverflow.com/a/54386260/324449
-        return SqlEventLogStorageTable.insert().values(  # pylint: disable=no-value-for-parameter
+        return dict(
             run_id=event.run_id,
             event=serialize_dagster_namedtuple(event),
             dagster_event_type=dagster_event_type,
@@ -146,6 +177,65 @@ def store_asset_event(self, event):
             except db.exc.IntegrityError:
                 conn.execute(update_statement)
 
+        self._update_asset_partitions_index(event)
+
+    def _update_asset_partitions_index(self, event):
+        # Points the asset partitions index at a newly stored partition materialization. The storage
+        # id is looked up over the index connection, since that is where asset queries are served
+        # from (the run shards of sharded storages assign their own ids)
+        if (
+            not event.dagster_event.is_step_materialization
+            or not event.dagster_event.partition
+            or not self.has_secondary_index(ASSET_PARTITIONS_INDEX)
+        ):
+            return
+
+        asset_key_str = event.dagster_event.asset_key.to_string()
+        partition = event.dagster_event.partition
+        with self.index_connection() as conn:
+            storage_id = conn.execute(
+                db.select([db.func.max(SqlEventLogStorageTable.c.id)]).where(
+                    db.and_(
+                        SqlEventLogStorageTable.c.asset_key == asset_key_str,
+                        SqlEventLogStorageTable.c.partition == partition,
+                        SqlEventLogStorageTable.c.run_id == event.run_id,
+                        SqlEventLogStorageTable.c.dagster_event_type
+                        == DagsterEventType.ASSET_MATERIALIZATION.value,
+                    )
+                )
+            ).scalar()
+            if storage_id is None:
+                return
+
+            partition_filter = db.and_(
+                AssetPartitionsTable.c.asset_key == asset_key_str,
+                AssetPartitionsTable.c.partition == partition,
+            )
+            if conn.execute(
+                db.select([AssetPartitionsTable.c.id]).where(partition_filter).limit(1)
+            ).fetchone():
+                # only ever move the index forward, in case events are stored out of order
+                conn.execute(
+                    AssetPartitionsTable.update()  # pylint: disable=no-value-for-parameter
+                    .where(
+                        db.and_(
+                            partition_filter,
+                            AssetPartitionsTable.c.last_materialization_storage_id < storage_id,
+                        )
+                    )
+                    .values(last_materialization_storage_id=storage_id)
+                )
+            else:
+                # concurrent writers may both insert a row for the partition, so readers take the
+                # max storage id over the rows of a partition
+                conn.execute(
+                    AssetPartitionsTable.insert().values(  # pylint: disable=no-value-for-parameter
+                        asset_key=asset_key_str,
+                        partition=partition,
+                        last_materialization_storage_id=storage_id,
+                    )
+                )
+
     def _get_asset_entry_values(self, event, has_asset_key_index_cols):
         # The AssetKeyTable contains a `last_materialization_timestamp` column that is exclusively
         # used to determine if an asset exists (last materialization timestamp > wipe timestamp).
@@ -226,6 +316,35 @@ def store_event(self, event):
         ):
             self.store_asset_event(event)
 
+    def store_events(self, events):
+        """Store a batch of events, writing consecutive events for the same run with multi-row
+        inserts over a single connection.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+
+        for run_id, run_events in groupby(events, key=lambda event: event.run_id):
+            run_events = list(run_events)
+            with self.run_connection(run_id) as conn:
+                for i in range(0, len(run_events), EVENT_INSERT_BATCH_SIZE):
+                    conn.execute(
+                        self.prepare_insert_event_batch(run_events[i : i + EVENT_INSERT_BATCH_SIZE])
+                    )
+
+        for event in events:
+            if (
+                event.is_dagster_event
+                and (
+                    event.dagster_event.is_step_materialization
+                    or event.dagster_event.is_asset_observation
+                    or event.dagster_event.is_asset_materialization_planned
+                )
+                and event.dagster_event.asset_key
+            ):
+                self.store_asset_event(event)
+
     def get_records_for_run(
         self,
         run_id,
@@ -465,10 +584,68 @@ def wipe(self):
         with self.index_connection() as conn:
             conn.execute(SqlEventLogStorageTable.delete())  # pylint: disable=no-value-for-parameter
             conn.execute(AssetKeyTable.delete())  # pylint: disable=no-value-for-parameter
+            if self.has_secondary_index(ASSET_PARTITIONS_INDEX):
+                conn.execute(
+                    AssetPartitionsTable.delete()  # pylint: disable=no-value-for-parameter
+                )
 
     def delete_events(self, run_id):
+        materialized_partitions = self._get_materialized_partitions_for_run(run_id)
         with self.run_connection(run_id) as conn:
             self.delete_events_for_run(conn, run_id)
+        self._refresh_asset_partitions_index(materialized_partitions)
+
+    def _get_materialized_partitions_for_run(self, run_id) -> Mapping[AssetKey, Set[str]]:
+        # the asset partitions materialized by a run, whose index entries need to be recomputed
+        # when the events of the run are deleted
+        if not self.has_secondary_index(ASSET_PARTITIONS_INDEX):
+            return {}
+
+        query = (
+            db.select([SqlEventLogStorageTable.c.asset_key, SqlEventLogStorageTable.c.partition])
+            .where(
+                db.and_(
+                    SqlEventLogStorageTable.c.run_id == run_id,
+                    SqlEventLogStorageTable.c.dagster_event_type
+                    == DagsterEventType.ASSET_MATERIALIZATION.value,
+                    SqlEventLogStorageTable.c.partition != None,
+                )
+            )
+            .group_by(SqlEventLogStorageTable.c.asset_key, SqlEventLogStorageTable.c.partition)
+        )
+        with self.index_connection() as conn:
+            results = conn.execute(query).fetchall()
+
+        materialized_partitions: Dict[AssetKey, Set[str]] = {}
+        for asset_key_str, partition in results:
+            asset_key = AssetKey.from_db_string(asset_key_str)
+            if asset_key:
+                materialized_partitions.setdefault(asset_key, set()).add(partition)
+        return materialized_partitions
+
+    def _refresh_asset_partitions_index(self, materialized_partitions: Mapping[AssetKey, Set[str]]):
+        # recomputes the index entries of the given asset partitions from the remaining events,
+        # without creating entries for partitions that are not indexed (e.g. wiped assets)
+        for asset_key, partitions in materialized_partitions.items():
+            latest_ids = self._get_latest_materialization_ids_by_partition(asset_key, partitions)
+            with self.index_connection() as conn:
+                for partition in partitions:
+                    partition_filter = db.and_(
+                        AssetPartitionsTable.c.asset_key == asset_key.to_string(),
+                        AssetPartitionsTable.c.partition == partition,
+                    )
+                    if partition in latest_ids:
+                        conn.execute(
+                            AssetPartitionsTable.update()  # pylint: disable=no-value-for-parameter
+                            .where(partition_filter)
+                            .values(last_materialization_storage_id=latest_ids[partition])
+                        )
+                    else:
+                        conn.execute(
+                            AssetPartitionsTable.delete().where(  # pylint: disable=no-value-for-parameter
+                                partition_filter
+                            )
+                        )
 
     def delete_events_for_run(self, conn, run_id):
         check.str_param(run_id, "run_id")
@@ -763,6 +940,51 @@ def get_logs_for_all_runs_by_log_id(
 
         return events
 
+    def get_records_for_run_ids(
+        self, run_ids: Sequence[str], after_cursor: int = -1
+    ) -> List[EventLogRecord]:
+        """Get the event log records of several runs with a storage id greater than `after_cursor`,
+        in storage id order, with a single query.
+
+        Args:
+            run_ids (Sequence[str]): The ids of the runs for which to fetch records.
+            after_cursor (int): Only records with a greater storage id are returned.
+        """
+        check.sequence_param(run_ids, "run_ids", of_type=str)
+        check.int_param(after_cursor, "after_cursor")
+        if not run_ids:
+            return []
+
+        query = (
+            db.select(
+                [
+                    SqlEventLogStorageTable.c.id,
+                    SqlEventLogStorageTable.c.run_id,
+                    SqlEventLogStorageTable.c.event,
+                ]
+            )
+            .where(SqlEventLogStorageTable.c.run_id.in_(run_ids))
+            .where(SqlEventLogStorageTable.c.id > after_cursor)
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+
+        with self.index_connection() as conn:
+            results = conn.execute(query).fetchall()
+
+        records = []
+        for (record_id, run_id, json_str) in results:
+            try:
+                records.append(
+                    EventLogRecord(
+                        storage_id=record_id,
+                        event_log_entry=deserialize_as(json_str, EventLogEntry),
+                    )
+                )
+            except (seven.JSONDecodeError, DeserializationError) as err:
+                raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+
+        return records
+
     def get_maximum_record_id(self) -> Optional[int]:
         with self.index_connection() as conn:
             result = conn.execute(db.select([db.func.max(SqlEventLogStorageTable.c.id)])).fetchone()
@@ -1224,6 +1446,14 @@ def wipe_asset(self, asset_key):
                     )
                 )
 
+        if self.has_secondary_index(ASSET_PARTITIONS_INDEX):
+            with self.index_connection() as conn:
+                conn.execute(
+                    AssetPartitionsTable.delete().where(  # pylint: disable=no-value-for-parameter
+                        AssetPartitionsTable.c.asset_key == asset_key.to_string()
+                    )
+                )
+
     def get_materialization_count_by_partition(
         self, asset_keys: Sequence[AssetKey]
     ) -> Mapping[AssetKey, Mapping[str, int]]:
@@ -1269,6 +1499,101 @@ def get_materialization_count_by_partition(
 
         return materialization_count_by_partition
 
+    def get_latest_materialization_by_partition(
+        self, asset_key: AssetKey, partitions: Optional[Sequence[str]] = None
+    ) -> Mapping[str, EventLogRecord]:
+        check.inst_param(asset_key, "asset_key", AssetKey)
+        check.opt_sequence_param(partitions, "partitions", of_type=str)
+
+        if self.has_secondary_index(ASSET_PARTITIONS_INDEX):
+            # the index holds a single row per partition of the asset, so the requested partitions
+            # are filtered here rather than bound into the query
+            query = (
+                db.select(
+                    [
+                        AssetPartitionsTable.c.partition,
+                        db.func.max(AssetPartitionsTable.c.last_materialization_storage_id),
+                    ]
+                )
+                .where(AssetPartitionsTable.c.asset_key == asset_key.to_string())
+                .group_by(AssetPartitionsTable.c.partition)
+            )
+            with self.index_connection() as conn:
+                results = conn.execute(query).fetchall()
+            latest_ids = {partition: storage_id for partition, storage_id in results}
+            if partitions is not None:
+                latest_ids = {
+                    partition: latest_ids[partition]
+                    for partition in partitions
+                    if partition in latest_ids
+                }
+        else:
+            latest_ids = self._get_latest_materialization_ids_by_partition(asset_key, partitions)
+
+        records_by_id = self._get_event_records_by_id(list(latest_ids.values()))
+        return {
+            partition: records_by_id[storage_id]
+            for partition, storage_id in latest_ids.items()
+            if storage_id in records_by_id
+        }
+
+    def _get_latest_materialization_ids_by_partition(
+        self, asset_key: AssetKey, partitions: Optional[Iterable[str]] = None
+    ) -> Dict[str, int]:
+        # scans the materializations of the asset, for storages whose asset partitions index has
+        # not been built, and to recompute entries of the index
+        query = (
+            db.select(
+                [SqlEventLogStorageTable.c.partition, db.func.max(SqlEventLogStorageTable.c.id)]
+            )
+            .where(
+                db.and_(
+                    db.or_(
+                        SqlEventLogStorageTable.c.asset_key == asset_key.to_string(),
+                        SqlEventLogStorageTable.c.asset_key == asset_key.to_string(legacy=True),
+                    ),
+                    SqlEventLogStorageTable.c.dagster_event_type
+                    == DagsterEventType.ASSET_MATERIALIZATION.value,
+                    SqlEventLogStorageTable.c.partition != None,
+                )
+            )
+            .group_by(SqlEventLogStorageTable.c.partition)
+        )
+        assets_details = self._get_assets_details([asset_key])
+        query = self._add_assets_wipe_filter_to_query(query, assets_details, [asset_key])
+
+        with self.index_connection() as conn:
+            results = conn.execute(query).fetchall()
+
+        latest_ids = {partition: storage_id for partition, storage_id in results}
+        if partitions is None:
+            return latest_ids
+
+        return {
+            partition: latest_ids[partition] for partition in partitions if partition in latest_ids
+        }
+
+    def _get_event_records_by_id(self, storage_ids: Sequence[int]) -> Dict[int, EventLogRecord]:
+        event_records = {}
+        with self.index_connection() as conn:
+            for i in range(0, len(storage_ids), EVENT_FETCH_BATCH_SIZE):
+                results = conn.execute(
+                    db.select(
+                        [SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event]
+                    ).where(
+                        SqlEventLogStorageTable.c.id.in_(
+                            storage_ids[i : i + EVENT_FETCH_BATCH_SIZE]
+                        )
+                    )
+                ).fetchall()
+                for row_id, json_str in results:
+                    event_record = deserialize_json_to_dagster_namedtuple(json_str)
+                    if isinstance(event_record, EventLogEntry):
+                        event_records[row_id] = EventLogRecord(
+                            storage_id=row_id, event_log_entry=event_record
+                        )
+        return event_records
+
 
 def _get_from_row(row, column):
     """utility function for extracting a column from a sqlalchemy row proxy, since '_asdict' is not
@@ -17,7 +17,7 @@
 import dagster._check as check
 import dagster._seven as seven
 from dagster._config import StringSource
-from dagster._core.events import DagsterEventType
+from dagster._core.events import ASSET_EVENTS, DagsterEventType
 from dagster._core.events.log import EventLogEntry
 from dagster._core.storage.event_log.base import EventLogCursor, EventLogRecord, EventRecordsFilter
 from dagster._core.storage.pipeline_run import PipelineRunStatus, RunsFilter
@@ -25,6 +25,7 @@
     check_alembic_revision,
     create_engine,
     get_alembic_config,
+    run_alembic_downgrade,
     run_alembic_upgrade,
     stamp_alembic_rev,
 )
@@ -37,7 +38,7 @@
 from dagster._utils import mkdir_p
 
 from ..schema import SqlEventLogStorageMetadata, SqlEventLogStorageTable
-from ..sql_event_log import RunShardedEventsCursor, SqlEventLogStorage
+from ..sql_event_log import EVENT_INSERT_BATCH_SIZE, RunShardedEventsCursor, SqlEventLogStorage
 
 INDEX_SHARD_NAME = "index"
 
@@ -111,6 +112,11 @@ def upgrade(self):
 
         self._initialized_dbs = set()
 
+    def _alembic_downgrade(self, rev="head"):
+        alembic_config = get_alembic_config(__file__)
+        with self.index_connection() as conn:
+            run_alembic_downgrade(alembic_config, conn, rev=rev)
+
     @property
     def inst_data(self):
         return self._inst_data
@@ -244,6 +250,39 @@ def store_event(self, event):
             ):
                 self.store_asset_event(event)
 
+    def store_events(self, events):
+        """
+        Overridden method to replicate the asset events of a batch in the central assets.db sqlite
+        shard, enabling cross-run asset queries.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+
+        asset_events = [
+            event for event in events if event.is_dagster_event and event.dagster_event.asset_key
+        ]
+        for event in asset_events:
+            check.invariant(
+                event.dagster_event_type in ASSET_EVENTS,
+                "Can only store asset materializations, materialization_planned, and observations in index database",
+            )
+
+        if asset_events:
+            # mirror the events in the cross-run index database
+            with self.index_connection() as conn:
+                for i in range(0, len(asset_events), EVENT_INSERT_BATCH_SIZE):
+                    conn.execute(
+                        self.prepare_insert_event_batch(
+                            asset_events[i : i + EVENT_INSERT_BATCH_SIZE]
+                        )
+                    )
+
+        # stores the events in their run shards and updates the asset indexes, which are built from
+        # the mirrored events
+        super().store_events(events)
+
     def get_event_records(
         self,
         event_records_filter: EventRecordsFilter,
@@ -345,7 +384,20 @@ def get_event_records(
     def supports_event_consumer_queries(self):
         return False
 
+    def get_records_for_run_ids(self, run_ids, after_cursor=-1):
+        """Overridden method to query each run shard in turn, since events are not stored in a
+        shared table.
+        """
+        check.sequence_param(run_ids, "run_ids", of_type=str)
+        check.int_param(after_cursor, "after_cursor")
+        cursor = EventLogCursor.from_storage_id(after_cursor).to_string()
+        records = []
+        for run_id in run_ids:
+            records.extend(self.get_records_for_run(run_id, cursor=cursor).records)
+        return records
+
     def delete_events(self, run_id):
+        materialized_partitions = self._get_materialized_partitions_for_run(run_id)
         with self.run_connection(run_id) as conn:
             self.delete_events_for_run(conn, run_id)
 
@@ -353,6 +405,8 @@ def delete_events(self, run_id):
         with self.index_connection() as conn:
             self.delete_events_for_run(conn, run_id)
 
+        self._refresh_asset_partitions_index(materialized_partitions)
+
     def wipe(self):
         # should delete all the run-sharded dbs as well as the index db
         for filename in (
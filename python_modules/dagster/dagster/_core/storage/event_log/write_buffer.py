@@ -0,0 +1,155 @@
+import logging
+import threading
+from typing import List, Optional
+
+import dagster._check as check
+from dagster._core.events import PIPELINE_EVENTS, DagsterEventType
+from dagster._core.events.log import EventLogEntry
+
+from .base import EventLogStorage
+from .sql_event_log import EVENT_INSERT_BATCH_SIZE
+
+DEFAULT_MAX_BATCH_SIZE = 100
+DEFAULT_FLUSH_INTERVAL_SECONDS = 1.0
+DEFAULT_MAX_BUFFERED_EVENTS = 10000
+
+# Events that run orchestration reads back from the event log (run status, and the step state
+# tracked by ActiveExecution in step-delegating executors), and which must therefore never wait
+# in the buffer
+SYNCHRONOUS_FLUSH_EVENT_TYPES = PIPELINE_EVENTS | {
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.STEP_FAILURE,
+    DagsterEventType.STEP_SKIPPED,
+    DagsterEventType.STEP_UP_FOR_RETRY,
+    DagsterEventType.STEP_RESTARTED,
+}
+
+
+class EventLogWriteBuffer:
+    """Buffers events on their way to an event log storage, writing them in batches with
+    :py:meth:`EventLogStorage.store_events`.
+
+    The buffer is flushed when it holds ``max_batch_size`` events, every
+    ``flush_interval_seconds`` from a background thread, and whenever an event of one of the
+    ``SYNCHRONOUS_FLUSH_EVENT_TYPES`` is written. In the last case the event is stored, along with
+    everything buffered ahead of it, before ``write`` returns.
+
+    Events stay buffered until they are stored, so that a failed flush is retried by the next one.
+    Once ``max_buffered_events`` events are held, which only happens while the storage is failing,
+    ``write`` flushes synchronously and raises the storage error instead of buffering the event.
+    """
+
+    def __init__(
+        self,
+        event_storage: EventLogStorage,
+        max_batch_size: Optional[int] = None,
+        flush_interval_seconds: Optional[float] = None,
+        max_buffered_events: Optional[int] = None,
+    ):
+        self._event_storage = check.inst_param(event_storage, "event_storage", EventLogStorage)
+        self._max_batch_size = check.opt_int_param(
+            max_batch_size, "max_batch_size", DEFAULT_MAX_BATCH_SIZE
+        )
+        check.invariant(self._max_batch_size > 0, "max_batch_size must be positive")
+        self._flush_interval_seconds = check.opt_numeric_param(
+            flush_interval_seconds, "flush_interval_seconds", DEFAULT_FLUSH_INTERVAL_SECONDS
+        )
+        check.invariant(self._flush_interval_seconds > 0, "flush_interval_seconds must be positive")
+        self._max_buffered_events = check.opt_int_param(
+            max_buffered_events, "max_buffered_events", DEFAULT_MAX_BUFFERED_EVENTS
+        )
+        check.invariant(
+            self._max_buffered_events >= self._max_batch_size,
+            "max_buffered_events must be at least max_batch_size",
+        )
+
+        self._lock = threading.RLock()
+        self._buffer: List[EventLogEntry] = []
+        self._flush_thread: Optional[threading.Thread] = None
+        self._shutdown_event = threading.Event()
+
+    def write(self, event: EventLogEntry):
+        check.inst_param(event, "event", EventLogEntry)
+
+        with self._lock:
+            if len(self._buffer) >= self._max_buffered_events:
+                self._flush()
+
+            self._buffer.append(event)
+            if (
+                len(self._buffer) >= self._max_batch_size
+                or _requires_synchronous_flush(event)
+                or self._shutdown_event.is_set()
+            ):
+                self._flush()
+            else:
+                self._ensure_flush_thread()
+
+    def flush(self):
+        with self._lock:
+            self._flush()
+
+    def dispose(self):
+        self._shutdown_event.set()
+        if self._flush_thread:
+            self._flush_thread.join()
+            self._flush_thread = None
+        self.flush()
+
+    @property
+    def buffered_event_count(self) -> int:
+        with self._lock:
+            return len(self._buffer)
+
+    def _flush(self):
+        # Events are removed from the buffer once they are stored, a unit at a time, so that a
+        # failed write is retried on the next flush without storing the events ahead of it again
+        while self._buffer:
+            events = _next_write_unit(self._buffer)
+            self._event_storage.store_events(events)
+            del self._buffer[: len(events)]
+
+    def _ensure_flush_thread(self):
+        if self._flush_thread or self._shutdown_event.is_set():
+            return
+
+        self._flush_thread = threading.Thread(
+            target=self._flush_loop, name="event-log-write-buffer", daemon=True
+        )
+        self._flush_thread.start()
+
+    def _flush_loop(self):
+        while not self._shutdown_event.wait(self._flush_interval_seconds):
+            try:
+                self.flush()
+            except Exception:
+                logging.getLogger("dagster").exception(
+                    "Error flushing buffered events to the event log storage"
+                )
+
+
+def _requires_synchronous_flush(event: EventLogEntry) -> bool:
+    return event.is_dagster_event and event.dagster_event_type in SYNCHRONOUS_FLUSH_EVENT_TYPES
+
+
+def _is_asset_event(event: EventLogEntry) -> bool:
+    return event.is_dagster_event and event.dagster_event.asset_key is not None
+
+
+def _next_write_unit(events: List[EventLogEntry]) -> List[EventLogEntry]:
+    """
+    The events at the head of the buffer that are stored together: consecutive events of the same
+    run, no more than the SQL storages write with a single insert, so that a unit is either stored
+    entirely or not at all. Asset events are stored on their own, since the storage indexes them
+    with further writes after inserting them.
+    """
+    head = events[0]
+    if _is_asset_event(head):
+        return [head]
+
+    unit = [head]
+    for event in events[1:EVENT_INSERT_BATCH_SIZE]:
+        if event.run_id != head.run_id or _is_asset_event(event):
+            break
+        unit.append(event)
+    return unit
@@ -181,6 +181,18 @@ def load_input(self, context):
         with open(filepath, self.read_mode) as read_obj:
             return pickle.load(read_obj)
 
+    def release_output(self, context):
+        """Delete the file of an output that no other step of the run needs. Asset outputs are
+        kept, since they are not specific to the run."""
+        check.inst_param(context, "context", OutputContext)
+
+        if context.has_asset_key:
+            return
+
+        filepath = self._get_path(context)
+        if os.path.exists(filepath):
+            os.remove(filepath)
+
 
 class CustomPathPickledObjectFilesystemIOManager(IOManager):
     """Built-in filesystem IO managerthat stores and retrieves values using pickling and
@@ -147,6 +147,19 @@ def handle_output(self, context: "OutputContext", obj: Any) -> None:
             obj (Any): The object, returned by the op, to be stored.
         """
 
+    @public  # type: ignore
+    def release_output(self, context: "OutputContext") -> None:
+        """Optional method that frees whatever holds an output, once no step that will execute in
+        the run needs it anymore.
+
+        It is only called when the executor is configured with ``release_outputs: true``, after
+        every step of the run that consumes the output has succeeded or been skipped. Outputs that
+        are not consumed by any step, or that are consumed by a step that fails, are never released.
+
+        Args:
+            context (OutputContext): The context of the step output that produced the object.
+        """
+
     def get_output_asset_key(self, _context: "OutputContext") -> Optional[AssetKey]:
         """User-defined method that associates outputs handled by this IOManager with a particular
         AssetKey.
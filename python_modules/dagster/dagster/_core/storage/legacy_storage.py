@@ -17,7 +17,7 @@
 
 from .base_storage import DagsterStorage
 from .event_log.base import AssetRecord, EventLogRecord, EventLogStorage, EventRecordsFilter
-from .runs.base import RunStorage
+from .runs.base import QueuedRunIdsConnection, RunStorage
 from .schedules.base import ScheduleStorage
 
 if TYPE_CHECKING:
@@ -39,6 +39,7 @@
         JobBucket,
         PipelineRun,
         PipelineRunStatsSnapshot,
+        RunPartitionData,
         RunRecord,
         RunsFilter,
         TagBucket,
@@ -159,6 +160,9 @@ def from_config_value(inst_data, config_value):
     def add_run(self, pipeline_run: "PipelineRun") -> "PipelineRun":
         return self._storage.run_storage.add_run(pipeline_run)
 
+    def add_runs(self, pipeline_runs: List["PipelineRun"]) -> List["PipelineRun"]:
+        return self._storage.run_storage.add_runs(pipeline_runs)
+
     def handle_run_event(self, run_id: str, event: "DagsterEvent"):
         return self._storage.run_storage.handle_run_event(run_id, event)
 
@@ -171,6 +175,19 @@ def get_runs(
     ) -> Iterable["PipelineRun"]:
         return self._storage.run_storage.get_runs(filters, cursor, limit, bucket_by)
 
+    def get_run_ids(
+        self,
+        filters: Optional["RunsFilter"] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[str]:
+        return self._storage.run_storage.get_run_ids(filters, cursor, limit)
+
+    def get_queued_run_ids(
+        self, cursor: Optional[str] = None, limit: Optional[int] = None
+    ) -> QueuedRunIdsConnection:
+        return self._storage.run_storage.get_queued_run_ids(cursor=cursor, limit=limit)
+
     def get_runs_count(self, filters: Optional["RunsFilter"] = None) -> int:
         return self._storage.run_storage.get_runs_count(filters)
 
@@ -252,6 +269,16 @@ def wipe(self):
     def delete_run(self, run_id: str):
         return self._storage.run_storage.delete_run(run_id)
 
+    def get_run_partition_data(self, runs_filter: "RunsFilter") -> List["RunPartitionData"]:
+        return self._storage.run_storage.get_run_partition_data(runs_filter)
+
+    def get_latest_run_partition_data(
+        self, pipeline_name: str, repository_label: str
+    ) -> List["RunPartitionData"]:
+        return self._storage.run_storage.get_latest_run_partition_data(
+            pipeline_name, repository_label
+        )
+
     @property
     def supports_bucket_queries(self):
         return self._storage.run_storage.supports_bucket_queries()
@@ -440,6 +467,13 @@ def get_materialization_count_by_partition(
     ) -> Mapping["AssetKey", Mapping[str, int]]:
         return self._storage.event_storage.get_materialization_count_by_partition(asset_keys)
 
+    def get_latest_materialization_by_partition(
+        self, asset_key: "AssetKey", partitions: Optional[Sequence[str]] = None
+    ) -> Mapping[str, EventLogRecord]:
+        return self._storage.event_storage.get_latest_materialization_by_partition(
+            asset_key, partitions
+        )
+
 
 class LegacyScheduleStorage(ScheduleStorage, ConfigurableClass):
     def __init__(self, storage, inst_data=None):
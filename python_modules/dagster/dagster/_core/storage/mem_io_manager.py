@@ -13,6 +13,10 @@ def load_input(self, context):
         keys = tuple(context.get_identifier())
         return self.values[keys]
 
+    def release_output(self, context):
+        keys = tuple(context.get_identifier())
+        self.values.pop(keys, None)
+
 
 @io_manager(description="Built-in IO manager that stores and retrieves values in memory.")
 def mem_io_manager(_):
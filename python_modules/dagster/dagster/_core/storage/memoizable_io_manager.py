@@ -1,7 +1,7 @@
 import os
 import pickle
 from abc import abstractmethod
-from typing import Union
+from typing import Sequence, Union
 
 import dagster._check as check
 from dagster._annotations import experimental, public
@@ -32,6 +32,22 @@ def has_output(self, context: OutputContext) -> bool:
             bool: True if there is data present that matches the provided context. False otherwise.
         """
 
+    @public
+    def has_outputs(self, contexts: Sequence[OutputContext]) -> Sequence[bool]:
+        """Returns whether data exists for each of a batch of step outputs.
+
+        Used when building a memoized execution plan, which checks every step output in the job.
+        By default, this calls ``has_output`` for each context in turn. IO managers backed by
+        remote storage can override it to check the outputs concurrently, or with a single listing.
+
+        Args:
+            contexts (Sequence[OutputContext]): The contexts of the step outputs to check.
+
+        Returns:
+            Sequence[bool]: For each context, in order, whether data matching it is present.
+        """
+        return [self.has_output(context) for context in contexts]
+
 
 class VersionedPickledObjectFilesystemIOManager(MemoizableIOManager):
     def __init__(self, base_dir=None):
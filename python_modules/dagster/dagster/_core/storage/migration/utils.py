@@ -201,6 +201,83 @@ def extract_asset_keys_idx_columns():
     op.add_column("asset_keys", db.Column("tags", db.TEXT))
 
 
+def create_asset_partitions_table():
+    if not has_table("event_logs"):
+        return
+
+    if not has_table("asset_partitions"):
+        op.create_table(
+            "asset_partitions",
+            db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+            db.Column("asset_key", db.Text, nullable=False),
+            db.Column("partition", db.Text, nullable=False),
+            db.Column("last_materialization_storage_id", db.Integer, nullable=False),
+            db.Column("create_timestamp", db.DateTime, server_default=get_current_timestamp()),
+        )
+
+    if not has_index("asset_partitions", "idx_asset_partitions"):
+        op.create_index(
+            "idx_asset_partitions",
+            "asset_partitions",
+            ["asset_key", "partition"],
+            mysql_length=64,
+        )
+
+
+def drop_asset_partitions_table():
+    if has_table("asset_partitions"):
+        op.drop_table("asset_partitions")
+
+    # the index is rebuilt by the data migration on the next upgrade
+    if has_table("secondary_indexes"):
+        op.execute(db.text("DELETE FROM secondary_indexes WHERE name = 'asset_partitions_index'"))
+
+
+def create_partition_statuses_table():
+    if not has_table("runs"):
+        return
+
+    if not has_table("partition_statuses"):
+        op.create_table(
+            "partition_statuses",
+            db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+            db.Column("repository_label", db.Text, nullable=False),
+            db.Column("pipeline_name", db.Text, nullable=False),
+            db.Column("partition", db.Text, nullable=False),
+            db.Column("run_storage_id", db.Integer, nullable=False),
+            db.Column("run_id", db.String(255), nullable=False),
+            db.Column("status", db.String(63)),
+            db.Column("start_time", db.Float),
+            db.Column("end_time", db.Float),
+            db.Column("update_timestamp", db.DateTime, server_default=get_current_timestamp()),
+        )
+
+    if not has_index("partition_statuses", "idx_partition_statuses"):
+        op.create_index(
+            "idx_partition_statuses",
+            "partition_statuses",
+            ["pipeline_name", "repository_label", "partition"],
+            mysql_length=64,
+        )
+
+    if not has_index("partition_statuses", "idx_partition_statuses_run_id"):
+        op.create_index(
+            "idx_partition_statuses_run_id",
+            "partition_statuses",
+            ["run_id"],
+            mysql_length=64,
+        )
+
+
+def drop_partition_statuses_table():
+    if has_table("partition_statuses"):
+        op.drop_table("partition_statuses")
+
+    # the table is rebuilt by the data migration on the next upgrade
+    if has_table("secondary_indexes"):
+        op.execute(db.text("DELETE FROM secondary_indexes WHERE name = 'partition_statuses'"))
+
+
 def create_event_log_event_idx():
     if not has_table("event_logs"):
         return
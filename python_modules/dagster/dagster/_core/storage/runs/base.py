@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple, Union
 
 from dagster._core.events import DagsterEvent
 from dagster._core.execution.backfill import BulkActionStatus, PartitionBackfill
@@ -8,14 +8,22 @@
 from dagster._core.storage.pipeline_run import (
     JobBucket,
     PipelineRun,
+    PipelineRunStatus,
     RunPartitionData,
     RunRecord,
     RunsFilter,
     TagBucket,
 )
+from dagster._core.storage.tags import REPOSITORY_LABEL_TAG, get_run_priority
 from dagster._daemon.types import DaemonHeartbeat
 
 
+class QueuedRunIdsConnection(NamedTuple):
+    run_ids: List[str]
+    cursor: Optional[str]
+    has_more: bool
+
+
 class RunStorage(ABC, MayHaveInstanceWeakref):
     """Abstract base class for storing pipeline run history.
 
@@ -39,6 +47,17 @@ def add_run(self, pipeline_run: PipelineRun) -> PipelineRun:
             pipeline_run (PipelineRun): The run to add.
         """
 
+    def add_runs(self, pipeline_runs: List[PipelineRun]) -> List[PipelineRun]:
+        """Add several runs to storage.
+
+        Storages that can write several runs at once, e.g. with a single multi-row insert, should
+        override this method. The default implementation adds the runs one at a time.
+
+        Args:
+            pipeline_runs (List[PipelineRun]): The runs to add.
+        """
+        return [self.add_run(pipeline_run) for pipeline_run in pipeline_runs]
+
     @abstractmethod
     def handle_run_event(self, run_id: str, event: DagsterEvent):
         """Update run storage in accordance to a pipeline run related DagsterEvent
@@ -69,6 +88,75 @@ def get_runs(
             List[PipelineRun]
         """
 
+    def get_run_ids(
+        self,
+        filters: Optional[RunsFilter] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[str]:
+        """Return the ids of the runs present in the storage that match the given filters, in the
+        same order as get_runs, without loading the runs themselves.
+
+        Args:
+            filters (Optional[RunsFilter]) -- The
+                :py:class:`~dagster._core.storage.pipeline_run.RunsFilter` by which to filter
+                runs
+            cursor (Optional[str]): Starting cursor (run_id) of range of runs
+            limit (Optional[int]): Number of results to get. Defaults to infinite.
+
+        Returns:
+            List[str]
+        """
+        return [run.run_id for run in self.get_runs(filters=filters, cursor=cursor, limit=limit)]
+
+    def get_queued_run_ids(
+        self, cursor: Optional[str] = None, limit: Optional[int] = None
+    ) -> QueuedRunIdsConnection:
+        """Return the ids of the queued runs, in the order in which they should be dequeued: by
+        descending priority (set with the ``dagster/priority`` tag), then in the order in which
+        they were created.
+
+        Args:
+            cursor (Optional[str]): The cursor returned with the previous page of run ids, after
+                which to start.
+            limit (Optional[int]): Number of results to get. Defaults to infinite.
+
+        Returns:
+            QueuedRunIdsConnection
+        """
+        # This implementation loads every queued run, and uses the id of the last run returned as
+        # the cursor. Storages that can order the queue in a query should override it.
+        queued_runs = list(self.get_runs(RunsFilter(statuses=[PipelineRunStatus.QUEUED])))
+        if cursor and cursor not in {run.run_id for run in queued_runs}:
+            # the cursor run may have been dequeued since, so load it with the queued runs to find
+            # its place in the queue
+            queued_runs = list(
+                self.get_runs(RunsFilter(run_ids=[run.run_id for run in queued_runs] + [cursor]))
+            )
+
+        # runs are returned newest first; sorted is stable, so reversing first keeps fifo order
+        # within each priority
+        queued_run_ids = [
+            run.run_id
+            for run in sorted(
+                reversed(queued_runs), key=lambda run: get_run_priority(run.tags), reverse=True
+            )
+        ]
+
+        # if the cursor run was deleted its place in the queue is unknown, so start over
+        if cursor and cursor in queued_run_ids:
+            queued_run_ids = queued_run_ids[queued_run_ids.index(cursor) + 1 :]
+
+        has_more = bool(limit) and len(queued_run_ids) > limit
+        if limit:
+            queued_run_ids = queued_run_ids[:limit]
+
+        return QueuedRunIdsConnection(
+            run_ids=queued_run_ids,
+            cursor=queued_run_ids[-1] if queued_run_ids else cursor,
+            has_more=has_more,
+        )
+
     @abstractmethod
     def get_runs_count(self, filters: Optional[RunsFilter] = None) -> int:
         """Return the number of runs present in the storage that match the given filters.
@@ -327,6 +415,19 @@ def supports_bucket_queries(self):
     def get_run_partition_data(self, runs_filter: RunsFilter) -> List[RunPartitionData]:
         """Get run partition data for a given partitioned job."""
 
+    def get_latest_run_partition_data(
+        self, pipeline_name: str, repository_label: str
+    ) -> List[RunPartitionData]:
+        """Get the run partition data of the latest run of each partition of a job.
+
+        Args:
+            pipeline_name (str): The name of the partitioned job.
+            repository_label (str): The label of the repository the runs were launched from.
+        """
+        return self.get_run_partition_data(
+            RunsFilter(pipeline_name=pipeline_name, tags={REPOSITORY_LABEL_TAG: repository_label})
+        )
+
     def migrate(self, print_fn: Optional[Callable] = None, force_rebuild_all: bool = False):
         """Call this method to run any required data migrations"""
 
@@ -10,19 +10,21 @@
 from ...execution.bulk_actions import BulkActionType
 from ..pipeline_run import PipelineRun, PipelineRunStatus
 from ..runs.base import RunStorage
-from ..runs.schema import BulkActionsTable, RunTagsTable, RunsTable
+from ..runs.schema import BulkActionsTable, PartitionStatusesTable, RunTagsTable, RunsTable
 from ..tags import PARTITION_NAME_TAG, PARTITION_SET_TAG, REPOSITORY_LABEL_TAG
 
 RUN_PARTITIONS = "run_partitions"
 RUN_START_END = "run_start_end_overwritten"  # was run_start_end, but renamed to overwrite bad timestamps written
 RUN_REPO_LABEL_TAGS = "run_repo_label_tags"
 BULK_ACTION_TYPES = "bulk_action_types"
+PARTITION_STATUSES = "partition_statuses"
 
 # for `dagster instance migrate`, paired with schema changes
 REQUIRED_DATA_MIGRATIONS = {
     RUN_PARTITIONS: lambda: migrate_run_partition,
     RUN_REPO_LABEL_TAGS: lambda: migrate_run_repo_tags,
     BULK_ACTION_TYPES: lambda: migrate_bulk_actions,
+    PARTITION_STATUSES: lambda: migrate_partition_statuses,
 }
 # for `dagster instance reindex`, optionally run for better read performance
 OPTIONAL_DATA_MIGRATIONS = {
@@ -253,3 +255,85 @@ def migrate_bulk_actions(run_storage: RunStorage, print_fn=None):
                     .where(BulkActionsTable.c.id == storage_id)
                 )
                 cursor = storage_id
+
+
+def migrate_partition_statuses(run_storage: RunStorage, print_fn=None):
+    """
+    Utility method to build the table of the latest run of each job partition from the runs in
+    run storage.
+    """
+    from dagster._core.storage.runs.sql_run_storage import SqlRunStorage
+
+    if not isinstance(run_storage, SqlRunStorage):
+        return
+
+    if print_fn:
+        print_fn("Querying run storage.")
+
+    subquery = (
+        db.select(
+            [RunTagsTable.c.run_id.label("tags_run_id"), RunTagsTable.c.value.label("repo_label")]
+        )
+        .where(RunTagsTable.c.key == REPOSITORY_LABEL_TAG)
+        .alias("tag_subquery")
+    )
+    base_query = (
+        db.select(
+            [
+                RunsTable.c.id,
+                RunsTable.c.run_id,
+                RunsTable.c.pipeline_name,
+                RunsTable.c.partition,
+                RunsTable.c.status,
+                RunsTable.c.start_time,
+                RunsTable.c.end_time,
+                subquery.c.repo_label,
+            ]
+        )
+        .select_from(RunsTable.join(subquery, RunsTable.c.run_id == subquery.c.tags_run_id))
+        .where(RunsTable.c.partition != None)
+        .order_by(db.asc(RunsTable.c.id))
+        .limit(CHUNK_SIZE)
+    )
+
+    # runs are read in creation order, so later runs of a partition replace earlier ones
+    latest_by_partition = {}
+    cursor = None
+    has_more = True
+    while has_more:
+        if cursor:
+            query = base_query.where(RunsTable.c.id > cursor)
+        else:
+            query = base_query
+
+        with run_storage.connect() as conn:
+            result_proxy = conn.execute(query)
+            rows = result_proxy.fetchall()
+            result_proxy.close()
+
+        has_more = len(rows) >= CHUNK_SIZE
+        for row in rows:
+            cursor = row[0]
+            latest_by_partition[(row.repo_label, row.pipeline_name, row.partition)] = dict(
+                repository_label=row.repo_label,
+                pipeline_name=row.pipeline_name,
+                partition=row.partition,
+                run_storage_id=row.id,
+                run_id=row.run_id,
+                status=row.status,
+                start_time=row.start_time,
+                end_time=row.end_time,
+            )
+
+    if print_fn:
+        print_fn(f"Found {len(latest_by_partition)} job partitions to index.")
+
+    rows = list(latest_by_partition.values())
+    with run_storage.connect() as conn:
+        conn.execute(PartitionStatusesTable.delete())  # pylint: disable=no-value-for-parameter
+        for i in range(0, len(rows), CHUNK_SIZE):
+            conn.execute(
+                PartitionStatusesTable.insert().values(  # pylint: disable=no-value-for-parameter
+                    rows[i : i + CHUNK_SIZE]
+                )
+            )
@@ -103,6 +103,25 @@
     db.Column("value", db.Text),
 )
 
+# Status of the latest run of each partition of a job, keyed by the repository label of the run.
+# Maintained as runs are added and updated, and backfilled by a data migration, so that the
+# partition statuses of a job can be read without scanning all of its runs.
+PartitionStatusesTable = db.Table(
+    "partition_statuses",
+    RunStorageSqlMetadata,
+    db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+    db.Column("repository_label", db.Text, nullable=False),
+    db.Column("pipeline_name", db.Text, nullable=False),
+    db.Column("partition", db.Text, nullable=False),
+    # storage id of the latest run in the runs table, used to order runs of the same partition
+    db.Column("run_storage_id", db.Integer, nullable=False),
+    db.Column("run_id", db.String(255), nullable=False),
+    db.Column("status", db.String(63)),
+    db.Column("start_time", db.Float),
+    db.Column("end_time", db.Float),
+    db.Column("update_timestamp", db.DateTime, server_default=get_current_timestamp()),
+)
+
 db.Index("idx_run_tags", RunTagsTable.c.key, RunTagsTable.c.value, mysql_length=64)
 db.Index("idx_run_partitions", RunsTable.c.partition_set, RunsTable.c.partition, mysql_length=64)
 db.Index("idx_bulk_actions", BulkActionsTable.c.key, mysql_length=32)
@@ -122,3 +141,11 @@
     },
 )
 db.Index("idx_kvs_keys_unique", KeyValueStoreTable.c.key, unique=True, mysql_length=64)
+db.Index(
+    "idx_partition_statuses",
+    PartitionStatusesTable.c.pipeline_name,
+    PartitionStatusesTable.c.repository_label,
+    PartitionStatusesTable.c.partition,
+    mysql_length=64,
+)
+db.Index("idx_partition_statuses_run_id", PartitionStatusesTable.c.run_id, mysql_length=64)
@@ -26,14 +26,20 @@
     create_execution_plan_snapshot_id,
     create_pipeline_snapshot_id,
 )
-from dagster._core.storage.tags import PARTITION_NAME_TAG, PARTITION_SET_TAG, ROOT_RUN_ID_TAG
+from dagster._core.storage.tags import (
+    PARTITION_NAME_TAG,
+    PARTITION_SET_TAG,
+    PRIORITY_TAG,
+    REPOSITORY_LABEL_TAG,
+    ROOT_RUN_ID_TAG,
+)
 from dagster._daemon.types import DaemonHeartbeat
 from dagster._serdes import (
     deserialize_as,
     deserialize_json_to_dagster_namedtuple,
     serialize_dagster_namedtuple,
 )
-from dagster._seven import JSONDecodeError
+from dagster._seven import JSONDecodeError, json
 from dagster._utils import merge_dicts, utc_datetime_from_timestamp
 
 from ..pipeline_run import (
@@ -45,19 +51,27 @@
     RunsFilter,
     TagBucket,
 )
-from .base import RunStorage
-from .migration import OPTIONAL_DATA_MIGRATIONS, REQUIRED_DATA_MIGRATIONS, RUN_PARTITIONS
+from .base import QueuedRunIdsConnection, RunStorage
+from .migration import (
+    OPTIONAL_DATA_MIGRATIONS,
+    PARTITION_STATUSES,
+    REQUIRED_DATA_MIGRATIONS,
+    RUN_PARTITIONS,
+)
 from .schema import (
     BulkActionsTable,
     DaemonHeartbeatsTable,
     InstanceInfo,
     KeyValueStoreTable,
+    PartitionStatusesTable,
     RunTagsTable,
     RunsTable,
     SecondaryIndexMigrationTable,
     SnapshotsTable,
 )
 
+RUN_INSERT_BATCH_SIZE = 100
+
 
 class SnapshotType(Enum):
     PIPELINE = "PIPELINE"
@@ -95,46 +109,184 @@ def fetchone(self, query):
 
     def add_run(self, pipeline_run: PipelineRun) -> PipelineRun:
         check.inst_param(pipeline_run, "pipeline_run", PipelineRun)
+        self.add_runs([pipeline_run])
+        return pipeline_run
 
-        if pipeline_run.pipeline_snapshot_id and not self.has_pipeline_snapshot(
-            pipeline_run.pipeline_snapshot_id
-        ):
-            raise DagsterSnapshotDoesNotExist(
-                "Snapshot {ss_id} does not exist in run storage".format(
-                    ss_id=pipeline_run.pipeline_snapshot_id
+    def add_runs(self, pipeline_runs: List[PipelineRun]) -> List[PipelineRun]:
+        check.list_param(pipeline_runs, "pipeline_runs", of_type=PipelineRun)
+        if not pipeline_runs:
+            return pipeline_runs
+
+        # runs created together usually share a snapshot, so only check each snapshot once
+        for snapshot_id in {run.pipeline_snapshot_id for run in pipeline_runs}:
+            if snapshot_id and not self.has_pipeline_snapshot(snapshot_id):
+                raise DagsterSnapshotDoesNotExist(
+                    "Snapshot {ss_id} does not exist in run storage".format(ss_id=snapshot_id)
+                )
+
+        run_rows = []
+        tag_rows = []
+        for pipeline_run in pipeline_runs:
+            has_tags = pipeline_run.tags and len(pipeline_run.tags) > 0
+            run_rows.append(
+                dict(
+                    run_id=pipeline_run.run_id,
+                    pipeline_name=pipeline_run.pipeline_name,
+                    status=pipeline_run.status.value,
+                    run_body=serialize_dagster_namedtuple(pipeline_run),
+                    snapshot_id=pipeline_run.pipeline_snapshot_id,
+                    partition=pipeline_run.tags.get(PARTITION_NAME_TAG) if has_tags else None,
+                    partition_set=pipeline_run.tags.get(PARTITION_SET_TAG) if has_tags else None,
                 )
             )
+            tag_rows.extend(
+                dict(run_id=pipeline_run.run_id, key=k, value=v)
+                for k, v in pipeline_run.tags_for_storage().items()
+            )
 
-        has_tags = pipeline_run.tags and len(pipeline_run.tags) > 0
-        partition = pipeline_run.tags.get(PARTITION_NAME_TAG) if has_tags else None
-        partition_set = pipeline_run.tags.get(PARTITION_SET_TAG) if has_tags else None
-
-        runs_insert = RunsTable.insert().values(  # pylint: disable=no-value-for-parameter
-            run_id=pipeline_run.run_id,
-            pipeline_name=pipeline_run.pipeline_name,
-            status=pipeline_run.status.value,
-            run_body=serialize_dagster_namedtuple(pipeline_run),
-            snapshot_id=pipeline_run.pipeline_snapshot_id,
-            partition=partition,
-            partition_set=partition_set,
-        )
-        with self.connect() as conn:
+        # write runs, their tags, and the statuses of their partitions in one transaction, so that a
+        # failure never leaves runs without tags, batching the inserts to stay within the
+        # database's limit on bound values
+        update_partition_statuses = self.has_built_index(PARTITION_STATUSES)
+        with self._connect_for_transaction() as conn:
             try:
-                conn.execute(runs_insert)
+                with conn.begin():
+                    for i in range(0, len(run_rows), RUN_INSERT_BATCH_SIZE):
+                        conn.execute(
+                            RunsTable.insert().values(  # pylint: disable=no-value-for-parameter
+                                run_rows[i : i + RUN_INSERT_BATCH_SIZE]
+                            )
+                        )
+                    for i in range(0, len(tag_rows), RUN_INSERT_BATCH_SIZE):
+                        conn.execute(
+                            RunTagsTable.insert().values(  # pylint: disable=no-value-for-parameter
+                                tag_rows[i : i + RUN_INSERT_BATCH_SIZE]
+                            )
+                        )
+                    if update_partition_statuses:
+                        for i in range(0, len(pipeline_runs), RUN_INSERT_BATCH_SIZE):
+                            self._add_partition_statuses(
+                                conn, pipeline_runs[i : i + RUN_INSERT_BATCH_SIZE]
+                            )
             except db.exc.IntegrityError as exc:
                 raise DagsterRunAlreadyExists from exc
 
-            tags_to_insert = pipeline_run.tags_for_storage()
-            if tags_to_insert:
+        return pipeline_runs
+
+    def _connect_for_transaction(self):
+        """A connection on which ``conn.begin()`` starts a transaction. Override in storages whose
+        engine autocommits every statement.
+        """
+        return self.connect()
+
+    def _add_partition_statuses(self, conn, pipeline_runs: List[PipelineRun]):
+        # newly created runs are the latest runs of their partitions
+        partitioned_runs = {
+            pipeline_run.run_id: pipeline_run
+            for pipeline_run in pipeline_runs
+            if pipeline_run.tags.get(PARTITION_NAME_TAG)
+            and pipeline_run.tags_for_storage().get(REPOSITORY_LABEL_TAG)
+        }
+        if not partitioned_runs:
+            return
+
+        run_storage_ids = dict(
+            conn.execute(
+                db.select([RunsTable.c.run_id, RunsTable.c.id]).where(
+                    RunsTable.c.run_id.in_(list(partitioned_runs.keys()))
+                )
+            ).fetchall()
+        )
+
+        # the latest of the runs of each partition, by job
+        latest_runs: Dict[Tuple[str, str], Dict[str, Tuple[int, PipelineRun]]] = defaultdict(dict)
+        for run_id, pipeline_run in partitioned_runs.items():
+            job_key = (
+                pipeline_run.tags_for_storage()[REPOSITORY_LABEL_TAG],
+                pipeline_run.pipeline_name,
+            )
+            partition = pipeline_run.tags[PARTITION_NAME_TAG]
+            run_storage_id = run_storage_ids[run_id]
+            latest_run = latest_runs[job_key].get(partition)
+            if not latest_run or latest_run[0] < run_storage_id:
+                latest_runs[job_key][partition] = (run_storage_id, pipeline_run)
+
+        update_timestamp = pendulum.now("UTC")
+        for (repository_label, pipeline_name), runs_by_partition in latest_runs.items():
+            job_filter = db.and_(
+                PartitionStatusesTable.c.repository_label == repository_label,
+                PartitionStatusesTable.c.pipeline_name == pipeline_name,
+            )
+            existing_partitions = {
+                row[0]
+                for row in conn.execute(
+                    db.select([PartitionStatusesTable.c.partition])
+                    .where(
+                        db.and_(
+                            job_filter,
+                            PartitionStatusesTable.c.partition.in_(list(runs_by_partition.keys())),
+                        )
+                    )
+                    .distinct()
+                ).fetchall()
+            }
+
+            # concurrent writers may both insert a row for the partition, so readers take the row
+            # of the latest run
+            new_rows = [
+                dict(
+                    repository_label=repository_label,
+                    pipeline_name=pipeline_name,
+                    partition=partition,
+                    run_storage_id=run_storage_id,
+                    run_id=pipeline_run.run_id,
+                    status=pipeline_run.status.value,
+                    start_time=None,
+                    end_time=None,
+                    update_timestamp=update_timestamp,
+                )
+                for partition, (run_storage_id, pipeline_run) in runs_by_partition.items()
+                if partition not in existing_partitions
+            ]
+            if new_rows:
                 conn.execute(
-                    RunTagsTable.insert(),  # pylint: disable=no-value-for-parameter
-                    [
-                        dict(run_id=pipeline_run.run_id, key=k, value=v)
-                        for k, v in tags_to_insert.items()
-                    ],
+                    PartitionStatusesTable.insert().values(  # pylint: disable=no-value-for-parameter
+                        new_rows
+                    )
                 )
 
-        return pipeline_run
+            if not existing_partitions:
+                continue
+
+            def _by_partition(get_value):
+                return db.case(
+                    {
+                        partition: get_value(*runs_by_partition[partition])
+                        for partition in existing_partitions
+                    },
+                    value=PartitionStatusesTable.c.partition,
+                )
+
+            run_storage_id_by_partition = _by_partition(lambda run_storage_id, _: run_storage_id)
+            conn.execute(
+                PartitionStatusesTable.update()  # pylint: disable=no-value-for-parameter
+                .where(
+                    db.and_(
+                        job_filter,
+                        PartitionStatusesTable.c.partition.in_(list(existing_partitions)),
+                        # only ever move to a later run, in case runs are added concurrently
+                        PartitionStatusesTable.c.run_storage_id < run_storage_id_by_partition,
+                    )
+                )
+                .values(
+                    run_storage_id=run_storage_id_by_partition,
+                    run_id=_by_partition(lambda _, pipeline_run: pipeline_run.run_id),
+                    status=_by_partition(lambda _, pipeline_run: pipeline_run.status.value),
+                    start_time=None,
+                    end_time=None,
+                    update_timestamp=update_timestamp,
+                )
+            )
 
     def handle_run_event(self, run_id: str, event: DagsterEvent):
         check.str_param(run_id, "run_id")
@@ -181,6 +333,28 @@ def handle_run_event(self, run_id: str, event: DagsterEvent):
                 )
             )
 
+        if run.tags.get(PARTITION_NAME_TAG) and self.has_built_index(PARTITION_STATUSES):
+            partition_status_values = {}
+            if event.event_type == DagsterEventType.PIPELINE_START:
+                partition_status_values["start_time"] = now.timestamp()
+            if event.event_type in {
+                DagsterEventType.PIPELINE_CANCELED,
+                DagsterEventType.PIPELINE_FAILURE,
+                DagsterEventType.PIPELINE_SUCCESS,
+            }:
+                partition_status_values["end_time"] = now.timestamp()
+
+            with self.connect() as conn:
+                conn.execute(
+                    PartitionStatusesTable.update()  # pylint: disable=no-value-for-parameter
+                    .where(PartitionStatusesTable.c.run_id == run_id)
+                    .values(
+                        status=new_pipeline_status.value,
+                        update_timestamp=now,
+                        **partition_status_values,
+                    )
+                )
+
     def _row_to_run(self, row) -> PipelineRun:
         run = deserialize_as(row["run_body"], PipelineRun)
         status = DagsterRunStatus(row["status"])
@@ -393,6 +567,69 @@ def get_runs(
         rows = self.fetchall(query)
         return self._rows_to_runs(rows)
 
+    def get_run_ids(
+        self,
+        filters: Optional[RunsFilter] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[str]:
+        query = self._runs_query(filters=filters, cursor=cursor, limit=limit, columns=["run_id"])
+        rows = self.fetchall(query)
+        return [row[0] for row in rows]
+
+    def get_queued_run_ids(
+        self, cursor: Optional[str] = None, limit: Optional[int] = None
+    ) -> QueuedRunIdsConnection:
+        # Reads only the run id and priority tag of each queued run, using the status and run tag
+        # indexes, and orders the queue in the database rather than deserializing every queued run
+        priority = self._run_priority_column(RunTagsTable.c.value)
+        query = (
+            db.select([RunsTable.c.run_id, priority, RunsTable.c.id])
+            .select_from(
+                RunsTable.outerjoin(
+                    RunTagsTable,
+                    db.and_(
+                        RunsTable.c.run_id == RunTagsTable.c.run_id,
+                        RunTagsTable.c.key == PRIORITY_TAG,
+                    ),
+                )
+            )
+            .where(RunsTable.c.status == DagsterRunStatus.QUEUED.value)
+            .order_by(priority.desc(), RunsTable.c.id.asc())
+        )
+
+        if cursor:
+            # the cursor is the place in the queue of the last run returned, so it holds even if
+            # that run has since been dequeued or deleted
+            cursor_priority, cursor_id = json.loads(cursor)
+            query = query.where(
+                db.or_(
+                    priority < cursor_priority,
+                    db.and_(priority == cursor_priority, RunsTable.c.id > cursor_id),
+                )
+            )
+
+        if limit:
+            query = query.limit(limit + 1)
+
+        rows = self.fetchall(query)
+        has_more = bool(limit) and len(rows) > limit
+        if has_more:
+            rows = rows[:limit]
+
+        return QueuedRunIdsConnection(
+            run_ids=[row[0] for row in rows],
+            cursor=json.dumps([rows[-1][1], rows[-1][2]]) if rows else cursor,
+            has_more=has_more,
+        )
+
+    def _run_priority_column(self, priority_tag_column):
+        """The priority of a run, as an integer, given its priority tag value. Runs without a
+        priority tag have priority 0. Override in storages whose database raises an error, rather
+        than returning 0, when casting a malformed priority to an integer.
+        """
+        return db.func.coalesce(db.cast(priority_tag_column, db.Integer), 0)
+
     def get_runs_count(self, filters: Optional[RunsFilter] = None) -> int:
         subquery = self._runs_query(filters=filters).alias("subquery")
 
@@ -722,6 +959,55 @@ def delete_run(self, run_id: str):
         with self.connect() as conn:
             conn.execute(query)
 
+        if self.has_built_index(PARTITION_STATUSES):
+            self._refresh_partition_statuses_for_run(run_id)
+
+    def _refresh_partition_statuses_for_run(self, run_id: str):
+        # points the partitions whose latest run was deleted at their previous run, if any
+        rows = self.fetchall(
+            db.select(
+                [
+                    PartitionStatusesTable.c.id,
+                    PartitionStatusesTable.c.repository_label,
+                    PartitionStatusesTable.c.pipeline_name,
+                    PartitionStatusesTable.c.partition,
+                ]
+            ).where(PartitionStatusesTable.c.run_id == run_id)
+        )
+        for row in rows:
+            latest_run_query = self._runs_query(
+                filters=RunsFilter(
+                    pipeline_name=row.pipeline_name,
+                    tags={
+                        REPOSITORY_LABEL_TAG: row.repository_label,
+                        PARTITION_NAME_TAG: row.partition,
+                    },
+                ),
+                limit=1,
+                columns=["id", "run_id", "status", "start_time", "end_time"],
+            )
+            latest_run = self.fetchone(latest_run_query)
+            with self.connect() as conn:
+                if latest_run:
+                    conn.execute(
+                        PartitionStatusesTable.update()  # pylint: disable=no-value-for-parameter
+                        .where(PartitionStatusesTable.c.id == row.id)
+                        .values(
+                            run_storage_id=latest_run["id"],
+                            run_id=latest_run["run_id"],
+                            status=latest_run["status"],
+                            start_time=latest_run["start_time"],
+                            end_time=latest_run["end_time"],
+                            update_timestamp=pendulum.now("UTC"),
+                        )
+                    )
+                else:
+                    conn.execute(
+                        PartitionStatusesTable.delete().where(  # pylint: disable=no-value-for-parameter
+                            PartitionStatusesTable.c.id == row.id
+                        )
+                    )
+
     def has_pipeline_snapshot(self, pipeline_snapshot_id: str) -> bool:
         check.str_param(pipeline_snapshot_id, "pipeline_snapshot_id")
         return self._has_snapshot_id(pipeline_snapshot_id)
@@ -783,7 +1069,12 @@ def _add_snapshot(self, snapshot_id: str, snapshot_obj, snapshot_type: SnapshotT
                     snapshot_type=snapshot_type.value,
                 )
             )
-            conn.execute(snapshot_insert)
+            try:
+                conn.execute(snapshot_insert)
+            except db.exc.IntegrityError:
+                # snapshot ids are content hashes, so the snapshot was already added with the same
+                # body, e.g. by a run created concurrently from the same job
+                pass
             return snapshot_id
 
     def get_run_storage_id(self) -> str:
@@ -858,6 +1149,51 @@ def get_run_partition_data(self, runs_filter: RunsFilter) -> List[RunPartitionDa
 
             return list(_partition_data_by_partition.values())
 
+    def get_latest_run_partition_data(
+        self, pipeline_name: str, repository_label: str
+    ) -> List[RunPartitionData]:
+        check.str_param(pipeline_name, "pipeline_name")
+        check.str_param(repository_label, "repository_label")
+
+        if not self.has_built_index(PARTITION_STATUSES):
+            return super().get_latest_run_partition_data(pipeline_name, repository_label)
+
+        query = (
+            db.select(
+                [
+                    PartitionStatusesTable.c.partition,
+                    PartitionStatusesTable.c.run_id,
+                    PartitionStatusesTable.c.status,
+                    PartitionStatusesTable.c.start_time,
+                    PartitionStatusesTable.c.end_time,
+                ]
+            )
+            .where(
+                db.and_(
+                    PartitionStatusesTable.c.pipeline_name == pipeline_name,
+                    PartitionStatusesTable.c.repository_label == repository_label,
+                )
+            )
+            .order_by(PartitionStatusesTable.c.run_storage_id.desc())
+        )
+        rows = self.fetchall(query)
+
+        # dedup by partition, in case concurrent writers inserted more than one row for it
+        _partition_data_by_partition = {}
+        for row in rows:
+            if row["partition"] in _partition_data_by_partition:
+                continue
+
+            _partition_data_by_partition[row["partition"]] = RunPartitionData(
+                run_id=row["run_id"],
+                partition=row["partition"],
+                status=DagsterRunStatus[row["status"]],
+                start_time=row["start_time"],
+                end_time=row["end_time"],
+            )
+
+        return list(_partition_data_by_partition.values())
+
     def _get_partition_runs(
         self, partition_set_name: str, partition_name: str
     ) -> List[PipelineRun]:
@@ -992,6 +1328,12 @@ def wipe(self):
             conn.execute(SnapshotsTable.delete())  # pylint: disable=no-value-for-parameter
             conn.execute(DaemonHeartbeatsTable.delete())  # pylint: disable=no-value-for-parameter
 
+        if self.has_built_index(PARTITION_STATUSES):
+            with self.connect() as conn:
+                conn.execute(
+                    PartitionStatusesTable.delete()  # pylint: disable=no-value-for-parameter
+                )
+
     def wipe_daemon_heartbeats(self):
         with self.connect() as conn:
             # https://stackoverflow.com/a/54386260/324449
@@ -19,6 +19,7 @@
 from dagster._serdes import ConfigurableClass, ConfigurableClassData
 from dagster._utils import mkdir_p
 
+from ..migration import PARTITION_STATUSES
 from ..schema import InstanceInfo, RunStorageSqlMetadata, RunTagsTable, RunsTable
 from ..sql_run_storage import SqlRunStorage
 
@@ -160,6 +161,9 @@ def delete_run(self, run_id):
             conn.execute(remove_tags)
             conn.execute(remove_run)
 
+        if self.has_built_index(PARTITION_STATUSES):
+            self._refresh_partition_statuses_for_run(run_id)
+
     def alembic_version(self):
         alembic_config = get_alembic_config(__file__)
         with self.connect() as conn:
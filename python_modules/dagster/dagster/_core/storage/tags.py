@@ -69,6 +69,15 @@ def get_tag_type(tag):
         return TagType.USER_PROVIDED
 
 
+def get_run_priority(tags) -> int:
+    """The priority of a run with the given tags, set with the PRIORITY_TAG. Higher priority runs
+    are dequeued first; runs without a valid priority have priority 0."""
+    try:
+        return int(tags.get(PRIORITY_TAG, "0"))
+    except ValueError:
+        return 0
+
+
 def check_reserved_tags(tags):
     check.opt_dict_param(tags, "tags", key_type=str, value_type=str)
 
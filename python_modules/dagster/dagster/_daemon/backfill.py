@@ -1,3 +1,4 @@
+import concurrent.futures
 import os
 import sys
 import time
@@ -16,10 +17,14 @@
 from dagster._utils.error import serializable_error_info_from_exc_info
 
 # out of abundance of caution, sleep at checkpoints in case we are pinning CPU by submitting lots
-# of jobs all at once
+# of jobs all at once. Backfills that submit their runs in a threadpool are already bounded by its
+# number of workers, so they do not sleep.
 CHECKPOINT_INTERVAL = 1
 CHECKPOINT_COUNT = 25
 
+# How long the daemon thread waits for threaded backfills before yielding to heartbeat
+THREADED_BACKFILL_WAIT_SECONDS = 1
+
 
 def _check_for_debug_crash(debug_crash_flags, key):
     if not debug_crash_flags:
@@ -34,9 +39,24 @@ def _check_for_debug_crash(debug_crash_flags, key):
     raise Exception("Process didn't terminate after sending crash signal")
 
 
-def execute_backfill_iteration(instance, workspace, logger, debug_crash_flags=None):
+def execute_backfill_iteration(
+    instance,
+    workspace,
+    logger,
+    debug_crash_flags=None,
+    threadpool_executor=None,
+    submit_threadpool_executor=None,
+):
     check.inst_param(instance, "instance", DagsterInstance)
     check.inst_param(workspace, "workspace", IWorkspace)
+    check.opt_inst_param(
+        threadpool_executor, "threadpool_executor", concurrent.futures.ThreadPoolExecutor
+    )
+    check.opt_inst_param(
+        submit_threadpool_executor,
+        "submit_threadpool_executor",
+        concurrent.futures.ThreadPoolExecutor,
+    )
 
     backfill_jobs = instance.get_backfills(status=BulkActionStatus.REQUESTED)
 
@@ -45,79 +65,130 @@ def execute_backfill_iteration(instance, workspace, logger, debug_crash_flags=No
         yield
         return
 
-    for backfill_job in backfill_jobs:
-        backfill_id = backfill_job.backfill_id
+    backfill_args = [
+        (instance, workspace, logger, backfill_job, debug_crash_flags, submit_threadpool_executor)
+        for backfill_job in backfill_jobs
+    ]
 
-        # refetch, in case the backfill was updated in the meantime
-        backfill_job = instance.get_backfill(backfill_id)
+    if threadpool_executor:
+        yield from _execute_backfill_jobs_in_threads(logger, threadpool_executor, backfill_args)
+    else:
+        for args in backfill_args:
+            yield from _execute_backfill_job_iteration(*args)
+
+
+def _execute_backfill_jobs_in_threads(logger, threadpool_executor, backfill_args):
+    """
+    Submit each backfill in the threadpool, waiting for every backfill to finish submitting its
+    runs for this iteration so that no backfill is submitted twice at once.
+    """
+    running = {
+        threadpool_executor.submit(_execute_backfill_job_in_thread, *args): args[3].backfill_id
+        for args in backfill_args
+    }
+    while running:
+        done, _ = concurrent.futures.wait(
+            running,
+            timeout=THREADED_BACKFILL_WAIT_SECONDS,
+            return_when=concurrent.futures.FIRST_COMPLETED,
+        )
+        for future in done:
+            backfill_id = running.pop(future)
+            try:
+                yield from future.result()
+            except Exception:
+                error_info = serializable_error_info_from_exc_info(sys.exc_info())
+                logger.error(f"Backfill failed for {backfill_id}: {error_info.to_string()}")
+                yield error_info
+
+        # yield to allow the backfill daemon to heartbeat while backfills are submitted
+        yield
 
-        if not backfill_job.last_submitted_partition_name:
-            logger.info(f"Starting backfill for {backfill_id}")
-        else:
-            logger.info(
-                f"Resuming backfill for {backfill_id} from {backfill_job.last_submitted_partition_name}"
-            )
 
-        origin = (
-            backfill_job.partition_set_origin.external_repository_origin.repository_location_origin
+def _execute_backfill_job_in_thread(*args):
+    # submit the backfill from within a thread, collecting what it yields so that the daemon
+    # thread can report errors from its own generator
+    return [error_info for error_info in _execute_backfill_job_iteration(*args) if error_info]
+
+
+def _execute_backfill_job_iteration(
+    instance, workspace, logger, backfill_job, debug_crash_flags, submit_threadpool_executor
+):
+    backfill_id = backfill_job.backfill_id
+
+    # refetch, in case the backfill was updated in the meantime
+    backfill_job = instance.get_backfill(backfill_id)
+
+    if not backfill_job.last_submitted_partition_name:
+        logger.info(f"Starting backfill for {backfill_id}")
+    else:
+        logger.info(
+            f"Resuming backfill for {backfill_id} from {backfill_job.last_submitted_partition_name}"
         )
 
-        try:
-            repo_location = workspace.get_repository_location(origin.location_name)
-            repo_name = backfill_job.partition_set_origin.external_repository_origin.repository_name
-            partition_set_name = backfill_job.partition_set_origin.partition_set_name
-            if not repo_location.has_repository(repo_name):
-                raise DagsterBackfillFailedError(
-                    f"Could not find repository {repo_name} in location {repo_location.name} to "
-                    f"run backfill {backfill_id}."
-                )
-            external_repo = repo_location.get_repository(repo_name)
-            if not external_repo.has_external_partition_set(partition_set_name):
-                raise DagsterBackfillFailedError(
-                    f"Could not find partition set {partition_set_name} in repository {repo_name}. "
-                )
+    origin = backfill_job.partition_set_origin.external_repository_origin.repository_location_origin
 
-            has_more = True
-            while has_more:
-                if backfill_job.status != BulkActionStatus.REQUESTED:
-                    break
+    try:
+        repo_location = workspace.get_repository_location(origin.location_name)
+        repo_name = backfill_job.partition_set_origin.external_repository_origin.repository_name
+        partition_set_name = backfill_job.partition_set_origin.partition_set_name
+        if not repo_location.has_repository(repo_name):
+            raise DagsterBackfillFailedError(
+                f"Could not find repository {repo_name} in location {repo_location.name} to "
+                f"run backfill {backfill_id}."
+            )
+        external_repo = repo_location.get_repository(repo_name)
+        if not external_repo.has_external_partition_set(partition_set_name):
+            raise DagsterBackfillFailedError(
+                f"Could not find partition set {partition_set_name} in repository {repo_name}. "
+            )
 
-                chunk, checkpoint, has_more = _get_partitions_chunk(
-                    instance, logger, backfill_job, CHECKPOINT_COUNT
-                )
-                _check_for_debug_crash(debug_crash_flags, "BEFORE_SUBMIT")
-
-                if chunk:
-                    for _run_id in submit_backfill_runs(
-                        instance, workspace, repo_location, backfill_job, chunk
-                    ):
-                        yield
-                        # before submitting, refetch the backfill job to check for status changes
-                        backfill_job = instance.get_backfill(backfill_job.backfill_id)
-                        if backfill_job.status != BulkActionStatus.REQUESTED:
-                            return
-
-                _check_for_debug_crash(debug_crash_flags, "AFTER_SUBMIT")
-
-                if has_more:
-                    # refetch, in case the backfill was updated in the meantime
-                    backfill_job = instance.get_backfill(backfill_job.backfill_id)
-                    instance.update_backfill(backfill_job.with_partition_checkpoint(checkpoint))
+        has_more = True
+        while has_more:
+            if backfill_job.status != BulkActionStatus.REQUESTED:
+                break
+
+            chunk, checkpoint, has_more = _get_partitions_chunk(
+                instance, logger, backfill_job, CHECKPOINT_COUNT
+            )
+            _check_for_debug_crash(debug_crash_flags, "BEFORE_SUBMIT")
+
+            if chunk:
+                for _run_id in submit_backfill_runs(
+                    instance,
+                    workspace,
+                    repo_location,
+                    backfill_job,
+                    chunk,
+                    threadpool_executor=submit_threadpool_executor,
+                ):
                     yield
+
+            _check_for_debug_crash(debug_crash_flags, "AFTER_SUBMIT")
+
+            # refetch once per chunk, in case the backfill was canceled or updated in the meantime
+            backfill_job = instance.get_backfill(backfill_job.backfill_id)
+            if backfill_job.status != BulkActionStatus.REQUESTED:
+                return
+
+            if has_more:
+                instance.update_backfill(backfill_job.with_partition_checkpoint(checkpoint))
+                yield
+                if not submit_threadpool_executor:
                     time.sleep(CHECKPOINT_INTERVAL)
-                else:
-                    logger.info(
-                        f"Backfill completed for {backfill_id} for {len(backfill_job.partition_names)} partitions"
-                    )
-                    instance.update_backfill(backfill_job.with_status(BulkActionStatus.COMPLETED))
-                    yield
-        except Exception:
-            error_info = serializable_error_info_from_exc_info(sys.exc_info())
-            instance.update_backfill(
-                backfill_job.with_status(BulkActionStatus.FAILED).with_error(error_info)
-            )
-            logger.error(f"Backfill failed for {backfill_id}: {error_info.to_string()}")
-            yield error_info
+            else:
+                logger.info(
+                    f"Backfill completed for {backfill_id} for {len(backfill_job.partition_names)} partitions"
+                )
+                instance.update_backfill(backfill_job.with_status(BulkActionStatus.COMPLETED))
+                yield
+    except Exception:
+        error_info = serializable_error_info_from_exc_info(sys.exc_info())
+        instance.update_backfill(
+            backfill_job.with_status(BulkActionStatus.FAILED).with_error(error_info)
+        )
+        logger.error(f"Backfill failed for {backfill_id}: {error_info.to_string()}")
+        yield error_info
 
 
 def _get_partitions_chunk(instance, logger, backfill_job, chunk_size):
@@ -4,7 +4,8 @@
 import uuid
 from abc import abstractmethod
 from collections import deque
-from contextlib import AbstractContextManager
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, ExitStack
 from threading import Event
 from typing import Callable, ContextManager, Tuple
 
@@ -246,7 +247,32 @@ def daemon_type(cls):
         return "BACKFILL"
 
     def run_iteration(self, instance, workspace):
-        yield from execute_backfill_iteration(instance, workspace, self._logger)
+        with ExitStack() as stack:
+            settings = instance.get_settings("backfills")
+            threadpool_executor = None
+            submit_threadpool_executor = None
+            if settings.get("use_threads"):
+                threadpool_executor = stack.enter_context(
+                    ThreadPoolExecutor(
+                        max_workers=settings.get("num_workers"),
+                        thread_name_prefix="backfill_daemon_worker",
+                    )
+                )
+                if settings.get("num_submit_workers"):
+                    submit_threadpool_executor = stack.enter_context(
+                        ThreadPoolExecutor(
+                            max_workers=settings.get("num_submit_workers"),
+                            thread_name_prefix="backfill_submit_worker",
+                        )
+                    )
+
+            yield from execute_backfill_iteration(
+                instance,
+                workspace,
+                self._logger,
+                threadpool_executor=threadpool_executor,
+                submit_threadpool_executor=submit_threadpool_executor,
+            )
 
 
 class MonitoringDaemon(IntervalDaemon):
@@ -1,6 +1,6 @@
 import sys
 from collections import defaultdict
-from typing import Dict
+from typing import Dict, List, Mapping, Optional
 
 from dagster import DagsterEvent, DagsterEventType
 from dagster import _check as check
@@ -11,11 +11,13 @@
     PipelineRunStatus,
     RunsFilter,
 )
-from dagster._core.storage.tags import PRIORITY_TAG
 from dagster._core.workspace import IWorkspace
 from dagster._daemon.daemon import IntervalDaemon
 from dagster._utils.error import serializable_error_info_from_exc_info
 
+# Maximum number of runs loaded from the run storage at once
+RUN_FETCH_BATCH_SIZE = 100
+
 
 class _TagConcurrencyLimitsCounter:
     """
@@ -50,6 +52,10 @@ def __init__(self, tag_concurrency_limits, in_progress_runs):
         for run in in_progress_runs:
             self.update_counters_with_launched_run(run)
 
+    @property
+    def has_limits(self):
+        return bool(self._key_limits or self._key_value_limits or self._unique_value_limits)
+
     def is_run_blocked(self, run):
         """
         True if there are in progress runs which are blocking this run based on tag limits
@@ -77,24 +83,44 @@ def update_counters_with_launched_run(self, run):
         """
         Add a new in progress run to the counters
         """
-        for key, value in run.tags.items():
+        self._update_counters(run.tags, 1)
+
+    def update_counters_with_finished_run(self, run_tags):
+        """
+        Remove a run that is no longer in progress from the counters
+        """
+        self._update_counters(run_tags, -1)
+
+    def _update_counters(self, run_tags, delta):
+        for key, value in run_tags.items():
             if key in self._key_limits:
-                self._key_counts[key] += 1
+                self._key_counts[key] += delta
 
             tag_tuple = (key, value)
             if tag_tuple in self._key_value_limits:
-                self._key_value_counts[tag_tuple] += 1
+                self._key_value_counts[tag_tuple] += delta
 
             if key in self._unique_value_limits:
-                self._unique_value_counts[tag_tuple] += 1
+                self._unique_value_counts[tag_tuple] += delta
 
 
 class QueuedRunCoordinatorDaemon(IntervalDaemon):
     """
     Used with the QueuedRunCoordinator on the instance. This process finds queued runs from the run
     store and launches them.
+
+    The tags of in progress runs are cached between iterations, so that each iteration only loads
+    the runs that started since the last one, and queued runs are loaded in pages, in the order
+    they are dequeued, until the concurrency limit is reached.
     """
 
+    def __init__(self, interval_seconds):
+        super().__init__(interval_seconds)
+        self._tag_concurrency_limits: Optional[List[dict]] = None
+        self._tag_concurrency_limits_counter: Optional[_TagConcurrencyLimitsCounter] = None
+        # run_id -> tags of every in progress run counted by the tag concurrency limits counter
+        self._in_progress_run_tags: Dict[str, Mapping[str, str]] = {}
+
     @classmethod
     def daemon_type(cls):
         return "QUEUED_RUN_COORDINATOR"
@@ -108,48 +134,33 @@ def run_iteration(self, instance, workspace):
         max_concurrent_runs = run_queue_config.max_concurrent_runs
         tag_concurrency_limits = run_queue_config.tag_concurrency_limits
 
-        in_progress_runs = self._get_in_progress_runs(instance)
+        num_in_progress_runs = self._update_in_progress_runs(instance, tag_concurrency_limits)
+        tag_concurrency_limits_counter = self._tag_concurrency_limits_counter
 
         max_concurrent_runs_enabled = max_concurrent_runs != -1  # setting to -1 disables the limit
         if max_concurrent_runs_enabled:
-            max_runs_to_launch = max_concurrent_runs - len(in_progress_runs)
+            max_runs_to_launch = max_concurrent_runs - num_in_progress_runs
 
             # Possibly under 0 if runs were launched without queuing
             if max_runs_to_launch <= 0:
                 self._logger.info(
                     "{} runs are currently in progress. Maximum is {}, won't launch more.".format(
-                        len(in_progress_runs), max_concurrent_runs
+                        num_in_progress_runs, max_concurrent_runs
                     )
                 )
                 return
 
-        queued_runs = self._get_queued_runs(instance)
-
-        if not queued_runs:
-            self._logger.debug("Poll returned no queued runs.")
-        else:
-            self._logger.info("Retrieved %d queued runs, checking limits.", len(queued_runs))
-
-        # place in order
-        sorted_runs = self._priority_sort(queued_runs)
-
         # launch until blocked by limit rules
         num_dequeued_runs = 0
-        tag_concurrency_limits_counter = _TagConcurrencyLimitsCounter(
-            tag_concurrency_limits, in_progress_runs
-        )
-
-        for run in sorted_runs:
-            if max_concurrent_runs_enabled and num_dequeued_runs >= max_runs_to_launch:
-                break
 
+        for run in self._iterate_queued_runs(instance):
             if tag_concurrency_limits_counter.is_run_blocked(run):
                 continue
 
             error_info = None
 
             try:
-                self._dequeue_run(instance, run, workspace)
+                dequeued = self._dequeue_run(instance, run, workspace)
             except Exception:
                 error_info = serializable_error_info_from_exc_info(sys.exc_info())
 
@@ -166,48 +177,109 @@ def run_iteration(self, instance, workspace):
                 error_info = error_info._replace(message=f"{message}: {error_info.message}")
 
             else:
-                tag_concurrency_limits_counter.update_counters_with_launched_run(run)
-                num_dequeued_runs += 1
+                if dequeued:
+                    tag_concurrency_limits_counter.update_counters_with_launched_run(run)
+                    if tag_concurrency_limits_counter.has_limits:
+                        self._in_progress_run_tags[run.run_id] = run.tags
+                    num_dequeued_runs += 1
 
             yield error_info
 
+            if max_concurrent_runs_enabled and num_dequeued_runs >= max_runs_to_launch:
+                break
+
         if num_dequeued_runs > 0:
             self._logger.info("Launched %d runs.", num_dequeued_runs)
 
-    def _get_queued_runs(self, instance):
-        queued_runs_filter = RunsFilter(statuses=[PipelineRunStatus.QUEUED])
+    def _update_in_progress_runs(self, instance, tag_concurrency_limits):
+        """
+        Bring the tag concurrency limits counter up to date with the runs that are currently in
+        progress, and return the number of in progress runs. Only the runs that started since the
+        last iteration are loaded from the run storage.
+        """
+        in_progress_run_ids = set(
+            instance.get_run_ids(filters=RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES))
+        )
+
+        if (
+            self._tag_concurrency_limits_counter is None
+            or tag_concurrency_limits != self._tag_concurrency_limits
+        ):
+            self._tag_concurrency_limits = tag_concurrency_limits
+            self._tag_concurrency_limits_counter = _TagConcurrencyLimitsCounter(
+                tag_concurrency_limits, []
+            )
+            self._in_progress_run_tags = {}
 
-        # Reversed for fifo ordering
-        # Note: should add a maximum fetch limit https://github.com/dagster-io/dagster/issues/3339
-        runs = instance.get_runs(filters=queued_runs_filter)[::-1]
-        return runs
+        counter = self._tag_concurrency_limits_counter
+        if not counter.has_limits:
+            # only the number of in progress runs matters
+            return len(in_progress_run_ids)
 
-    def _get_in_progress_runs(self, instance):
-        # Note: should add a maximum fetch limit https://github.com/dagster-io/dagster/issues/3339
-        return instance.get_runs(filters=RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES))
+        for run_id in list(self._in_progress_run_tags):
+            if run_id not in in_progress_run_ids:
+                counter.update_counters_with_finished_run(self._in_progress_run_tags.pop(run_id))
 
-    def _priority_sort(self, runs):
-        def get_priority(run):
-            priority_tag_value = run.tags.get(PRIORITY_TAG, "0")
-            try:
-                return int(priority_tag_value)
-            except ValueError:
-                return 0
+        new_run_ids = [
+            run_id for run_id in in_progress_run_ids if run_id not in self._in_progress_run_tags
+        ]
+        for i in range(0, len(new_run_ids), RUN_FETCH_BATCH_SIZE):
+            batch = new_run_ids[i : i + RUN_FETCH_BATCH_SIZE]
+            for run in instance.get_runs(filters=RunsFilter(run_ids=batch)):
+                counter.update_counters_with_launched_run(run)
+                self._in_progress_run_tags[run.run_id] = run.tags
 
-        # sorted is stable, so fifo is maintained
-        return sorted(runs, key=get_priority, reverse=True)
+        return len(in_progress_run_ids)
+
+    def _iterate_queued_runs(self, instance):
+        """
+        Yield the queued runs in dequeue order, by priority and then fifo. The queue is read a page
+        at a time, so that only the runs that are considered for launching are read and
+        deserialized.
+        """
+        cursor = None
+        while True:
+            connection = instance.get_queued_run_ids(cursor=cursor, limit=RUN_FETCH_BATCH_SIZE)
+            queued_run_ids = connection.run_ids
+            if not queued_run_ids:
+                if cursor is None:
+                    self._logger.debug("Poll returned no queued runs.")
+                return
+
+            self._logger.info("Retrieved %d queued runs, checking limits.", len(queued_run_ids))
+
+            runs_by_id = {
+                run.run_id: run
+                for run in instance.get_runs(filters=RunsFilter(run_ids=queued_run_ids))
+            }
+            for run_id in queued_run_ids:
+                run = runs_by_id.get(run_id)
+                # the run may have been deleted or dequeued since the queue was read
+                if not run:
+                    continue
+                if run.status != PipelineRunStatus.QUEUED:
+                    self._logger.info(
+                        "Run %s is now %s instead of QUEUED, skipping", run.run_id, run.status
+                    )
+                    continue
+                yield run
+
+            if not connection.has_more:
+                return
+            cursor = connection.cursor
 
     def _dequeue_run(self, instance, run, workspace):
-        # double check that the run is still queued before dequeing
+        # double check that the run is still queued before dequeing, since it may have been
+        # canceled while the runs ahead of it on the same page were launched
         reloaded_run = instance.get_run_by_id(run.run_id)
 
-        if reloaded_run.status != PipelineRunStatus.QUEUED:
+        if not reloaded_run or reloaded_run.status != PipelineRunStatus.QUEUED:
             self._logger.info(
                 "Run %s is now %s instead of QUEUED, skipping",
-                reloaded_run.run_id,
-                reloaded_run.status,
+                run.run_id,
+                reloaded_run.status if reloaded_run else "deleted",
             )
-            return
+            return False
 
         dequeued_event = DagsterEvent(
             event_type_value=DagsterEventType.PIPELINE_DEQUEUED.value,
@@ -215,3 +287,4 @@ def _dequeue_run(self, instance, run, workspace):
         )
         instance.report_dagster_event(dequeued_event, run_id=run.run_id)
         instance.launch_run(run.run_id, workspace)
+        return True
@@ -1,9 +1,11 @@
 import os
 import subprocess
 import sys
+import threading
 import warnings
+from collections import OrderedDict
 from contextlib import contextmanager
-from typing import Iterator, Optional
+from typing import Any, Iterator, Optional, Sequence, Tuple
 
 import grpc
 from grpc_health.v1 import health_pb2
@@ -39,6 +41,13 @@
 
 DEFAULT_GRPC_TIMEOUT = 60
 
+# Keepalive pings are only sent while there are calls in flight, at the minimum interval that gRPC
+# servers accept by default, so that they also work against servers on older versions
+GRPC_KEEPALIVE_TIME_MS = 5 * 60 * 1000
+GRPC_KEEPALIVE_TIMEOUT_MS = 20 * 1000
+
+MAX_POOLED_CHANNELS = 128
+
 
 def client_heartbeat_thread(client, shutdown_event):
     while True:
@@ -52,6 +61,72 @@ def client_heartbeat_thread(client, shutdown_event):
             continue
 
 
+class _PooledChannel:
+    def __init__(self, channel: grpc.Channel):
+        self.channel = channel
+        self.num_active_calls = 0
+        self.evicted = False
+
+
+class _ChannelPool:
+    """
+    Long-lived gRPC channels shared by all of the clients in this process, keyed by server address
+    and channel options, so that each call does not pay for setting up a new HTTP/2 connection.
+
+    An evicted channel is closed once the calls that are using it have finished.
+    """
+
+    def __init__(self, max_channels: int):
+        self._max_channels = max_channels
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._channels: "OrderedDict[Any, _PooledChannel]" = OrderedDict()
+
+    def acquire(self, key, create_channel) -> _PooledChannel:
+        with self._lock:
+            if self._pid != os.getpid():
+                # channels can't be used across a fork, so the child starts with an empty pool
+                self._pid = os.getpid()
+                self._channels = OrderedDict()
+
+            pooled_channel = self._channels.get(key)
+            if pooled_channel is None:
+                pooled_channel = _PooledChannel(create_channel())
+                self._channels[key] = pooled_channel
+                if len(self._channels) > self._max_channels:
+                    _, lru_channel = self._channels.popitem(last=False)
+                    self._mark_evicted(lru_channel)
+            else:
+                self._channels.move_to_end(key)
+
+            pooled_channel.num_active_calls += 1
+            return pooled_channel
+
+    def release(self, pooled_channel: _PooledChannel):
+        with self._lock:
+            pooled_channel.num_active_calls -= 1
+            self._close_if_unused(pooled_channel)
+
+    def evict(self, key, pooled_channel: Optional[_PooledChannel] = None):
+        with self._lock:
+            current = self._channels.get(key)
+            if current is None or (pooled_channel is not None and current is not pooled_channel):
+                return
+            del self._channels[key]
+            self._mark_evicted(current)
+
+    def _mark_evicted(self, pooled_channel: _PooledChannel):
+        pooled_channel.evicted = True
+        self._close_if_unused(pooled_channel)
+
+    def _close_if_unused(self, pooled_channel: _PooledChannel):
+        if pooled_channel.evicted and pooled_channel.num_active_calls == 0:
+            pooled_channel.channel.close()
+
+
+_channel_pool = _ChannelPool(MAX_POOLED_CHANNELS)
+
+
 class DagsterGrpcClient:
     def __init__(self, port=None, socket=None, host="localhost", use_ssl=False):
         self.port = check.opt_int_param(port, "port")
@@ -83,54 +158,87 @@ def __init__(self, port=None, socket=None, host="localhost", use_ssl=False):
     def use_ssl(self) -> bool:
         return self._use_ssl
 
-    @contextmanager
-    def _channel(self):
-        options = [
+    def _channel_options(self) -> Sequence[Tuple[str, Any]]:
+        return (
             ("grpc.max_receive_message_length", max_rx_bytes()),
             ("grpc.max_send_message_length", max_send_bytes()),
-        ]
-        with (
-            grpc.secure_channel(
-                self._server_address,
-                self._ssl_creds,
-                options=options,
-                compression=grpc.Compression.Gzip,
-            )
-            if self._use_ssl
-            else grpc.insecure_channel(
-                self._server_address,
-                options=options,
-                compression=grpc.Compression.Gzip,
-            )
-        ) as channel:
-            yield channel
+            ("grpc.keepalive_time_ms", GRPC_KEEPALIVE_TIME_MS),
+            ("grpc.keepalive_timeout_ms", GRPC_KEEPALIVE_TIMEOUT_MS),
+            ("grpc.keepalive_permit_without_calls", 0),
+        )
+
+    def _create_channel(self, options: Sequence[Tuple[str, Any]]) -> grpc.Channel:
+        if self._use_ssl:
+            return grpc.secure_channel(self._server_address, self._ssl_creds, options=options)
+        return grpc.insecure_channel(self._server_address, options=options)
 
-    def _query(self, method, request_type, timeout=DEFAULT_GRPC_TIMEOUT, **kwargs):
+    @contextmanager
+    def _channel(self):
+        options = self._channel_options()
+        key = (self._server_address, self._use_ssl, options)
+        pooled_channel = _channel_pool.acquire(key, lambda: self._create_channel(options))
+        try:
+            yield pooled_channel.channel
+        except grpc.RpcError as e:
+            # the connection to the server is broken, so the next call should start a new one
+            # rather than wait for this channel to reconnect
+            if e.code() == grpc.StatusCode.UNAVAILABLE:  # pylint: disable=no-member
+                _channel_pool.evict(key, pooled_channel)
+            raise
+        finally:
+            _channel_pool.release(pooled_channel)
+
+    def _close_channel(self):
+        _channel_pool.evict((self._server_address, self._use_ssl, self._channel_options()))
+
+    def _query(
+        self,
+        method,
+        request_type,
+        timeout=DEFAULT_GRPC_TIMEOUT,
+        compression=grpc.Compression.Gzip,
+        **kwargs,
+    ):
         try:
             with self._channel() as channel:
                 stub = DagsterApiStub(channel)
-                response = getattr(stub, method)(request_type(**kwargs), timeout=timeout)
+                response = getattr(stub, method)(
+                    request_type(**kwargs), timeout=timeout, compression=compression
+                )
             return response
         except Exception as e:
             raise DagsterUserCodeUnreachableError("Could not reach user code server") from e
 
-    def _streaming_query(self, method, request_type, timeout=DEFAULT_GRPC_TIMEOUT, **kwargs):
+    def _streaming_query(
+        self,
+        method,
+        request_type,
+        timeout=DEFAULT_GRPC_TIMEOUT,
+        compression=grpc.Compression.Gzip,
+        **kwargs,
+    ):
         try:
             with self._channel() as channel:
                 stub = DagsterApiStub(channel)
-                response_stream = getattr(stub, method)(request_type(**kwargs), timeout=timeout)
+                response_stream = getattr(stub, method)(
+                    request_type(**kwargs), timeout=timeout, compression=compression
+                )
                 yield from response_stream
         except Exception as e:
             raise DagsterUserCodeUnreachableError("Could not reach user code server") from e
 
     def ping(self, echo):
         check.str_param(echo, "echo")
-        res = self._query("Ping", api_pb2.PingRequest, echo=echo)
+        res = self._query(
+            "Ping", api_pb2.PingRequest, compression=grpc.Compression.NoCompression, echo=echo
+        )
         return res.echo
 
     def heartbeat(self, echo=""):
         check.str_param(echo, "echo")
-        res = self._query("Heartbeat", api_pb2.PingRequest, echo=echo)
+        res = self._query(
+            "Heartbeat", api_pb2.PingRequest, compression=grpc.Compression.NoCompression, echo=echo
+        )
         return res.echo
 
     def streaming_ping(self, sequence_length, echo):
@@ -149,7 +257,12 @@ def streaming_ping(self, sequence_length, echo):
             }
 
     def get_server_id(self, timeout=None):
-        res = self._query("GetServerId", api_pb2.Empty, timeout=timeout)
+        res = self._query(
+            "GetServerId",
+            api_pb2.Empty,
+            timeout=timeout,
+            compression=grpc.Compression.NoCompression,
+        )
         return res.server_id
 
     def execution_plan_snapshot(self, execution_plan_snapshot_args):
@@ -388,7 +501,8 @@ def health_check_query(self):
         try:
             with self._channel() as channel:
                 response = HealthStub(channel).Check(
-                    health_pb2.HealthCheckRequest(service="DagsterApi")
+                    health_pb2.HealthCheckRequest(service="DagsterApi"),
+                    compression=grpc.Compression.NoCompression,
                 )
         except grpc.RpcError as e:
             print(e)  # pylint: disable=print-call
@@ -417,6 +531,7 @@ def cleanup_server(self):
                 except DagsterUserCodeUnreachableError:
                     pass
             self._server_process = None
+            self._close_channel()
 
     def __enter__(self):
         return self
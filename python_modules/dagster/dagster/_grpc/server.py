@@ -325,7 +325,8 @@ def _recon_pipeline_from_origin(self, external_pipeline_origin: ExternalPipeline
         )
         return recon_repo.get_reconstructable_pipeline(external_pipeline_origin.pipeline_name)
 
-    def Ping(self, request, _context):
+    def Ping(self, request, context):
+        context.set_compression(grpc.Compression.NoCompression)
         echo = request.echo
         return api_pb2.PingReply(echo=echo)
 
@@ -335,12 +336,14 @@ def StreamingPing(self, request, _context):
         for sequence_number in range(sequence_length):
             yield api_pb2.StreamingPingEvent(sequence_number=sequence_number, echo=echo)
 
-    def Heartbeat(self, request, _context):
+    def Heartbeat(self, request, context):
+        context.set_compression(grpc.Compression.NoCompression)
         self.__last_heartbeat_time = time.time()
         echo = request.echo
         return api_pb2.PingReply(echo=echo)
 
-    def GetServerId(self, _request, _context):
+    def GetServerId(self, _request, context):
+        context.set_compression(grpc.Compression.NoCompression)
         return api_pb2.GetServerIdReply(server_id=self._server_id)
 
     def ExecutionPlanSnapshot(self, request, _context):
@@ -1,8 +1,10 @@
+import concurrent.futures
 import datetime
 import os
 import sys
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
+from contextlib import ExitStack
 from typing import cast
 
 import pendulum
@@ -82,36 +84,53 @@ def __exit__(self, exception_type, exception_value, traceback):
 MIN_INTERVAL_LOOP_TIME = 5
 RELOAD_WORKSPACE = 60
 
+# How long the daemon thread waits for threaded schedule evaluations before yielding to heartbeat
+THREADED_EVALUATION_WAIT_SECONDS = 1
+
 
 def execute_scheduler_iteration_loop(
     instance, workspace, logger, max_catchup_runs, max_tick_retries
 ):
     workspace_loaded_time = pendulum.now("UTC").timestamp()
 
-    workspace_iteration = 0
-    start_time = pendulum.now("UTC").timestamp()
-    while True:
-        start_time = pendulum.now("UTC").timestamp()
-        if start_time - workspace_loaded_time > RELOAD_WORKSPACE:
-            workspace.cleanup(cleanup_locations=True)
-            workspace_loaded_time = pendulum.now("UTC").timestamp()
-            workspace_iteration = 0
+    with ExitStack() as stack:
+        settings = instance.get_settings("schedules")
+        if settings.get("use_threads"):
+            threadpool_executor = stack.enter_context(
+                concurrent.futures.ThreadPoolExecutor(
+                    max_workers=settings.get("num_workers"),
+                    thread_name_prefix="schedule_daemon_worker",
+                )
+            )
+        else:
+            threadpool_executor = None
 
-        end_datetime_utc = pendulum.now("UTC")
-        yield from launch_scheduled_runs(
-            instance,
-            workspace,
-            logger,
-            end_datetime_utc=end_datetime_utc,
-            max_catchup_runs=max_catchup_runs,
-            max_tick_retries=max_tick_retries,
-            log_verbose_checks=(workspace_iteration == 0),
-        )
-        loop_duration = pendulum.now("UTC").timestamp() - start_time
-        sleep_time = max(0, MIN_INTERVAL_LOOP_TIME - loop_duration)
-        time.sleep(sleep_time)
-        yield
-        workspace_iteration += 1
+        workspace_iteration = 0
+        start_time = pendulum.now("UTC").timestamp()
+        while True:
+            start_time = pendulum.now("UTC").timestamp()
+            if start_time - workspace_loaded_time > RELOAD_WORKSPACE:
+                workspace.cleanup(cleanup_locations=True)
+                workspace_loaded_time = pendulum.now("UTC").timestamp()
+                workspace_iteration = 0
+
+            end_datetime_utc = pendulum.now("UTC")
+            yield from launch_scheduled_runs(
+                instance,
+                workspace,
+                logger,
+                end_datetime_utc=end_datetime_utc,
+                max_catchup_runs=max_catchup_runs,
+                max_tick_retries=max_tick_retries,
+                log_verbose_checks=(workspace_iteration == 0),
+                threadpool_executor=threadpool_executor,
+                max_workers_per_location=settings.get("num_workers_per_location"),
+            )
+            loop_duration = pendulum.now("UTC").timestamp() - start_time
+            sleep_time = max(0, MIN_INTERVAL_LOOP_TIME - loop_duration)
+            time.sleep(sleep_time)
+            yield
+            workspace_iteration += 1
 
 
 def launch_scheduled_runs(
@@ -123,9 +142,15 @@ def launch_scheduled_runs(
     max_tick_retries=0,
     debug_crash_flags=None,
     log_verbose_checks=True,
+    threadpool_executor=None,
+    max_workers_per_location=None,
 ):
     check.inst_param(instance, "instance", DagsterInstance)
     check.inst_param(workspace, "workspace", IWorkspace)
+    check.opt_inst_param(
+        threadpool_executor, "threadpool_executor", concurrent.futures.ThreadPoolExecutor
+    )
+    check.opt_int_param(max_workers_per_location, "max_workers_per_location")
 
     workspace_snapshot = {
         location_entry.origin.location_name: location_entry
@@ -217,8 +242,8 @@ def launch_scheduled_runs(
         schedule_names = ", ".join([schedule.name for schedule in schedules.values()])
         logger.info(f"Checking for new runs for the following schedules: {schedule_names}")
 
+    schedule_evaluations = []
     for external_schedule in schedules.values():
-        error_info = None
         try:
             schedule_state = all_schedule_states.get(external_schedule.selector_id)
             if not schedule_state:
@@ -233,30 +258,146 @@ def launch_scheduled_runs(
                     ),
                 )
                 instance.add_instigator_state(schedule_state)
-
-            yield from launch_scheduled_runs_for_schedule(
-                instance,
-                logger,
-                external_schedule,
-                schedule_state,
-                workspace,
-                end_datetime_utc,
-                max_catchup_runs,
-                max_tick_retries,
-                tick_retention_settings,
-                (
-                    debug_crash_flags.get(schedule_state.instigator_name)
-                    if debug_crash_flags
-                    else None
-                ),
-                log_verbose_checks=log_verbose_checks,
-            )
         except Exception:
             error_info = serializable_error_info_from_exc_info(sys.exc_info())
             logger.error(
                 f"Scheduler caught an error for schedule {external_schedule.name} : {error_info.to_string()}"
             )
-        yield error_info
+            yield error_info
+            continue
+
+        schedule_evaluations.append(
+            (
+                external_schedule,
+                (
+                    instance,
+                    logger,
+                    external_schedule,
+                    schedule_state,
+                    workspace,
+                    end_datetime_utc,
+                    max_catchup_runs,
+                    max_tick_retries,
+                    tick_retention_settings,
+                    (
+                        debug_crash_flags.get(schedule_state.instigator_name)
+                        if debug_crash_flags
+                        else None
+                    ),
+                    log_verbose_checks,
+                ),
+            )
+        )
+
+    if threadpool_executor:
+        yield from _launch_scheduled_runs_in_threads(
+            logger, threadpool_executor, schedule_evaluations, max_workers_per_location
+        )
+    else:
+        for _external_schedule, evaluation_args in schedule_evaluations:
+            yield from _launch_scheduled_runs_for_schedule_iterator(*evaluation_args)
+
+
+def _launch_scheduled_runs_in_threads(
+    logger, threadpool_executor, schedule_evaluations, max_workers_per_location
+):
+    """
+    Evaluate each schedule in the threadpool, waiting for every evaluation to finish so that no
+    schedule is evaluated twice at once. Schedules are submitted round-robin across repository
+    locations, and at most max_workers_per_location schedules from a location are evaluated at
+    once, so that one slow or busy location cannot hold every worker.
+    """
+    pending_by_location = defaultdict(deque)
+    for external_schedule, evaluation_args in schedule_evaluations:
+        location_name = external_schedule.handle.location_name
+        pending_by_location[location_name].append(evaluation_args)
+
+    running = {}
+    running_by_location = defaultdict(int)
+
+    def _submit_pending():
+        submitted = True
+        while submitted:
+            submitted = False
+            for location_name, pending in pending_by_location.items():
+                if not pending or (
+                    max_workers_per_location
+                    and running_by_location[location_name] >= max_workers_per_location
+                ):
+                    continue
+                future = threadpool_executor.submit(
+                    _launch_scheduled_runs_for_schedule_in_thread, *pending.popleft()
+                )
+                running[future] = location_name
+                running_by_location[location_name] += 1
+                submitted = True
+
+    _submit_pending()
+    while running:
+        done, _ = concurrent.futures.wait(
+            running,
+            timeout=THREADED_EVALUATION_WAIT_SECONDS,
+            return_when=concurrent.futures.FIRST_COMPLETED,
+        )
+        for future in done:
+            running_by_location[running.pop(future)] -= 1
+            try:
+                yield from future.result()
+            except Exception:
+                error_info = serializable_error_info_from_exc_info(sys.exc_info())
+                logger.error(f"Scheduler caught an error: {error_info.to_string()}")
+                yield error_info
+
+        _submit_pending()
+        # yield to allow the scheduler daemon to heartbeat while schedules are evaluated
+        yield
+
+
+def _launch_scheduled_runs_for_schedule_in_thread(*evaluation_args):
+    # evaluate the schedule from within a thread, collecting what it yields so that the daemon
+    # thread can report errors from its own generator
+    return [
+        error_info
+        for error_info in _launch_scheduled_runs_for_schedule_iterator(*evaluation_args)
+        if error_info
+    ]
+
+
+def _launch_scheduled_runs_for_schedule_iterator(
+    instance,
+    logger,
+    external_schedule,
+    schedule_state,
+    workspace,
+    end_datetime_utc,
+    max_catchup_runs,
+    max_tick_retries,
+    tick_retention_settings,
+    debug_crash_flags,
+    log_verbose_checks,
+):
+    # failures are isolated to the schedule being evaluated
+    error_info = None
+    try:
+        yield from launch_scheduled_runs_for_schedule(
+            instance,
+            logger,
+            external_schedule,
+            schedule_state,
+            workspace,
+            end_datetime_utc,
+            max_catchup_runs,
+            max_tick_retries,
+            tick_retention_settings,
+            debug_crash_flags,
+            log_verbose_checks=log_verbose_checks,
+        )
+    except Exception:
+        error_info = serializable_error_info_from_exc_info(sys.exc_info())
+        logger.error(
+            f"Scheduler caught an error for schedule {external_schedule.name} : {error_info.to_string()}"
+        )
+    yield error_info
 
 
 def launch_scheduled_runs_for_schedule(
@@ -333,12 +474,21 @@ def launch_scheduled_runs_for_schedule(
         logger.warning(f"{schedule_name} has fallen behind, only launching {max_catchup_runs} runs")
         tick_times = tick_times[-max_catchup_runs:]
 
+    # how long after its scheduled execution time the earliest tick is being evaluated
+    tick_lag_seconds = pendulum.now("UTC").timestamp() - tick_times[0].timestamp()
+
     if len(tick_times) == 1:
         tick_time = tick_times[0].strftime(default_date_format_string())
-        logger.info(f"Evaluating schedule `{schedule_name}` at {tick_time}")
+        logger.info(
+            f"Evaluating schedule `{schedule_name}` at {tick_time} "
+            f"({tick_lag_seconds:.2f} seconds after its scheduled time)"
+        )
     else:
         times = ", ".join([time.strftime(default_date_format_string()) for time in tick_times])
-        logger.info(f"Evaluating schedule `{schedule_name}` at the following times: {times}")
+        logger.info(
+            f"Evaluating schedule `{schedule_name}` at the following times: {times} "
+            f"({tick_lag_seconds:.2f} seconds after the earliest scheduled time)"
+        )
 
     for schedule_time in tick_times:
         schedule_timestamp = schedule_time.timestamp()
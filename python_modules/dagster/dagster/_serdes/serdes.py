@@ -14,6 +14,7 @@
   (in memory, not human readable, etc) just handle the json case effectively.
 """
 
+import re
 from abc import ABC, abstractmethod
 from enum import Enum
 from inspect import Parameter, signature
@@ -39,6 +40,11 @@
 
 from .errors import DeserializationError, SerdesUsageError, SerializationError
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 ###################################################################################################
 # Whitelisting
 ###################################################################################################
@@ -54,6 +60,10 @@ class WhitelistMap(NamedTuple):
     enums: Dict[str, EnumEntry]
     serialized_names: Dict[str, str]
     deserialized_names: Dict[str, str]
+    # pack functions by namedtuple class and unpack functions by stored class name, compiled on
+    # first use and cleared whenever the map changes
+    tuple_packers: Dict[Type[Any], Callable[[Any], Dict[str, Any]]]
+    tuple_unpackers: Dict[str, Callable[[Dict[str, Any]], Any]]
 
     def register_tuple(
         self,
@@ -71,6 +81,7 @@ def register_tuple(
             args_for_class: the inspect.signature paramaters for __new__
         """
         self.tuples[name] = (nt, serializer or DefaultNamedTupleSerializer, args_for_class)
+        self.clear_compiled()
 
     def has_tuple_entry(self, name: str) -> bool:
         return name in self.tuples
@@ -85,6 +96,7 @@ def register_enum(
         serializer: Optional[Type["EnumSerializer"]],
     ):
         self.enums[name] = (enum, serializer or DefaultEnumSerializer)
+        self.clear_compiled()
 
     def has_enum_entry(self, name: str) -> bool:
         return name in self.enums
@@ -94,6 +106,7 @@ def get_enum_entry(self, name: str) -> EnumEntry:
 
     def register_serialized_name(self, name: str, serialized_name: str):
         self.serialized_names[name] = serialized_name
+        self.clear_compiled()
 
     def has_serialized_name(self, name: str) -> bool:
         return name in self.serialized_names
@@ -103,6 +116,7 @@ def get_serialized_name(self, name: str) -> str:
 
     def register_deserialized_name(self, name: str, deserialized_name: str):
         self.deserialized_names[name] = deserialized_name
+        self.clear_compiled()
 
     def has_deserialized_name(self, name: str) -> bool:
         return name in self.deserialized_names
@@ -110,9 +124,20 @@ def has_deserialized_name(self, name: str) -> bool:
     def get_deserialized_name(self, name: str) -> str:
         return self.deserialized_names[name]
 
+    def clear_compiled(self):
+        self.tuple_packers.clear()
+        self.tuple_unpackers.clear()
+
     @staticmethod
     def create():
-        return WhitelistMap(tuples={}, enums={}, serialized_names={}, deserialized_names={})
+        return WhitelistMap(
+            tuples={},
+            enums={},
+            serialized_names={},
+            deserialized_names={},
+            tuple_packers={},
+            tuple_unpackers={},
+        )
 
 
 _WHITELIST_MAP = WhitelistMap.create()
@@ -368,9 +393,117 @@ def pack_value(val: Any) -> Any:
 
 
 def pack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str) -> Any:
+    try:
+        return _pack_value(val, whitelist_map)
+    except SerializationError:
+        # Descent paths are only built to report where an error happened, by packing the value
+        # again while tracking them
+        return _pack_inner_value_with_path(val, whitelist_map, descent_path)
+
+
+# Types that are packed as they are, checked by exact type before the isinstance checks
+_PASSTHROUGH_TYPES = (str, int, float, bool, type(None))
+
+
+def _pack_value(val: Any, whitelist_map: WhitelistMap) -> Any:
+    val_type = type(val)
+    if val_type in _PASSTHROUGH_TYPES:
+        return val
+    if val_type is list:
+        return [
+            item if type(item) in _PASSTHROUGH_TYPES else _pack_value(item, whitelist_map)
+            for item in val
+        ]
+    if val_type is dict:
+        return {
+            key: value if type(value) in _PASSTHROUGH_TYPES else _pack_value(value, whitelist_map)
+            for key, value in val.items()
+        }
+    packer = whitelist_map.tuple_packers.get(val_type)
+    if packer:
+        return packer(val)
+
+    if isinstance(val, list):
+        return [_pack_value(item, whitelist_map) for item in val]
+    if isinstance(val, tuple):
+        return _compile_tuple_packer(val_type, whitelist_map)(val)
+    if isinstance(val, Enum):
+        klass_name = val.__class__.__name__
+        if not whitelist_map.has_enum_entry(klass_name):
+            raise SerializationError(
+                f"Can only serialize whitelisted Enums, received {klass_name}."
+            )
+        _, enum_serializer = whitelist_map.get_enum_entry(klass_name)
+        return {"__enum__": enum_serializer.value_to_storage_str(val, whitelist_map, "")}
+    if isinstance(val, set):
+        return {"__set__": [_pack_value(item, whitelist_map) for item in sorted(val, key=str)]}
+    if isinstance(val, frozenset):
+        return {
+            "__frozenset__": [_pack_value(item, whitelist_map) for item in sorted(val, key=str)]
+        }
+    if isinstance(val, dict):
+        return {key: _pack_value(value, whitelist_map) for key, value in val.items()}
+
+    return val
+
+
+def _compile_tuple_packer(
+    klass: Type[Any], whitelist_map: WhitelistMap
+) -> Callable[[Any], Dict[str, Any]]:
+    klass_name = klass.__name__
+    if not whitelist_map.has_tuple_entry(klass_name):
+        raise SerializationError(f"Can only serialize whitelisted namedtuples, received {klass}.")
+    _, serializer, _ = whitelist_map.get_tuple_entry(klass_name)
+
+    if _overrides(serializer, "value_to_storage_dict"):
+
+        def _pack_with_serializer(value: Any) -> Dict[str, Any]:
+            return serializer.value_to_storage_dict(value, whitelist_map, "")
+
+        packer = _pack_with_serializer
+
+    else:
+        # Same output as DefaultNamedTupleSerializer.value_to_storage_dict
+        fields = klass._fields
+        skip_when_empty_fields = cast(
+            Type[DefaultNamedTupleSerializer], serializer
+        ).skip_when_empty()
+        storage_name = (
+            whitelist_map.get_serialized_name(klass_name)
+            if whitelist_map.has_serialized_name(klass_name)
+            else klass_name
+        )
+
+        def _pack_fields(value: Any) -> Dict[str, Any]:
+            base_dict = {
+                key: inner_value
+                if type(inner_value) in _PASSTHROUGH_TYPES
+                else _pack_value(inner_value, whitelist_map)
+                for key, inner_value in zip(fields, value)
+                if not (key in skip_when_empty_fields and inner_value in EMPTY_VALUES_TO_SKIP)
+            }
+            base_dict["__class__"] = storage_name
+            return base_dict
+
+        packer = _pack_fields
+
+    whitelist_map.tuple_packers[klass] = packer
+    return packer
+
+
+def _overrides(serializer: Type[NamedTupleSerializer], method_name: str) -> bool:
+    """Whether the serializer changes a DefaultNamedTupleSerializer method, in which case it is
+    called instead of the compiled function."""
+    if not issubclass(serializer, DefaultNamedTupleSerializer):
+        return True
+    method = getattr(serializer, method_name)
+    return method.__func__ is not getattr(DefaultNamedTupleSerializer, method_name).__func__
+
+
+def _pack_inner_value_with_path(val: Any, whitelist_map: WhitelistMap, descent_path: str) -> Any:
     if isinstance(val, list):
         return [
-            pack_inner_value(item, whitelist_map, f"{descent_path}[{idx}]")
+            _pack_inner_value_with_path(item, whitelist_map, f"{descent_path}[{idx}]")
             for idx, item in enumerate(val)
         ]
     if isinstance(val, tuple):
@@ -394,7 +527,7 @@ def pack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str) -
         set_path = descent_path + "{}"
         return {
             "__set__": [
-                pack_inner_value(item, whitelist_map, set_path)
+                _pack_inner_value_with_path(item, whitelist_map, set_path)
                 for item in sorted(list(val), key=str)
             ]
         }
@@ -402,13 +535,13 @@ def pack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str) -
         frz_set_path = descent_path + "{}"
         return {
             "__frozenset__": [
-                pack_inner_value(item, whitelist_map, frz_set_path)
+                _pack_inner_value_with_path(item, whitelist_map, frz_set_path)
                 for item in sorted(list(val), key=str)
             ]
         }
     if isinstance(val, dict):
         return {
-            key: pack_inner_value(value, whitelist_map, f"{descent_path}.{key}")
+            key: _pack_inner_value_with_path(value, whitelist_map, f"{descent_path}.{key}")
             for key, value in val.items()
         }
 
@@ -462,15 +595,32 @@ def opt_deserialize_as(json_str: Optional[str], cls: Type[T]) -> Optional[T]:
     return deserialize_as(json_str, cls) if json_str else None
 
 
+# orjson reads integers that do not fit in 64 bits as floats, so documents with numbers that might
+# not fit are left to seven.json
+_LONG_DIGIT_RUN = re.compile(r"\d{19}")
+
+
+def _loads(json_str: str) -> Any:
+    """Parses json with orjson when it is installed, which gives the same values as
+    seven.json.loads. Documents that orjson does not accept, like ones with NaN or with unpaired
+    surrogates in strings, are parsed by seven.json.loads instead."""
+    if orjson is not None and not _LONG_DIGIT_RUN.search(json_str):
+        try:
+            return orjson.loads(json_str)
+        except orjson.JSONDecodeError:
+            pass
+    return seven.json.loads(json_str)
+
+
 def _deserialize_json(json_str: str, whitelist_map: WhitelistMap):
-    value = seven.json.loads(json_str)
+    value = _loads(json_str)
     return unpack_inner_value(value, whitelist_map=whitelist_map, descent_path=_root(value))
 
 
 def deserialize_value(val: str, whitelist_map: WhitelistMap = _WHITELIST_MAP) -> Any:
     """Deserialize a json encoded string in to its original value"""
     return unpack_inner_value(
-        seven.json.loads(check.str_param(val, "val")),
+        _loads(check.str_param(val, "val")),
         whitelist_map=whitelist_map,
         descent_path="",
     )
@@ -486,9 +636,105 @@ def unpack_value(val: Any) -> Any:
 
 
 def unpack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str) -> Any:
+    try:
+        return _unpack_value(val, whitelist_map)
+    except DeserializationError:
+        # Descent paths are only built to report where an error happened, by unpacking the value
+        # again while tracking them. The first pass leaves the value unchanged for this.
+        return _unpack_inner_value_with_path(val, whitelist_map, descent_path)
+
+
+def _unpack_value(val: Any, whitelist_map: WhitelistMap) -> Any:
+    if isinstance(val, list):
+        return [_unpack_value(item, whitelist_map) for item in val]
+    if not isinstance(val, dict):
+        return val
+
+    klass_name = val.get("__class__")
+    if klass_name:
+        unpacker = whitelist_map.tuple_unpackers.get(klass_name)
+        if unpacker is None:
+            unpacker = _compile_tuple_unpacker(klass_name, whitelist_map)
+        return unpacker(val)
+    if val.get("__enum__"):
+        name, member = val["__enum__"].split(".")
+        if not whitelist_map.has_enum_entry(name):
+            raise DeserializationError(
+                f"Attempted to deserialize enum {name} which was not in the whitelist."
+            )
+        enum_class, enum_serializer = whitelist_map.get_enum_entry(name)
+        return enum_serializer.value_from_storage_str(member, enum_class)
+    if val.get("__set__") is not None:
+        return set([_unpack_value(item, whitelist_map) for item in val["__set__"]])
+    if val.get("__frozenset__") is not None:
+        return frozenset([_unpack_value(item, whitelist_map) for item in val["__frozenset__"]])
+
+    return {key: _unpack_value(value, whitelist_map) for key, value in val.items()}
+
+
+def _compile_tuple_unpacker(
+    klass_name: str, whitelist_map: WhitelistMap
+) -> Callable[[Dict[str, Any]], Any]:
+    lookup_name = (
+        whitelist_map.get_deserialized_name(klass_name)
+        if whitelist_map.has_deserialized_name(klass_name)
+        else klass_name
+    )
+    if not whitelist_map.has_tuple_entry(lookup_name):
+        raise DeserializationError(
+            f'Attempted to deserialize class "{klass_name}" which is not in the whitelist.'
+        )
+    klass, serializer, args_for_class = whitelist_map.get_tuple_entry(lookup_name)
+
+    if klass is None:
+        # Target class being set to none, likely by register_serdes_tuple_fallbacks
+
+        def _unpack_none(_storage_dict: Dict[str, Any]) -> None:
+            return None
+
+        unpacker: Callable[[Dict[str, Any]], Any] = _unpack_none
+
+    elif _overrides(serializer, "value_from_storage_dict"):
+
+        def _unpack_with_serializer(storage_dict: Dict[str, Any]) -> Any:
+            return serializer.value_from_storage_dict(
+                {key: value for key, value in storage_dict.items() if key != "__class__"},
+                klass,
+                args_for_class,
+                whitelist_map,
+                "",
+            )
+
+        unpacker = _unpack_with_serializer
+
+    else:
+        # Same result as DefaultNamedTupleSerializer.value_from_storage_dict
+        value_from_unpacked = cast(
+            Type[DefaultNamedTupleSerializer], serializer
+        ).value_from_unpacked
+
+        def _unpack_fields(storage_dict: Dict[str, Any]) -> Any:
+            return value_from_unpacked(
+                {
+                    key: value
+                    if type(value) in _PASSTHROUGH_TYPES
+                    else _unpack_value(value, whitelist_map)
+                    for key, value in storage_dict.items()
+                    if key in args_for_class
+                },
+                klass,
+            )
+
+        unpacker = _unpack_fields
+
+    whitelist_map.tuple_unpackers[klass_name] = unpacker
+    return unpacker
+
+
+def _unpack_inner_value_with_path(val: Any, whitelist_map: WhitelistMap, descent_path: str) -> Any:
     if isinstance(val, list):
         return [
-            unpack_inner_value(item, whitelist_map, f"{descent_path}[{idx}]")
+            _unpack_inner_value_with_path(item, whitelist_map, f"{descent_path}[{idx}]")
             for idx, item in enumerate(val)
         ]
     if isinstance(val, dict) and val.get("__class__"):
@@ -531,15 +777,23 @@ def unpack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str)
         return enum_serializer.value_from_storage_str(member, enum_class)
     if isinstance(val, dict) and val.get("__set__") is not None:
         set_path = descent_path + "{}"
-        return set([unpack_inner_value(item, whitelist_map, set_path) for item in val["__set__"]])
+        return set(
+            [
+                _unpack_inner_value_with_path(item, whitelist_map, set_path)
+                for item in val["__set__"]
+            ]
+        )
     if isinstance(val, dict) and val.get("__frozenset__") is not None:
         frz_set_path = descent_path + "{}"
         return frozenset(
-            [unpack_inner_value(item, whitelist_map, frz_set_path) for item in val["__frozenset__"]]
+            [
+                _unpack_inner_value_with_path(item, whitelist_map, frz_set_path)
+                for item in val["__frozenset__"]
+            ]
         )
     if isinstance(val, dict):
         return {
-            key: unpack_inner_value(value, whitelist_map, f"{descent_path}.{key}")
+            key: _unpack_inner_value_with_path(value, whitelist_map, f"{descent_path}.{key}")
             for key, value in val.items()
         }
 
@@ -6,173 +6,78 @@
 
 snapshots = Snapshot()
 
-snapshots['test_basic_solids_config 1'] = {
-    'execution': {
-        'in_process': {
-            'config': {
-                'marker_to_close': '',
-                'retries': {
-                    'disabled': {
-                    },
-                    'enabled': {
-                    }
-                }
+snapshots["test_basic_solids_config 1"] = {
+    "execution": {
+        "in_process": {
+            "config": {
+                "marker_to_close": "",
+                "release_outputs": True,
+                "retries": {"disabled": {}, "enabled": {}},
             }
         },
-        'multiprocess': {
-            'config': {
-                'max_concurrent': 0,
-                'retries': {
-                    'disabled': {
-                    },
-                    'enabled': {
-                    }
-                },
-                'start_method': {
-                    'forkserver': {
-                        'preload_modules': [
-                        ]
-                    },
-                    'spawn': {
-                    }
-                }
+        "multiprocess": {
+            "config": {
+                "max_concurrent": 0,
+                "release_outputs": True,
+                "retries": {"disabled": {}, "enabled": {}},
+                "start_method": {"forkserver": {"preload_modules": []}, "spawn": {}},
+                "worker_pool": {"enabled": True, "max_steps_per_worker": 0},
             }
-        }
-    },
-    'loggers': {
-        'console': {
-            'config': {
-                'log_level': '',
-                'name': ''
-            }
-        }
-    },
-    'resources': {
-        'io_manager': {
-            'config': 'AnyType'
-        }
+        },
     },
-    'solids': {
-        'required_field_solid': {
-            'config': {
-                'required_int': 0
-            }
-        }
-    }
+    "loggers": {"console": {"config": {"log_level": "", "name": ""}}},
+    "resources": {"io_manager": {"config": "AnyType"}},
+    "solids": {"required_field_solid": {"config": {"required_int": 0}}},
 }
 
-snapshots['test_two_modes 1'] = {
-}
+snapshots["test_two_modes 1"] = {}
 
-snapshots['test_two_modes 2'] = {
-    'execution': {
-        'in_process': {
-            'config': {
-                'marker_to_close': '',
-                'retries': {
-                    'disabled': {
-                    },
-                    'enabled': {
-                    }
-                }
+snapshots["test_two_modes 2"] = {
+    "execution": {
+        "in_process": {
+            "config": {
+                "marker_to_close": "",
+                "release_outputs": True,
+                "retries": {"disabled": {}, "enabled": {}},
             }
         },
-        'multiprocess': {
-            'config': {
-                'max_concurrent': 0,
-                'retries': {
-                    'disabled': {
-                    },
-                    'enabled': {
-                    }
-                },
-                'start_method': {
-                    'forkserver': {
-                        'preload_modules': [
-                        ]
-                    },
-                    'spawn': {
-                    }
-                }
-            }
-        }
-    },
-    'loggers': {
-        'console': {
-            'config': {
-                'log_level': '',
-                'name': ''
+        "multiprocess": {
+            "config": {
+                "max_concurrent": 0,
+                "release_outputs": True,
+                "retries": {"disabled": {}, "enabled": {}},
+                "start_method": {"forkserver": {"preload_modules": []}, "spawn": {}},
+                "worker_pool": {"enabled": True, "max_steps_per_worker": 0},
             }
-        }
-    },
-    'resources': {
-        'io_manager': {
-            'config': 'AnyType'
         },
-        'value': {
-            'config': {
-                'mode_one_field': ''
-            }
-        }
     },
-    'solids': {
-    }
+    "loggers": {"console": {"config": {"log_level": "", "name": ""}}},
+    "resources": {"io_manager": {"config": "AnyType"}, "value": {"config": {"mode_one_field": ""}}},
+    "solids": {},
 }
 
-snapshots['test_two_modes 3'] = {
-}
+snapshots["test_two_modes 3"] = {}
 
-snapshots['test_two_modes 4'] = {
-    'execution': {
-        'in_process': {
-            'config': {
-                'marker_to_close': '',
-                'retries': {
-                    'disabled': {
-                    },
-                    'enabled': {
-                    }
-                }
+snapshots["test_two_modes 4"] = {
+    "execution": {
+        "in_process": {
+            "config": {
+                "marker_to_close": "",
+                "release_outputs": True,
+                "retries": {"disabled": {}, "enabled": {}},
             }
         },
-        'multiprocess': {
-            'config': {
-                'max_concurrent': 0,
-                'retries': {
-                    'disabled': {
-                    },
-                    'enabled': {
-                    }
-                },
-                'start_method': {
-                    'forkserver': {
-                        'preload_modules': [
-                        ]
-                    },
-                    'spawn': {
-                    }
-                }
+        "multiprocess": {
+            "config": {
+                "max_concurrent": 0,
+                "release_outputs": True,
+                "retries": {"disabled": {}, "enabled": {}},
+                "start_method": {"forkserver": {"preload_modules": []}, "spawn": {}},
+                "worker_pool": {"enabled": True, "max_steps_per_worker": 0},
             }
-        }
-    },
-    'loggers': {
-        'console': {
-            'config': {
-                'log_level': '',
-                'name': ''
-            }
-        }
-    },
-    'resources': {
-        'io_manager': {
-            'config': 'AnyType'
         },
-        'value': {
-            'config': {
-                'mode_two_field': 0
-            }
-        }
     },
-    'solids': {
-    }
+    "loggers": {"console": {"config": {"log_level": "", "name": ""}}},
+    "resources": {"io_manager": {"config": "AnyType"}, "value": {"config": {"mode_two_field": 0}}},
+    "solids": {},
 }
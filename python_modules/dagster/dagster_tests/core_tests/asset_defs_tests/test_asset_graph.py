@@ -0,0 +1,107 @@
+import pytest
+
+from dagster import AssetKey, SourceAsset, asset
+from dagster._check import CheckError
+from dagster._core.definitions import AssetSelection
+from dagster._core.definitions.asset_graph import AssetGraph
+
+
+@asset
+def upstream():
+    return 1
+
+
+@asset
+def middle(upstream, source):
+    return upstream + source
+
+
+@asset
+def other(source):
+    return source
+
+
+@asset
+def downstream(middle, other):
+    return middle + other
+
+
+source = SourceAsset("source")
+
+
+@pytest.fixture
+def asset_graph():
+    return AssetGraph.from_assets([downstream, middle, other, upstream, source])
+
+
+def _keys(*names):
+    return {AssetKey(name) for name in names}
+
+
+def test_asset_graph_keys(asset_graph):
+    assert asset_graph.materializable_asset_keys == _keys(
+        "upstream", "middle", "other", "downstream"
+    )
+    assert asset_graph.source_asset_keys == _keys("source")
+    assert asset_graph.has(AssetKey("source"))
+    assert not asset_graph.has(AssetKey("missing"))
+
+    toposorted_keys = asset_graph.toposorted_asset_keys
+    assert set(toposorted_keys) == _keys("upstream", "middle", "other", "downstream", "source")
+    for asset_key in toposorted_keys:
+        for parent_key in asset_graph.get_parents(asset_key):
+            assert toposorted_keys.index(parent_key) < toposorted_keys.index(asset_key)
+
+
+def test_asset_graph_neighbors(asset_graph):
+    assert asset_graph.get_parents(AssetKey("middle")) == _keys("upstream", "source")
+    assert asset_graph.get_parents(AssetKey("upstream")) == set()
+    assert asset_graph.get_children(AssetKey("middle")) == _keys("downstream")
+    assert asset_graph.get_children(AssetKey("source")) == _keys("middle", "other")
+
+
+def test_asset_graph_closures(asset_graph):
+    assert asset_graph.get_upstream(_keys("downstream")) == _keys(
+        "middle", "other", "upstream", "source"
+    )
+    assert asset_graph.get_upstream(_keys("downstream"), depth=1) == _keys("middle", "other")
+    assert asset_graph.get_upstream(_keys("downstream"), depth=0) == set()
+    assert asset_graph.get_upstream(_keys("middle", "other")) == _keys("upstream", "source")
+
+    assert asset_graph.get_downstream(_keys("upstream")) == _keys("middle", "downstream")
+    assert asset_graph.get_downstream(_keys("upstream"), depth=1) == _keys("middle")
+    assert asset_graph.get_downstream(_keys("upstream", "middle")) == _keys("middle", "downstream")
+    assert asset_graph.get_downstream(_keys("downstream")) == set()
+
+
+def test_asset_graph_cycle():
+    asset_graph = AssetGraph(
+        upstream_keys_by_key={
+            AssetKey("a"): _keys("c"),
+            AssetKey("b"): _keys("a"),
+            AssetKey("c"): _keys("b"),
+            AssetKey("d"): _keys("c", "undefined"),
+        },
+        source_asset_keys=set(),
+        group_names_by_key={},
+    )
+    with pytest.raises(CheckError, match="cycle"):
+        asset_graph.toposorted_asset_keys  # pylint: disable=pointless-statement
+
+    assert asset_graph.get_upstream(_keys("a")) == _keys("a", "b", "c")
+    assert asset_graph.get_downstream(_keys("a")) == _keys("a", "b", "c", "d")
+    assert asset_graph.get_downstream(_keys("a"), depth=2) == _keys("b", "c")
+
+    # upstream keys that no asset produces are still traversed
+    assert asset_graph.has(AssetKey("undefined"))
+    assert asset_graph.get_upstream(_keys("d"), depth=1) == _keys("c", "undefined")
+
+
+def test_resolve_selection_with_asset_graph(asset_graph):
+    assert AssetSelection.keys("middle").upstream().resolve(asset_graph) == _keys(
+        "middle", "upstream", "source"
+    )
+    assert AssetSelection.keys("upstream").downstream(depth=1).resolve(asset_graph) == _keys(
+        "upstream", "middle"
+    )
+    assert AssetSelection.all().resolve(asset_graph) == asset_graph.materializable_asset_keys
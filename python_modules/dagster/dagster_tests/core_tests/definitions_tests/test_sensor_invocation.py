@@ -1,5 +1,7 @@
+import tempfile
 from unittest import mock
 
+import pendulum
 import pytest
 
 from dagster import (
@@ -16,7 +18,9 @@
     run_status_sensor,
     sensor,
 )
+from dagster._core.definitions.run_status_sensor_definition import RunStatusEventFeed
 from dagster._core.errors import DagsterInvalidInvocationError
+from dagster._core.events import DagsterEventType
 from dagster._core.test_utils import instance_for_test
 from dagster._legacy import SensorExecutionContext
 
@@ -253,3 +257,79 @@ def basic_sensor_w_arg(context):
         return RunRequest(run_key=None, run_config={}, tags={})
 
     assert basic_sensor_w_arg(context).run_config == {}
+
+
+def test_run_status_event_feed():
+    @op
+    def will_fail():
+        raise Exception("failure")
+
+    @job
+    def my_job():
+        will_fail()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with instance_for_test(
+            overrides={
+                "event_log_storage": {
+                    "module": "dagster._core.storage.event_log",
+                    "class": "ConsolidatedSqliteEventLogStorage",
+                    "config": {"base_dir": temp_dir},
+                },
+            }
+        ) as instance:
+            run_ids = [
+                my_job.execute_in_process(instance=instance, raise_on_error=False).run_id
+                for _ in range(3)
+            ]
+            update_timestamp = pendulum.now("UTC").subtract(hours=1).isoformat()
+            feed = RunStatusEventFeed()
+
+            def _get_records(record_id, limit):
+                context = SensorEvaluationContext(
+                    instance_ref=instance.get_ref(),
+                    last_completion_time=None,
+                    last_run_key=None,
+                    cursor=None,
+                    repository_name=None,
+                )
+                with context:
+                    return feed.get_records(
+                        context,
+                        DagsterEventType.PIPELINE_FAILURE,
+                        record_id,
+                        update_timestamp,
+                        limit,
+                    )
+
+            with mock.patch.object(
+                DagsterInstance, "get_event_records", wraps=instance.get_event_records
+            ) as get_event_records, mock.patch.object(
+                DagsterInstance, "get_run_records", wraps=instance.get_run_records
+            ) as get_run_records:
+                records = _get_records(-1, 2)
+                assert [run_record.pipeline_run.run_id for _, run_record in records] == run_ids[:2]
+                assert get_event_records.call_count == 1
+                assert get_run_records.call_count == 1
+
+                # sensors with cursors within the fetched page are served from it
+                first_storage_id = records[0][0].storage_id
+                records = _get_records(first_storage_id, 2)
+                assert [run_record.pipeline_run.run_id for _, run_record in records] == run_ids[1:]
+                last_storage_id = records[-1][0].storage_id
+                assert _get_records(last_storage_id, 2) == []
+                assert get_event_records.call_count == 1
+                assert get_run_records.call_count == 1
+
+                # once the page is stale, events from new runs are picked up
+                new_run_id = my_job.execute_in_process(
+                    instance=instance, raise_on_error=False
+                ).run_id
+                with mock.patch(
+                    "dagster._core.definitions.run_status_sensor_definition."
+                    "RUN_STATUS_EVENT_FEED_TTL_SECONDS",
+                    0,
+                ):
+                    records = _get_records(last_storage_id, 2)
+                assert [run_record.pipeline_run.run_id for _, run_record in records] == [new_run_id]
+                assert get_event_records.call_count == 2
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import cast
+from typing import Dict, List, cast
 
 import pendulum
 import pytest
@@ -16,6 +16,7 @@
     weekly_partitioned_config,
 )
 from dagster._core.definitions.time_window_partitions import TimeWindow
+from dagster._core.errors import DagsterUnknownPartitionError
 from dagster._utils.partitions import DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE
 
 DATE_FORMAT = "%Y-%m-%d"
@@ -301,3 +302,107 @@ def test_get_partition_keys_in_range(partitions_def, range_start, range_end, par
         partitions_def.get_partition_keys_in_range(PartitionKeyRange(range_start, range_end))
         == partition_keys
     )
+
+
+def test_lazy_partitions():
+    partitions_def = HourlyPartitionsDefinition(start_date="2017-01-01-00:00")
+    partitions = partitions_def.get_partitions(
+        datetime.strptime("2022-01-01-00:00", DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE)
+    )
+
+    assert len(partitions) == 43824
+    assert partitions[0].name == "2017-01-01-00:00"
+    assert partitions[-1].name == "2021-12-31-23:00"
+    assert partitions[-1].value == time_window("2021-12-31T23:00:00", "2022-01-01T00:00:00")
+
+    last_day = partitions[-24:]
+    assert len(last_day) == 24
+    assert [partition.name for partition in last_day[:2]] == [
+        "2021-12-31-00:00",
+        "2021-12-31-01:00",
+    ]
+    assert last_day == list(partitions)[-24:]
+    assert partitions[::-1][0] == partitions[-1]
+
+    with pytest.raises(IndexError):
+        partitions[43824]  # pylint: disable=pointless-statement
+
+    assert partitions_def.get_num_partitions(
+        datetime.strptime("2022-01-01-00:00", DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE)
+    ) == len(partitions)
+
+
+def test_get_partition():
+    partitions_def = DailyPartitionsDefinition(start_date="2021-05-05", hour_offset=4)
+    current_time = datetime.strptime("2021-05-10", DATE_FORMAT)
+
+    partition = partitions_def.get_partition("2021-05-07", current_time)
+    assert partition.name == "2021-05-07"
+    assert partition.value == time_window("2021-05-07T04:00:00", "2021-05-08T04:00:00")
+
+    for partition_key in ["2021-05-04", "2021-05-09", "2021-05-07-extra", "not-a-date"]:
+        with pytest.raises(DagsterUnknownPartitionError):
+            partitions_def.get_partition(partition_key, current_time)
+
+
+@pytest.mark.parametrize("timezone", ["UTC", "US/Central", "Australia/Lord_Howe"])
+@pytest.mark.parametrize(
+    "partitions_def_fn",
+    [
+        lambda tz: HourlyPartitionsDefinition(
+            start_date="2019-03-01-00:00", minute_offset=30, timezone=tz, end_offset=1
+        ),
+        lambda tz: DailyPartitionsDefinition(
+            start_date="2019-01-01", hour_offset=2, minute_offset=30, timezone=tz
+        ),
+        lambda tz: DailyPartitionsDefinition(
+            start_date="2019-01-01", hour_offset=1, minute_offset=30, timezone=tz, end_offset=-1
+        ),
+        lambda tz: WeeklyPartitionsDefinition(
+            start_date="2019-01-01", day_offset=0, hour_offset=2, minute_offset=30, timezone=tz
+        ),
+        lambda tz: MonthlyPartitionsDefinition(
+            start_date="2018-01-01", day_offset=10, hour_offset=2, timezone=tz, end_offset=2
+        ),
+        lambda tz: MonthlyPartitionsDefinition(start_date="2018-01-01", day_offset=31, timezone=tz),
+    ],
+)
+def test_partitions_match_schedule(partitions_def_fn, timezone):
+    # the partitions are computed in closed form, so check them against the cron schedule across
+    # DST transitions
+    partitions_def = partitions_def_fn(timezone)
+    current_time = pendulum.datetime(2019, 11, 4, 8, tz="UTC")
+    current_timestamp = current_time.timestamp()
+
+    expected = []
+    for time_window in partitions_def._iterate_time_windows(  # pylint: disable=protected-access
+        partitions_def.start
+    ):
+        if time_window.end.timestamp() > current_timestamp:
+            break
+        expected.append((time_window.start.strftime(partitions_def.fmt), time_window))
+
+    if partitions_def.end_offset < 0:
+        expected = expected[: partitions_def.end_offset]
+    else:
+        windows = partitions_def._iterate_time_windows(  # pylint: disable=protected-access
+            expected[-1][1].end
+        )
+        for _ in range(partitions_def.end_offset):
+            time_window = next(windows)
+            expected.append((time_window.start.strftime(partitions_def.fmt), time_window))
+
+    partitions = partitions_def.get_partitions(current_time)
+    assert [(partition.name, partition.value) for partition in partitions] == expected
+    assert [(partition.name, partition.value) for partition in partitions[3:7]] == expected[3:7]
+
+    # partition keys can repeat across a DST transition, and refer to the first such partition
+    windows_by_key: Dict[str, List[TimeWindow]] = {}
+    for partition_key, time_window in expected:
+        windows_by_key.setdefault(partition_key, []).append(time_window)
+
+    for partition_key, windows in windows_by_key.items():
+        assert partitions_def.time_window_for_partition_key(partition_key).start.timestamp() in {
+            window.start.timestamp() for window in windows
+        }
+        assert partitions_def.get_partition(partition_key, current_time).value == windows[0]
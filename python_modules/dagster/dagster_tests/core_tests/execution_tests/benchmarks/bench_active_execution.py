@@ -0,0 +1,111 @@
+"""Measures the time ActiveExecution spends orchestrating synthetic wide and deep execution plans,
+with steps completed as soon as they are vended, the way an executor drives it.
+
+Usage:
+
+    python -m dagster_tests.core_tests.execution_tests.benchmarks.bench_active_execution \\
+        --steps 10000 --shapes wide deep --concurrency 1 16
+"""
+import argparse
+import time
+
+from dagster import In, Nothing, job, op
+from dagster._core.events import DagsterEvent, DagsterEventType
+from dagster._core.execution.api import create_execution_plan
+from dagster._core.execution.plan.objects import StepSuccessData
+from dagster._core.execution.plan.outputs import StepOutputHandle
+from dagster._core.execution.retries import RetryMode
+
+
+@op
+def root():
+    pass
+
+
+@op(ins={"start": In(Nothing)})
+def node():
+    pass
+
+
+def define_wide_job(num_steps):
+    """One root op fanning out to ``num_steps - 1`` independent ops."""
+
+    @job(name=f"wide_{num_steps}")
+    def wide_job():
+        start = root()
+        for i in range(num_steps - 1):
+            node.alias(f"node_{i}")(start)
+
+    return wide_job
+
+
+# graph construction recurses along dependency chains, so deep plans are built from several
+# chains of bounded length
+DEEP_CHAIN_LENGTH = 500
+
+
+def define_deep_job(num_steps):
+    """Chains of ``DEEP_CHAIN_LENGTH`` ops hanging off one root op, ``num_steps`` ops in total."""
+
+    @job(name=f"deep_{num_steps}")
+    def deep_job():
+        start = root()
+        prev = start
+        for i in range(num_steps - 1):
+            if i % DEEP_CHAIN_LENGTH == 0:
+                prev = start
+            prev = node.alias(f"node_{i}")(prev)
+
+    return deep_job
+
+
+SHAPES = {"wide": define_wide_job, "deep": define_deep_job}
+
+
+def _success_event(pipeline_name, step_key):
+    return DagsterEvent(
+        DagsterEventType.STEP_SUCCESS.value,
+        pipeline_name=pipeline_name,
+        step_key=step_key,
+        event_specific_data=StepSuccessData(duration_ms=1.0),
+    )
+
+
+def run_benchmark(pipeline_def, concurrency):
+    execution_plan = create_execution_plan(pipeline_def)
+
+    start = time.time()
+    num_steps = 0
+    with execution_plan.start(RetryMode.DISABLED) as active_execution:
+        while not active_execution.is_complete:
+            steps = active_execution.get_steps_to_execute(limit=concurrency)
+            for step in steps:
+                for step_output in step.step_outputs:
+                    active_execution.mark_step_produced_output(
+                        StepOutputHandle(step.key, step_output.name)
+                    )
+                active_execution.handle_event(_success_event(pipeline_def.name, step.key))
+                num_steps += 1
+
+    return num_steps, time.time() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--steps", type=int, default=10000)
+    parser.add_argument("--shapes", nargs="+", choices=list(SHAPES.keys()), default=list(SHAPES))
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 16])
+    args = parser.parse_args()
+
+    for shape in args.shapes:
+        pipeline_def = SHAPES[shape](args.steps)
+        for concurrency in args.concurrency:
+            num_steps, elapsed = run_benchmark(pipeline_def, concurrency)
+            print(  # pylint: disable=print-call
+                f"{shape:>5} concurrency={concurrency:<3} {num_steps} steps in {elapsed:.3f}s "
+                f"({num_steps / elapsed:.0f} steps/s)"
+            )
+
+
+if __name__ == "__main__":
+    main()
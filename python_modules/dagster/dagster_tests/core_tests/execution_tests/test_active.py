@@ -148,3 +148,67 @@ def test_recover_in_between_steps():
                 step_key="bar_op",
             )
         )
+
+
+def define_fan_in_job():
+    @op
+    def upstream_op():
+        return 1
+
+    @op
+    def fan_in_op(_a, _b, _c):
+        pass
+
+    @job
+    def fan_in_job():
+        fan_in_op(upstream_op.alias("a")(), upstream_op.alias("b")(), upstream_op.alias("c")())
+
+    return fan_in_job
+
+
+def _step_success_event(job_def, step_key):
+    return DagsterEvent(
+        DagsterEventType.STEP_SUCCESS.value,
+        pipeline_name=job_def.name,
+        event_specific_data=StepSuccessData(duration_ms=10.0),
+        step_key=step_key,
+    )
+
+
+def test_fan_in_waits_for_all_upstream_steps():
+    fan_in_job = define_fan_in_job()
+
+    with create_execution_plan(fan_in_job).start(RetryMode.DISABLED) as active_execution:
+        steps = active_execution.get_steps_to_execute()
+        assert [step.key for step in steps] == ["a", "b", "c"]
+
+        for step_key in ["a", "b"]:
+            active_execution.mark_step_produced_output(StepOutputHandle(step_key, "result"))
+            active_execution.handle_event(_step_success_event(fan_in_job, step_key))
+            assert not active_execution.get_steps_to_execute()
+
+        active_execution.mark_step_produced_output(StepOutputHandle("c", "result"))
+        active_execution.handle_event(_step_success_event(fan_in_job, "c"))
+        assert [step.key for step in active_execution.get_steps_to_execute()] == ["fan_in_op"]
+
+        active_execution.handle_event(_step_success_event(fan_in_job, "fan_in_op"))
+        assert active_execution.is_complete
+
+
+def test_fan_in_abandoned_on_upstream_failure():
+    fan_in_job = define_fan_in_job()
+
+    with create_execution_plan(fan_in_job).start(RetryMode.DISABLED) as active_execution:
+        active_execution.get_steps_to_execute()
+
+        active_execution.mark_step_produced_output(StepOutputHandle("a", "result"))
+        active_execution.handle_event(_step_success_event(fan_in_job, "a"))
+        active_execution.mark_failed("b")
+        assert not active_execution.get_steps_to_execute()
+        assert [step.key for step in active_execution.get_steps_to_abandon()] == ["fan_in_op"]
+        active_execution.mark_abandoned("fan_in_op")
+
+        active_execution.mark_step_produced_output(StepOutputHandle("c", "result"))
+        active_execution.handle_event(_step_success_event(fan_in_job, "c"))
+        assert not active_execution.get_steps_to_execute()
+        assert active_execution.is_complete
@@ -1,6 +1,20 @@
 import pytest
 
-from dagster import AssetKey, AssetsDefinition, GraphOut, In, Out, define_asset_job, graph, job, op
+from dagster import (
+    AssetKey,
+    AssetsDefinition,
+    GraphOut,
+    In,
+    Out,
+    ScheduleDefinition,
+    define_asset_job,
+    graph,
+    job,
+    op,
+    repository,
+    sensor,
+)
+from dagster._check import CheckError
 from dagster._core.definitions import AssetIn, SourceAsset, asset, build_assets_job, multi_asset
 from dagster._core.definitions.metadata import MetadataValue, normalize_metadata
 from dagster._core.definitions.utils import DEFAULT_GROUP_NAME
@@ -12,8 +26,9 @@
     ExternalSensorData,
     ExternalTargetData,
     external_asset_graph_from_defs,
+    external_repository_data_from_def,
 )
-from dagster._serdes import deserialize_json_to_dagster_namedtuple
+from dagster._serdes import deserialize_json_to_dagster_namedtuple, serialize_dagster_namedtuple
 
 
 def test_single_asset_job():
@@ -957,3 +972,46 @@ def test_back_compat_external_sensor():
     target = external_sensor_data.target_dict["my_pipeline"]
     assert isinstance(target, ExternalTargetData)
     assert target.pipeline_name == "my_pipeline"
+
+
+def test_external_repository_data_lookups():
+    @op
+    def noop():
+        pass
+
+    def define_job(name):
+        @job(name=name)
+        def _job():
+            noop()
+
+        return _job
+
+    jobs = [define_job(f"job_{i}") for i in range(3)]
+
+    @sensor(job=jobs[1])
+    def my_sensor():
+        pass
+
+    @repository
+    def repo():
+        return [*jobs, ScheduleDefinition(job=jobs[2], cron_schedule="@daily"), my_sensor]
+
+    repository_data = external_repository_data_from_def(repo)
+
+    for external_repository_data in [
+        repository_data,
+        deserialize_json_to_dagster_namedtuple(serialize_dagster_namedtuple(repository_data)),
+    ]:
+        assert external_repository_data == repository_data
+        assert external_repository_data.get_external_pipeline_data("job_1").name == "job_1"
+        assert external_repository_data.get_pipeline_snapshot("job_2").name == "job_2"
+        assert external_repository_data.get_external_sensor_data("my_sensor").name == "my_sensor"
+        assert (
+            external_repository_data.get_external_schedule_data("job_2_schedule").name
+            == "job_2_schedule"
+        )
+
+        with pytest.raises(CheckError, match="Could not find external pipeline data named job_3"):
+            external_repository_data.get_external_pipeline_data("job_3")
+        with pytest.raises(CheckError, match="Could not find sensor data named other_sensor"):
+            external_repository_data.get_external_sensor_data("other_sensor")
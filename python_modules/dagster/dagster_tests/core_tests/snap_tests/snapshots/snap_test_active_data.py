@@ -4,10 +4,11 @@
 
 from snapshottest import Snapshot
 
-
 snapshots = Snapshot()
 
-snapshots['test_external_pipeline_data 1'] = '''{
+snapshots[
+    "test_external_pipeline_data 1"
+] = """{
   "__class__": "ExternalPipelineData",
   "active_presets": [
     {
@@ -223,7 +224,7 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Selector.2e65905622a9acb147069bfa7ccdb42fed0aa39e": {
+        "Selector.496227f5419889b1bf73123ef81c9270cfbf275b": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
@@ -231,24 +232,24 @@
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+              "default_value_as_json_str": "{\\"config\\": {\\"release_outputs\\": false, \\"retries\\": {\\"enabled\\": {}}}}",
               "description": null,
               "is_required": false,
               "name": "in_process",
-              "type_key": "Shape.09d73f0755bf4752d3f121837669c8660dcf451e"
+              "type_key": "Shape.e8f2597d5559c58c0ffed9f68742cb24f57a98c1"
             },
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+              "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"release_outputs\\": false, \\"retries\\": {\\"enabled\\": {}}}}",
               "description": null,
               "is_required": false,
               "name": "multiprocess",
-              "type_key": "Shape.711132734fb3e636a3de89133ea95d2b1f2417b0"
+              "type_key": "Shape.6de73ca6abc02110a1be850614fe2558ba0c81a3"
             }
           ],
           "given_name": null,
-          "key": "Selector.2e65905622a9acb147069bfa7ccdb42fed0aa39e",
+          "key": "Selector.496227f5419889b1bf73123ef81c9270cfbf275b",
           "kind": {
             "__enum__": "ConfigTypeKind.SELECTOR"
           },
@@ -524,6 +525,65 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
+        "Shape.00f6e91ddaac6293ecfa0fbe71a1f7d7aec5b659": {
+          "__class__": "ConfigTypeSnap",
+          "description": null,
+          "enum_values": null,
+          "fields": [
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "0",
+              "description": "The number of processes that may run concurrently. By default, this is set to be the return value of `multiprocessing.cpu_count()`.",
+              "is_required": false,
+              "name": "max_concurrent",
+              "type_key": "Int"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "false",
+              "description": "Release each step output through its IO manager\'s `release_output` method once every step that consumes it has succeeded or been skipped, for example deleting its file with the `fs_io_manager`. Released outputs can not be loaded by later re-executions of the run.",
+              "is_required": false,
+              "name": "release_outputs",
+              "type_key": "Bool"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{\\"enabled\\": {}}",
+              "description": "Whether retries are enabled or not. By default, retries are enabled.",
+              "is_required": false,
+              "name": "retries",
+              "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": false,
+              "default_value_as_json_str": null,
+              "description": "Select how subprocesses are created. By default, `spawn` is selected. See https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods.",
+              "is_required": false,
+              "name": "start_method",
+              "type_key": "Selector.8318f5aff6cd0698a5c7fedfb9bdc75fd8006db8"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": false,
+              "default_value_as_json_str": null,
+              "description": "Configure the multiprocess executor to reuse worker processes between steps.",
+              "is_required": false,
+              "name": "worker_pool",
+              "type_key": "Shape.ce6829bb799a76c6e714e1c55039cc04fa650ccb"
+            }
+          ],
+          "given_name": null,
+          "key": "Shape.00f6e91ddaac6293ecfa0fbe71a1f7d7aec5b659",
+          "kind": {
+            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+          },
+          "scalar_kind": null,
+          "type_param_keys": null
+        },
         "Shape.081354663b9d4b8fbfd1cb8e358763912953913f": {
           "__class__": "ConfigTypeSnap",
           "description": null,
@@ -556,23 +616,53 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.09d73f0755bf4752d3f121837669c8660dcf451e": {
+        "Shape.09d2c5f8bc9c499233771f65f0767ab5c553b2ed": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
+          "field_aliases": {
+            "solids": "ops"
+          },
           "fields": [
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
-              "description": "Execute all steps in a single process.",
+              "default_value_as_json_str": "{\\"in_process\\": {}}",
+              "description": "Configure how steps are executed within a run.",
               "is_required": false,
-              "name": "config",
-              "type_key": "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c"
+              "name": "execution",
+              "type_key": "Selector.496227f5419889b1bf73123ef81c9270cfbf275b"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{}",
+              "description": "Configure how loggers emit messages within a run.",
+              "is_required": false,
+              "name": "loggers",
+              "type_key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{\\"io_manager\\": {}}",
+              "description": "Configure how shared resources are implemented within a run.",
+              "is_required": false,
+              "name": "resources",
+              "type_key": "Shape.95e096750f330490a26714025addb5f403b099e6"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{\\"a_solid\\": {}}",
+              "description": "Configure runtime parameters for ops or assets.",
+              "is_required": false,
+              "name": "solids",
+              "type_key": "Shape.b25df6ff575a5177ad6130bc61f4d62097c2a29b"
             }
           ],
           "given_name": null,
-          "key": "Shape.09d73f0755bf4752d3f121837669c8660dcf451e",
+          "key": "Shape.09d2c5f8bc9c499233771f65f0767ab5c553b2ed",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
@@ -625,38 +715,6 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c": {
-          "__class__": "ConfigTypeSnap",
-          "description": null,
-          "enum_values": null,
-          "fields": [
-            {
-              "__class__": "ConfigFieldSnap",
-              "default_provided": false,
-              "default_value_as_json_str": null,
-              "description": "[DEPRECATED]",
-              "is_required": false,
-              "name": "marker_to_close",
-              "type_key": "String"
-            },
-            {
-              "__class__": "ConfigFieldSnap",
-              "default_provided": true,
-              "default_value_as_json_str": "{\\"enabled\\": {}}",
-              "description": "Whether retries are enabled or not. By default, retries are enabled.",
-              "is_required": false,
-              "name": "retries",
-              "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-            }
-          ],
-          "given_name": null,
-          "key": "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c",
-          "kind": {
-            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-          },
-          "scalar_kind": null,
-          "type_param_keys": null
-        },
         "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2": {
           "__class__": "ConfigTypeSnap",
           "description": null,
@@ -738,7 +796,7 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.711132734fb3e636a3de89133ea95d2b1f2417b0": {
+        "Shape.6de73ca6abc02110a1be850614fe2558ba0c81a3": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
@@ -746,15 +804,15 @@
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+              "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"release_outputs\\": false, \\"retries\\": {\\"enabled\\": {}}}",
               "description": "Execute each step in an individual process.",
               "is_required": false,
               "name": "config",
-              "type_key": "Shape.f14346cd5dd7ef8afab32d29899a1776169809b7"
+              "type_key": "Shape.00f6e91ddaac6293ecfa0fbe71a1f7d7aec5b659"
             }
           ],
           "given_name": null,
-          "key": "Shape.711132734fb3e636a3de89133ea95d2b1f2417b0",
+          "key": "Shape.6de73ca6abc02110a1be850614fe2558ba0c81a3",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
@@ -807,53 +865,41 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.9f29a8c7a40f52438834fcb535aa9670e2c50f7a": {
+        "Shape.9c7fe4a307fe8610251c25eb9ca06c93dfdea803": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
-          "field_aliases": {
-            "solids": "ops"
-          },
           "fields": [
             {
               "__class__": "ConfigFieldSnap",
-              "default_provided": true,
-              "default_value_as_json_str": "{\\"in_process\\": {}}",
-              "description": "Configure how steps are executed within a run.",
-              "is_required": false,
-              "name": "execution",
-              "type_key": "Selector.2e65905622a9acb147069bfa7ccdb42fed0aa39e"
-            },
-            {
-              "__class__": "ConfigFieldSnap",
-              "default_provided": true,
-              "default_value_as_json_str": "{}",
-              "description": "Configure how loggers emit messages within a run.",
+              "default_provided": false,
+              "default_value_as_json_str": null,
+              "description": "[DEPRECATED]",
               "is_required": false,
-              "name": "loggers",
-              "type_key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b"
+              "name": "marker_to_close",
+              "type_key": "String"
             },
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{\\"io_manager\\": {}}",
-              "description": "Configure how shared resources are implemented within a run.",
+              "default_value_as_json_str": "false",
+              "description": "Release each step output through its IO manager\'s `release_output` method once every step that consumes it has succeeded or been skipped, for example deleting its file with the `fs_io_manager`. Released outputs can not be loaded by later re-executions of the run.",
               "is_required": false,
-              "name": "resources",
-              "type_key": "Shape.95e096750f330490a26714025addb5f403b099e6"
+              "name": "release_outputs",
+              "type_key": "Bool"
             },
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{\\"a_solid\\": {}}",
-              "description": "Configure runtime parameters for ops or assets.",
+              "default_value_as_json_str": "{\\"enabled\\": {}}",
+              "description": "Whether retries are enabled or not. By default, retries are enabled.",
               "is_required": false,
-              "name": "solids",
-              "type_key": "Shape.b25df6ff575a5177ad6130bc61f4d62097c2a29b"
+              "name": "retries",
+              "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
             }
           ],
           "given_name": null,
-          "key": "Shape.9f29a8c7a40f52438834fcb535aa9670e2c50f7a",
+          "key": "Shape.9c7fe4a307fe8610251c25eb9ca06c93dfdea803",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
@@ -886,6 +932,38 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
+        "Shape.ce6829bb799a76c6e714e1c55039cc04fa650ccb": {
+          "__class__": "ConfigTypeSnap",
+          "description": null,
+          "enum_values": null,
+          "fields": [
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "false",
+              "description": "Execute steps in a pool of up to `max_concurrent` worker processes that are kept for the life of the run, rather than starting a new process for each step. Each worker loads the job and opens the Dagster instance once.",
+              "is_required": false,
+              "name": "enabled",
+              "type_key": "Bool"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "100",
+              "description": "The number of steps a worker process executes before it is replaced with a new one. Workers are also replaced after a step fails in them.",
+              "is_required": false,
+              "name": "max_steps_per_worker",
+              "type_key": "Int"
+            }
+          ],
+          "given_name": null,
+          "key": "Shape.ce6829bb799a76c6e714e1c55039cc04fa650ccb",
+          "kind": {
+            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+          },
+          "scalar_kind": null,
+          "type_param_keys": null
+        },
         "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
           "__class__": "ConfigTypeSnap",
           "description": null,
@@ -922,7 +1000,7 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.f14346cd5dd7ef8afab32d29899a1776169809b7": {
+        "Shape.e8f2597d5559c58c0ffed9f68742cb24f57a98c1": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
@@ -930,33 +1008,15 @@
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "0",
-              "description": "The number of processes that may run concurrently. By default, this is set to be the return value of `multiprocessing.cpu_count()`.",
-              "is_required": false,
-              "name": "max_concurrent",
-              "type_key": "Int"
-            },
-            {
-              "__class__": "ConfigFieldSnap",
-              "default_provided": true,
-              "default_value_as_json_str": "{\\"enabled\\": {}}",
-              "description": "Whether retries are enabled or not. By default, retries are enabled.",
-              "is_required": false,
-              "name": "retries",
-              "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-            },
-            {
-              "__class__": "ConfigFieldSnap",
-              "default_provided": false,
-              "default_value_as_json_str": null,
-              "description": "Select how subprocesses are created. By default, `spawn` is selected. See https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods.",
+              "default_value_as_json_str": "{\\"release_outputs\\": false, \\"retries\\": {\\"enabled\\": {}}}",
+              "description": "Execute all steps in a single process.",
               "is_required": false,
-              "name": "start_method",
-              "type_key": "Selector.8318f5aff6cd0698a5c7fedfb9bdc75fd8006db8"
+              "name": "config",
+              "type_key": "Shape.9c7fe4a307fe8610251c25eb9ca06c93dfdea803"
             }
           ],
           "given_name": null,
-          "key": "Shape.f14346cd5dd7ef8afab32d29899a1776169809b7",
+          "key": "Shape.e8f2597d5559c58c0ffed9f68742cb24f57a98c1",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
@@ -1122,7 +1182,7 @@
             "name": "io_manager"
           }
         ],
-        "root_config_key": "Shape.9f29a8c7a40f52438834fcb535aa9670e2c50f7a"
+        "root_config_key": "Shape.09d2c5f8bc9c499233771f65f0767ab5c553b2ed"
       },
       {
         "__class__": "ModeDefSnap",
@@ -1160,7 +1220,7 @@
             "name": "io_manager"
           }
         ],
-        "root_config_key": "Shape.9f29a8c7a40f52438834fcb535aa9670e2c50f7a"
+        "root_config_key": "Shape.09d2c5f8bc9c499233771f65f0767ab5c553b2ed"
       }
     ],
     "name": "a_pipeline",
@@ -1199,9 +1259,11 @@
     },
     "tags": {}
   }
-}'''
+}"""
 
-snapshots['test_external_repository_data 1'] = '''{
+snapshots[
+    "test_external_repository_data 1"
+] = """{
   "__class__": "ExternalRepositoryData",
   "external_asset_graph_data": [],
   "external_partition_set_datas": [
@@ -1430,7 +1492,7 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Selector.2e65905622a9acb147069bfa7ccdb42fed0aa39e": {
+            "Selector.496227f5419889b1bf73123ef81c9270cfbf275b": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
@@ -1438,24 +1500,24 @@
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+                  "default_value_as_json_str": "{\\"config\\": {\\"release_outputs\\": false, \\"retries\\": {\\"enabled\\": {}}}}",
                   "description": null,
                   "is_required": false,
                   "name": "in_process",
-                  "type_key": "Shape.09d73f0755bf4752d3f121837669c8660dcf451e"
+                  "type_key": "Shape.e8f2597d5559c58c0ffed9f68742cb24f57a98c1"
                 },
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+                  "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"release_outputs\\": false, \\"retries\\": {\\"enabled\\": {}}}}",
                   "description": null,
                   "is_required": false,
                   "name": "multiprocess",
-                  "type_key": "Shape.711132734fb3e636a3de89133ea95d2b1f2417b0"
+                  "type_key": "Shape.6de73ca6abc02110a1be850614fe2558ba0c81a3"
                 }
               ],
               "given_name": null,
-              "key": "Selector.2e65905622a9acb147069bfa7ccdb42fed0aa39e",
+              "key": "Selector.496227f5419889b1bf73123ef81c9270cfbf275b",
               "kind": {
                 "__enum__": "ConfigTypeKind.SELECTOR"
               },
@@ -1731,6 +1793,65 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
+            "Shape.00f6e91ddaac6293ecfa0fbe71a1f7d7aec5b659": {
+              "__class__": "ConfigTypeSnap",
+              "description": null,
+              "enum_values": null,
+              "fields": [
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "0",
+                  "description": "The number of processes that may run concurrently. By default, this is set to be the return value of `multiprocessing.cpu_count()`.",
+                  "is_required": false,
+                  "name": "max_concurrent",
+                  "type_key": "Int"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "false",
+                  "description": "Release each step output through its IO manager\'s `release_output` method once every step that consumes it has succeeded or been skipped, for example deleting its file with the `fs_io_manager`. Released outputs can not be loaded by later re-executions of the run.",
+                  "is_required": false,
+                  "name": "release_outputs",
+                  "type_key": "Bool"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{\\"enabled\\": {}}",
+                  "description": "Whether retries are enabled or not. By default, retries are enabled.",
+                  "is_required": false,
+                  "name": "retries",
+                  "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": false,
+                  "default_value_as_json_str": null,
+                  "description": "Select how subprocesses are created. By default, `spawn` is selected. See https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods.",
+                  "is_required": false,
+                  "name": "start_method",
+                  "type_key": "Selector.8318f5aff6cd0698a5c7fedfb9bdc75fd8006db8"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": false,
+                  "default_value_as_json_str": null,
+                  "description": "Configure the multiprocess executor to reuse worker processes between steps.",
+                  "is_required": false,
+                  "name": "worker_pool",
+                  "type_key": "Shape.ce6829bb799a76c6e714e1c55039cc04fa650ccb"
+                }
+              ],
+              "given_name": null,
+              "key": "Shape.00f6e91ddaac6293ecfa0fbe71a1f7d7aec5b659",
+              "kind": {
+                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+              },
+              "scalar_kind": null,
+              "type_param_keys": null
+            },
             "Shape.081354663b9d4b8fbfd1cb8e358763912953913f": {
               "__class__": "ConfigTypeSnap",
               "description": null,
@@ -1763,23 +1884,53 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.09d73f0755bf4752d3f121837669c8660dcf451e": {
+            "Shape.09d2c5f8bc9c499233771f65f0767ab5c553b2ed": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
+              "field_aliases": {
+                "solids": "ops"
+              },
               "fields": [
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
-                  "description": "Execute all steps in a single process.",
+                  "default_value_as_json_str": "{\\"in_process\\": {}}",
+                  "description": "Configure how steps are executed within a run.",
                   "is_required": false,
-                  "name": "config",
-                  "type_key": "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c"
+                  "name": "execution",
+                  "type_key": "Selector.496227f5419889b1bf73123ef81c9270cfbf275b"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{}",
+                  "description": "Configure how loggers emit messages within a run.",
+                  "is_required": false,
+                  "name": "loggers",
+                  "type_key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{\\"io_manager\\": {}}",
+                  "description": "Configure how shared resources are implemented within a run.",
+                  "is_required": false,
+                  "name": "resources",
+                  "type_key": "Shape.95e096750f330490a26714025addb5f403b099e6"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{\\"a_solid\\": {}}",
+                  "description": "Configure runtime parameters for ops or assets.",
+                  "is_required": false,
+                  "name": "solids",
+                  "type_key": "Shape.b25df6ff575a5177ad6130bc61f4d62097c2a29b"
                 }
               ],
               "given_name": null,
-              "key": "Shape.09d73f0755bf4752d3f121837669c8660dcf451e",
+              "key": "Shape.09d2c5f8bc9c499233771f65f0767ab5c553b2ed",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
@@ -1832,38 +1983,6 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c": {
-              "__class__": "ConfigTypeSnap",
-              "description": null,
-              "enum_values": null,
-              "fields": [
-                {
-                  "__class__": "ConfigFieldSnap",
-                  "default_provided": false,
-                  "default_value_as_json_str": null,
-                  "description": "[DEPRECATED]",
-                  "is_required": false,
-                  "name": "marker_to_close",
-                  "type_key": "String"
-                },
-                {
-                  "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "{\\"enabled\\": {}}",
-                  "description": "Whether retries are enabled or not. By default, retries are enabled.",
-                  "is_required": false,
-                  "name": "retries",
-                  "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-                }
-              ],
-              "given_name": null,
-              "key": "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c",
-              "kind": {
-                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-              },
-              "scalar_kind": null,
-              "type_param_keys": null
-            },
             "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2": {
               "__class__": "ConfigTypeSnap",
               "description": null,
@@ -1945,7 +2064,7 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.711132734fb3e636a3de89133ea95d2b1f2417b0": {
+            "Shape.6de73ca6abc02110a1be850614fe2558ba0c81a3": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
@@ -1953,15 +2072,15 @@
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+                  "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"release_outputs\\": false, \\"retries\\": {\\"enabled\\": {}}}",
                   "description": "Execute each step in an individual process.",
                   "is_required": false,
                   "name": "config",
-                  "type_key": "Shape.f14346cd5dd7ef8afab32d29899a1776169809b7"
+                  "type_key": "Shape.00f6e91ddaac6293ecfa0fbe71a1f7d7aec5b659"
                 }
               ],
               "given_name": null,
-              "key": "Shape.711132734fb3e636a3de89133ea95d2b1f2417b0",
+              "key": "Shape.6de73ca6abc02110a1be850614fe2558ba0c81a3",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
@@ -2014,53 +2133,41 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.9f29a8c7a40f52438834fcb535aa9670e2c50f7a": {
+            "Shape.9c7fe4a307fe8610251c25eb9ca06c93dfdea803": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
-              "field_aliases": {
-                "solids": "ops"
-              },
               "fields": [
                 {
                   "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "{\\"in_process\\": {}}",
-                  "description": "Configure how steps are executed within a run.",
-                  "is_required": false,
-                  "name": "execution",
-                  "type_key": "Selector.2e65905622a9acb147069bfa7ccdb42fed0aa39e"
-                },
-                {
-                  "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "{}",
-                  "description": "Configure how loggers emit messages within a run.",
+                  "default_provided": false,
+                  "default_value_as_json_str": null,
+                  "description": "[DEPRECATED]",
                   "is_required": false,
-                  "name": "loggers",
-                  "type_key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b"
+                  "name": "marker_to_close",
+                  "type_key": "String"
                 },
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{\\"io_manager\\": {}}",
-                  "description": "Configure how shared resources are implemented within a run.",
+                  "default_value_as_json_str": "false",
+                  "description": "Release each step output through its IO manager\'s `release_output` method once every step that consumes it has succeeded or been skipped, for example deleting its file with the `fs_io_manager`. Released outputs can not be loaded by later re-executions of the run.",
                   "is_required": false,
-                  "name": "resources",
-                  "type_key": "Shape.95e096750f330490a26714025addb5f403b099e6"
+                  "name": "release_outputs",
+                  "type_key": "Bool"
                 },
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{\\"a_solid\\": {}}",
-                  "description": "Configure runtime parameters for ops or assets.",
+                  "default_value_as_json_str": "{\\"enabled\\": {}}",
+                  "description": "Whether retries are enabled or not. By default, retries are enabled.",
                   "is_required": false,
-                  "name": "solids",
-                  "type_key": "Shape.b25df6ff575a5177ad6130bc61f4d62097c2a29b"
+                  "name": "retries",
+                  "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
                 }
               ],
               "given_name": null,
-              "key": "Shape.9f29a8c7a40f52438834fcb535aa9670e2c50f7a",
+              "key": "Shape.9c7fe4a307fe8610251c25eb9ca06c93dfdea803",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
@@ -2093,6 +2200,38 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
+            "Shape.ce6829bb799a76c6e714e1c55039cc04fa650ccb": {
+              "__class__": "ConfigTypeSnap",
+              "description": null,
+              "enum_values": null,
+              "fields": [
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "false",
+                  "description": "Execute steps in a pool of up to `max_concurrent` worker processes that are kept for the life of the run, rather than starting a new process for each step. Each worker loads the job and opens the Dagster instance once.",
+                  "is_required": false,
+                  "name": "enabled",
+                  "type_key": "Bool"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "100",
+                  "description": "The number of steps a worker process executes before it is replaced with a new one. Workers are also replaced after a step fails in them.",
+                  "is_required": false,
+                  "name": "max_steps_per_worker",
+                  "type_key": "Int"
+                }
+              ],
+              "given_name": null,
+              "key": "Shape.ce6829bb799a76c6e714e1c55039cc04fa650ccb",
+              "kind": {
+                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+              },
+              "scalar_kind": null,
+              "type_param_keys": null
+            },
             "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
               "__class__": "ConfigTypeSnap",
               "description": null,
@@ -2129,7 +2268,7 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.f14346cd5dd7ef8afab32d29899a1776169809b7": {
+            "Shape.e8f2597d5559c58c0ffed9f68742cb24f57a98c1": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
@@ -2137,33 +2276,15 @@
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "0",
-                  "description": "The number of processes that may run concurrently. By default, this is set to be the return value of `multiprocessing.cpu_count()`.",
-                  "is_required": false,
-                  "name": "max_concurrent",
-                  "type_key": "Int"
-                },
-                {
-                  "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "{\\"enabled\\": {}}",
-                  "description": "Whether retries are enabled or not. By default, retries are enabled.",
-                  "is_required": false,
-                  "name": "retries",
-                  "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-                },
-                {
-                  "__class__": "ConfigFieldSnap",
-                  "default_provided": false,
-                  "default_value_as_json_str": null,
-                  "description": "Select how subprocesses are created. By default, `spawn` is selected. See https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods.",
+                  "default_value_as_json_str": "{\\"release_outputs\\": false, \\"retries\\": {\\"enabled\\": {}}}",
+                  "description": "Execute all steps in a single process.",
                   "is_required": false,
-                  "name": "start_method",
-                  "type_key": "Selector.8318f5aff6cd0698a5c7fedfb9bdc75fd8006db8"
+                  "name": "config",
+                  "type_key": "Shape.9c7fe4a307fe8610251c25eb9ca06c93dfdea803"
                 }
               ],
               "given_name": null,
-              "key": "Shape.f14346cd5dd7ef8afab32d29899a1776169809b7",
+              "key": "Shape.e8f2597d5559c58c0ffed9f68742cb24f57a98c1",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
@@ -2329,7 +2450,7 @@
                 "name": "io_manager"
               }
             ],
-            "root_config_key": "Shape.9f29a8c7a40f52438834fcb535aa9670e2c50f7a"
+            "root_config_key": "Shape.09d2c5f8bc9c499233771f65f0767ab5c553b2ed"
           },
           {
             "__class__": "ModeDefSnap",
@@ -2367,7 +2488,7 @@
                 "name": "io_manager"
               }
             ],
-            "root_config_key": "Shape.9f29a8c7a40f52438834fcb535aa9670e2c50f7a"
+            "root_config_key": "Shape.09d2c5f8bc9c499233771f65f0767ab5c553b2ed"
           }
         ],
         "name": "a_pipeline",
@@ -2424,4 +2545,4 @@
   ],
   "external_sensor_datas": [],
   "name": "repo"
-}'''
+}"""
@@ -4,10 +4,11 @@
 
 from snapshottest import Snapshot
 
-
 snapshots = Snapshot()
 
-snapshots['test_create_execution_plan_with_dep 1'] = '''{
+snapshots[
+    "test_create_execution_plan_with_dep 1"
+] = """{
   "__class__": "ExecutionPlanSnapshot",
   "artifacts_persisted": true,
   "executor_name": "in_process",
@@ -21,7 +22,7 @@
     },
     "step_output_versions": []
   },
-  "pipeline_snapshot_id": "4e770878de7d4f59d0c4841924046e1310918f5b",
+  "pipeline_snapshot_id": "35d762293ed6107a177f91200eb0805a96337dec",
   "snapshot_version": 1,
   "step_keys_to_execute": [
     "solid_one",
@@ -139,9 +140,11 @@
       "tags": {}
     }
   ]
-}'''
+}"""
 
-snapshots['test_create_noop_execution_plan 1'] = '''{
+snapshots[
+    "test_create_noop_execution_plan 1"
+] = """{
   "__class__": "ExecutionPlanSnapshot",
   "artifacts_persisted": true,
   "executor_name": "in_process",
@@ -155,7 +158,7 @@
     },
     "step_output_versions": []
   },
-  "pipeline_snapshot_id": "8ed9ed25f01be4b6c27ffe6d5619edbf54f7e859",
+  "pipeline_snapshot_id": "46bf32ff2c604aff17b6b77d396490de9ed06269",
   "snapshot_version": 1,
   "step_keys_to_execute": [
     "noop_solid"
@@ -202,9 +205,11 @@
       "tags": {}
     }
   ]
-}'''
+}"""
 
-snapshots['test_create_noop_execution_plan_with_tags 1'] = '''{
+snapshots[
+    "test_create_noop_execution_plan_with_tags 1"
+] = """{
   "__class__": "ExecutionPlanSnapshot",
   "artifacts_persisted": true,
   "executor_name": "in_process",
@@ -218,7 +223,7 @@
     },
     "step_output_versions": []
   },
-  "pipeline_snapshot_id": "9fe072eddd35c49d2899a4d605ae231e268086db",
+  "pipeline_snapshot_id": "5b5fdc2dd4cae33f6e5ac4d96561d8b17fd374f7",
   "snapshot_version": 1,
   "step_keys_to_execute": [
     "noop_solid"
@@ -279,9 +284,11 @@
       }
     }
   ]
-}'''
+}"""
 
-snapshots['test_create_with_composite 1'] = '''{
+snapshots[
+    "test_create_with_composite 1"
+] = """{
   "__class__": "ExecutionPlanSnapshot",
   "artifacts_persisted": true,
   "executor_name": "in_process",
@@ -295,7 +302,7 @@
     },
     "step_output_versions": []
   },
-  "pipeline_snapshot_id": "7ff012b7ed8b0a5aeb1a53929bbd30108fe77873",
+  "pipeline_snapshot_id": "c2f745fe243092b1a1007c70e8fc9602ba63be59",
   "snapshot_version": 1,
   "step_keys_to_execute": [
     "comp_1.return_one",
@@ -657,4 +664,4 @@
       "tags": {}
     }
   ]
-}'''
+}"""
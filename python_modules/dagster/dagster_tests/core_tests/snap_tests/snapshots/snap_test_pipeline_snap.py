@@ -4,10 +4,11 @@
 
 from snapshottest import Snapshot
 
-
 snapshots = Snapshot()
 
-snapshots['test_basic_dep_fan_out 1'] = '''{
+snapshots[
+    "test_basic_dep_fan_out 1"
+] = """{
   "__class__": "PipelineSnapshot",
   "config_schema_snapshot": {
     "__class__": "ConfigSchemaSnapshot",
@@ -196,7 +197,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.2e65905622a9acb147069bfa7ccdb42fed0aa39e": {
+      "Selector.496227f5419889b1bf73123ef81c9270cfbf275b": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -204,24 +205,24 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+            "default_value_as_json_str": "{\\"config\\": {\\"release_outputs\\": false, \\"retries\\": {\\"enabled\\": {}}}}",
             "description": null,
             "is_required": false,
             "name": "in_process",
-            "type_key": "Shape.09d73f0755bf4752d3f121837669c8660dcf451e"
+            "type_key": "Shape.e8f2597d5559c58c0ffed9f68742cb24f57a98c1"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"release_outputs\\": false, \\"retries\\": {\\"enabled\\": {}}}}",
             "description": null,
             "is_required": false,
             "name": "multiprocess",
-            "type_key": "Shape.711132734fb3e636a3de89133ea95d2b1f2417b0"
+            "type_key": "Shape.6de73ca6abc02110a1be850614fe2558ba0c81a3"
           }
         ],
         "given_name": null,
-        "key": "Selector.2e65905622a9acb147069bfa7ccdb42fed0aa39e",
+        "key": "Selector.496227f5419889b1bf73123ef81c9270cfbf275b",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
@@ -497,7 +498,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.081354663b9d4b8fbfd1cb8e358763912953913f": {
+      "Shape.00f6e91ddaac6293ecfa0fbe71a1f7d7aec5b659": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -505,153 +506,113 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "\\"INFO\\"",
-            "description": "The logger\'s threshold.",
+            "default_value_as_json_str": "0",
+            "description": "The number of processes that may run concurrently. By default, this is set to be the return value of `multiprocessing.cpu_count()`.",
             "is_required": false,
-            "name": "log_level",
-            "type_key": "String"
+            "name": "max_concurrent",
+            "type_key": "Int"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "\\"dagster\\"",
-            "description": "The name of your logger.",
+            "default_value_as_json_str": "false",
+            "description": "Release each step output through its IO manager\'s `release_output` method once every step that consumes it has succeeded or been skipped, for example deleting its file with the `fs_io_manager`. Released outputs can not be loaded by later re-executions of the run.",
             "is_required": false,
-            "name": "name",
-            "type_key": "String"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.081354663b9d4b8fbfd1cb8e358763912953913f",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
-      "Shape.09d73f0755bf4752d3f121837669c8660dcf451e": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
+            "name": "release_outputs",
+            "type_key": "Bool"
+          },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
-            "description": "Execute all steps in a single process.",
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": "Whether retries are enabled or not. By default, retries are enabled.",
             "is_required": false,
-            "name": "config",
-            "type_key": "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.09d73f0755bf4752d3f121837669c8660dcf451e",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
-      "Shape.0fe8353d6b542accfad9becbdbaeb92f649ebb9a": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"log_level\\": \\"INFO\\", \\"name\\": \\"dagster\\"}",
-            "description": "The default colored console logger.",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. By default, `spawn` is selected. See https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods.",
             "is_required": false,
-            "name": "config",
-            "type_key": "Shape.081354663b9d4b8fbfd1cb8e358763912953913f"
+            "name": "start_method",
+            "type_key": "Selector.8318f5aff6cd0698a5c7fedfb9bdc75fd8006db8"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Configure the multiprocess executor to reuse worker processes between steps.",
+            "is_required": false,
+            "name": "worker_pool",
+            "type_key": "Shape.ce6829bb799a76c6e714e1c55039cc04fa650ccb"
           }
         ],
         "given_name": null,
-        "key": "Shape.0fe8353d6b542accfad9becbdbaeb92f649ebb9a",
+        "key": "Shape.00f6e91ddaac6293ecfa0fbe71a1f7d7aec5b659",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.1f841afe38eb41fe6566522cac6b020ac2d27fa4": {
+      "Shape.081354663b9d4b8fbfd1cb8e358763912953913f": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "field_aliases": {
-          "solids": "ops"
-        },
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"in_process\\": {}}",
-            "description": "Configure how steps are executed within a run.",
-            "is_required": false,
-            "name": "execution",
-            "type_key": "Selector.2e65905622a9acb147069bfa7ccdb42fed0aa39e"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": "Configure how loggers emit messages within a run.",
-            "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"io_manager\\": {}}",
-            "description": "Configure how shared resources are implemented within a run.",
+            "default_value_as_json_str": "\\"INFO\\"",
+            "description": "The logger\'s threshold.",
             "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.95e096750f330490a26714025addb5f403b099e6"
+            "name": "log_level",
+            "type_key": "String"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"passone\\": {}, \\"passtwo\\": {}, \\"return_one\\": {}}",
-            "description": "Configure runtime parameters for ops or assets.",
+            "default_value_as_json_str": "\\"dagster\\"",
+            "description": "The name of your logger.",
             "is_required": false,
-            "name": "solids",
-            "type_key": "Shape.efd6e48220d7eb65a0b9e8814dd15fa00be63496"
+            "name": "name",
+            "type_key": "String"
           }
         ],
         "given_name": null,
-        "key": "Shape.1f841afe38eb41fe6566522cac6b020ac2d27fa4",
+        "key": "Shape.081354663b9d4b8fbfd1cb8e358763912953913f",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.41de0e2d7b75524510155d0bdab8723c6feced3b": {
+      "Shape.0fe8353d6b542accfad9becbdbaeb92f649ebb9a": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"log_level\\": \\"INFO\\", \\"name\\": \\"dagster\\"}",
+            "description": "The default colored console logger.",
             "is_required": false,
-            "name": "result",
-            "type_key": "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742"
+            "name": "config",
+            "type_key": "Shape.081354663b9d4b8fbfd1cb8e358763912953913f"
           }
         ],
         "given_name": null,
-        "key": "Shape.41de0e2d7b75524510155d0bdab8723c6feced3b",
+        "key": "Shape.0fe8353d6b542accfad9becbdbaeb92f649ebb9a",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c": {
+      "Shape.41de0e2d7b75524510155d0bdab8723c6feced3b": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -660,23 +621,14 @@
             "__class__": "ConfigFieldSnap",
             "default_provided": false,
             "default_value_as_json_str": null,
-            "description": "[DEPRECATED]",
-            "is_required": false,
-            "name": "marker_to_close",
-            "type_key": "String"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": "Whether retries are enabled or not. By default, retries are enabled.",
+            "description": null,
             "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+            "name": "result",
+            "type_key": "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742"
           }
         ],
         "given_name": null,
-        "key": "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c",
+        "key": "Shape.41de0e2d7b75524510155d0bdab8723c6feced3b",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -764,7 +716,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.711132734fb3e636a3de89133ea95d2b1f2417b0": {
+      "Shape.6de73ca6abc02110a1be850614fe2558ba0c81a3": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -772,15 +724,15 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"release_outputs\\": false, \\"retries\\": {\\"enabled\\": {}}}",
             "description": "Execute each step in an individual process.",
             "is_required": false,
             "name": "config",
-            "type_key": "Shape.f14346cd5dd7ef8afab32d29899a1776169809b7"
+            "type_key": "Shape.00f6e91ddaac6293ecfa0fbe71a1f7d7aec5b659"
           }
         ],
         "given_name": null,
-        "key": "Shape.711132734fb3e636a3de89133ea95d2b1f2417b0",
+        "key": "Shape.6de73ca6abc02110a1be850614fe2558ba0c81a3",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -833,6 +785,79 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.9c7fe4a307fe8610251c25eb9ca06c93dfdea803": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "[DEPRECATED]",
+            "is_required": false,
+            "name": "marker_to_close",
+            "type_key": "String"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "false",
+            "description": "Release each step output through its IO manager\'s `release_output` method once every step that consumes it has succeeded or been skipped, for example deleting its file with the `fs_io_manager`. Released outputs can not be loaded by later re-executions of the run.",
+            "is_required": false,
+            "name": "release_outputs",
+            "type_key": "Bool"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": "Whether retries are enabled or not. By default, retries are enabled.",
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.9c7fe4a307fe8610251c25eb9ca06c93dfdea803",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.ce6829bb799a76c6e714e1c55039cc04fa650ccb": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "false",
+            "description": "Execute steps in a pool of up to `max_concurrent` worker processes that are kept for the life of the run, rather than starting a new process for each step. Each worker loads the job and opens the Dagster instance once.",
+            "is_required": false,
+            "name": "enabled",
+            "type_key": "Bool"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "100",
+            "description": "The number of steps a worker process executes before it is replaced with a new one. Workers are also replaced after a step fails in them.",
+            "is_required": false,
+            "name": "max_steps_per_worker",
+            "type_key": "Int"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.ce6829bb799a76c6e714e1c55039cc04fa650ccb",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -869,6 +894,29 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.e8f2597d5559c58c0ffed9f68742cb24f57a98c1": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"release_outputs\\": false, \\"retries\\": {\\"enabled\\": {}}}",
+            "description": "Execute all steps in a single process.",
+            "is_required": false,
+            "name": "config",
+            "type_key": "Shape.9c7fe4a307fe8610251c25eb9ca06c93dfdea803"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.e8f2597d5559c58c0ffed9f68742cb24f57a98c1",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.efd6e48220d7eb65a0b9e8814dd15fa00be63496": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -913,41 +961,53 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.f14346cd5dd7ef8afab32d29899a1776169809b7": {
+      "Shape.fb06c44f5f1e3435eac31450056cec3505287f37": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
+        "field_aliases": {
+          "solids": "ops"
+        },
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": "The number of processes that may run concurrently. By default, this is set to be the return value of `multiprocessing.cpu_count()`.",
+            "default_value_as_json_str": "{\\"in_process\\": {}}",
+            "description": "Configure how steps are executed within a run.",
             "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
+            "name": "execution",
+            "type_key": "Selector.496227f5419889b1bf73123ef81c9270cfbf275b"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": "Whether retries are enabled or not. By default, retries are enabled.",
+            "default_value_as_json_str": "{}",
+            "description": "Configure how loggers emit messages within a run.",
             "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+            "name": "loggers",
+            "type_key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. By default, `spawn` is selected. See https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods.",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"io_manager\\": {}}",
+            "description": "Configure how shared resources are implemented within a run.",
             "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.8318f5aff6cd0698a5c7fedfb9bdc75fd8006db8"
+            "name": "resources",
+            "type_key": "Shape.95e096750f330490a26714025addb5f403b099e6"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"passone\\": {}, \\"passtwo\\": {}, \\"return_one\\": {}}",
+            "description": "Configure runtime parameters for ops or assets.",
+            "is_required": false,
+            "name": "solids",
+            "type_key": "Shape.efd6e48220d7eb65a0b9e8814dd15fa00be63496"
           }
         ],
         "given_name": null,
-        "key": "Shape.f14346cd5dd7ef8afab32d29899a1776169809b7",
+        "key": "Shape.fb06c44f5f1e3435eac31450056cec3505287f37",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -1155,7 +1215,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.1f841afe38eb41fe6566522cac6b020ac2d27fa4"
+      "root_config_key": "Shape.fb06c44f5f1e3435eac31450056cec3505287f37"
     }
   ],
   "name": "single_dep_pipeline",
@@ -1227,11 +1287,13 @@
     ]
   },
   "tags": {}
-}'''
+}"""
 
-snapshots['test_basic_dep_fan_out 2'] = 'b99f5d4a160716492b048f298df2995404d207b3'
+snapshots["test_basic_dep_fan_out 2"] = "358f9abe3ebd0d7398f08a3054c1bcfe21e6cfd3"
 
-snapshots['test_basic_fan_in 1'] = '''{
+snapshots[
+    "test_basic_fan_in 1"
+] = """{
   "__class__": "PipelineSnapshot",
   "config_schema_snapshot": {
     "__class__": "ConfigSchemaSnapshot",
@@ -1420,7 +1482,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.2e65905622a9acb147069bfa7ccdb42fed0aa39e": {
+      "Selector.496227f5419889b1bf73123ef81c9270cfbf275b": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -1428,24 +1490,24 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+            "default_value_as_json_str": "{\\"config\\": {\\"release_outputs\\": false, \\"retries\\": {\\"enabled\\": {}}}}",
             "description": null,
             "is_required": false,
             "name": "in_process",
-            "type_key": "Shape.09d73f0755bf4752d3f121837669c8660dcf451e"
+            "type_key": "Shape.e8f2597d5559c58c0ffed9f68742cb24f57a98c1"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"release_outputs\\": false, \\"retries\\": {\\"enabled\\": {}}}}",
             "description": null,
             "is_required": false,
             "name": "multiprocess",
-            "type_key": "Shape.711132734fb3e636a3de89133ea95d2b1f2417b0"
+            "type_key": "Shape.6de73ca6abc02110a1be850614fe2558ba0c81a3"
           }
         ],
         "given_name": null,
-        "key": "Selector.2e65905622a9acb147069bfa7ccdb42fed0aa39e",
+        "key": "Selector.496227f5419889b1bf73123ef81c9270cfbf275b",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
@@ -1721,7 +1783,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.081354663b9d4b8fbfd1cb8e358763912953913f": {
+      "Shape.00f6e91ddaac6293ecfa0fbe71a1f7d7aec5b659": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -1729,100 +1791,83 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "\\"INFO\\"",
-            "description": "The logger\'s threshold.",
+            "default_value_as_json_str": "0",
+            "description": "The number of processes that may run concurrently. By default, this is set to be the return value of `multiprocessing.cpu_count()`.",
             "is_required": false,
-            "name": "log_level",
-            "type_key": "String"
+            "name": "max_concurrent",
+            "type_key": "Int"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "\\"dagster\\"",
-            "description": "The name of your logger.",
+            "default_value_as_json_str": "false",
+            "description": "Release each step output through its IO manager\'s `release_output` method once every step that consumes it has succeeded or been skipped, for example deleting its file with the `fs_io_manager`. Released outputs can not be loaded by later re-executions of the run.",
             "is_required": false,
-            "name": "name",
-            "type_key": "String"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.081354663b9d4b8fbfd1cb8e358763912953913f",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
-      "Shape.09d73f0755bf4752d3f121837669c8660dcf451e": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
+            "name": "release_outputs",
+            "type_key": "Bool"
+          },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
-            "description": "Execute all steps in a single process.",
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": "Whether retries are enabled or not. By default, retries are enabled.",
             "is_required": false,
-            "name": "config",
-            "type_key": "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c"
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. By default, `spawn` is selected. See https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods.",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.8318f5aff6cd0698a5c7fedfb9bdc75fd8006db8"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Configure the multiprocess executor to reuse worker processes between steps.",
+            "is_required": false,
+            "name": "worker_pool",
+            "type_key": "Shape.ce6829bb799a76c6e714e1c55039cc04fa650ccb"
           }
         ],
         "given_name": null,
-        "key": "Shape.09d73f0755bf4752d3f121837669c8660dcf451e",
+        "key": "Shape.00f6e91ddaac6293ecfa0fbe71a1f7d7aec5b659",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.0fba37ddcd037d7c23aae63dca98084ff4bdd361": {
+      "Shape.081354663b9d4b8fbfd1cb8e358763912953913f": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "field_aliases": {
-          "solids": "ops"
-        },
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"in_process\\": {}}",
-            "description": "Configure how steps are executed within a run.",
-            "is_required": false,
-            "name": "execution",
-            "type_key": "Selector.2e65905622a9acb147069bfa7ccdb42fed0aa39e"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": "Configure how loggers emit messages within a run.",
-            "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"io_manager\\": {}}",
-            "description": "Configure how shared resources are implemented within a run.",
+            "default_value_as_json_str": "\\"INFO\\"",
+            "description": "The logger\'s threshold.",
             "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.95e096750f330490a26714025addb5f403b099e6"
+            "name": "log_level",
+            "type_key": "String"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"nothing_one\\": {}, \\"nothing_two\\": {}, \\"take_nothings\\": {}}",
-            "description": "Configure runtime parameters for ops or assets.",
+            "default_value_as_json_str": "\\"dagster\\"",
+            "description": "The name of your logger.",
             "is_required": false,
-            "name": "solids",
-            "type_key": "Shape.7666198738d531f40c136b24e46d12ee0ca3dc25"
+            "name": "name",
+            "type_key": "String"
           }
         ],
         "given_name": null,
-        "key": "Shape.0fba37ddcd037d7c23aae63dca98084ff4bdd361",
+        "key": "Shape.081354663b9d4b8fbfd1cb8e358763912953913f",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -1901,38 +1946,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "[DEPRECATED]",
-            "is_required": false,
-            "name": "marker_to_close",
-            "type_key": "String"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": "Whether retries are enabled or not. By default, retries are enabled.",
-            "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -2014,7 +2027,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.711132734fb3e636a3de89133ea95d2b1f2417b0": {
+      "Shape.6de73ca6abc02110a1be850614fe2558ba0c81a3": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -2022,15 +2035,15 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"release_outputs\\": false, \\"retries\\": {\\"enabled\\": {}}}",
             "description": "Execute each step in an individual process.",
             "is_required": false,
             "name": "config",
-            "type_key": "Shape.f14346cd5dd7ef8afab32d29899a1776169809b7"
+            "type_key": "Shape.00f6e91ddaac6293ecfa0fbe71a1f7d7aec5b659"
           }
         ],
         "given_name": null,
-        "key": "Shape.711132734fb3e636a3de89133ea95d2b1f2417b0",
+        "key": "Shape.6de73ca6abc02110a1be850614fe2558ba0c81a3",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -2127,43 +2140,101 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
+      "Shape.9c7fe4a307fe8610251c25eb9ca06c93dfdea803": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "fields": [],
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "[DEPRECATED]",
+            "is_required": false,
+            "name": "marker_to_close",
+            "type_key": "String"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "false",
+            "description": "Release each step output through its IO manager\'s `release_output` method once every step that consumes it has succeeded or been skipped, for example deleting its file with the `fs_io_manager`. Released outputs can not be loaded by later re-executions of the run.",
+            "is_required": false,
+            "name": "release_outputs",
+            "type_key": "Bool"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": "Whether retries are enabled or not. By default, retries are enabled.",
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          }
+        ],
         "given_name": null,
-        "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
+        "key": "Shape.9c7fe4a307fe8610251c25eb9ca06c93dfdea803",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b": {
+      "Shape.c26e1b3ce5dcb346b5bbf806ea9a7ceab93a7869": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
+        "field_aliases": {
+          "solids": "ops"
+        },
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"in_process\\": {}}",
+            "description": "Configure how steps are executed within a run.",
             "is_required": false,
-            "name": "console",
-            "type_key": "Shape.0fe8353d6b542accfad9becbdbaeb92f649ebb9a"
+            "name": "execution",
+            "type_key": "Selector.496227f5419889b1bf73123ef81c9270cfbf275b"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{}",
+            "description": "Configure how loggers emit messages within a run.",
+            "is_required": false,
+            "name": "loggers",
+            "type_key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"io_manager\\": {}}",
+            "description": "Configure how shared resources are implemented within a run.",
+            "is_required": false,
+            "name": "resources",
+            "type_key": "Shape.95e096750f330490a26714025addb5f403b099e6"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"nothing_one\\": {}, \\"nothing_two\\": {}, \\"take_nothings\\": {}}",
+            "description": "Configure runtime parameters for ops or assets.",
+            "is_required": false,
+            "name": "solids",
+            "type_key": "Shape.7666198738d531f40c136b24e46d12ee0ca3dc25"
           }
         ],
         "given_name": null,
-        "key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b",
+        "key": "Shape.c26e1b3ce5dcb346b5bbf806ea9a7ceab93a7869",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.f14346cd5dd7ef8afab32d29899a1776169809b7": {
+      "Shape.ce6829bb799a76c6e714e1c55039cc04fa650ccb": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -2171,33 +2242,83 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": "The number of processes that may run concurrently. By default, this is set to be the return value of `multiprocessing.cpu_count()`.",
+            "default_value_as_json_str": "false",
+            "description": "Execute steps in a pool of up to `max_concurrent` worker processes that are kept for the life of the run, rather than starting a new process for each step. Each worker loads the job and opens the Dagster instance once.",
             "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
+            "name": "enabled",
+            "type_key": "Bool"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": "Whether retries are enabled or not. By default, retries are enabled.",
+            "default_value_as_json_str": "100",
+            "description": "The number of steps a worker process executes before it is replaced with a new one. Workers are also replaced after a step fails in them.",
             "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          },
+            "name": "max_steps_per_worker",
+            "type_key": "Int"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.ce6829bb799a76c6e714e1c55039cc04fa650ccb",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [],
+        "given_name": null,
+        "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": false,
             "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. By default, `spawn` is selected. See https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods.",
+            "description": null,
             "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.8318f5aff6cd0698a5c7fedfb9bdc75fd8006db8"
+            "name": "console",
+            "type_key": "Shape.0fe8353d6b542accfad9becbdbaeb92f649ebb9a"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.e8f2597d5559c58c0ffed9f68742cb24f57a98c1": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"release_outputs\\": false, \\"retries\\": {\\"enabled\\": {}}}",
+            "description": "Execute all steps in a single process.",
+            "is_required": false,
+            "name": "config",
+            "type_key": "Shape.9c7fe4a307fe8610251c25eb9ca06c93dfdea803"
           }
         ],
         "given_name": null,
-        "key": "Shape.f14346cd5dd7ef8afab32d29899a1776169809b7",
+        "key": "Shape.e8f2597d5559c58c0ffed9f68742cb24f57a98c1",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -2397,7 +2518,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.0fba37ddcd037d7c23aae63dca98084ff4bdd361"
+      "root_config_key": "Shape.c26e1b3ce5dcb346b5bbf806ea9a7ceab93a7869"
     }
   ],
   "name": "fan_in_test",
@@ -2469,11 +2590,13 @@
     ]
   },
   "tags": {}
-}'''
+}"""
 
-snapshots['test_basic_fan_in 2'] = 'c61d8c5c9fa18f22b99b3434e7e4c3b039858312'
+snapshots["test_basic_fan_in 2"] = "e5f6cfbc7fc1bbb0daad584e133949b035761a7a"
 
-snapshots['test_deserialize_solid_def_snaps_multi_type_config 1'] = '''{
+snapshots[
+    "test_deserialize_solid_def_snaps_multi_type_config 1"
+] = """{
   "__class__": "ConfigTypeSnap",
   "description": null,
   "enum_values": null,
@@ -2504,9 +2627,11 @@
   },
   "scalar_kind": null,
   "type_param_keys": null
-}'''
+}"""
 
-snapshots['test_empty_pipeline_snap_props 1'] = '''{
+snapshots[
+    "test_empty_pipeline_snap_props 1"
+] = """{
   "__class__": "PipelineSnapshot",
   "config_schema_snapshot": {
     "__class__": "ConfigSchemaSnapshot",
@@ -2695,7 +2820,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.2e65905622a9acb147069bfa7ccdb42fed0aa39e": {
+      "Selector.496227f5419889b1bf73123ef81c9270cfbf275b": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -2703,24 +2828,24 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+            "default_value_as_json_str": "{\\"config\\": {\\"release_outputs\\": false, \\"retries\\": {\\"enabled\\": {}}}}",
             "description": null,
             "is_required": false,
             "name": "in_process",
-            "type_key": "Shape.09d73f0755bf4752d3f121837669c8660dcf451e"
+            "type_key": "Shape.e8f2597d5559c58c0ffed9f68742cb24f57a98c1"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"release_outputs\\": false, \\"retries\\": {\\"enabled\\": {}}}}",
             "description": null,
             "is_required": false,
             "name": "multiprocess",
-            "type_key": "Shape.711132734fb3e636a3de89133ea95d2b1f2417b0"
+            "type_key": "Shape.6de73ca6abc02110a1be850614fe2558ba0c81a3"
           }
         ],
         "given_name": null,
-        "key": "Selector.2e65905622a9acb147069bfa7ccdb42fed0aa39e",
+        "key": "Selector.496227f5419889b1bf73123ef81c9270cfbf275b",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
@@ -2996,7 +3121,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.081354663b9d4b8fbfd1cb8e358763912953913f": {
+      "Shape.00f6e91ddaac6293ecfa0fbe71a1f7d7aec5b659": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -3004,31 +3129,58 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "\\"INFO\\"",
-            "description": "The logger\'s threshold.",
+            "default_value_as_json_str": "0",
+            "description": "The number of processes that may run concurrently. By default, this is set to be the return value of `multiprocessing.cpu_count()`.",
             "is_required": false,
-            "name": "log_level",
-            "type_key": "String"
+            "name": "max_concurrent",
+            "type_key": "Int"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "\\"dagster\\"",
-            "description": "The name of your logger.",
+            "default_value_as_json_str": "false",
+            "description": "Release each step output through its IO manager\'s `release_output` method once every step that consumes it has succeeded or been skipped, for example deleting its file with the `fs_io_manager`. Released outputs can not be loaded by later re-executions of the run.",
             "is_required": false,
-            "name": "name",
-            "type_key": "String"
+            "name": "release_outputs",
+            "type_key": "Bool"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": "Whether retries are enabled or not. By default, retries are enabled.",
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. By default, `spawn` is selected. See https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods.",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.8318f5aff6cd0698a5c7fedfb9bdc75fd8006db8"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Configure the multiprocess executor to reuse worker processes between steps.",
+            "is_required": false,
+            "name": "worker_pool",
+            "type_key": "Shape.ce6829bb799a76c6e714e1c55039cc04fa650ccb"
           }
         ],
         "given_name": null,
-        "key": "Shape.081354663b9d4b8fbfd1cb8e358763912953913f",
+        "key": "Shape.00f6e91ddaac6293ecfa0fbe71a1f7d7aec5b659",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.09d73f0755bf4752d3f121837669c8660dcf451e": {
+      "Shape.081354663b9d4b8fbfd1cb8e358763912953913f": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -3036,15 +3188,24 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
-            "description": "Execute all steps in a single process.",
+            "default_value_as_json_str": "\\"INFO\\"",
+            "description": "The logger\'s threshold.",
             "is_required": false,
-            "name": "config",
-            "type_key": "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c"
+            "name": "log_level",
+            "type_key": "String"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "\\"dagster\\"",
+            "description": "The name of your logger.",
+            "is_required": false,
+            "name": "name",
+            "type_key": "String"
           }
         ],
         "given_name": null,
-        "key": "Shape.09d73f0755bf4752d3f121837669c8660dcf451e",
+        "key": "Shape.081354663b9d4b8fbfd1cb8e358763912953913f",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -3074,30 +3235,60 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.41de0e2d7b75524510155d0bdab8723c6feced3b": {
+      "Shape.378df191f74c19f444e923970cc6b87df8d45d53": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
+        "field_aliases": {
+          "solids": "ops"
+        },
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"in_process\\": {}}",
+            "description": "Configure how steps are executed within a run.",
             "is_required": false,
-            "name": "result",
-            "type_key": "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742"
+            "name": "execution",
+            "type_key": "Selector.496227f5419889b1bf73123ef81c9270cfbf275b"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{}",
+            "description": "Configure how loggers emit messages within a run.",
+            "is_required": false,
+            "name": "loggers",
+            "type_key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"io_manager\\": {}}",
+            "description": "Configure how shared resources are implemented within a run.",
+            "is_required": false,
+            "name": "resources",
+            "type_key": "Shape.95e096750f330490a26714025addb5f403b099e6"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"noop_solid\\": {}}",
+            "description": "Configure runtime parameters for ops or assets.",
+            "is_required": false,
+            "name": "solids",
+            "type_key": "Shape.ba913521099bed4314e25592059869c8f3a3c96e"
           }
         ],
         "given_name": null,
-        "key": "Shape.41de0e2d7b75524510155d0bdab8723c6feced3b",
+        "key": "Shape.378df191f74c19f444e923970cc6b87df8d45d53",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c": {
+      "Shape.41de0e2d7b75524510155d0bdab8723c6feced3b": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -3106,23 +3297,14 @@
             "__class__": "ConfigFieldSnap",
             "default_provided": false,
             "default_value_as_json_str": null,
-            "description": "[DEPRECATED]",
-            "is_required": false,
-            "name": "marker_to_close",
-            "type_key": "String"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": "Whether retries are enabled or not. By default, retries are enabled.",
+            "description": null,
             "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+            "name": "result",
+            "type_key": "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742"
           }
         ],
         "given_name": null,
-        "key": "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c",
+        "key": "Shape.41de0e2d7b75524510155d0bdab8723c6feced3b",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -3210,7 +3392,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.711132734fb3e636a3de89133ea95d2b1f2417b0": {
+      "Shape.6de73ca6abc02110a1be850614fe2558ba0c81a3": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -3218,15 +3400,15 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"release_outputs\\": false, \\"retries\\": {\\"enabled\\": {}}}",
             "description": "Execute each step in an individual process.",
             "is_required": false,
             "name": "config",
-            "type_key": "Shape.f14346cd5dd7ef8afab32d29899a1776169809b7"
+            "type_key": "Shape.00f6e91ddaac6293ecfa0fbe71a1f7d7aec5b659"
           }
         ],
         "given_name": null,
-        "key": "Shape.711132734fb3e636a3de89133ea95d2b1f2417b0",
+        "key": "Shape.6de73ca6abc02110a1be850614fe2558ba0c81a3",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -3279,53 +3461,41 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.a81addb1fd452e2e53df684ce29ed145a6dfa77c": {
+      "Shape.9c7fe4a307fe8610251c25eb9ca06c93dfdea803": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "field_aliases": {
-          "solids": "ops"
-        },
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"in_process\\": {}}",
-            "description": "Configure how steps are executed within a run.",
-            "is_required": false,
-            "name": "execution",
-            "type_key": "Selector.2e65905622a9acb147069bfa7ccdb42fed0aa39e"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": "Configure how loggers emit messages within a run.",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "[DEPRECATED]",
             "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b"
+            "name": "marker_to_close",
+            "type_key": "String"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"io_manager\\": {}}",
-            "description": "Configure how shared resources are implemented within a run.",
+            "default_value_as_json_str": "false",
+            "description": "Release each step output through its IO manager\'s `release_output` method once every step that consumes it has succeeded or been skipped, for example deleting its file with the `fs_io_manager`. Released outputs can not be loaded by later re-executions of the run.",
             "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.95e096750f330490a26714025addb5f403b099e6"
+            "name": "release_outputs",
+            "type_key": "Bool"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"noop_solid\\": {}}",
-            "description": "Configure runtime parameters for ops or assets.",
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": "Whether retries are enabled or not. By default, retries are enabled.",
             "is_required": false,
-            "name": "solids",
-            "type_key": "Shape.ba913521099bed4314e25592059869c8f3a3c96e"
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
           }
         ],
         "given_name": null,
-        "key": "Shape.a81addb1fd452e2e53df684ce29ed145a6dfa77c",
+        "key": "Shape.9c7fe4a307fe8610251c25eb9ca06c93dfdea803",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -3358,6 +3528,38 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.ce6829bb799a76c6e714e1c55039cc04fa650ccb": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "false",
+            "description": "Execute steps in a pool of up to `max_concurrent` worker processes that are kept for the life of the run, rather than starting a new process for each step. Each worker loads the job and opens the Dagster instance once.",
+            "is_required": false,
+            "name": "enabled",
+            "type_key": "Bool"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "100",
+            "description": "The number of steps a worker process executes before it is replaced with a new one. Workers are also replaced after a step fails in them.",
+            "is_required": false,
+            "name": "max_steps_per_worker",
+            "type_key": "Int"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.ce6829bb799a76c6e714e1c55039cc04fa650ccb",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -3394,7 +3596,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.f14346cd5dd7ef8afab32d29899a1776169809b7": {
+      "Shape.e8f2597d5559c58c0ffed9f68742cb24f57a98c1": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -3402,33 +3604,15 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": "The number of processes that may run concurrently. By default, this is set to be the return value of `multiprocessing.cpu_count()`.",
-            "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": "Whether retries are enabled or not. By default, retries are enabled.",
-            "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. By default, `spawn` is selected. See https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods.",
+            "default_value_as_json_str": "{\\"release_outputs\\": false, \\"retries\\": {\\"enabled\\": {}}}",
+            "description": "Execute all steps in a single process.",
             "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.8318f5aff6cd0698a5c7fedfb9bdc75fd8006db8"
+            "name": "config",
+            "type_key": "Shape.9c7fe4a307fe8610251c25eb9ca06c93dfdea803"
           }
         ],
         "given_name": null,
-        "key": "Shape.f14346cd5dd7ef8afab32d29899a1776169809b7",
+        "key": "Shape.e8f2597d5559c58c0ffed9f68742cb24f57a98c1",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -3594,7 +3778,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.a81addb1fd452e2e53df684ce29ed145a6dfa77c"
+      "root_config_key": "Shape.378df191f74c19f444e923970cc6b87df8d45d53"
     }
   ],
   "name": "noop_pipeline",
@@ -3632,11 +3816,13 @@
     ]
   },
   "tags": {}
-}'''
+}"""
 
-snapshots['test_empty_pipeline_snap_props 2'] = '8ed9ed25f01be4b6c27ffe6d5619edbf54f7e859'
+snapshots["test_empty_pipeline_snap_props 2"] = "46bf32ff2c604aff17b6b77d396490de9ed06269"
 
-snapshots['test_empty_pipeline_snap_snapshot 1'] = '''{
+snapshots[
+    "test_empty_pipeline_snap_snapshot 1"
+] = """{
   "__class__": "PipelineSnapshot",
   "config_schema_snapshot": {
     "__class__": "ConfigSchemaSnapshot",
@@ -3825,7 +4011,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.2e65905622a9acb147069bfa7ccdb42fed0aa39e": {
+      "Selector.496227f5419889b1bf73123ef81c9270cfbf275b": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -3833,24 +4019,24 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+            "default_value_as_json_str": "{\\"config\\": {\\"release_outputs\\": false, \\"retries\\": {\\"enabled\\": {}}}}",
             "description": null,
             "is_required": false,
             "name": "in_process",
-            "type_key": "Shape.09d73f0755bf4752d3f121837669c8660dcf451e"
+            "type_key": "Shape.e8f2597d5559c58c0ffed9f68742cb24f57a98c1"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"release_outputs\\": false, \\"retries\\": {\\"enabled\\": {}}}}",
             "description": null,
             "is_required": false,
             "name": "multiprocess",
-            "type_key": "Shape.711132734fb3e636a3de89133ea95d2b1f2417b0"
+            "type_key": "Shape.6de73ca6abc02110a1be850614fe2558ba0c81a3"
           }
         ],
         "given_name": null,
-        "key": "Selector.2e65905622a9acb147069bfa7ccdb42fed0aa39e",
+        "key": "Selector.496227f5419889b1bf73123ef81c9270cfbf275b",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
@@ -4126,7 +4312,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.081354663b9d4b8fbfd1cb8e358763912953913f": {
+      "Shape.00f6e91ddaac6293ecfa0fbe71a1f7d7aec5b659": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -4134,31 +4320,58 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "\\"INFO\\"",
-            "description": "The logger\'s threshold.",
+            "default_value_as_json_str": "0",
+            "description": "The number of processes that may run concurrently. By default, this is set to be the return value of `multiprocessing.cpu_count()`.",
             "is_required": false,
-            "name": "log_level",
-            "type_key": "String"
+            "name": "max_concurrent",
+            "type_key": "Int"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "\\"dagster\\"",
-            "description": "The name of your logger.",
+            "default_value_as_json_str": "false",
+            "description": "Release each step output through its IO manager\'s `release_output` method once every step that consumes it has succeeded or been skipped, for example deleting its file with the `fs_io_manager`. Released outputs can not be loaded by later re-executions of the run.",
             "is_required": false,
-            "name": "name",
-            "type_key": "String"
+            "name": "release_outputs",
+            "type_key": "Bool"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": "Whether retries are enabled or not. By default, retries are enabled.",
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. By default, `spawn` is selected. See https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods.",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.8318f5aff6cd0698a5c7fedfb9bdc75fd8006db8"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Configure the multiprocess executor to reuse worker processes between steps.",
+            "is_required": false,
+            "name": "worker_pool",
+            "type_key": "Shape.ce6829bb799a76c6e714e1c55039cc04fa650ccb"
           }
         ],
         "given_name": null,
-        "key": "Shape.081354663b9d4b8fbfd1cb8e358763912953913f",
+        "key": "Shape.00f6e91ddaac6293ecfa0fbe71a1f7d7aec5b659",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.09d73f0755bf4752d3f121837669c8660dcf451e": {
+      "Shape.081354663b9d4b8fbfd1cb8e358763912953913f": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -4166,15 +4379,24 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
-            "description": "Execute all steps in a single process.",
+            "default_value_as_json_str": "\\"INFO\\"",
+            "description": "The logger\'s threshold.",
             "is_required": false,
-            "name": "config",
-            "type_key": "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c"
+            "name": "log_level",
+            "type_key": "String"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "\\"dagster\\"",
+            "description": "The name of your logger.",
+            "is_required": false,
+            "name": "name",
+            "type_key": "String"
           }
         ],
         "given_name": null,
-        "key": "Shape.09d73f0755bf4752d3f121837669c8660dcf451e",
+        "key": "Shape.081354663b9d4b8fbfd1cb8e358763912953913f",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -4204,30 +4426,60 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.41de0e2d7b75524510155d0bdab8723c6feced3b": {
+      "Shape.378df191f74c19f444e923970cc6b87df8d45d53": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
+        "field_aliases": {
+          "solids": "ops"
+        },
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"in_process\\": {}}",
+            "description": "Configure how steps are executed within a run.",
+            "is_required": false,
+            "name": "execution",
+            "type_key": "Selector.496227f5419889b1bf73123ef81c9270cfbf275b"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{}",
+            "description": "Configure how loggers emit messages within a run.",
+            "is_required": false,
+            "name": "loggers",
+            "type_key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"io_manager\\": {}}",
+            "description": "Configure how shared resources are implemented within a run.",
+            "is_required": false,
+            "name": "resources",
+            "type_key": "Shape.95e096750f330490a26714025addb5f403b099e6"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"noop_solid\\": {}}",
+            "description": "Configure runtime parameters for ops or assets.",
             "is_required": false,
-            "name": "result",
-            "type_key": "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742"
+            "name": "solids",
+            "type_key": "Shape.ba913521099bed4314e25592059869c8f3a3c96e"
           }
         ],
         "given_name": null,
-        "key": "Shape.41de0e2d7b75524510155d0bdab8723c6feced3b",
+        "key": "Shape.378df191f74c19f444e923970cc6b87df8d45d53",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c": {
+      "Shape.41de0e2d7b75524510155d0bdab8723c6feced3b": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -4236,23 +4488,14 @@
             "__class__": "ConfigFieldSnap",
             "default_provided": false,
             "default_value_as_json_str": null,
-            "description": "[DEPRECATED]",
-            "is_required": false,
-            "name": "marker_to_close",
-            "type_key": "String"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": "Whether retries are enabled or not. By default, retries are enabled.",
+            "description": null,
             "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+            "name": "result",
+            "type_key": "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742"
           }
         ],
         "given_name": null,
-        "key": "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c",
+        "key": "Shape.41de0e2d7b75524510155d0bdab8723c6feced3b",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -4340,7 +4583,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.711132734fb3e636a3de89133ea95d2b1f2417b0": {
+      "Shape.6de73ca6abc02110a1be850614fe2558ba0c81a3": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -4348,15 +4591,15 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"release_outputs\\": false, \\"retries\\": {\\"enabled\\": {}}}",
             "description": "Execute each step in an individual process.",
             "is_required": false,
             "name": "config",
-            "type_key": "Shape.f14346cd5dd7ef8afab32d29899a1776169809b7"
+            "type_key": "Shape.00f6e91ddaac6293ecfa0fbe71a1f7d7aec5b659"
           }
         ],
         "given_name": null,
-        "key": "Shape.711132734fb3e636a3de89133ea95d2b1f2417b0",
+        "key": "Shape.6de73ca6abc02110a1be850614fe2558ba0c81a3",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -4409,53 +4652,41 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.a81addb1fd452e2e53df684ce29ed145a6dfa77c": {
+      "Shape.9c7fe4a307fe8610251c25eb9ca06c93dfdea803": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "field_aliases": {
-          "solids": "ops"
-        },
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"in_process\\": {}}",
-            "description": "Configure how steps are executed within a run.",
-            "is_required": false,
-            "name": "execution",
-            "type_key": "Selector.2e65905622a9acb147069bfa7ccdb42fed0aa39e"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": "Configure how loggers emit messages within a run.",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "[DEPRECATED]",
             "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b"
+            "name": "marker_to_close",
+            "type_key": "String"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"io_manager\\": {}}",
-            "description": "Configure how shared resources are implemented within a run.",
+            "default_value_as_json_str": "false",
+            "description": "Release each step output through its IO manager\'s `release_output` method once every step that consumes it has succeeded or been skipped, for example deleting its file with the `fs_io_manager`. Released outputs can not be loaded by later re-executions of the run.",
             "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.95e096750f330490a26714025addb5f403b099e6"
+            "name": "release_outputs",
+            "type_key": "Bool"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"noop_solid\\": {}}",
-            "description": "Configure runtime parameters for ops or assets.",
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": "Whether retries are enabled or not. By default, retries are enabled.",
             "is_required": false,
-            "name": "solids",
-            "type_key": "Shape.ba913521099bed4314e25592059869c8f3a3c96e"
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
           }
         ],
         "given_name": null,
-        "key": "Shape.a81addb1fd452e2e53df684ce29ed145a6dfa77c",
+        "key": "Shape.9c7fe4a307fe8610251c25eb9ca06c93dfdea803",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -4488,6 +4719,38 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.ce6829bb799a76c6e714e1c55039cc04fa650ccb": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "false",
+            "description": "Execute steps in a pool of up to `max_concurrent` worker processes that are kept for the life of the run, rather than starting a new process for each step. Each worker loads the job and opens the Dagster instance once.",
+            "is_required": false,
+            "name": "enabled",
+            "type_key": "Bool"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "100",
+            "description": "The number of steps a worker process executes before it is replaced with a new one. Workers are also replaced after a step fails in them.",
+            "is_required": false,
+            "name": "max_steps_per_worker",
+            "type_key": "Int"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.ce6829bb799a76c6e714e1c55039cc04fa650ccb",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -4524,7 +4787,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.f14346cd5dd7ef8afab32d29899a1776169809b7": {
+      "Shape.e8f2597d5559c58c0ffed9f68742cb24f57a98c1": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -4532,33 +4795,15 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": "The number of processes that may run concurrently. By default, this is set to be the return value of `multiprocessing.cpu_count()`.",
-            "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": "Whether retries are enabled or not. By default, retries are enabled.",
-            "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. By default, `spawn` is selected. See https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods.",
+            "default_value_as_json_str": "{\\"release_outputs\\": false, \\"retries\\": {\\"enabled\\": {}}}",
+            "description": "Execute all steps in a single process.",
             "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.8318f5aff6cd0698a5c7fedfb9bdc75fd8006db8"
+            "name": "config",
+            "type_key": "Shape.9c7fe4a307fe8610251c25eb9ca06c93dfdea803"
           }
         ],
         "given_name": null,
-        "key": "Shape.f14346cd5dd7ef8afab32d29899a1776169809b7",
+        "key": "Shape.e8f2597d5559c58c0ffed9f68742cb24f57a98c1",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -4724,7 +4969,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.a81addb1fd452e2e53df684ce29ed145a6dfa77c"
+      "root_config_key": "Shape.378df191f74c19f444e923970cc6b87df8d45d53"
     }
   ],
   "name": "noop_pipeline",
@@ -4762,9 +5007,11 @@
     ]
   },
   "tags": {}
-}'''
+}"""
 
-snapshots['test_multi_type_config_array_dict_fields[Permissive] 1'] = '''{
+snapshots[
+    "test_multi_type_config_array_dict_fields[Permissive] 1"
+] = """{
   "__class__": "ConfigTypeSnap",
   "description": "List of Array.Permissive.1f37a068c7c51aba23e9c41475c78eebc4e58471",
   "enum_values": null,
@@ -4778,9 +5025,11 @@
   "type_param_keys": [
     "Permissive.1f37a068c7c51aba23e9c41475c78eebc4e58471"
   ]
-}'''
+}"""
 
-snapshots['test_multi_type_config_array_dict_fields[Selector] 1'] = '''{
+snapshots[
+    "test_multi_type_config_array_dict_fields[Selector] 1"
+] = """{
   "__class__": "ConfigTypeSnap",
   "description": "List of Array.Selector.1f37a068c7c51aba23e9c41475c78eebc4e58471",
   "enum_values": null,
@@ -4794,9 +5043,11 @@
   "type_param_keys": [
     "Selector.1f37a068c7c51aba23e9c41475c78eebc4e58471"
   ]
-}'''
+}"""
 
-snapshots['test_multi_type_config_array_dict_fields[Shape] 1'] = '''{
+snapshots[
+    "test_multi_type_config_array_dict_fields[Shape] 1"
+] = """{
   "__class__": "ConfigTypeSnap",
   "description": "List of Array.Shape.1f37a068c7c51aba23e9c41475c78eebc4e58471",
   "enum_values": null,
@@ -4810,9 +5061,11 @@
   "type_param_keys": [
     "Shape.1f37a068c7c51aba23e9c41475c78eebc4e58471"
   ]
-}'''
+}"""
 
-snapshots['test_multi_type_config_array_map 1'] = '''{
+snapshots[
+    "test_multi_type_config_array_map 1"
+] = """{
   "__class__": "ConfigTypeSnap",
   "description": "List of Array.Map.String.Int",
   "enum_values": null,
@@ -4826,9 +5079,11 @@
   "type_param_keys": [
     "Map.String.Int"
   ]
-}'''
+}"""
 
-snapshots['test_multi_type_config_nested_dicts[nested_dict_types0] 1'] = '''{
+snapshots[
+    "test_multi_type_config_nested_dicts[nested_dict_types0] 1"
+] = """{
   "__class__": "ConfigTypeSnap",
   "description": null,
   "enum_values": null,
@@ -4850,9 +5105,11 @@
   },
   "scalar_kind": null,
   "type_param_keys": null
-}'''
+}"""
 
-snapshots['test_multi_type_config_nested_dicts[nested_dict_types1] 1'] = '''{
+snapshots[
+    "test_multi_type_config_nested_dicts[nested_dict_types1] 1"
+] = """{
   "__class__": "ConfigTypeSnap",
   "description": null,
   "enum_values": null,
@@ -4874,9 +5131,11 @@
   },
   "scalar_kind": null,
   "type_param_keys": null
-}'''
+}"""
 
-snapshots['test_multi_type_config_nested_dicts[nested_dict_types2] 1'] = '''{
+snapshots[
+    "test_multi_type_config_nested_dicts[nested_dict_types2] 1"
+] = """{
   "__class__": "ConfigTypeSnap",
   "description": null,
   "enum_values": null,
@@ -4898,9 +5157,11 @@
   },
   "scalar_kind": null,
   "type_param_keys": null
-}'''
+}"""
 
-snapshots['test_multi_type_config_nested_dicts[nested_dict_types3] 1'] = '''{
+snapshots[
+    "test_multi_type_config_nested_dicts[nested_dict_types3] 1"
+] = """{
   "__class__": "ConfigTypeSnap",
   "description": null,
   "enum_values": null,
@@ -4922,9 +5183,11 @@
   },
   "scalar_kind": null,
   "type_param_keys": null
-}'''
+}"""
 
-snapshots['test_multi_type_config_nested_dicts[nested_dict_types4] 1'] = '''{
+snapshots[
+    "test_multi_type_config_nested_dicts[nested_dict_types4] 1"
+] = """{
   "__class__": "ConfigTypeSnap",
   "description": null,
   "enum_values": null,
@@ -4946,9 +5209,11 @@
   },
   "scalar_kind": null,
   "type_param_keys": null
-}'''
+}"""
 
-snapshots['test_multi_type_config_nested_dicts[nested_dict_types5] 1'] = '''{
+snapshots[
+    "test_multi_type_config_nested_dicts[nested_dict_types5] 1"
+] = """{
   "__class__": "ConfigTypeSnap",
   "description": null,
   "enum_values": null,
@@ -4970,9 +5235,11 @@
   },
   "scalar_kind": null,
   "type_param_keys": null
-}'''
+}"""
 
-snapshots['test_pipeline_snap_all_props 1'] = '''{
+snapshots[
+    "test_pipeline_snap_all_props 1"
+] = """{
   "__class__": "PipelineSnapshot",
   "config_schema_snapshot": {
     "__class__": "ConfigSchemaSnapshot",
@@ -5161,7 +5428,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.2e65905622a9acb147069bfa7ccdb42fed0aa39e": {
+      "Selector.496227f5419889b1bf73123ef81c9270cfbf275b": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -5169,24 +5436,24 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+            "default_value_as_json_str": "{\\"config\\": {\\"release_outputs\\": false, \\"retries\\": {\\"enabled\\": {}}}}",
             "description": null,
             "is_required": false,
             "name": "in_process",
-            "type_key": "Shape.09d73f0755bf4752d3f121837669c8660dcf451e"
+            "type_key": "Shape.e8f2597d5559c58c0ffed9f68742cb24f57a98c1"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"release_outputs\\": false, \\"retries\\": {\\"enabled\\": {}}}}",
             "description": null,
             "is_required": false,
             "name": "multiprocess",
-            "type_key": "Shape.711132734fb3e636a3de89133ea95d2b1f2417b0"
+            "type_key": "Shape.6de73ca6abc02110a1be850614fe2558ba0c81a3"
           }
         ],
         "given_name": null,
-        "key": "Selector.2e65905622a9acb147069bfa7ccdb42fed0aa39e",
+        "key": "Selector.496227f5419889b1bf73123ef81c9270cfbf275b",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
@@ -5462,7 +5729,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.081354663b9d4b8fbfd1cb8e358763912953913f": {
+      "Shape.00f6e91ddaac6293ecfa0fbe71a1f7d7aec5b659": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -5470,31 +5737,58 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "\\"INFO\\"",
-            "description": "The logger\'s threshold.",
+            "default_value_as_json_str": "0",
+            "description": "The number of processes that may run concurrently. By default, this is set to be the return value of `multiprocessing.cpu_count()`.",
             "is_required": false,
-            "name": "log_level",
-            "type_key": "String"
+            "name": "max_concurrent",
+            "type_key": "Int"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "\\"dagster\\"",
-            "description": "The name of your logger.",
+            "default_value_as_json_str": "false",
+            "description": "Release each step output through its IO manager\'s `release_output` method once every step that consumes it has succeeded or been skipped, for example deleting its file with the `fs_io_manager`. Released outputs can not be loaded by later re-executions of the run.",
             "is_required": false,
-            "name": "name",
-            "type_key": "String"
+            "name": "release_outputs",
+            "type_key": "Bool"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": "Whether retries are enabled or not. By default, retries are enabled.",
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. By default, `spawn` is selected. See https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods.",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.8318f5aff6cd0698a5c7fedfb9bdc75fd8006db8"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Configure the multiprocess executor to reuse worker processes between steps.",
+            "is_required": false,
+            "name": "worker_pool",
+            "type_key": "Shape.ce6829bb799a76c6e714e1c55039cc04fa650ccb"
           }
         ],
         "given_name": null,
-        "key": "Shape.081354663b9d4b8fbfd1cb8e358763912953913f",
+        "key": "Shape.00f6e91ddaac6293ecfa0fbe71a1f7d7aec5b659",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.09d73f0755bf4752d3f121837669c8660dcf451e": {
+      "Shape.081354663b9d4b8fbfd1cb8e358763912953913f": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -5502,15 +5796,24 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
-            "description": "Execute all steps in a single process.",
+            "default_value_as_json_str": "\\"INFO\\"",
+            "description": "The logger\'s threshold.",
             "is_required": false,
-            "name": "config",
-            "type_key": "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c"
+            "name": "log_level",
+            "type_key": "String"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "\\"dagster\\"",
+            "description": "The name of your logger.",
+            "is_required": false,
+            "name": "name",
+            "type_key": "String"
           }
         ],
         "given_name": null,
-        "key": "Shape.09d73f0755bf4752d3f121837669c8660dcf451e",
+        "key": "Shape.081354663b9d4b8fbfd1cb8e358763912953913f",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -5540,30 +5843,60 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.41de0e2d7b75524510155d0bdab8723c6feced3b": {
+      "Shape.378df191f74c19f444e923970cc6b87df8d45d53": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
+        "field_aliases": {
+          "solids": "ops"
+        },
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"in_process\\": {}}",
+            "description": "Configure how steps are executed within a run.",
             "is_required": false,
-            "name": "result",
-            "type_key": "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742"
+            "name": "execution",
+            "type_key": "Selector.496227f5419889b1bf73123ef81c9270cfbf275b"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{}",
+            "description": "Configure how loggers emit messages within a run.",
+            "is_required": false,
+            "name": "loggers",
+            "type_key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"io_manager\\": {}}",
+            "description": "Configure how shared resources are implemented within a run.",
+            "is_required": false,
+            "name": "resources",
+            "type_key": "Shape.95e096750f330490a26714025addb5f403b099e6"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"noop_solid\\": {}}",
+            "description": "Configure runtime parameters for ops or assets.",
+            "is_required": false,
+            "name": "solids",
+            "type_key": "Shape.ba913521099bed4314e25592059869c8f3a3c96e"
           }
         ],
         "given_name": null,
-        "key": "Shape.41de0e2d7b75524510155d0bdab8723c6feced3b",
+        "key": "Shape.378df191f74c19f444e923970cc6b87df8d45d53",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c": {
+      "Shape.41de0e2d7b75524510155d0bdab8723c6feced3b": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -5572,23 +5905,14 @@
             "__class__": "ConfigFieldSnap",
             "default_provided": false,
             "default_value_as_json_str": null,
-            "description": "[DEPRECATED]",
-            "is_required": false,
-            "name": "marker_to_close",
-            "type_key": "String"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": "Whether retries are enabled or not. By default, retries are enabled.",
+            "description": null,
             "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+            "name": "result",
+            "type_key": "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742"
           }
         ],
         "given_name": null,
-        "key": "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c",
+        "key": "Shape.41de0e2d7b75524510155d0bdab8723c6feced3b",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -5676,7 +6000,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.711132734fb3e636a3de89133ea95d2b1f2417b0": {
+      "Shape.6de73ca6abc02110a1be850614fe2558ba0c81a3": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -5684,15 +6008,15 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"release_outputs\\": false, \\"retries\\": {\\"enabled\\": {}}}",
             "description": "Execute each step in an individual process.",
             "is_required": false,
             "name": "config",
-            "type_key": "Shape.f14346cd5dd7ef8afab32d29899a1776169809b7"
+            "type_key": "Shape.00f6e91ddaac6293ecfa0fbe71a1f7d7aec5b659"
           }
         ],
         "given_name": null,
-        "key": "Shape.711132734fb3e636a3de89133ea95d2b1f2417b0",
+        "key": "Shape.6de73ca6abc02110a1be850614fe2558ba0c81a3",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -5745,53 +6069,41 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.a81addb1fd452e2e53df684ce29ed145a6dfa77c": {
+      "Shape.9c7fe4a307fe8610251c25eb9ca06c93dfdea803": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "field_aliases": {
-          "solids": "ops"
-        },
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"in_process\\": {}}",
-            "description": "Configure how steps are executed within a run.",
-            "is_required": false,
-            "name": "execution",
-            "type_key": "Selector.2e65905622a9acb147069bfa7ccdb42fed0aa39e"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": "Configure how loggers emit messages within a run.",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "[DEPRECATED]",
             "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b"
+            "name": "marker_to_close",
+            "type_key": "String"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"io_manager\\": {}}",
-            "description": "Configure how shared resources are implemented within a run.",
+            "default_value_as_json_str": "false",
+            "description": "Release each step output through its IO manager\'s `release_output` method once every step that consumes it has succeeded or been skipped, for example deleting its file with the `fs_io_manager`. Released outputs can not be loaded by later re-executions of the run.",
             "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.95e096750f330490a26714025addb5f403b099e6"
+            "name": "release_outputs",
+            "type_key": "Bool"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"noop_solid\\": {}}",
-            "description": "Configure runtime parameters for ops or assets.",
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": "Whether retries are enabled or not. By default, retries are enabled.",
             "is_required": false,
-            "name": "solids",
-            "type_key": "Shape.ba913521099bed4314e25592059869c8f3a3c96e"
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
           }
         ],
         "given_name": null,
-        "key": "Shape.a81addb1fd452e2e53df684ce29ed145a6dfa77c",
+        "key": "Shape.9c7fe4a307fe8610251c25eb9ca06c93dfdea803",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -5824,6 +6136,38 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.ce6829bb799a76c6e714e1c55039cc04fa650ccb": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "false",
+            "description": "Execute steps in a pool of up to `max_concurrent` worker processes that are kept for the life of the run, rather than starting a new process for each step. Each worker loads the job and opens the Dagster instance once.",
+            "is_required": false,
+            "name": "enabled",
+            "type_key": "Bool"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "100",
+            "description": "The number of steps a worker process executes before it is replaced with a new one. Workers are also replaced after a step fails in them.",
+            "is_required": false,
+            "name": "max_steps_per_worker",
+            "type_key": "Int"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.ce6829bb799a76c6e714e1c55039cc04fa650ccb",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -5860,7 +6204,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.f14346cd5dd7ef8afab32d29899a1776169809b7": {
+      "Shape.e8f2597d5559c58c0ffed9f68742cb24f57a98c1": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -5868,33 +6212,15 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": "The number of processes that may run concurrently. By default, this is set to be the return value of `multiprocessing.cpu_count()`.",
-            "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": "Whether retries are enabled or not. By default, retries are enabled.",
-            "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. By default, `spawn` is selected. See https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods.",
+            "default_value_as_json_str": "{\\"release_outputs\\": false, \\"retries\\": {\\"enabled\\": {}}}",
+            "description": "Execute all steps in a single process.",
             "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.8318f5aff6cd0698a5c7fedfb9bdc75fd8006db8"
+            "name": "config",
+            "type_key": "Shape.9c7fe4a307fe8610251c25eb9ca06c93dfdea803"
           }
         ],
         "given_name": null,
-        "key": "Shape.f14346cd5dd7ef8afab32d29899a1776169809b7",
+        "key": "Shape.e8f2597d5559c58c0ffed9f68742cb24f57a98c1",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -6060,7 +6386,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.a81addb1fd452e2e53df684ce29ed145a6dfa77c"
+      "root_config_key": "Shape.378df191f74c19f444e923970cc6b87df8d45d53"
     }
   ],
   "name": "noop_pipeline",
@@ -6100,11 +6426,13 @@
   "tags": {
     "key": "value"
   }
-}'''
+}"""
 
-snapshots['test_pipeline_snap_all_props 2'] = 'c800a450c568d4e91cc7e05b26101756a73bfea2'
+snapshots["test_pipeline_snap_all_props 2"] = "0549db0104d4d506f62bfedcb2600c05c32e55a4"
 
-snapshots['test_two_invocations_deps_snap 1'] = '''{
+snapshots[
+    "test_two_invocations_deps_snap 1"
+] = """{
   "__class__": "PipelineSnapshot",
   "config_schema_snapshot": {
     "__class__": "ConfigSchemaSnapshot",
@@ -6293,7 +6621,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.2e65905622a9acb147069bfa7ccdb42fed0aa39e": {
+      "Selector.496227f5419889b1bf73123ef81c9270cfbf275b": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -6301,24 +6629,24 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+            "default_value_as_json_str": "{\\"config\\": {\\"release_outputs\\": false, \\"retries\\": {\\"enabled\\": {}}}}",
             "description": null,
             "is_required": false,
             "name": "in_process",
-            "type_key": "Shape.09d73f0755bf4752d3f121837669c8660dcf451e"
+            "type_key": "Shape.e8f2597d5559c58c0ffed9f68742cb24f57a98c1"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"release_outputs\\": false, \\"retries\\": {\\"enabled\\": {}}}}",
             "description": null,
             "is_required": false,
             "name": "multiprocess",
-            "type_key": "Shape.711132734fb3e636a3de89133ea95d2b1f2417b0"
+            "type_key": "Shape.6de73ca6abc02110a1be850614fe2558ba0c81a3"
           }
         ],
         "given_name": null,
-        "key": "Selector.2e65905622a9acb147069bfa7ccdb42fed0aa39e",
+        "key": "Selector.496227f5419889b1bf73123ef81c9270cfbf275b",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
@@ -6594,7 +6922,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.081354663b9d4b8fbfd1cb8e358763912953913f": {
+      "Shape.00f6e91ddaac6293ecfa0fbe71a1f7d7aec5b659": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -6602,31 +6930,58 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "\\"INFO\\"",
-            "description": "The logger\'s threshold.",
+            "default_value_as_json_str": "0",
+            "description": "The number of processes that may run concurrently. By default, this is set to be the return value of `multiprocessing.cpu_count()`.",
             "is_required": false,
-            "name": "log_level",
-            "type_key": "String"
+            "name": "max_concurrent",
+            "type_key": "Int"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "\\"dagster\\"",
-            "description": "The name of your logger.",
+            "default_value_as_json_str": "false",
+            "description": "Release each step output through its IO manager\'s `release_output` method once every step that consumes it has succeeded or been skipped, for example deleting its file with the `fs_io_manager`. Released outputs can not be loaded by later re-executions of the run.",
             "is_required": false,
-            "name": "name",
-            "type_key": "String"
+            "name": "release_outputs",
+            "type_key": "Bool"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": "Whether retries are enabled or not. By default, retries are enabled.",
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. By default, `spawn` is selected. See https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods.",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.8318f5aff6cd0698a5c7fedfb9bdc75fd8006db8"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Configure the multiprocess executor to reuse worker processes between steps.",
+            "is_required": false,
+            "name": "worker_pool",
+            "type_key": "Shape.ce6829bb799a76c6e714e1c55039cc04fa650ccb"
           }
         ],
         "given_name": null,
-        "key": "Shape.081354663b9d4b8fbfd1cb8e358763912953913f",
+        "key": "Shape.00f6e91ddaac6293ecfa0fbe71a1f7d7aec5b659",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.09d73f0755bf4752d3f121837669c8660dcf451e": {
+      "Shape.081354663b9d4b8fbfd1cb8e358763912953913f": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -6634,15 +6989,24 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
-            "description": "Execute all steps in a single process.",
+            "default_value_as_json_str": "\\"INFO\\"",
+            "description": "The logger\'s threshold.",
             "is_required": false,
-            "name": "config",
-            "type_key": "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c"
+            "name": "log_level",
+            "type_key": "String"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "\\"dagster\\"",
+            "description": "The name of your logger.",
+            "is_required": false,
+            "name": "name",
+            "type_key": "String"
           }
         ],
         "given_name": null,
-        "key": "Shape.09d73f0755bf4752d3f121837669c8660dcf451e",
+        "key": "Shape.081354663b9d4b8fbfd1cb8e358763912953913f",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -6672,30 +7036,60 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.41de0e2d7b75524510155d0bdab8723c6feced3b": {
+      "Shape.1b72b04d152190b43346d1e104c7ef51cbb4b949": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
+        "field_aliases": {
+          "solids": "ops"
+        },
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"in_process\\": {}}",
+            "description": "Configure how steps are executed within a run.",
             "is_required": false,
-            "name": "result",
-            "type_key": "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742"
+            "name": "execution",
+            "type_key": "Selector.496227f5419889b1bf73123ef81c9270cfbf275b"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{}",
+            "description": "Configure how loggers emit messages within a run.",
+            "is_required": false,
+            "name": "loggers",
+            "type_key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"io_manager\\": {}}",
+            "description": "Configure how shared resources are implemented within a run.",
+            "is_required": false,
+            "name": "resources",
+            "type_key": "Shape.95e096750f330490a26714025addb5f403b099e6"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"one\\": {}, \\"two\\": {}}",
+            "description": "Configure runtime parameters for ops or assets.",
+            "is_required": false,
+            "name": "solids",
+            "type_key": "Shape.ba7fa03e7f2b7ee324ff5f3ed290c26cb2585795"
           }
         ],
         "given_name": null,
-        "key": "Shape.41de0e2d7b75524510155d0bdab8723c6feced3b",
+        "key": "Shape.1b72b04d152190b43346d1e104c7ef51cbb4b949",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c": {
+      "Shape.41de0e2d7b75524510155d0bdab8723c6feced3b": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -6704,23 +7098,14 @@
             "__class__": "ConfigFieldSnap",
             "default_provided": false,
             "default_value_as_json_str": null,
-            "description": "[DEPRECATED]",
-            "is_required": false,
-            "name": "marker_to_close",
-            "type_key": "String"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": "Whether retries are enabled or not. By default, retries are enabled.",
+            "description": null,
             "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+            "name": "result",
+            "type_key": "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742"
           }
         ],
         "given_name": null,
-        "key": "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c",
+        "key": "Shape.41de0e2d7b75524510155d0bdab8723c6feced3b",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -6808,7 +7193,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.711132734fb3e636a3de89133ea95d2b1f2417b0": {
+      "Shape.6de73ca6abc02110a1be850614fe2558ba0c81a3": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -6816,15 +7201,15 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"release_outputs\\": false, \\"retries\\": {\\"enabled\\": {}}}",
             "description": "Execute each step in an individual process.",
             "is_required": false,
             "name": "config",
-            "type_key": "Shape.f14346cd5dd7ef8afab32d29899a1776169809b7"
+            "type_key": "Shape.00f6e91ddaac6293ecfa0fbe71a1f7d7aec5b659"
           }
         ],
         "given_name": null,
-        "key": "Shape.711132734fb3e636a3de89133ea95d2b1f2417b0",
+        "key": "Shape.6de73ca6abc02110a1be850614fe2558ba0c81a3",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -6877,42 +7262,48 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.ba7fa03e7f2b7ee324ff5f3ed290c26cb2585795": {
+      "Shape.9c7fe4a307fe8610251c25eb9ca06c93dfdea803": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "field_aliases": {
-          "solids": "ops"
-        },
         "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "[DEPRECATED]",
+            "is_required": false,
+            "name": "marker_to_close",
+            "type_key": "String"
+          },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
+            "default_value_as_json_str": "false",
+            "description": "Release each step output through its IO manager\'s `release_output` method once every step that consumes it has succeeded or been skipped, for example deleting its file with the `fs_io_manager`. Released outputs can not be loaded by later re-executions of the run.",
             "is_required": false,
-            "name": "one",
-            "type_key": "Shape.69ff9be621991cc7961ea5e667d43edaac9d2339"
+            "name": "release_outputs",
+            "type_key": "Bool"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": "Whether retries are enabled or not. By default, retries are enabled.",
             "is_required": false,
-            "name": "two",
-            "type_key": "Shape.69ff9be621991cc7961ea5e667d43edaac9d2339"
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
           }
         ],
         "given_name": null,
-        "key": "Shape.ba7fa03e7f2b7ee324ff5f3ed290c26cb2585795",
+        "key": "Shape.9c7fe4a307fe8610251c25eb9ca06c93dfdea803",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.be677bbd595ff02b2e624c92bc93a2290a40dd1f": {
+      "Shape.ba7fa03e7f2b7ee324ff5f3ed290c26cb2585795": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -6923,42 +7314,56 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"in_process\\": {}}",
-            "description": "Configure how steps are executed within a run.",
+            "default_value_as_json_str": "{}",
+            "description": null,
             "is_required": false,
-            "name": "execution",
-            "type_key": "Selector.2e65905622a9acb147069bfa7ccdb42fed0aa39e"
+            "name": "one",
+            "type_key": "Shape.69ff9be621991cc7961ea5e667d43edaac9d2339"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
             "default_value_as_json_str": "{}",
-            "description": "Configure how loggers emit messages within a run.",
+            "description": null,
             "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b"
-          },
+            "name": "two",
+            "type_key": "Shape.69ff9be621991cc7961ea5e667d43edaac9d2339"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.ba7fa03e7f2b7ee324ff5f3ed290c26cb2585795",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.ce6829bb799a76c6e714e1c55039cc04fa650ccb": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"io_manager\\": {}}",
-            "description": "Configure how shared resources are implemented within a run.",
+            "default_value_as_json_str": "false",
+            "description": "Execute steps in a pool of up to `max_concurrent` worker processes that are kept for the life of the run, rather than starting a new process for each step. Each worker loads the job and opens the Dagster instance once.",
             "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.95e096750f330490a26714025addb5f403b099e6"
+            "name": "enabled",
+            "type_key": "Bool"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"one\\": {}, \\"two\\": {}}",
-            "description": "Configure runtime parameters for ops or assets.",
+            "default_value_as_json_str": "100",
+            "description": "The number of steps a worker process executes before it is replaced with a new one. Workers are also replaced after a step fails in them.",
             "is_required": false,
-            "name": "solids",
-            "type_key": "Shape.ba7fa03e7f2b7ee324ff5f3ed290c26cb2585795"
+            "name": "max_steps_per_worker",
+            "type_key": "Int"
           }
         ],
         "given_name": null,
-        "key": "Shape.be677bbd595ff02b2e624c92bc93a2290a40dd1f",
+        "key": "Shape.ce6829bb799a76c6e714e1c55039cc04fa650ccb",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -7001,7 +7406,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.f14346cd5dd7ef8afab32d29899a1776169809b7": {
+      "Shape.e8f2597d5559c58c0ffed9f68742cb24f57a98c1": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -7009,33 +7414,15 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": "The number of processes that may run concurrently. By default, this is set to be the return value of `multiprocessing.cpu_count()`.",
-            "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": "Whether retries are enabled or not. By default, retries are enabled.",
-            "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. By default, `spawn` is selected. See https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods.",
+            "default_value_as_json_str": "{\\"release_outputs\\": false, \\"retries\\": {\\"enabled\\": {}}}",
+            "description": "Execute all steps in a single process.",
             "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.8318f5aff6cd0698a5c7fedfb9bdc75fd8006db8"
+            "name": "config",
+            "type_key": "Shape.9c7fe4a307fe8610251c25eb9ca06c93dfdea803"
           }
         ],
         "given_name": null,
-        "key": "Shape.f14346cd5dd7ef8afab32d29899a1776169809b7",
+        "key": "Shape.e8f2597d5559c58c0ffed9f68742cb24f57a98c1",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -7209,7 +7596,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.be677bbd595ff02b2e624c92bc93a2290a40dd1f"
+      "root_config_key": "Shape.1b72b04d152190b43346d1e104c7ef51cbb4b949"
     }
   ],
   "name": "two_solid_pipeline",
@@ -7247,6 +7634,6 @@
     ]
   },
   "tags": {}
-}'''
+}"""
 
-snapshots['test_two_invocations_deps_snap 2'] = 'd44ec7b059c6ad8e476037c784256d028cf4c7c7'
+snapshots["test_two_invocations_deps_snap 2"] = "b1ea2bc178c48b3d020af41abb5f770e4a8b3928"
@@ -11,13 +11,16 @@
     create_pipeline_snapshot_id,
     snap_from_config_type,
 )
+from dagster._core.snap import pipeline_snapshot as pipeline_snapshot_module
 from dagster._core.snap.dep_snapshot import (
     InputHandle,
     OutputHandleSnap,
     build_dep_structure_snapshot_from_icontains_solids,
 )
+from dagster._core.test_utils import instance_for_test
 from dagster._legacy import InputDefinition, OutputDefinition, pipeline, solid
 from dagster._serdes import (
+    create_snapshot_id,
     deserialize_json_to_dagster_namedtuple,
     serialize_dagster_namedtuple,
     serialize_pp,
@@ -44,6 +47,29 @@ def test_empty_pipeline_snap_snapshot(snapshot):
     snapshot.assert_match(serialize_pp(PipelineSnapshot.from_pipeline_def(get_noop_pipeline())))
 
 
+def test_pipeline_snapshot_cached_on_definition(monkeypatch):
+    noop_pipeline = get_noop_pipeline()
+
+    pipeline_snapshot = noop_pipeline.get_pipeline_snapshot()
+    assert noop_pipeline.get_pipeline_snapshot() is pipeline_snapshot
+    assert noop_pipeline.get_pipeline_snapshot_id() == create_snapshot_id(pipeline_snapshot)
+
+    hashed_snapshots = []
+
+    def _create_snapshot_id(snapshot):
+        hashed_snapshots.append(snapshot)
+        return create_snapshot_id(snapshot)
+
+    # runs use the snapshot id kept by the definition, rather than hashing the snapshot again
+    monkeypatch.setattr(pipeline_snapshot_module, "create_snapshot_id", _create_snapshot_id)
+    with instance_for_test() as instance:
+        for _ in range(2):
+            run = instance.create_run_for_pipeline(noop_pipeline)
+            assert run.pipeline_snapshot_id == noop_pipeline.get_pipeline_snapshot_id()
+        assert instance.has_pipeline_snapshot(noop_pipeline.get_pipeline_snapshot_id())
+    assert hashed_snapshots == []
+
+
 def test_empty_pipeline_snap_props(snapshot):
 
     pipeline_snapshot = PipelineSnapshot.from_pipeline_def(get_noop_pipeline())
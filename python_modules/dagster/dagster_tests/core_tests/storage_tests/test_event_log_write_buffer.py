@@ -0,0 +1,217 @@
+import time
+
+import pytest
+
+from dagster import DagsterEventType, job, op
+from dagster._core.events import DagsterEvent, EngineEventData
+from dagster._core.events.log import EventLogEntry
+from dagster._core.execution.plan.objects import StepSuccessData
+from dagster._core.storage.event_log import EventLogWriteBuffer, InMemoryEventLogStorage
+from dagster._core.test_utils import instance_for_test
+
+
+def _event(run_id, event_type=DagsterEventType.ENGINE_EVENT, event_specific_data=None):
+    return EventLogEntry(
+        error_info=None,
+        level="debug",
+        user_message="",
+        run_id=run_id,
+        timestamp=time.time(),
+        dagster_event=DagsterEvent(
+            event_type.value,
+            "nonce",
+            event_specific_data=event_specific_data or EngineEventData.in_process(999),
+        ),
+    )
+
+
+class CountingEventLogStorage(InMemoryEventLogStorage):
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    def store_events(self, events):
+        self.batches.append(len(events))
+        super().store_events(events)
+
+
+def test_flush_on_batch_size():
+    storage = CountingEventLogStorage()
+    buffer = EventLogWriteBuffer(storage, max_batch_size=3, flush_interval_seconds=60)
+
+    buffer.write(_event("foo"))
+    buffer.write(_event("foo"))
+    assert storage.get_logs_for_run("foo") == []
+    assert buffer.buffered_event_count == 2
+
+    buffer.write(_event("foo"))
+    assert len(storage.get_logs_for_run("foo")) == 3
+    assert storage.batches == [3]
+    buffer.dispose()
+
+
+class FlakyEventLogStorage(CountingEventLogStorage):
+    def __init__(self):
+        super().__init__()
+        self.num_failures = 0
+
+    def store_events(self, events):
+        if self.num_failures > 0:
+            self.num_failures -= 1
+            raise Exception("Failed to store events")
+        super().store_events(events)
+
+
+def test_failed_flush_keeps_events():
+    storage = FlakyEventLogStorage()
+    buffer = EventLogWriteBuffer(storage, max_batch_size=100, flush_interval_seconds=60)
+
+    buffer.write(_event("foo"))
+    buffer.write(_event("foo"))
+
+    storage.num_failures = 1
+    with pytest.raises(Exception, match="Failed to store events"):
+        buffer.flush()
+    assert buffer.buffered_event_count == 2
+    assert storage.get_logs_for_run("foo") == []
+
+    buffer.flush()
+    assert buffer.buffered_event_count == 0
+    assert len(storage.get_logs_for_run("foo")) == 2
+    assert storage.batches == [2]
+    buffer.dispose()
+
+
+def test_failed_flush_keeps_only_unstored_events():
+    storage = FlakyEventLogStorage()
+    buffer = EventLogWriteBuffer(storage, max_batch_size=100, flush_interval_seconds=60)
+
+    buffer.write(_event("foo"))
+    buffer.write(_event("foo"))
+    buffer.write(_event("bar"))
+
+    # the events of foo are stored before the write of the events of bar fails
+    store_events = storage.store_events
+
+    def _store_events(events):
+        if events[0].run_id == "bar":
+            raise Exception("Failed to store events")
+        store_events(events)
+
+    storage.store_events = _store_events
+    with pytest.raises(Exception, match="Failed to store events"):
+        buffer.flush()
+    assert buffer.buffered_event_count == 1
+
+    storage.store_events = store_events
+    buffer.flush()
+    assert len(storage.get_logs_for_run("foo")) == 2
+    assert len(storage.get_logs_for_run("bar")) == 1
+    assert storage.batches == [2, 1]
+    buffer.dispose()
+
+
+def test_max_buffered_events():
+    storage = FlakyEventLogStorage()
+    buffer = EventLogWriteBuffer(
+        storage, max_batch_size=2, flush_interval_seconds=60, max_buffered_events=3
+    )
+
+    storage.num_failures = 3
+    buffer.write(_event("foo"))
+    with pytest.raises(Exception, match="Failed to store events"):
+        buffer.write(_event("foo"))
+    with pytest.raises(Exception, match="Failed to store events"):
+        buffer.write(_event("foo"))
+    assert buffer.buffered_event_count == 3
+
+    # once the buffer is full, events are not buffered while the storage is failing
+    with pytest.raises(Exception, match="Failed to store events"):
+        buffer.write(_event("foo"))
+    assert buffer.buffered_event_count == 3
+
+    # the buffered events are stored once the storage recovers
+    buffer.write(_event("foo"))
+    assert len(storage.get_logs_for_run("foo")) == 3
+    assert buffer.buffered_event_count == 1
+    buffer.dispose()
+    assert len(storage.get_logs_for_run("foo")) == 4
+
+
+def test_flush_on_step_terminal_event():
+    storage = CountingEventLogStorage()
+    buffer = EventLogWriteBuffer(storage, max_batch_size=100, flush_interval_seconds=60)
+
+    buffer.write(_event("foo"))
+    buffer.write(
+        _event(
+            "foo",
+            DagsterEventType.STEP_SUCCESS,
+            event_specific_data=StepSuccessData(duration_ms=1.0),
+        )
+    )
+    logs = storage.get_logs_for_run("foo")
+    assert [log.dagster_event_type for log in logs] == [
+        DagsterEventType.ENGINE_EVENT,
+        DagsterEventType.STEP_SUCCESS,
+    ]
+    assert storage.batches == [2]
+    buffer.dispose()
+
+
+def test_flush_on_interval():
+    storage = CountingEventLogStorage()
+    buffer = EventLogWriteBuffer(storage, max_batch_size=100, flush_interval_seconds=0.1)
+
+    buffer.write(_event("foo"))
+    start_time = time.time()
+    while not storage.get_logs_for_run("foo"):
+        assert time.time() - start_time < 10
+        time.sleep(0.05)
+
+    buffer.dispose()
+    assert storage.batches == [1]
+
+
+def test_dispose_flushes():
+    storage = CountingEventLogStorage()
+    buffer = EventLogWriteBuffer(storage, max_batch_size=100, flush_interval_seconds=60)
+
+    buffer.write(_event("foo"))
+    buffer.dispose()
+    assert len(storage.get_logs_for_run("foo")) == 1
+
+    # writes after dispose are not held back
+    buffer.write(_event("foo"))
+    assert len(storage.get_logs_for_run("foo")) == 2
+
+
+@op
+def noop_op():
+    pass
+
+
+@job
+def noop_job():
+    noop_op()
+    noop_op.alias("other_noop_op")()
+
+
+def test_buffered_instance_execution():
+    with instance_for_test(
+        overrides={
+            "event_log_buffering": {
+                "enabled": True,
+                "max_batch_size": 1000,
+                "flush_interval_seconds": 60.0,
+            }
+        }
+    ) as instance:
+        result = noop_job.execute_in_process(instance=instance)
+        assert result.success
+
+        # run lifecycle events flush synchronously, so the run status and the full event log are
+        # visible to other readers of the storage
+        stored_logs = instance.event_log_storage.get_logs_for_run(result.run_id)
+        assert stored_logs[-1].dagster_event_type == DagsterEventType.RUN_SUCCESS
+        assert len(instance.all_logs(result.run_id)) == len(stored_logs)
@@ -616,6 +616,45 @@ def basic_pipeline():
     assert result.output_for_solid("basic_solid") == 5
 
 
+def test_release_outputs_in_process():
+    mem_io_manager_instance = InMemoryIOManager()
+
+    @op
+    def op_a():
+        return 1
+
+    @op
+    def op_b(x):
+        return x + 1
+
+    @op
+    def op_c(x, y):
+        return x + y
+
+    @job(
+        resource_defs={
+            "io_manager": IOManagerDefinition.hardcoded_io_manager(mem_io_manager_instance)
+        }
+    )
+    def release_job():
+        a = op_a()
+        op_c(a, op_b(a))
+
+    result = execute_pipeline(
+        release_job,
+        run_config={"execution": {"config": {"in_process": {"release_outputs": True}}}},
+    )
+    assert result.success
+    assert result.output_for_solid("op_c") == 3
+    # only the output that no op consumes is kept
+    assert list(mem_io_manager_instance.values.keys()) == [(result.run_id, "op_c", "result")]
+
+    mem_io_manager_instance.values.clear()
+    result = execute_pipeline(release_job, run_config={"execution": {"config": {"in_process": {}}}})
+    assert result.success
+    assert len(mem_io_manager_instance.values) == 3
+
+
 def test_get_output_context_with_resources():
     @solid
     def basic_solid():
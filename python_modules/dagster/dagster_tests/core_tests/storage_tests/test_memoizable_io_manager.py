@@ -82,3 +82,49 @@ def test_versioned_filesystem_io_manager_default_base_dir():
             assert my_io_manager.base_dir == os.path.join(
                 instance.storage_directory(), "versioned_outputs"
             )
+
+
+def test_memoized_plan_checks_outputs_in_batch():
+    has_outputs_calls = []
+    executed_step_keys = []
+
+    @io_manager
+    def batched_memoizable_io_manager(_):
+        class BatchedIOManager(MemoizableIOManager):
+            def handle_output(self, context, _obj):
+                executed_step_keys.append(context.step_key)
+
+            def load_input(self, _context):
+                return None
+
+            def has_output(self, context):
+                raise Exception("has_output should not be called when has_outputs is implemented")
+
+            def has_outputs(self, contexts):
+                has_outputs_calls.append(sorted(context.step_key for context in contexts))
+                return [context.step_key == "memoized_solid" for context in contexts]
+
+        return BatchedIOManager()
+
+    @solid(version="1")
+    def memoized_solid():
+        pass
+
+    @solid(version="1")
+    def unmemoized_solid():
+        pass
+
+    @pipeline(
+        mode_defs=[ModeDefinition(resource_defs={"io_manager": batched_memoizable_io_manager})],
+        tags={MEMOIZED_RUN_TAG: "true"},
+    )
+    def batched_pipeline():
+        memoized_solid()
+        unmemoized_solid()
+
+    with instance_for_test() as instance:
+        result = execute_pipeline(batched_pipeline, instance=instance)
+        assert result.success
+
+    assert has_outputs_calls == [["memoized_solid", "unmemoized_solid"]]
+    assert executed_step_keys == ["unmemoized_solid"]
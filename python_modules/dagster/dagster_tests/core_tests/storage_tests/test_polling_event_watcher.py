@@ -1,13 +1,21 @@
 import tempfile
+import threading
 import time
 from contextlib import contextmanager
 from typing import Callable, Union
 
+import pytest
+
 import dagster._check as check
 from dagster._core.events import DagsterEvent, DagsterEventType, EngineEventData
 from dagster._core.events.log import EventLogEntry
 from dagster._core.storage.event_log import SqlPollingEventWatcher, SqliteEventLogStorage
-from dagster._core.storage.event_log.base import EventLogCursor
+from dagster._core.storage.event_log.base import EventLogCursor, EventLogRecord
+from dagster._core.storage.event_log.polling_event_watcher import (
+    MAX_FINISHED_RUN_POLLING_CADENCE,
+    POLLING_CADENCE,
+    SqlPollingWatchedRun,
+)
 
 
 class SqlitePollingEventLogStorage(SqliteEventLogStorage):
@@ -129,3 +137,79 @@ def watch_two(event, _cursor):
 
         assert [int(evt.message) for evt in watched_1] == [2, 3, 4]
         assert [int(evt.message) for evt in watched_2] == [4, 5]
+
+
+def test_single_watcher_thread_for_many_runs():
+    with create_sqlite_run_event_logstorage() as storage:
+        run_ids = [f"run_{i}" for i in range(5)]
+        watched = {run_id: [] for run_id in run_ids}
+
+        def _callback_for(run_id):
+            def _callback(event, _cursor):
+                watched[run_id].append(event)
+
+            return _callback
+
+        callbacks = {run_id: _callback_for(run_id) for run_id in run_ids}
+        for run_id in run_ids:
+            storage.watch(run_id, None, callbacks[run_id])
+
+        for i, run_id in enumerate(run_ids):
+            for count in range(i + 1):
+                storage.store_event(create_event(count, run_id=run_id))
+
+        attempts = 20
+        while any(len(watched[run_id]) < i + 1 for i, run_id in enumerate(run_ids)):
+            assert attempts > 0
+            time.sleep(0.1)
+            attempts -= 1
+
+        assert (
+            len([thread for thread in threading.enumerate() if thread.name == "sql-event-watch"])
+            == 1
+        )
+        for i, run_id in enumerate(run_ids):
+            assert [int(evt.message) for evt in watched[run_id]] == list(range(i + 1))
+
+        for run_id in run_ids:
+            storage.end_watch(run_id, callbacks[run_id])
+
+        attempts = 20
+        while any(thread.name == "sql-event-watch" for thread in threading.enumerate()):
+            assert attempts > 0
+            time.sleep(0.1)
+            attempts -= 1
+
+        storage.dispose()
+
+
+def test_finished_run_backoff():
+    watched_run = SqlPollingWatchedRun(RUN_ID, None)
+    watched_run.add_callback(None, lambda _event, _cursor: None)
+
+    watched_run.handle_records([EventLogRecord(1, create_event(1))], watched_run.callbacks, 0)
+    assert watched_run.next_poll_time == POLLING_CADENCE
+
+    # active runs are polled at the base cadence, even when no new events arrive
+    watched_run.handle_records([], watched_run.callbacks, 10)
+    assert watched_run.next_poll_time == 10 + POLLING_CADENCE
+
+    finished_event = EventLogEntry(
+        error_info=None,
+        user_message="",
+        level="debug",
+        run_id=RUN_ID,
+        timestamp=time.time(),
+        dagster_event=DagsterEvent(DagsterEventType.RUN_SUCCESS.value, "nonce"),
+    )
+    watched_run.handle_records([EventLogRecord(2, finished_event)], watched_run.callbacks, 20)
+    assert watched_run.next_poll_time == 20 + POLLING_CADENCE
+
+    intervals = []
+    for tick in range(10):
+        watched_run.handle_records([], watched_run.callbacks, 30 + tick)
+        intervals.append(watched_run.next_poll_time - (30 + tick))
+
+    assert intervals == sorted(intervals)
+    assert intervals[0] == pytest.approx(2 * POLLING_CADENCE)
+    assert intervals[-1] == pytest.approx(MAX_FINISHED_RUN_POLLING_CADENCE)
@@ -414,6 +414,93 @@ def test_event_log_storage_store_with_multiple_runs(self, instance, storage):
             for run in runs:
                 instance.delete_run(run)
 
+    def test_event_log_storage_store_events_batch(self, instance, storage):
+        runs = ["foo", "bar"]
+        if instance:
+            for run in runs:
+                create_run_for_test(instance, run_id=run)
+
+        events = [
+            create_test_event_log_record(str(i), run_id=runs[(i // 3) % 2]) for i in range(250)
+        ]
+        storage.store_events(events)
+
+        for run_id in runs:
+            logs = storage.get_logs_for_run(run_id)
+            assert [log.user_message for log in logs] == [
+                event.user_message for event in events if event.run_id == run_id
+            ]
+
+        if self.can_wipe():
+            storage.wipe()
+            for run_id in runs:
+                assert len(storage.get_logs_for_run(run_id)) == 0
+
+        if instance:
+            for run in runs:
+                instance.delete_run(run)
+
+    def test_store_events_batch_asset_materialization(self, storage, test_run_id):
+        asset_key = AssetKey(["path", "to", "batched_asset"])
+
+        @solid
+        def materialize_one(_):
+            yield AssetMaterialization(asset_key=asset_key)
+            yield Output(1)
+
+        def _solids():
+            materialize_one()
+
+        with instance_for_test() as created_instance:
+            if not storage._instance:  # pylint: disable=protected-access
+                storage.register_instance(created_instance)
+
+            events, _ = _synthesize_events(_solids, instance=created_instance, run_id=test_run_id)
+            storage.store_events(events)
+
+            assert len(storage.get_logs_for_run(test_run_id)) == len(events)
+            assert asset_key in set(storage.all_asset_keys())
+            records = storage.get_event_records(
+                EventRecordsFilter(
+                    event_type=DagsterEventType.ASSET_MATERIALIZATION,
+                    asset_key=asset_key,
+                )
+            )
+            assert len(records) == 1
+
+    def test_get_records_for_run_ids(self, instance, storage):
+        if not isinstance(storage, SqlEventLogStorage):
+            pytest.skip("This test is for SQL-backed Event Log behavior")
+
+        runs = ["foo", "bar", "baz"]
+        if instance:
+            for run in runs:
+                create_run_for_test(instance, run_id=run)
+
+        for i in range(3):
+            for run_id in runs:
+                storage.store_event(create_test_event_log_record(str(i), run_id=run_id))
+
+        records = storage.get_records_for_run_ids(["foo", "bar"])
+        assert len(records) == 6
+        assert {record.event_log_entry.run_id for record in records} == {"foo", "bar"}
+
+        foo_records = storage.get_records_for_run("foo").records
+        after_records = storage.get_records_for_run_ids(
+            ["foo"], after_cursor=foo_records[0].storage_id
+        )
+        assert [record.storage_id for record in after_records] == [
+            record.storage_id for record in foo_records[1:]
+        ]
+        assert storage.get_records_for_run_ids([]) == []
+
+        if self.can_wipe():
+            storage.wipe()
+
+        if instance:
+            for run in runs:
+                instance.delete_run(run)
+
     def test_event_log_storage_watch(self, test_run_id, storage):
         if not self.can_watch():
             pytest.skip("storage cannot watch runs")
@@ -1915,6 +2002,90 @@ def _fetch_counts(storage):
                     assert materialization_count_by_partition.get(c)["a"] == 1
                     assert materialization_count_by_partition.get(d)["x"] == 2
 
+    def test_get_latest_materialization_by_partition(self, storage, instance):
+        a = AssetKey("partitioned_asset")
+        b = AssetKey("other_asset")
+
+        @op
+        def materialize():
+            yield AssetMaterialization(a, partition="x")
+            yield AssetMaterialization(a, partition="y")
+            yield AssetMaterialization(b, partition="x")
+            yield AssetMaterialization(a)
+            yield Output(None)
+
+        @op
+        def materialize_two():
+            yield AssetMaterialization(a, partition="x")
+            yield Output(None)
+
+        def _fetch_latest_run_ids(partitions=None):
+            return {
+                partition: record.event_log_entry.run_id
+                for partition, record in storage.get_latest_materialization_by_partition(
+                    a, partitions
+                ).items()
+            }
+
+        with instance_for_test() as created_instance:
+            if not storage._instance:  # pylint: disable=protected-access
+                storage.register_instance(created_instance)
+
+            run_id_1 = make_new_run_id()
+            run_id_2 = make_new_run_id()
+            run_id_3 = make_new_run_id()
+
+            with create_and_delete_test_runs(instance, [run_id_1, run_id_2, run_id_3]):
+                assert _fetch_latest_run_ids() == {}
+
+                events, _ = _synthesize_events(
+                    lambda: materialize(), instance=created_instance, run_id=run_id_1
+                )
+                for event in events:
+                    storage.store_event(event)
+
+                assert _fetch_latest_run_ids() == {"x": run_id_1, "y": run_id_1}
+
+                events, _ = _synthesize_events(
+                    lambda: materialize_two(), instance=created_instance, run_id=run_id_2
+                )
+                storage.store_events(events)
+
+                assert _fetch_latest_run_ids() == {"x": run_id_2, "y": run_id_1}
+                assert _fetch_latest_run_ids(["x", "z"]) == {"x": run_id_2}
+
+                latest = storage.get_latest_materialization_by_partition(a, ["x"])["x"]
+                assert latest.event_log_entry.dagster_event.partition == "x"
+                assert latest.storage_id == max(
+                    record.storage_id
+                    for record in storage.get_event_records(
+                        EventRecordsFilter(
+                            event_type=DagsterEventType.ASSET_MATERIALIZATION,
+                            asset_key=a,
+                            asset_partitions=["x"],
+                        )
+                    )
+                )
+
+                # deleting the latest materialization falls back to the previous one
+                storage.delete_events(run_id_2)
+                assert _fetch_latest_run_ids() == {"x": run_id_1, "y": run_id_1}
+
+                if self.can_wipe():
+                    storage.wipe_asset(a)
+                    assert _fetch_latest_run_ids() == {}
+
+                    events, _ = _synthesize_events(
+                        lambda: materialize_two(), instance=created_instance, run_id=run_id_3
+                    )
+                    for event in events:
+                        storage.store_event(event)
+
+                    assert _fetch_latest_run_ids() == {"x": run_id_3}
+
+                    storage.delete_events(run_id_3)
+                    assert _fetch_latest_run_ids() == {}
+
     def test_get_observation(self, storage, test_run_id):
         a = AssetKey(["key_a"])
 
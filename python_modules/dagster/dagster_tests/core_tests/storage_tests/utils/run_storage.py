@@ -38,6 +38,7 @@
     PARENT_RUN_ID_TAG,
     PARTITION_NAME_TAG,
     PARTITION_SET_TAG,
+    PRIORITY_TAG,
     REPOSITORY_LABEL_TAG,
     ROOT_RUN_ID_TAG,
 )
@@ -146,6 +147,75 @@ def test_basic_storage(self, storage):
         assert fetched_run.run_id == run_id
         assert fetched_run.pipeline_name == "some_pipeline"
 
+    def test_add_runs(self, storage):
+        assert storage
+        run_ids = [make_new_run_id() for _ in range(3)]
+        added = storage.add_runs(
+            [
+                TestRunStorage.build_run(
+                    run_id=run_id, pipeline_name="some_pipeline", tags={"index": str(i)}
+                )
+                for i, run_id in enumerate(run_ids)
+            ]
+        )
+        assert [run.run_id for run in added] == run_ids
+
+        runs = storage.get_runs()
+        assert len(runs) == 3
+        assert {run.run_id for run in runs} == set(run_ids)
+        for i, run_id in enumerate(run_ids):
+            fetched_run = storage.get_run_by_id(run_id)
+            assert fetched_run.pipeline_name == "some_pipeline"
+            assert fetched_run.tags == {"index": str(i)}
+            assert storage.get_runs_count(RunsFilter(tags={"index": str(i)})) == 1
+
+        assert storage.add_runs([]) == []
+
+        with pytest.raises(DagsterRunAlreadyExists):
+            storage.add_runs(
+                [TestRunStorage.build_run(run_id=run_ids[0], pipeline_name="some_pipeline")]
+            )
+
+    def test_add_runs_in_batches(self, storage):
+        assert storage
+        num_runs = 250
+        run_ids = [make_new_run_id() for _ in range(num_runs)]
+        storage.add_runs(
+            [
+                TestRunStorage.build_run(
+                    run_id=run_id,
+                    pipeline_name="some_pipeline",
+                    tags={"index": str(i), "foo": "bar", "baz": "quux"},
+                )
+                for i, run_id in enumerate(run_ids)
+            ]
+        )
+        assert storage.get_runs_count() == num_runs
+        assert storage.get_runs_count(RunsFilter(tags={"foo": "bar"})) == num_runs
+        assert storage.get_run_by_id(run_ids[-1]).tags == {
+            "index": str(num_runs - 1),
+            "foo": "bar",
+            "baz": "quux",
+        }
+
+        if not isinstance(storage, SqlRunStorage):
+            return
+
+        # a failed insert does not leave any of the runs behind
+        new_run_ids = [make_new_run_id() for _ in range(150)]
+        with pytest.raises(DagsterRunAlreadyExists):
+            storage.add_runs(
+                [
+                    TestRunStorage.build_run(
+                        run_id=run_id, pipeline_name="other_pipeline", tags={"foo": "bar"}
+                    )
+                    for run_id in new_run_ids + [run_ids[0]]
+                ]
+            )
+        assert storage.get_runs_count() == num_runs
+        assert storage.get_runs_count(RunsFilter(pipeline_name="other_pipeline")) == 0
+        assert storage.get_runs_count(RunsFilter(tags={"foo": "bar"})) == num_runs
+
     def test_clear(self, storage):
         if not self.can_delete_runs():
             pytest.skip("storage cannot delete")
@@ -629,6 +699,101 @@ def test_fetch_by_status(self, storage):
             run.run_id for run in storage.get_runs(RunsFilter(statuses=[PipelineRunStatus.SUCCESS]))
         } == set()
 
+    def test_fetch_run_ids(self, storage):
+        assert storage
+        run_ids = [make_new_run_id() for _ in range(4)]
+        for i, run_id in enumerate(run_ids):
+            storage.add_run(
+                TestRunStorage.build_run(
+                    run_id=run_id,
+                    pipeline_name="some_pipeline",
+                    status=PipelineRunStatus.STARTED if i % 2 else PipelineRunStatus.SUCCESS,
+                )
+            )
+
+        assert storage.get_run_ids() == [run.run_id for run in storage.get_runs()]
+        assert storage.get_run_ids(RunsFilter(statuses=[PipelineRunStatus.STARTED])) == [
+            run_ids[3],
+            run_ids[1],
+        ]
+        assert storage.get_run_ids(cursor=run_ids[3], limit=2) == [run_ids[2], run_ids[1]]
+
+    def test_fetch_queued_run_ids(self, storage):
+        assert storage
+        one = make_new_run_id()
+        two = make_new_run_id()
+        three = make_new_run_id()
+        four = make_new_run_id()
+        five = make_new_run_id()
+
+        origin = self.fake_job_origin("some_pipeline")
+        for run_id, status, tags in [
+            (one, PipelineRunStatus.QUEUED, {}),
+            (two, PipelineRunStatus.QUEUED, {PRIORITY_TAG: "3"}),
+            (three, PipelineRunStatus.STARTED, {PRIORITY_TAG: "5"}),
+            (four, PipelineRunStatus.QUEUED, {PRIORITY_TAG: "-1"}),
+            (five, PipelineRunStatus.QUEUED, {PRIORITY_TAG: "foobar"}),
+        ]:
+            storage.add_run(
+                TestRunStorage.build_run(
+                    run_id=run_id,
+                    pipeline_name="some_pipeline",
+                    status=status,
+                    tags=tags,
+                    external_pipeline_origin=origin,
+                )
+            )
+
+        # by descending priority, then fifo; malformed priorities count as 0
+        connection = storage.get_queued_run_ids()
+        assert connection.run_ids == [two, one, five, four]
+        assert not connection.has_more
+
+        first_page = storage.get_queued_run_ids(limit=2)
+        assert first_page.run_ids == [two, one]
+        assert first_page.has_more
+        second_page = storage.get_queued_run_ids(cursor=first_page.cursor, limit=1)
+        assert second_page.run_ids == [five]
+        assert second_page.has_more
+        last_page = storage.get_queued_run_ids(cursor=second_page.cursor, limit=1)
+        assert last_page.run_ids == [four]
+        assert not last_page.has_more
+        assert storage.get_queued_run_ids(cursor=last_page.cursor).run_ids == []
+
+        # the run that the cursor was taken at no longer needs to be queued
+        storage.handle_run_event(
+            one,
+            DagsterEvent(
+                event_type_value=DagsterEventType.PIPELINE_START.value,
+                pipeline_name="some_pipeline",
+            ),
+        )
+        assert storage.get_queued_run_ids().run_ids == [two, five, four]
+        assert storage.get_queued_run_ids(cursor=first_page.cursor).run_ids == [five, four]
+
+    def test_fetch_queued_run_ids_after_deleted_cursor_run(self, storage):
+        assert storage
+        # storages that order the queue in a query keep the place of the cursor in the queue
+        self._skip_in_memory(storage)
+
+        run_ids = [make_new_run_id() for _ in range(4)]
+        origin = self.fake_job_origin("some_pipeline")
+        for run_id in run_ids:
+            storage.add_run(
+                TestRunStorage.build_run(
+                    run_id=run_id,
+                    pipeline_name="some_pipeline",
+                    status=PipelineRunStatus.QUEUED,
+                    external_pipeline_origin=origin,
+                )
+            )
+
+        first_page = storage.get_queued_run_ids(limit=2)
+        assert first_page.run_ids == run_ids[:2]
+
+        storage.delete_run(run_ids[1])
+        assert storage.get_queued_run_ids(cursor=first_page.cursor).run_ids == run_ids[2:]
+
     def test_fetch_records_by_update_timestamp(self, storage):
         assert storage
         self._skip_in_memory(storage)
@@ -1136,6 +1301,114 @@ def test_partition_status(self, storage):
         assert {_.partition for _ in partition_data} == {"one", "two", "three"}
         assert {_.run_id for _ in partition_data} == {one.run_id, two_retried.run_id, three.run_id}
 
+    def test_latest_run_partition_data(self, storage):
+        repository_label = "fake_repo@fake_location"
+
+        def _add_partition_run(partition, label=repository_label):
+            run = TestRunStorage.build_run(
+                run_id=make_new_run_id(),
+                pipeline_name="foo_pipeline",
+                tags={
+                    PARTITION_NAME_TAG: partition,
+                    PARTITION_SET_TAG: "foo_set",
+                    REPOSITORY_LABEL_TAG: label,
+                },
+            )
+            storage.add_run(run)
+            return run
+
+        one = _add_partition_run("one")
+        two = _add_partition_run("two")
+        two_retried = _add_partition_run("two")
+        _add_partition_run("three", label="other_repo@other_location")
+
+        partition_data = storage.get_latest_run_partition_data(
+            pipeline_name="foo_pipeline", repository_label=repository_label
+        )
+        assert {_.partition: _.run_id for _ in partition_data} == {
+            "one": one.run_id,
+            "two": two_retried.run_id,
+        }
+
+        storage.handle_run_event(
+            two_retried.run_id,
+            DagsterEvent(
+                message="a message",
+                event_type_value=DagsterEventType.PIPELINE_START.value,
+                pipeline_name="foo_pipeline",
+            ),
+        )
+        storage.handle_run_event(
+            two_retried.run_id,
+            DagsterEvent(
+                message="a message",
+                event_type_value=DagsterEventType.PIPELINE_SUCCESS.value,
+                pipeline_name="foo_pipeline",
+            ),
+        )
+        partition_data_by_partition = {
+            _.partition: _
+            for _ in storage.get_latest_run_partition_data(
+                pipeline_name="foo_pipeline", repository_label=repository_label
+            )
+        }
+        assert partition_data_by_partition["one"].status == PipelineRunStatus.NOT_STARTED
+        assert partition_data_by_partition["two"].status == PipelineRunStatus.SUCCESS
+        if isinstance(storage, SqlRunStorage):
+            assert partition_data_by_partition["two"].start_time is not None
+            assert partition_data_by_partition["two"].end_time is not None
+
+        if self.can_delete_runs():
+            storage.delete_run(two_retried.run_id)
+            storage.delete_run(one.run_id)
+            partition_data = storage.get_latest_run_partition_data(
+                pipeline_name="foo_pipeline", repository_label=repository_label
+            )
+            assert {_.partition: _.run_id for _ in partition_data} == {"two": two.run_id}
+
+    def test_add_runs_latest_run_partition_data(self, storage):
+        repository_label = "fake_repo@fake_location"
+
+        def _build_partition_run(partition, label=repository_label):
+            return TestRunStorage.build_run(
+                run_id=make_new_run_id(),
+                pipeline_name="foo_pipeline",
+                tags={
+                    PARTITION_NAME_TAG: partition,
+                    PARTITION_SET_TAG: "foo_set",
+                    REPOSITORY_LABEL_TAG: label,
+                },
+            )
+
+        def _latest_run_ids():
+            return {
+                _.partition: _.run_id
+                for _ in storage.get_latest_run_partition_data(
+                    pipeline_name="foo_pipeline", repository_label=repository_label
+                )
+            }
+
+        first = _build_partition_run("first")
+        storage.add_run(first)
+
+        # enough runs for several batches, with later runs of the same partitions
+        runs = [_build_partition_run(str(i % 150)) for i in range(300)]
+        runs.append(_build_partition_run("first"))
+        runs.append(_build_partition_run("other", label="other_repo@other_location"))
+        storage.add_runs(runs)
+
+        expected = {str(i): runs[150 + i].run_id for i in range(150)}
+        expected["first"] = runs[300].run_id
+        assert _latest_run_ids() == expected
+
+        if not isinstance(storage, SqlRunStorage):
+            return
+
+        # a failed insert does not update the statuses of any partitions
+        with pytest.raises(DagsterRunAlreadyExists):
+            storage.add_runs([_build_partition_run("first"), _build_partition_run("new"), first])
+        assert _latest_run_ids() == expected
+
     def _skip_in_memory(self, storage):
         from dagster._core.storage.runs import InMemoryRunStorage
 
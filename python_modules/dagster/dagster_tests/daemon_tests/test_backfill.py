@@ -3,6 +3,7 @@
 import string
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 
 import pendulum
@@ -28,6 +29,7 @@
 from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
 from dagster._core.workspace.load_target import PythonFileTarget
 from dagster._daemon import get_default_daemon_logger
+from dagster._daemon import backfill as backfill_daemon
 from dagster._daemon.backfill import execute_backfill_iteration
 from dagster._legacy import ModeDefinition, pipeline, solid
 from dagster._seven import IS_WINDOWS, get_system_temp_directory
@@ -301,7 +303,11 @@ def test_simple_backfill():
         assert three.tags[PARTITION_NAME_TAG] == "three"
 
 
-def test_canceled_backfill():
+def test_canceled_backfill(monkeypatch):
+    # cancellation is checked between chunks of partitions, so submit one partition per chunk
+    monkeypatch.setattr(backfill_daemon, "CHECKPOINT_COUNT", 1)
+    monkeypatch.setattr(backfill_daemon, "CHECKPOINT_INTERVAL", 0)
+
     with instance_for_context(default_repo) as (
         instance,
         workspace,
@@ -336,6 +342,50 @@ def test_canceled_backfill():
         assert instance.get_runs_count() == 1
 
 
+def test_threaded_backfills():
+    with instance_for_context(default_repo) as (
+        instance,
+        workspace,
+        external_repo,
+    ):
+        external_partition_set = external_repo.get_external_partition_set("simple_partition_set")
+        for backfill_id in ["simple_a", "simple_b"]:
+            instance.add_backfill(
+                PartitionBackfill(
+                    backfill_id=backfill_id,
+                    partition_set_origin=external_partition_set.get_external_origin(),
+                    status=BulkActionStatus.REQUESTED,
+                    partition_names=["one", "two", "three"],
+                    from_failure=False,
+                    reexecution_steps=None,
+                    tags=None,
+                    backfill_timestamp=pendulum.now().timestamp(),
+                )
+            )
+        assert instance.get_runs_count() == 0
+
+        with ThreadPoolExecutor(max_workers=2) as threadpool_executor, ThreadPoolExecutor(
+            max_workers=2
+        ) as submit_threadpool_executor:
+            list(
+                execute_backfill_iteration(
+                    instance,
+                    workspace,
+                    get_default_daemon_logger("BackfillDaemon"),
+                    threadpool_executor=threadpool_executor,
+                    submit_threadpool_executor=submit_threadpool_executor,
+                )
+            )
+
+        assert instance.get_runs_count() == 6
+        for backfill_id in ["simple_a", "simple_b"]:
+            assert instance.get_backfill(backfill_id).status == BulkActionStatus.COMPLETED
+            runs = instance.get_runs(
+                RunsFilter(tags={BACKFILL_ID_TAG: backfill_id}),
+            )
+            assert {run.tags[PARTITION_NAME_TAG] for run in runs} == {"one", "two", "three"}
+
+
 def test_failure_backfill():
     output_file = _failure_flag_file()
     with instance_for_context(default_repo) as (
@@ -5,6 +5,7 @@
 import pytest
 from dagster_tests.api_tests.utils import get_foo_pipeline_handle
 
+from dagster import DagsterEvent, DagsterEventType
 from dagster._core.host_representation.repository_location import GrpcServerRepositoryLocation
 from dagster._core.storage.pipeline_run import IN_PROGRESS_RUN_STATUSES, PipelineRunStatus
 from dagster._core.storage.tags import PRIORITY_TAG
@@ -563,3 +564,93 @@ def test_key_limit_with_extra_tags(workspace, daemon):
 
         list(daemon.run_iteration(instance, workspace))
         assert get_run_ids(instance.run_launcher.queue()) == ["run-1"]
+
+
+def test_tag_limits_across_iterations(workspace, daemon):
+    with instance_for_queued_run_coordinator(
+        max_concurrent_runs=10,
+        tag_concurrency_limits=[{"key": "database", "value": "tiny", "limit": 1}],
+    ) as instance:
+        for i in range(3):
+            create_run(
+                instance,
+                run_id=f"tiny-{i}",
+                status=PipelineRunStatus.QUEUED,
+                tags={"database": "tiny"},
+            )
+
+        list(daemon.run_iteration(instance, workspace))
+        assert get_run_ids(instance.run_launcher.queue()) == ["tiny-0"]
+
+        instance.handle_run_event(
+            "tiny-0",
+            DagsterEvent(event_type_value=DagsterEventType.RUN_START.value, pipeline_name="foo"),
+        )
+
+        # still in progress, so the limit is still reached
+        list(daemon.run_iteration(instance, workspace))
+        assert get_run_ids(instance.run_launcher.queue()) == ["tiny-0"]
+
+        instance.handle_run_event(
+            "tiny-0",
+            DagsterEvent(event_type_value=DagsterEventType.RUN_SUCCESS.value, pipeline_name="foo"),
+        )
+
+        # the finished run no longer counts towards the limit
+        list(daemon.run_iteration(instance, workspace))
+        assert get_run_ids(instance.run_launcher.queue()) == ["tiny-0", "tiny-1"]
+
+
+def test_queued_runs_fetched_in_batches(workspace, daemon, monkeypatch):
+    monkeypatch.setattr(
+        "dagster._daemon.run_coordinator.queued_run_coordinator_daemon.RUN_FETCH_BATCH_SIZE", 2
+    )
+    with instance_for_queued_run_coordinator(max_concurrent_runs=4) as instance:
+        for i in range(7):
+            create_run(
+                instance,
+                run_id=f"queued-run-{i}",
+                status=PipelineRunStatus.QUEUED,
+                tags={PRIORITY_TAG: "1"} if i == 6 else {},
+            )
+
+        queue_reads = []
+        get_queued_run_ids = instance.get_queued_run_ids
+
+        def _get_queued_run_ids(cursor=None, limit=None):
+            queue_reads.append((cursor, limit))
+            return get_queued_run_ids(cursor=cursor, limit=limit)
+
+        monkeypatch.setattr(instance, "get_queued_run_ids", _get_queued_run_ids)
+
+        list(daemon.run_iteration(instance, workspace))
+        assert get_run_ids(instance.run_launcher.queue()) == [
+            "queued-run-6",
+            "queued-run-0",
+            "queued-run-1",
+            "queued-run-2",
+        ]
+
+        # the queue is only read up to the number of runs that can be launched
+        assert [limit for _, limit in queue_reads] == [2, 2]
+        assert queue_reads[0][0] is None
+
+
+def test_run_canceled_while_queue_page_launches(workspace, daemon):
+    with instance_for_queued_run_coordinator(max_concurrent_runs=10) as instance:
+        for i in range(3):
+            create_run(instance, run_id=f"queued-run-{i}", status=PipelineRunStatus.QUEUED)
+
+        launch_run = instance.launch_run
+
+        def _launch_run(run_id, workspace):
+            # the next run on the page is canceled while this one is launched
+            if run_id == "queued-run-0":
+                instance.report_run_canceled(instance.get_run_by_id("queued-run-1"))
+            return launch_run(run_id, workspace)
+
+        instance.launch_run = _launch_run
+
+        list(daemon.run_iteration(instance, workspace))
+        assert get_run_ids(instance.run_launcher.queue()) == ["queued-run-0", "queued-run-2"]
+        assert instance.get_run_by_id("queued-run-1").status == PipelineRunStatus.CANCELED
@@ -0,0 +1,120 @@
+"""Measures how quickly a parent process receives events from concurrent child processes, driving
+the child process iterators the way the multiprocess executor does.
+
+Most of the children are quiet, as if running long computations, and send a single event after
+--quiet-seconds. The rest are busy, each sending --events events. Compares each iterator polling
+its own child with a TICK timeout ("polling") against blocking once for all children in a
+ChildProcessEventWaiter ("waiter"), reporting how long the busy children's events took to arrive
+and the CPU time the parent spent.
+
+Usage:
+
+    python -m dagster_tests.execution_tests.engine_tests.benchmarks.bench_child_process_events \\
+        --children 8 32 64 --busy-children 4 --events 200
+"""
+import argparse
+import multiprocessing
+import time
+
+from dagster._core.executor.child_process_executor import (
+    ChildProcessCommand,
+    ChildProcessEventWaiter,
+    execute_child_process_command,
+)
+
+MODES = ["polling", "waiter"]
+
+
+class EmitEventsCommand(ChildProcessCommand):
+    def __init__(self, num_events, interval):
+        self.num_events = num_events
+        self.interval = interval
+
+    def execute(self):
+        for i in range(self.num_events):
+            if self.interval:
+                time.sleep(self.interval)
+            yield i
+
+
+class QuietCommand(ChildProcessCommand):
+    def __init__(self, seconds):
+        self.seconds = seconds
+
+    def execute(self):
+        time.sleep(self.seconds)
+        yield "done"
+
+
+def run_benchmark(mode, num_children, num_busy_children, num_events, interval, quiet_seconds):
+    multiproc_ctx = multiprocessing.get_context("fork")
+    event_waiter = ChildProcessEventWaiter() if mode == "waiter" else None
+
+    start = time.time()
+    start_cpu = time.process_time()
+    active_iters = {
+        i: execute_child_process_command(
+            multiproc_ctx,
+            EmitEventsCommand(num_events, interval)
+            if i < num_busy_children
+            else QuietCommand(quiet_seconds),
+            event_waiter,
+        )
+        for i in range(num_children)
+    }
+    busy_events = 0
+    busy_elapsed = None
+    while active_iters:
+        made_progress = False
+        for key, child_iter in list(active_iters.items()):
+            try:
+                event = next(child_iter)
+            except StopIteration:
+                del active_iters[key]
+                made_progress = True
+                continue
+
+            if event is not None:
+                made_progress = True
+                if isinstance(event, int):
+                    busy_events += 1
+                    if busy_events == num_busy_children * num_events:
+                        busy_elapsed = time.time() - start
+
+        if event_waiter and active_iters and not made_progress:
+            event_waiter.wait(timeout=1.0)
+
+    return busy_events, busy_elapsed, time.process_time() - start_cpu
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--children", type=int, nargs="+", default=[8, 32, 64])
+    parser.add_argument("--busy-children", type=int, default=4)
+    parser.add_argument("--events", type=int, default=200, help="Events sent by each busy child.")
+    parser.add_argument(
+        "--interval", type=float, default=0.001, help="Seconds busy children wait between events."
+    )
+    parser.add_argument("--quiet-seconds", type=float, default=5.0)
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=MODES)
+    args = parser.parse_args()
+
+    for num_children in args.children:
+        for mode in args.modes:
+            busy_events, busy_elapsed, cpu = run_benchmark(
+                mode,
+                num_children,
+                args.busy_children,
+                args.events,
+                args.interval,
+                args.quiet_seconds,
+            )
+            print(  # pylint: disable=print-call
+                f"{mode:>7} children={num_children:<3} {busy_events} busy events in "
+                f"{busy_elapsed:.2f}s ({busy_events / busy_elapsed:.0f} events/s), "
+                f"parent cpu {cpu:.2f}s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,7 @@
     ChildProcessCrashException,
     ChildProcessDoneEvent,
     ChildProcessEvent,
+    ChildProcessEventWaiter,
     ChildProcessStartEvent,
     ChildProcessSystemErrorEvent,
     execute_child_process_command,
@@ -103,6 +104,53 @@ def test_child_process_segfault():
     assert exc.value.exit_code == -11
 
 
+def _drive_with_waiter(commands):
+    event_waiter = ChildProcessEventWaiter()
+    active_iters = {
+        i: execute_child_process_command(multiprocessing, command, event_waiter)
+        for i, command in enumerate(commands)
+    }
+    events = {i: [] for i in active_iters}
+    crashes = {}
+    while active_iters:
+        made_progress = False
+        for key, child_iter in list(active_iters.items()):
+            try:
+                event = next(child_iter)
+            except StopIteration:
+                del active_iters[key]
+                made_progress = True
+                continue
+            except ChildProcessCrashException as crash:
+                del active_iters[key]
+                crashes[key] = crash.exit_code
+                made_progress = True
+                continue
+
+            if event is not None:
+                made_progress = True
+                if not isinstance(event, ChildProcessEvent):
+                    events[key].append(event)
+
+        if active_iters and not made_progress:
+            event_waiter.wait(timeout=5)
+
+    return events, crashes
+
+
+def test_child_process_event_waiter():
+    events, crashes = _drive_with_waiter(
+        [
+            DoubleAStringChildProcessCommand("aa"),
+            LongRunningCommand(),
+            CrashyCommand(),
+            DoubleAStringChildProcessCommand("bb"),
+        ]
+    )
+    assert events == {0: ["aaaa"], 1: [1], 2: [], 3: ["bbbb"]}
+    assert crashes == {2: 1}
+
+
 @pytest.mark.skip("too long")
 def test_long_running_command():
     list(execute_child_process_command(multiprocessing, LongRunningCommand()))
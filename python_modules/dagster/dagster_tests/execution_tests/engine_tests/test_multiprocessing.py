@@ -4,7 +4,16 @@
 
 import pytest
 
-from dagster import Failure, Field, MetadataEntry, Nothing, Output, String, reconstructable
+from dagster import (
+    DagsterEventType,
+    Failure,
+    Field,
+    MetadataEntry,
+    Nothing,
+    Output,
+    String,
+    reconstructable,
+)
 from dagster._core.errors import DagsterUnmetExecutorRequirementsError
 from dagster._core.instance import DagsterInstance
 from dagster._core.storage.compute_log_manager import ComputeIOType
@@ -505,3 +514,93 @@ def test_crash_hard_multiprocessing():
         #     ).data
         #     is None
         # )
+
+
+def _worker_pids_by_step(result):
+    return {
+        event.step_key: next(
+            entry.value.text
+            for entry in event.event_specific_data.metadata_entries
+            if entry.label == "pid"
+        )
+        for event in result.event_list
+        if event.event_type == DagsterEventType.STEP_WORKER_STARTED
+    }
+
+
+def test_worker_pool_execution():
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            reconstructable(define_diamond_pipeline),
+            run_config={
+                "execution": {
+                    "multiprocess": {
+                        "config": {"max_concurrent": 1, "worker_pool": {"enabled": True}}
+                    }
+                },
+            },
+            instance=instance,
+        )
+        assert result.success
+        assert result.result_for_solid("adder").output_value() == 11
+
+        # every step ran in the same warm worker
+        worker_pids = _worker_pids_by_step(result)
+        assert len(worker_pids) == 4
+        assert len(set(worker_pids.values())) == 1
+        assert str(os.getpid()) not in worker_pids.values()
+
+
+def test_worker_pool_max_steps_per_worker():
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            reconstructable(define_diamond_pipeline),
+            run_config={
+                "execution": {
+                    "multiprocess": {
+                        "config": {
+                            "max_concurrent": 1,
+                            "worker_pool": {"enabled": True, "max_steps_per_worker": 2},
+                        }
+                    }
+                },
+            },
+            instance=instance,
+        )
+        assert result.success
+
+        worker_pids = _worker_pids_by_step(result)
+        assert len(worker_pids) == 4
+        assert len(set(worker_pids.values())) == 2
+
+
+def test_worker_pool_failure():
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            reconstructable(failure),
+            run_config={
+                "execution": {"multiprocess": {"config": {"worker_pool": {"enabled": True}}}},
+            },
+            instance=instance,
+            raise_on_error=False,
+        )
+        assert not result.success
+        failure_data = result.result_for_solid("throw").failure_data
+        assert failure_data.error.cls_name == "Failure"
+        assert failure_data.user_failure_data.label == "intentional-failure"
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Different crash output on Windows: See issue #2791")
+def test_worker_pool_crash():
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            reconstructable(sys_exit_pipeline),
+            run_config={
+                "execution": {"multiprocess": {"config": {"worker_pool": {"enabled": True}}}},
+            },
+            instance=instance,
+            raise_on_error=False,
+        )
+        assert not result.success
+        failure_data = result.result_for_solid("sys_exit").failure_data
+        assert failure_data.error.cls_name == "ChildProcessCrashException"
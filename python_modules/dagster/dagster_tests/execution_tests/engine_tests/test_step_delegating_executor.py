@@ -116,6 +116,22 @@ def test_execute():
     assert TestStepHandler.verify_step_count == 0
 
 
+def test_execute_wakes_on_step_events():
+    TestStepHandler.reset()
+    with instance_for_test() as instance:
+        start_time = time.time()
+        result = execute_pipeline(
+            reconstructable(foo_job),
+            instance=instance,
+            run_config={"execution": {"config": {"sleep_seconds": 60.0}}},
+        )
+        TestStepHandler.wait_for_processes()
+
+    assert result.success
+    # the executor picks up step events as they are written rather than after sleep_seconds
+    assert time.time() - start_time < 60
+
+
 def test_skip_execute():
     from .test_jobs import define_dynamic_skipping_job
 
@@ -173,6 +173,63 @@ def test_failing_execution_plan():
         assert active_execution.is_complete
 
 
+def _execute_active_step(active_execution, step_key):
+    # vend any newly executable steps, so that step_key is in flight
+    active_execution.get_steps_to_execute()
+    active_execution.mark_step_produced_output(StepOutputHandle(step_key, "result"))
+    active_execution.mark_success(step_key)
+
+
+def test_release_outputs_active_execution():
+    plan = create_execution_plan(define_diamond_pipeline())
+
+    with plan.start(retry_mode=RetryMode.DISABLED, release_outputs=True) as active_execution:
+        _execute_active_step(active_execution, "return_two")
+        assert active_execution.get_outputs_to_release() == []
+
+        _execute_active_step(active_execution, "add_three")
+        # still needed by mult_three
+        assert active_execution.get_outputs_to_release() == []
+
+        _execute_active_step(active_execution, "mult_three")
+        assert active_execution.get_outputs_to_release() == [
+            StepOutputHandle("return_two", "result")
+        ]
+        assert active_execution.get_outputs_to_release() == []
+
+        _execute_active_step(active_execution, "adder")
+        # the output of adder is not consumed by any step, so is kept
+        assert set(active_execution.get_outputs_to_release()) == {
+            StepOutputHandle("add_three", "result"),
+            StepOutputHandle("mult_three", "result"),
+        }
+        assert active_execution.is_complete
+
+    with plan.start(retry_mode=RetryMode.DISABLED) as active_execution:
+        for step_key in ["return_two", "add_three", "mult_three", "adder"]:
+            _execute_active_step(active_execution, step_key)
+            assert active_execution.get_outputs_to_release() == []
+
+
+def test_release_outputs_failing_active_execution():
+    plan = create_execution_plan(define_diamond_pipeline())
+
+    with plan.start(retry_mode=RetryMode.DISABLED, release_outputs=True) as active_execution:
+        _execute_active_step(active_execution, "return_two")
+        _execute_active_step(active_execution, "add_three")
+
+        active_execution.get_steps_to_execute()
+        active_execution.mark_failed("mult_three")
+
+        steps = active_execution.get_steps_to_abandon()
+        assert [step.key for step in steps] == ["adder"]
+        active_execution.mark_abandoned("adder")
+
+        # kept for the failed and abandoned steps to be re-executed
+        assert active_execution.get_outputs_to_release() == []
+        assert active_execution.is_complete
+
+
 def test_retries_active_execution():
     pipeline_def = define_diamond_pipeline()
     plan = create_execution_plan(pipeline_def)
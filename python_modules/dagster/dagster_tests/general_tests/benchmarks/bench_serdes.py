@@ -0,0 +1,122 @@
+"""Measures serializing and deserializing snapshots of a repository of wide jobs and the event log
+of a run, comparing serdes with the walk that tracks descent paths for every value.
+
+Usage:
+
+    python -m dagster_tests.general_tests.benchmarks.bench_serdes --ops 500 --iterations 5
+"""
+import argparse
+import time
+
+from dagster import DagsterInstance, In, Nothing, job, op, repository
+from dagster._core.host_representation.external_data import external_repository_data_from_def
+from dagster._serdes.serdes import (
+    _WHITELIST_MAP,
+    _pack_inner_value_with_path,
+    _root,
+    _unpack_inner_value_with_path,
+    deserialize_json_to_dagster_namedtuple,
+    pack_value,
+    serialize_dagster_namedtuple,
+    unpack_value,
+)
+from dagster._seven import json
+
+
+@op
+def root():
+    pass
+
+
+@op(ins={"start": In(Nothing)})
+def node():
+    pass
+
+
+def define_wide_job(name, num_ops):
+    @job(name=name)
+    def wide_job():
+        start = root()
+        for i in range(num_ops - 1):
+            node.alias(f"node_{i}")(start)
+
+    return wide_job
+
+
+def define_snapshots(num_ops):
+    """A repository snapshot and the event log entries of one run of its first job."""
+    jobs = [define_wide_job(f"wide_{i}", num_ops) for i in range(3)]
+
+    @repository
+    def bench_repo():
+        return jobs
+
+    with DagsterInstance.ephemeral() as instance:
+        result = jobs[0].execute_in_process(instance=instance)
+        event_log_entries = instance.all_logs(result.run_id)
+
+    return {
+        "repository": external_repository_data_from_def(bench_repo),
+        "event_log": event_log_entries,
+    }
+
+
+def _time(fn, iterations):
+    start = time.time()
+    for _ in range(iterations):
+        fn()
+    return (time.time() - start) / iterations
+
+
+def run_benchmark(snapshot, iterations):
+    values = snapshot if isinstance(snapshot, list) else [snapshot]
+    json_strs = [serialize_dagster_namedtuple(value) for value in values]
+
+    for value, json_str in zip(values, json_strs):
+        tracked = json.dumps(_pack_inner_value_with_path(value, _WHITELIST_MAP, _root(value)))
+        assert json_str == tracked, "serdes output differs from the descent path walk"
+
+    def _unpack_tracked():
+        for json_str in json_strs:
+            packed = json.loads(json_str)
+            _unpack_inner_value_with_path(packed, _WHITELIST_MAP, _root(packed))
+
+    return {
+        "pack": _time(lambda: [pack_value(value) for value in values], iterations),
+        "pack (tracked)": _time(
+            lambda: [
+                _pack_inner_value_with_path(value, _WHITELIST_MAP, _root(value)) for value in values
+            ],
+            iterations,
+        ),
+        "serialize": _time(
+            lambda: [serialize_dagster_namedtuple(value) for value in values], iterations
+        ),
+        "unpack": _time(
+            lambda: [unpack_value(json.loads(json_str)) for json_str in json_strs], iterations
+        ),
+        "unpack (tracked)": _time(_unpack_tracked, iterations),
+        "deserialize": _time(
+            lambda: [deserialize_json_to_dagster_namedtuple(json_str) for json_str in json_strs],
+            iterations,
+        ),
+    }, sum(len(json_str) for json_str in json_strs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--ops", type=int, default=500)
+    parser.add_argument("--iterations", type=int, default=5)
+    args = parser.parse_args()
+
+    for name, snapshot in define_snapshots(args.ops).items():
+        timings, num_bytes = run_benchmark(snapshot, args.iterations)
+        for operation, elapsed in timings.items():
+            print(  # pylint: disable=print-call
+                f"{name:>10} {operation:<16} {num_bytes} bytes in {elapsed:.3f}s "
+                f"({num_bytes / elapsed / 1e6:.1f} MB/s)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -14,7 +14,7 @@
 
 from dagster import AssetKey, AssetMaterialization, Output
 from dagster import _check as check
-from dagster import file_relative_path, job
+from dagster import file_relative_path, job, op
 from dagster._cli.debug import DebugRunPayload
 from dagster._core.definitions.dependency import NodeHandle
 from dagster._core.events import DagsterEvent
@@ -26,7 +26,11 @@
 from dagster._core.storage.event_log.sql_event_log import SqlEventLogStorage
 from dagster._core.storage.migration.utils import upgrading_instance
 from dagster._core.storage.pipeline_run import DagsterRun, DagsterRunStatus, RunsFilter
-from dagster._core.storage.tags import REPOSITORY_LABEL_TAG
+from dagster._core.storage.tags import (
+    PARTITION_NAME_TAG,
+    PARTITION_SET_TAG,
+    REPOSITORY_LABEL_TAG,
+)
 from dagster._legacy import execute_pipeline, pipeline, solid
 from dagster._serdes import DefaultNamedTupleSerializer, create_snapshot_id
 from dagster._serdes.serdes import (
@@ -1015,3 +1019,101 @@ def test_add_kvs_table():
 
             assert not "kvs" in get_sqlite3_tables(db_path)
             assert get_sqlite3_indexes(db_path, "kvs") == []
+
+
+def test_add_asset_partitions_table():
+    src_dir = file_relative_path(__file__, "snapshot_0_14_16_bulk_actions_columns/sqlite")
+
+    @op
+    def asset_op():
+        yield AssetMaterialization(asset_key=AssetKey(["a"]), partition="partition_1")
+        yield AssetMaterialization(asset_key=AssetKey(["a"]), partition="partition_2")
+        yield Output(1)
+
+    @job
+    def asset_job():
+        asset_op()
+
+    with copy_directory(src_dir) as test_dir:
+        db_path = os.path.join(test_dir, "history", "runs", "index.db")
+
+        with DagsterInstance.from_ref(InstanceRef.from_dir(test_dir)) as instance:
+            assert "asset_partitions" not in get_sqlite3_tables(db_path)
+
+            # materializations are stored, and read without the index, before the upgrade
+            asset_job.execute_in_process(instance=instance)
+            latest = instance.get_latest_materialization_by_partition(AssetKey(["a"]))
+            assert set(latest.keys()) == {"partition_1", "partition_2"}
+
+            instance.upgrade()
+
+            assert "asset_partitions" in get_sqlite3_tables(db_path)
+            assert get_sqlite3_indexes(db_path, "asset_partitions") == ["idx_asset_partitions"]
+            assert instance._event_storage.has_secondary_index("asset_partitions_index")
+            assert instance.get_latest_materialization_by_partition(AssetKey(["a"])) == latest
+
+            result = asset_job.execute_in_process(instance=instance)
+            latest = instance.get_latest_materialization_by_partition(
+                AssetKey(["a"]), ["partition_1"]
+            )
+            assert list(latest.keys()) == ["partition_1"]
+            assert latest["partition_1"].event_log_entry.run_id == result.run_id
+
+            instance._event_storage._alembic_downgrade(rev="5e139331e376")
+
+            assert "asset_partitions" not in get_sqlite3_tables(db_path)
+            assert not instance._event_storage.has_secondary_index("asset_partitions_index")
+
+
+def test_add_partition_statuses_table():
+    src_dir = file_relative_path(__file__, "snapshot_0_14_16_bulk_actions_columns/sqlite")
+
+    @solid
+    def noop_solid():
+        pass
+
+    @pipeline
+    def partitioned_pipeline():
+        noop_solid()
+
+    def _partition_tags(partition):
+        return {
+            PARTITION_NAME_TAG: partition,
+            PARTITION_SET_TAG: "partitioned_pipeline_partition_set",
+            REPOSITORY_LABEL_TAG: "repo@location",
+        }
+
+    with copy_directory(src_dir) as test_dir:
+        db_path = os.path.join(test_dir, "history", "runs.db")
+
+        with DagsterInstance.from_ref(InstanceRef.from_dir(test_dir)) as instance:
+            assert "partition_statuses" not in get_sqlite3_tables(db_path)
+
+            execute_pipeline(partitioned_pipeline, instance=instance, tags=_partition_tags("a"))
+            result = execute_pipeline(
+                partitioned_pipeline, instance=instance, tags=_partition_tags("a")
+            )
+
+            instance.upgrade()
+
+            assert "partition_statuses" in get_sqlite3_tables(db_path)
+            assert instance._run_storage.has_built_index("partition_statuses")
+
+            # the table is backfilled with the latest run for each partition
+            partition_data = instance.run_storage.get_latest_run_partition_data(
+                pipeline_name="partitioned_pipeline", repository_label="repo@location"
+            )
+            assert len(partition_data) == 1
+            assert partition_data[0].run_id == result.run_id
+            assert partition_data[0].status == DagsterRunStatus.SUCCESS
+
+            execute_pipeline(partitioned_pipeline, instance=instance, tags=_partition_tags("b"))
+            partition_data = instance.run_storage.get_latest_run_partition_data(
+                pipeline_name="partitioned_pipeline", repository_label="repo@location"
+            )
+            assert {data.partition for data in partition_data} == {"a", "b"}
+
+            instance._run_storage._alembic_downgrade(rev="b4f47d573dcd")
+
+            assert "partition_statuses" not in get_sqlite3_tables(db_path)
+            assert not instance._run_storage.has_built_index("partition_statuses")
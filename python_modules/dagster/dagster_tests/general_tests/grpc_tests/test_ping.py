@@ -189,3 +189,29 @@ def test_detect_server_restart():
         interrupt_ipc_subprocess_pid(server_process.pid)
 
     assert server_id_one != server_id_two
+
+
+def test_clients_share_channel():
+    port, server_process = create_server_process()
+    try:
+        api_client = DagsterGrpcClient(port=port)
+        other_api_client = DagsterGrpcClient(port=port)
+        assert api_client.ping("foo") == "foo"
+        # pylint: disable=protected-access
+        with api_client._channel() as channel, other_api_client._channel() as other_channel:
+            assert channel is other_channel
+    finally:
+        interrupt_ipc_subprocess_pid(server_process.pid)
+
+    seven.wait_for_process(server_process, timeout=5)
+    with pytest.raises(DagsterUserCodeUnreachableError):
+        api_client.ping("foo")
+
+    # the broken channel is replaced, so the client reconnects once the server is back up
+    server_process = open_server_process(port=port, socket=None)
+    try:
+        assert api_client.ping("foo") == "foo"
+        with api_client._channel() as new_channel:  # pylint: disable=protected-access
+            assert new_channel is not channel
+    finally:
+        interrupt_ipc_subprocess_pid(server_process.pid)
@@ -2,7 +2,7 @@
 import string
 from collections import namedtuple
 from enum import Enum
-from typing import NamedTuple, Set
+from typing import List, NamedTuple, Optional, Set
 
 import pytest
 
@@ -15,7 +15,9 @@
     EnumSerializer,
     WhitelistMap,
     _deserialize_json,
+    _pack_inner_value_with_path,
     _serialize_dagster_namedtuple,
+    _unpack_inner_value_with_path,
     _whitelist_for_serdes,
     deserialize_json_to_dagster_namedtuple,
     deserialize_value,
@@ -718,3 +720,97 @@ class Thing(NamedTuple):  # pylint: disable=unused-variable
 
     assert wmap.get_serialized_name("Thing") == "SerializedThing"
     assert wmap.get_deserialized_name("SerializedThing") == "Thing"
+
+
+def test_compiled_serdes_matches_descent_path_walk():
+    test_map = WhitelistMap.create()
+
+    @_whitelist_for_serdes(whitelist_map=test_map)
+    class Color(Enum):
+        RED = "red"
+
+    class SkipSerializer(DefaultNamedTupleSerializer):
+        @classmethod
+        def skip_when_empty(cls):
+            return {"skipped"}
+
+    @_whitelist_for_serdes(whitelist_map=test_map, serializer=SkipSerializer, storage_name="Old")
+    class Inner(NamedTuple):
+        color: Color
+        tags: Optional[frozenset]
+        skipped: Optional[List[int]] = None
+
+    class RenameSerializer(DefaultNamedTupleSerializer):
+        @classmethod
+        def value_to_storage_dict(cls, value, whitelist_map, descent_path):
+            return {
+                "__class__": "Outer",
+                "inners": pack_inner_value(value.inners, whitelist_map, f"{descent_path}.inners"),
+            }
+
+    @_whitelist_for_serdes(whitelist_map=test_map, serializer=RenameSerializer)
+    class Outer(NamedTuple):
+        inners: list
+
+    value = {
+        "outer": Outer([Inner(Color.RED, frozenset(["b", "a"])), Inner(Color.RED, None, [1])]),
+        "set": {3, 1, 2},
+    }
+
+    packed = pack_inner_value(value, test_map, "")
+    assert packed == _pack_inner_value_with_path(value, test_map, "")
+    assert packed["outer"]["inners"][0] == {
+        "color": {"__enum__": "Color.RED"},
+        "tags": {"__frozenset__": ["a", "b"]},
+        "__class__": "Old",
+    }
+
+    assert unpack_inner_value(packed, test_map, "") == value
+    assert unpack_inner_value(packed, test_map, "") == _unpack_inner_value_with_path(
+        packed, test_map, ""
+    )
+
+
+def test_compiled_serdes_descent_path_through_serializer():
+    test_map = WhitelistMap.create()
+
+    class Unregistered(NamedTuple):
+        num: int
+
+    class FieldsSerializer(DefaultNamedTupleSerializer):
+        @classmethod
+        def value_to_storage_dict(cls, value, whitelist_map, descent_path):
+            return {
+                "__class__": "Holder",
+                "held": pack_inner_value(value.held, whitelist_map, f"{descent_path}.held"),
+            }
+
+    @_whitelist_for_serdes(whitelist_map=test_map, serializer=FieldsSerializer)
+    class Holder(NamedTuple):
+        held: dict
+
+    with pytest.raises(SerializationError, match=re.escape("Descent path: <root:list>[1].held.c")):
+        _serialize_dagster_namedtuple(
+            [Holder({}), Holder({"c": Unregistered(1)})], whitelist_map=test_map
+        )
+
+
+def test_compiled_serdes_updates_with_whitelist():
+    test_map = WhitelistMap.create()
+
+    @_whitelist_for_serdes(whitelist_map=test_map)
+    class Thing(NamedTuple):
+        name: str
+
+    serialized = _serialize_dagster_namedtuple(Thing("foo"), test_map)
+    assert _seven.json.loads(serialized)["__class__"] == "Thing"
+    assert _deserialize_json(serialized, test_map) == Thing("foo")
+
+    test_map.register_serialized_name("Thing", "SerializedThing")
+    assert _seven.json.loads(_serialize_dagster_namedtuple(Thing("foo"), test_map)) == {
+        "__class__": "SerializedThing",
+        "name": "foo",
+    }
+
+    register_serdes_tuple_fallbacks({"Thing": None}, whitelist_map=test_map)
+    assert _deserialize_json(serialized, test_map) is None
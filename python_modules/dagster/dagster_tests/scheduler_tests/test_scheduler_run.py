@@ -2,9 +2,11 @@
 import random
 import string
 import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 
 import pendulum
+import pytest
 
 from dagster import (
     Any,
@@ -1258,6 +1260,70 @@ def test_bad_schedules_mixed_with_good_schedule(instance, workspace, external_re
         assert len(unloadable_ticks) == 0
 
 
+@pytest.mark.parametrize("max_workers_per_location", [None, 1])
+def test_bad_schedules_mixed_with_good_schedule_threaded(
+    instance, workspace, external_repo, max_workers_per_location
+):
+    good_schedule = external_repo.get_external_schedule("simple_schedule")
+    other_good_schedule = external_repo.get_external_schedule("simple_hourly_schedule")
+    bad_schedule = external_repo.get_external_schedule("bad_should_execute_schedule_on_odd_days")
+
+    initial_datetime = create_pendulum_time(
+        year=2019,
+        month=2,
+        day=27,
+        hour=0,
+        minute=0,
+        second=0,
+    )
+    with pendulum.test(initial_datetime):
+        instance.start_schedule(good_schedule)
+        instance.start_schedule(other_good_schedule)
+        instance.start_schedule(bad_schedule)
+
+        with ThreadPoolExecutor(max_workers=4) as threadpool_executor:
+            errors = [
+                error
+                for error in launch_scheduled_runs(
+                    instance,
+                    workspace,
+                    logger(),
+                    pendulum.now("UTC"),
+                    threadpool_executor=threadpool_executor,
+                    max_workers_per_location=max_workers_per_location,
+                )
+                if error
+            ]
+
+        # the failing schedule does not affect the others
+        assert len(errors) == 1
+        assert "bad_should_execute_schedule_on_odd_days" in errors[0].message
+
+        assert instance.get_runs_count() == 2
+        wait_for_all_runs_to_start(instance)
+
+        for external_schedule in [good_schedule, other_good_schedule]:
+            ticks = instance.get_ticks(
+                external_schedule.get_external_origin_id(), external_schedule.selector_id
+            )
+            assert len(ticks) == 1
+            runs = instance.get_runs(filters=RunsFilter.for_schedule(external_schedule))
+            assert len(runs) == 1
+            validate_tick(
+                ticks[0],
+                external_schedule,
+                initial_datetime,
+                TickStatus.SUCCESS,
+                [runs[0].run_id],
+            )
+
+        bad_ticks = instance.get_ticks(
+            bad_schedule.get_external_origin_id(), bad_schedule.selector_id
+        )
+        assert len(bad_ticks) == 1
+        assert bad_ticks[0].status == TickStatus.FAILURE
+
+
 def test_run_scheduled_on_time_boundary(instance, workspace, external_repo):
     external_schedule = external_repo.get_external_schedule("simple_schedule")
 
@@ -1,5 +1,6 @@
 import io
 import pickle
+from concurrent.futures import ThreadPoolExecutor
 from typing import Sequence, Union
 
 from dagster import (
@@ -14,6 +15,9 @@
 from dagster import io_manager
 from dagster._utils import PICKLE_PROTOCOL
 
+# the maximum number of concurrent requests made to S3 when checking for outputs in a batch
+HAS_OUTPUTS_MAX_WORKERS = 16
+
 
 class PickledObjectS3IOManager(MemoizableIOManager):
     def __init__(
@@ -40,6 +44,17 @@ def has_output(self, context):
         key = self._get_path(context)
         return self._has_object(key)
 
+    def has_outputs(self, contexts):
+        keys = [self._get_path(context) for context in contexts]
+        if len(keys) <= 1:
+            return [self._has_object(key) for key in keys]
+
+        with ThreadPoolExecutor(
+            max_workers=min(len(keys), HAS_OUTPUTS_MAX_WORKERS),
+            thread_name_prefix="s3_has_outputs",
+        ) as executor:
+            return list(executor.map(self._has_object, keys))
+
     def _rm_object(self, key):
         check.str_param(key, "key")
         check.param_invariant(len(key) > 0, "key")
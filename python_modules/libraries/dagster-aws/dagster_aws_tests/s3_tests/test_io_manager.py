@@ -1,4 +1,4 @@
-from dagster_aws.s3.io_manager import s3_pickle_io_manager
+from dagster_aws.s3.io_manager import PickledObjectS3IOManager, s3_pickle_io_manager
 from dagster_aws.s3.utils import construct_s3_client
 
 from dagster import (
@@ -11,6 +11,7 @@
     StaticPartitionsDefinition,
     VersionStrategy,
     asset,
+    build_output_context,
     graph,
     job,
     materialize,
@@ -126,6 +127,24 @@ def memoized():
         assert len(result.all_node_events) == 0
 
 
+def test_s3_io_manager_has_outputs(mock_s3_bucket):
+    manager = PickledObjectS3IOManager(
+        s3_bucket=mock_s3_bucket.name,
+        s3_session=construct_s3_client(max_attempts=5),
+        s3_prefix="dagster",
+    )
+    contexts = [
+        build_output_context(step_key=f"op_{i}", name="result", version="foo") for i in range(20)
+    ]
+    for context in contexts[::2]:
+        key = manager._get_path(context)  # pylint: disable=protected-access
+        mock_s3_bucket.put_object(Key=key, Body=b"foo")
+
+    assert manager.has_outputs(contexts) == [i % 2 == 0 for i in range(20)]
+    assert manager.has_outputs(contexts[1:2]) == [False]
+    assert manager.has_outputs([]) == []
+
+
 def define_assets_job(bucket):
     @op
     def first_op(first_input):
@@ -1,3 +1,5 @@
+import time
+
 import dask
 import dask.distributed
 
@@ -7,16 +9,22 @@
 from dagster._core.definitions.executor_definition import executor
 from dagster._core.errors import raise_execution_interrupts
 from dagster._core.events import DagsterEvent
-from dagster._core.execution.api import create_execution_plan, execute_plan
+from dagster._core.execution.api import create_execution_plan, execute_plan_iterator
 from dagster._core.execution.context.system import PlanOrchestrationContext
 from dagster._core.execution.plan.plan import ExecutionPlan
 from dagster._core.execution.retries import RetryMode
 from dagster._core.instance import DagsterInstance
+from dagster._serdes import deserialize_as, serialize_dagster_namedtuple
 from dagster._utils import frozentags, iterate_with_context
 
+from .io_manager import unpublish_datasets_for_run
+
 # Dask resource requirements are specified under this key
 DASK_RESOURCE_REQUIREMENTS_KEY = "dagster-dask/resource_requirements"
 
+# How often the executor collects the events that steps have streamed back from the workers
+EVENT_POLL_INTERVAL_SECONDS = 0.1
+
 
 @executor(
     name="dask",
@@ -115,9 +123,13 @@ def query_on_dask_worker(
     mode,
     instance_ref,
     known_state,
+    event_queue_name=None,
 ):  # pylint: disable=unused-argument
     """Note that we need to pass "dependencies" to ensure Dask sequences futures during task
     scheduling, even though we do not use this argument within the function.
+
+    If an event queue name is given, each event is put on that Dask queue as soon as it happens,
+    rather than returned when the step has finished.
     """
 
     with DagsterInstance.from_ref(instance_ref) as instance:
@@ -133,9 +145,21 @@ def query_on_dask_worker(
             known_state=known_state,
         )
 
-        return execute_plan(
-            execution_plan, subset_pipeline, instance, pipeline_run, run_config=run_config
+        events = execute_plan_iterator(
+            execution_plan, subset_pipeline, pipeline_run, instance, run_config=run_config
         )
+        if event_queue_name is None:
+            return list(events)
+
+        event_queue = dask.distributed.Queue(event_queue_name)
+        try:
+            for event in events:
+                # Dask queues don't preserve namedtuples, so send the serialized event
+                event_queue.put(serialize_dagster_namedtuple(event))
+        finally:
+            # the scheduler only drops the queue once every client that created it released it
+            event_queue.close()
+        return []
 
 
 def get_dask_resource_requirements(tags):
@@ -147,6 +171,27 @@ def get_dask_resource_requirements(tags):
     return {}
 
 
+def _stream_step_events(event_queue, execution_futures):
+    """Yields the events that the steps put on the event queue until every step has finished,
+    raising the error of any step that failed."""
+    pending_futures = set(execution_futures)
+    while pending_futures:
+        # A step puts all of its events on the queue before its future finishes, so check which
+        # futures are done before collecting the events
+        done_futures = {future for future in pending_futures if future.done()}
+
+        for serialized_event in event_queue.get(batch=True):
+            yield deserialize_as(serialized_event, DagsterEvent)
+
+        for future in done_futures:
+            # raises the error if the step failed
+            future.result()
+        pending_futures -= done_futures
+
+        if pending_futures:
+            time.sleep(EVENT_POLL_INTERVAL_SECONDS)
+
+
 class DaskExecutor(Executor):
     def __init__(self, cluster_type, cluster_configuration):
         self.cluster_type = check.opt_str_param(cluster_type, "cluster_type", default="local")
@@ -228,6 +273,9 @@ def execute(self, plan_context, execution_plan):
             )
 
         with dask.distributed.Client(cluster) as client:
+            event_queue_name = f"dagster-events-{plan_context.run_id}"
+            event_queue = dask.distributed.Queue(event_queue_name, client=client)
+
             execution_futures = []
             execution_futures_dict = {}
 
@@ -259,6 +307,7 @@ def execute(self, plan_context, execution_plan):
                         plan_context.pipeline_run.mode,
                         instance.get_ref(),
                         execution_plan.known_state,
+                        event_queue_name,
                         key=dask_task_name,
                         resources=get_dask_resource_requirements(step.tags),
                     )
@@ -266,15 +315,17 @@ def execute(self, plan_context, execution_plan):
                     execution_futures.append(future)
                     execution_futures_dict[step.key] = future
 
-            # This tells Dask to awaits the step executions and retrieve their results to the
-            # master
-            futures = dask.distributed.as_completed(execution_futures, with_results=True)
-
-            # Allow interrupts while waiting for the results from Dask
-            for future, result in iterate_with_context(raise_execution_interrupts, futures):
-                for step_event in result:
+            try:
+                # Allow interrupts while waiting for events from Dask
+                for step_event in iterate_with_context(
+                    raise_execution_interrupts,
+                    _stream_step_events(event_queue, execution_futures),
+                ):
                     check.inst(step_event, DagsterEvent)
                     yield step_event
+            finally:
+                event_queue.close()
+                unpublish_datasets_for_run(client, plan_context.run_id)
 
     def build_dict(self, pipeline_name):
         """Returns a dict we can use for kwargs passed to dask client instantiation.
@@ -0,0 +1,85 @@
+from typing import Optional, Sequence
+
+from dask.distributed import Client, get_client, get_worker
+
+from dagster import IOManager, OutputContext, io_manager
+
+# Outputs are published as Dask datasets under this prefix, followed by the id of the run that
+# produced them and the step output
+DATASET_PREFIX = "dagster"
+
+
+def _dataset_name(identifier: Sequence[str]) -> str:
+    return "/".join([DATASET_PREFIX, *identifier])
+
+
+def _dataset_name_for_output(context: OutputContext) -> str:
+    # Unlike OutputContext.get_identifier, the run id is kept for versioned outputs too, so that
+    # every output is released with the run that produced it
+    identifier = [context.run_id, context.step_key, context.name]
+    if context.mapping_key:
+        identifier.append(context.mapping_key)
+    return _dataset_name(identifier)
+
+
+def _local_worker_addresses() -> Optional[Sequence[str]]:
+    try:
+        return [get_worker().address]
+    except ValueError:
+        # not running in a Dask worker, so let the scheduler place the data
+        return None
+
+
+def unpublish_datasets_for_run(client: Client, run_id: str):
+    """Releases the outputs of a run that were kept in the Dask cluster."""
+    run_prefix = _dataset_name([run_id]) + "/"
+    for name in client.list_datasets():
+        if name.startswith(run_prefix):
+            client.unpublish_dataset(name)
+
+
+class DaskFuturesIOManager(IOManager):
+    def handle_output(self, context, obj):
+        client = get_client()
+        name = _dataset_name_for_output(context)
+
+        # Scatter a list so that collections are kept as a single value rather than scattered
+        # element by element
+        (future,) = client.scatter([obj], workers=_local_worker_addresses())
+
+        try:
+            client.publish_dataset(future, name=name)
+        except KeyError:
+            # The step is being retried. Unpublish the output of the previous attempt rather than
+            # overriding it, which would keep its data on the cluster.
+            client.unpublish_dataset(name)
+            client.publish_dataset(future, name=name)
+
+    def load_input(self, context):
+        client = get_client()
+        return client.get_dataset(_dataset_name_for_output(context.upstream_output)).result()
+
+
+@io_manager(description="IO manager that keeps op outputs in the memory of the Dask cluster.")
+def dask_futures_io_manager(_):
+    """IO manager that keeps op outputs in the memory of the Dask workers that computed them, as
+    Dask futures, instead of writing them to persistent storage.
+
+    Downstream steps read their inputs directly from the workers that hold them, and steps that
+    run on the same worker as their inputs use them without any transfer. It must be used with the
+    :py:func:`dask_executor`, which releases the outputs of a run when it finishes, so outputs can
+    not be loaded after the run, for example when re-executing it.
+
+    .. code-block:: python
+
+        from dagster import job
+        from dagster_dask import dask_executor, dask_futures_io_manager
+
+        @job(
+            executor_def=dask_executor,
+            resource_defs={"io_manager": dask_futures_io_manager},
+        )
+        def dask_enabled_job():
+            ...
+    """
+    return DaskFuturesIOManager()
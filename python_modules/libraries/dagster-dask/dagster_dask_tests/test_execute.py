@@ -1,16 +1,20 @@
 import asyncio
+import os
 import tempfile
 import time
 from threading import Thread
 
 import dagster_pandas as dagster_pd
 import pytest
-from dagster_dask import DataFrame, dask_executor
-from dask.distributed import Scheduler, Worker
+from dagster_dask import DataFrame, dask_executor, dask_futures_io_manager
+from dagster_dask.io_manager import DaskFuturesIOManager, unpublish_datasets_for_run
+from dask.distributed import Client, LocalCluster, Scheduler, Worker
 
 from dagster import (
     DagsterUnmetExecutorRequirementsError,
     VersionStrategy,
+    build_input_context,
+    build_output_context,
     file_relative_path,
     fs_io_manager,
     job,
@@ -20,6 +24,7 @@
 from dagster._core.definitions.executor_definition import default_executors
 from dagster._core.definitions.reconstruct import ReconstructablePipeline
 from dagster._core.events import DagsterEventType
+from dagster._core.storage.tags import MEMOIZED_RUN_TAG
 from dagster._core.test_utils import instance_for_test, nesting_composite_pipeline
 from dagster._legacy import (
     InputDefinition,
@@ -337,3 +342,150 @@ def test_dask_executor_job():
         )
         assert result.success
         assert result.output_for_solid("the_op") == 5
+
+
+@op(config_schema={"flag_path": str})
+def wait_for_flag_op(context):
+    # only finishes once the test has seen the step start, which requires events to be streamed
+    # from the worker while the step is running
+    start_time = time.time()
+    while not os.path.exists(context.op_config["flag_path"]):
+        time.sleep(0.1)
+        if time.time() - start_time > 60:
+            raise Exception("Timed out")
+
+
+@job(executor_def=dask_executor)
+def wait_for_flag_job():
+    wait_for_flag_op()
+
+
+def test_dask_executor_streams_events():
+    with tempfile.TemporaryDirectory() as tempdir:
+        flag_path = os.path.join(tempdir, "flag")
+        with instance_for_test(temp_dir=tempdir) as instance:
+            event_types = []
+            for event in execute_pipeline_iterator(
+                reconstructable(wait_for_flag_job),
+                instance=instance,
+                run_config={
+                    "ops": {"wait_for_flag_op": {"config": {"flag_path": flag_path}}},
+                    "execution": {"config": {"cluster": {"local": {"timeout": 30}}}},
+                },
+            ):
+                if event.event_type == DagsterEventType.STEP_START:
+                    with open(flag_path, "w", encoding="utf8"):
+                        pass
+                event_types.append(event.event_type)
+
+            assert DagsterEventType.STEP_SUCCESS in event_types
+            assert DagsterEventType.RUN_SUCCESS in event_types
+
+
+@op
+def make_list_op():
+    return [1, 2, 3]
+
+
+@op
+def sum_op(numbers):
+    return sum(numbers)
+
+
+@op
+def double_op(total):
+    assert total == 6
+    return total * 2
+
+
+@job(executor_def=dask_executor, resource_defs={"io_manager": dask_futures_io_manager})
+def dask_futures_job():
+    double_op(sum_op(make_list_op()))
+
+
+def test_event_queue_released_on_existing_cluster():
+    with LocalCluster(n_workers=1, processes=False, dashboard_address=None) as cluster:
+        with instance_for_test() as instance:
+            result = execute_pipeline(
+                reconstructable(dask_engine_pipeline),
+                run_config={
+                    "execution": {
+                        "dask": {
+                            "config": {
+                                "cluster": {"existing": {"address": cluster.scheduler_address}}
+                            }
+                        }
+                    },
+                },
+                instance=instance,
+                mode="filesystem",
+            )
+            assert result.success
+
+        # the run's event queue does not outlive the run on the long-lived scheduler
+        queues = cluster.scheduler.extensions["queues"].queues
+        start_time = time.time()
+        while queues:
+            assert time.time() - start_time < 10
+            time.sleep(0.1)
+
+
+@job(
+    executor_def=dask_executor,
+    resource_defs={"io_manager": dask_futures_io_manager},
+    version_strategy=BasicVersionStrategy(),
+    tags={MEMOIZED_RUN_TAG: "false"},
+)
+def versioned_dask_futures_job():
+    double_op(sum_op(make_list_op()))
+
+
+def test_dask_futures_io_manager_releases_versioned_outputs():
+    with LocalCluster(n_workers=1, processes=False, dashboard_address=None) as cluster:
+        with instance_for_test() as instance:
+            result = execute_pipeline(
+                reconstructable(versioned_dask_futures_job),
+                instance=instance,
+                run_config={
+                    "execution": {
+                        "config": {"cluster": {"existing": {"address": cluster.scheduler_address}}}
+                    }
+                },
+            )
+            assert result.success
+
+        # versioned outputs are unpublished when the run finishes, like any other output
+        assert not cluster.scheduler.extensions["publish"].datasets
+        start_time = time.time()
+        while cluster.scheduler.tasks:
+            assert time.time() - start_time < 10
+            time.sleep(0.1)
+
+
+def test_dask_futures_io_manager_republished_output():
+    # a task that dask runs again, e.g. after losing a worker, publishes its output again
+    with LocalCluster(n_workers=1, processes=False, dashboard_address=None) as cluster:
+        with Client(cluster) as client:
+            io_manager = DaskFuturesIOManager()
+            context = build_output_context(step_key="the_op", name="result", run_id="the_run")
+            io_manager.handle_output(context, [1, 2, 3])
+            io_manager.handle_output(context, [4, 5, 6])
+
+            assert client.list_datasets() == ["dagster/the_run/the_op/result"]
+            assert io_manager.load_input(build_input_context(upstream_output=context)) == [4, 5, 6]
+
+            # the output of the first attempt is not kept on the cluster
+            assert len(cluster.scheduler.tasks) == 1
+
+            unpublish_datasets_for_run(client, "the_run")
+            assert not client.list_datasets()
+
+
+def test_dask_futures_io_manager():
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            reconstructable(dask_futures_job),
+            instance=instance,
+            run_config={"execution": {"config": {"cluster": {"local": {"timeout": 30}}}}},
+        )
+        assert result.success
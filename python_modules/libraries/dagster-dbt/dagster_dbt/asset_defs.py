@@ -59,6 +59,113 @@ def _load_manifest_for_project(
         return json.load(f), cli_output
 
 
+# Directories in a dbt project that dbt writes to, by default, rather than reads from
+DBT_OUTPUT_DIRS = ["target", "logs"]
+
+# Directory under the target directory holding the cached results of loading the project
+MANIFEST_CACHE_DIR = "dagster_manifest_cache"
+
+
+def _get_manifest_cache_path(
+    project_dir: str, profiles_dir: str, target_dir: str, select: str
+) -> str:
+    """Path of the cached manifest for a project, named by a digest of the select string followed
+    by a digest of the contents of the files in the project and profiles directories."""
+    excluded_dirs = {os.path.abspath(target_dir)} | {
+        os.path.abspath(os.path.join(project_dir, output_dir)) for output_dir in DBT_OUTPUT_DIRS
+    }
+
+    digest = hashlib.sha1()
+    for root_dir in sorted({os.path.abspath(project_dir), os.path.abspath(profiles_dir)}):
+        for dirpath, dirnames, filenames in os.walk(root_dir):
+            # prune in place so that os.walk skips excluded and hidden directories
+            dirnames[:] = sorted(
+                dirname
+                for dirname in dirnames
+                if not dirname.startswith(".")
+                and os.path.join(dirpath, dirname) not in excluded_dirs
+            )
+            for filename in sorted(filenames):
+                path = os.path.join(dirpath, filename)
+                digest.update(os.path.relpath(path, root_dir).encode("utf-8"))
+                with open(path, "rb") as f:
+                    digest.update(f.read())
+
+    select_digest = hashlib.sha1(select.encode("utf-8")).hexdigest()
+    return os.path.join(
+        target_dir, MANIFEST_CACHE_DIR, f"{select_digest}_{digest.hexdigest()}.json"
+    )
+
+
+def _get_manifest_subset(
+    manifest_json: Mapping[str, Any], selected_unique_ids: AbstractSet[str]
+) -> Mapping[str, Any]:
+    """The parts of a manifest.json that are needed to load the selected nodes as assets: the
+    selected nodes and their parents."""
+    dbt_nodes = {**manifest_json["nodes"], **manifest_json["sources"]}
+    unique_ids = set(selected_unique_ids)
+    for unique_id in selected_unique_ids:
+        unique_ids.update(dbt_nodes[unique_id].get("depends_on", {}).get("nodes", []))
+
+    return {
+        "nodes": {
+            unique_id: node_info
+            for unique_id, node_info in manifest_json["nodes"].items()
+            if unique_id in unique_ids
+        },
+        "sources": {
+            unique_id: node_info
+            for unique_id, node_info in manifest_json["sources"].items()
+            if unique_id in unique_ids
+        },
+    }
+
+
+def _read_manifest_cache(
+    manifest_cache_path: str,
+) -> Optional[Tuple[Mapping[str, Any], AbstractSet[str]]]:
+    if not os.path.exists(manifest_cache_path):
+        return None
+    with open(manifest_cache_path, "r", encoding="utf8") as f:
+        cached = json.load(f)
+    return cached["manifest"], set(cached["selected_unique_ids"])
+
+
+def _write_manifest_cache(
+    manifest_cache_path: str,
+    manifest_json: Mapping[str, Any],
+    selected_unique_ids: AbstractSet[str],
+):
+    os.makedirs(os.path.dirname(manifest_cache_path), exist_ok=True)
+    # write to a temporary file first so that concurrent loads never read a partial cache
+    temp_path = f"{manifest_cache_path}.{os.getpid()}.tmp"
+    with open(temp_path, "w", encoding="utf8") as f:
+        json.dump(
+            {
+                "manifest": _get_manifest_subset(manifest_json, selected_unique_ids),
+                "selected_unique_ids": sorted(selected_unique_ids),
+            },
+            f,
+        )
+    os.replace(temp_path, manifest_cache_path)
+
+    # the project has changed since any other cached manifest for the same select string was
+    # written, so those will never be read again
+    cache_dir, cache_filename = os.path.split(manifest_cache_path)
+    select_prefix = cache_filename.split("_")[0] + "_"
+    for filename in os.listdir(cache_dir):
+        if (
+            filename.startswith(select_prefix)
+            and filename.endswith(".json")
+            and filename != cache_filename
+        ):
+            try:
+                os.remove(os.path.join(cache_dir, filename))
+            except FileNotFoundError:
+                # removed by a concurrent load
+                pass
+
+
 def _select_unique_ids_from_manifest_json(
     manifest_json: Mapping[str, Any], select: str
 ) -> AbstractSet[str]:
@@ -376,6 +483,7 @@ def load_assets_from_dbt_project(
     partitions_def: Optional[PartitionsDefinition] = None,
     partition_key_to_vars_fn: Optional[Callable[[str], Mapping[str, Any]]] = None,
     node_info_to_group_fn: Callable[[Dict[str, Any]], Optional[str]] = _get_node_group_name,
+    use_manifest_cache: bool = False,
 ) -> Sequence[AssetsDefinition]:
     """
     Loads a set of dbt models from a dbt project into Dagster assets.
@@ -414,6 +522,12 @@ def load_assets_from_dbt_project(
             invocation (e.g. {"run_date": "2022-01-01"})
         node_info_to_group_fn (Dict[str, Any] -> Optional[str]): A function that takes a
             dictionary of dbt node info and returns the group that this node should be assigned to.
+        use_manifest_cache (bool): Flag indicating if the selected models should be cached in
+            the target directory, keyed by the select string and the contents of the files in the
+            project and profiles directories. When nothing changed since the project was last
+            loaded, `dbt ls` is not run and manifest.json is not parsed. Only the latest cached
+            selection for each select string is kept. Do not use it for projects whose models
+            depend on environment variables, as changes to them are not detected.
 
     """
     project_dir = check.str_param(project_dir, "project_dir")
@@ -423,12 +537,22 @@ def load_assets_from_dbt_project(
     target_dir = check.opt_str_param(target_dir, "target_dir", os.path.join(project_dir, "target"))
     select = check.opt_str_param(select, "select", "*")
 
-    manifest_json, cli_output = _load_manifest_for_project(
-        project_dir, profiles_dir, target_dir, select
-    )
-    selected_unique_ids: Set[str] = set(
-        filter(None, (line.get("unique_id") for line in cli_output.logs))
+    manifest_cache_path = (
+        _get_manifest_cache_path(project_dir, profiles_dir, target_dir, select)
+        if use_manifest_cache
+        else None
     )
+    cached = _read_manifest_cache(manifest_cache_path) if manifest_cache_path else None
+    if cached:
+        manifest_json, selected_unique_ids = cached
+    else:
+        manifest_json, cli_output = _load_manifest_for_project(
+            project_dir, profiles_dir, target_dir, select
+        )
+        selected_unique_ids = set(filter(None, (line.get("unique_id") for line in cli_output.logs)))
+        if manifest_cache_path:
+            _write_manifest_cache(manifest_cache_path, manifest_json, selected_unique_ids)
+
     return load_assets_from_dbt_manifest(
         manifest_json=manifest_json,
         select=select,
@@ -1,7 +1,9 @@
+import hashlib
 import json
 import os
 from unittest.mock import MagicMock
 
+import dagster_dbt.asset_defs
 import psycopg2
 import pytest
 from dagster_dbt import dbt_cli_resource
@@ -388,6 +390,48 @@ def foo():
     assert len(foo.get_all_jobs()) == 2
 
 
+def test_manifest_cache(
+    dbt_seed, conn_string, test_project_dir, dbt_config_dir, tmp_path, monkeypatch
+):  # pylint: disable=unused-argument
+    select = "sort_by_calories subdir.least_caloric"
+
+    def _load_assets():
+        return load_assets_from_dbt_project(
+            test_project_dir,
+            dbt_config_dir,
+            target_dir=str(tmp_path),
+            select=select,
+            use_manifest_cache=True,
+        )
+
+    # a manifest cached for an earlier version of the project, and one for another selection
+    cache_dir = tmp_path / "dagster_manifest_cache"
+    cache_dir.mkdir()
+    select_digest = hashlib.sha1(select.encode("utf-8")).hexdigest()
+    (cache_dir / f"{select_digest}_stale.json").write_text("{}")
+    (cache_dir / "other_stale.json").write_text("{}")
+
+    dbt_assets = _load_assets()
+
+    # the stale manifest for the same selection is removed
+    cache_filenames = os.listdir(cache_dir)
+    assert len(cache_filenames) == 2
+    assert "other_stale.json" in cache_filenames
+    assert f"{select_digest}_stale.json" not in cache_filenames
+
+    # the cached manifest is used instead of running dbt ls
+    def _execute_cli(*args, **kwargs):
+        raise Exception("dbt ls should not run")
+
+    monkeypatch.setattr(dagster_dbt.asset_defs, "execute_cli", _execute_cli)
+    cached_dbt_assets = _load_assets()
+
+    assert cached_dbt_assets[0].keys == dbt_assets[0].keys
+    assert cached_dbt_assets[0].keys_by_input_name == dbt_assets[0].keys_by_input_name
+    assert cached_dbt_assets[0].asset_deps == dbt_assets[0].asset_deps
+    assert cached_dbt_assets[0].op.name == dbt_assets[0].op.name
+
+
 def test_dbt_ls_fail_fast():
     with pytest.raises(DagsterDbtCliFatalRuntimeError, match="Invalid --project-dir flag."):
         load_assets_from_dbt_project("bad_project_dir", "bad_config_dir")
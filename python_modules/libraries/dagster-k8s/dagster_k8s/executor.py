@@ -1,4 +1,4 @@
-from typing import Iterator, List, Optional, cast
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, cast
 
 import kubernetes
 from dagster_k8s.launcher import K8sRunLauncher
@@ -27,7 +27,7 @@
     get_k8s_job_name,
     get_user_defined_k8s_config,
 )
-from .utils import delete_job
+from .utils import delete_job, sanitize_k8s_label
 
 
 @executor(
@@ -244,6 +244,51 @@ def check_step_health(self, step_handler_context: StepHandlerContext) -> CheckSt
         job = self._batch_api.read_namespaced_job(
             namespace=container_context.namespace, name=job_name
         )
+        return self._get_step_health(job, job_name, step_key)
+
+    def check_step_health_batch(
+        self, step_handler_contexts: Sequence[StepHandlerContext]
+    ) -> Sequence[CheckStepHealthResult]:
+        # Fetch the jobs for all of the steps in a namespace with a single request, using the run
+        # id label that launch_step adds to each job
+        jobs_by_namespace_and_run: Dict[Tuple[str, str], Dict[str, kubernetes.client.V1Job]] = {}
+
+        results = []
+        for step_handler_context in step_handler_contexts:
+            step_keys_to_execute = cast(
+                List[str], step_handler_context.execute_step_args.step_keys_to_execute
+            )
+            assert (
+                len(step_keys_to_execute) == 1
+            ), "Launching multiple steps is not currently supported"
+            step_key = step_keys_to_execute[0]
+
+            job_name = self._get_k8s_step_job_name(step_handler_context)
+            namespace = self._get_container_context(step_handler_context).namespace
+            run_id = step_handler_context.execute_step_args.pipeline_run_id
+
+            if (namespace, run_id) not in jobs_by_namespace_and_run:
+                jobs = self._batch_api.list_namespaced_job(
+                    namespace=namespace,
+                    label_selector=f"dagster/run-id={sanitize_k8s_label(run_id)}",
+                ).items
+                jobs_by_namespace_and_run[(namespace, run_id)] = {
+                    job.metadata.name: job for job in jobs
+                }
+
+            job = jobs_by_namespace_and_run[(namespace, run_id)].get(job_name)
+            if not job:
+                results.append(
+                    CheckStepHealthResult.unhealthy(
+                        reason=f"Could not find Kubernetes job {job_name} for step {step_key}.",
+                    )
+                )
+            else:
+                results.append(self._get_step_health(job, job_name, step_key))
+
+        return results
+
+    def _get_step_health(self, job, job_name: str, step_key: str) -> CheckStepHealthResult:
         if job.status.failed:
             return CheckStepHealthResult.unhealthy(
                 reason=f"Discovered failed Kubernetes job {job_name} for step {step_key}.",
@@ -2,6 +2,7 @@
 import json
 from unittest import mock
 
+import kubernetes
 import pytest
 from dagster_k8s.container_context import K8sContainerContext
 from dagster_k8s.executor import K8sStepHandler, k8s_job_executor
@@ -426,3 +427,73 @@ def test_step_handler_with_container_context(
 
         assert envs["FOO_TEST"] == "bar"
         assert envs["BAZ_TEST"] == "blergh"
+
+
+class FakeK8sBatchApi:
+    def __init__(self):
+        self.jobs = []
+        self.list_calls = 0
+
+    def create_namespaced_job(self, body, namespace):
+        body.metadata.namespace = namespace
+        body.status = kubernetes.client.V1JobStatus()
+        self.jobs.append(body)
+
+    def list_namespaced_job(self, namespace, label_selector):
+        self.list_calls += 1
+        label, value = label_selector.split("=")
+        return kubernetes.client.V1JobList(
+            items=[
+                job
+                for job in self.jobs
+                if job.metadata.namespace == namespace and job.metadata.labels.get(label) == value
+            ]
+        )
+
+
+def test_step_handler_check_step_health_batch(kubeconfig_file, k8s_instance):
+    fake_k8s_client_batch_api = FakeK8sBatchApi()
+    handler = K8sStepHandler(
+        image="bizbuz",
+        container_context=K8sContainerContext(
+            namespace="foo",
+        ),
+        load_incluster_config=False,
+        kubeconfig_file=kubeconfig_file,
+        k8s_client_batch_api=fake_k8s_client_batch_api,
+    )
+
+    executor = _get_executor(k8s_instance, reconstructable(bar))
+    runs = [
+        create_run_for_test(
+            k8s_instance,
+            pipeline_name="bar",
+            pipeline_code_origin=reconstructable(bar).get_python_origin(),
+        )
+        for _ in range(3)
+    ]
+    step_handler_contexts = [
+        _step_handler_context(
+            pipeline=reconstructable(bar),
+            pipeline_run=run,
+            instance=k8s_instance,
+            executor=executor,
+        )
+        for run in runs
+    ]
+
+    # launch the steps for the first two runs
+    for step_handler_context in step_handler_contexts[:2]:
+        list(handler.launch_step(step_handler_context))
+
+    fake_k8s_client_batch_api.jobs[1].status.failed = 1
+
+    results = handler.check_step_health_batch(
+        step_handler_contexts[:1] + step_handler_contexts[:1] + step_handler_contexts[1:]
+    )
+    assert [result.is_healthy for result in results] == [True, True, False, False]
+    assert "Discovered failed Kubernetes job" in results[2].unhealthy_reason
+    assert "Could not find Kubernetes job" in results[3].unhealthy_reason
+
+    # one request for each run, rather than for each step
+    assert fake_k8s_client_batch_api.list_calls == 3
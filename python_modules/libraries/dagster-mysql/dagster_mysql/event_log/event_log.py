@@ -148,6 +148,8 @@ def store_asset_event(self, event):
                 except db.exc.IntegrityError:
                     pass
 
+        self._update_asset_partitions_index(event)
+
     def _connect(self):
         return create_mysql_connection(self._engine, __file__, "event log")
 
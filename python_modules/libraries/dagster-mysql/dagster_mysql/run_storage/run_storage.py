@@ -1,3 +1,4 @@
+from contextlib import contextmanager
 from typing import Dict
 
 import sqlalchemy as db
@@ -130,6 +131,13 @@ def create_clean_storage(mysql_url):
     def connect(self, run_id=None):  # pylint: disable=arguments-differ, unused-argument
         return create_mysql_connection(self._engine, __file__, "run")
 
+    @contextmanager
+    def _connect_for_transaction(self):
+        # the engine autocommits every statement, so begin transactions on a connection that
+        # doesn't; the isolation level is reset when the connection is released
+        with self.connect() as conn:
+            yield conn.execution_options(isolation_level="READ COMMITTED")
+
     def upgrade(self):
         alembic_config = mysql_alembic_config(__file__)
         with self.connect() as conn:
@@ -16,6 +16,7 @@
     dtype_in_set_validation_factory,
     non_null_validation,
     nonnull,
+    vectorized,
 )
 from .data_frame import (
     DataFrame,
@@ -47,4 +48,5 @@
     "nonnull",
     "non_null_validation",
     "categorical_column_validator_factory",
+    "vectorized",
 ]
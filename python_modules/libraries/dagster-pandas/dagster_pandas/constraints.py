@@ -3,6 +3,7 @@
 from datetime import datetime
 from functools import wraps
 
+import numpy as np
 import pandas as pd
 from pandas import DataFrame
 
@@ -26,6 +27,8 @@ class ConstraintWithMetadataException(Exception):
         expectation (Optional[Union[dict,list, str, set]]): what result was expected -- typically a jsonlike, though it can be a string
         offending (Optional[Union[dict,list, str, set]]):  which pieces of the dataframe violated the expectation, typically list or string
         actual (Optional[Union[dict,list, str, set]]): what those pieces of the dataframe actually were -- typically a jsonlike
+        unreported_offending (Optional[dict]): how many offending pieces of the dataframe were left out of offending
+            and actual, if any were -- typically a jsonlike
     """
 
     def __init__(
@@ -35,12 +38,16 @@ def __init__(
         expectation=None,
         offending=None,
         actual=None,
+        unreported_offending=None,
     ):
         self.constraint_name = constraint_name
         self.constraint_description = constraint_description
         self.expectation = check.opt_inst_param(expectation, "expectation", (dict, list, str, set))
         self.offending = check.opt_inst_param(offending, "offending", (dict, list, str, set))
         self.actual = check.opt_inst_param(actual, "actual", (dict, list, str, set))
+        self.unreported_offending = check.opt_dict_param(
+            unreported_offending, "unreported_offending"
+        )
         super(ConstraintWithMetadataException, self).__init__(
             "Violated {} - {}, {} was/were expected, but we received {} which was/were {}".format(
                 constraint_name,
@@ -58,16 +65,16 @@ def normalize_metadata_json_value(self, val):
             return val
 
     def convert_to_metadata(self):
-        return MetadataEntry(
-            "constraint-metadata",
-            value={
-                "constraint_name": self.constraint_name,
-                "constraint_description": self.constraint_description,
-                "expected": self.normalize_metadata_json_value(self.expectation),
-                "offending": self.normalize_metadata_json_value(self.offending),
-                "actual": self.normalize_metadata_json_value(self.actual),
-            },
-        )
+        value = {
+            "constraint_name": self.constraint_name,
+            "constraint_description": self.constraint_description,
+            "expected": self.normalize_metadata_json_value(self.expectation),
+            "offending": self.normalize_metadata_json_value(self.offending),
+            "actual": self.normalize_metadata_json_value(self.actual),
+        }
+        if self.unreported_offending:
+            value["unreported_offending"] = self.unreported_offending
+        return MetadataEntry("constraint-metadata", value=value)
 
     def return_as_typecheck(self):
         return TypeCheck(
@@ -117,13 +124,22 @@ def construct_message(self):
 
 
 class ColumnWithMetadataException(ConstraintWithMetadataException):
-    def __init__(self, constraint_name, constraint_description, expectation, offending, actual):
+    def __init__(
+        self,
+        constraint_name,
+        constraint_description,
+        expectation,
+        offending,
+        actual,
+        unreported_offending=None,
+    ):
         super(ColumnWithMetadataException, self).__init__(
             "the column constraint " + constraint_name,
             constraint_description,
             expectation,
             offending,
             actual,
+            unreported_offending=unreported_offending,
         )
 
 
@@ -450,7 +466,8 @@ class ColumnConstraintWithMetadata(ConstraintWithMetadata):
     This class is useful for constructing single constraints that
     you want to apply to multiple columns of your dataframe
     The main difference from the base class in terms of construction is that now, your validation_fns should operate on
-    individual values.
+    individual values, or on whole columns if they are decorated with
+    :py:func:`~dagster_pandas.constraints.vectorized`.
     args:
         description (str): description of the constraint
         validation_fn (Callable[[Any], Tuple[bool, dict[str, Union[dict,list, str, set]]]]:
@@ -462,23 +479,79 @@ class ColumnConstraintWithMetadata(ConstraintWithMetadata):
         raise_or_typecheck (Optional[bool]): whether to raise an exception (if set to True) or emit a failed typecheck event
                     (if set to False) when validation fails
         name (Optional[str]): what to call the constraint, defaults to the class name.
+        max_reported_rows (Optional[int]): if set, how many offending rows to report per column, which keeps
+                    the metadata of failed validations of large dataframes small. The number of offending
+                    rows that were left out is reported per column under unreported_offending. Defaults to
+                    None, which reports all offending rows.
+        chunk_size (Optional[int]): if set, columns are validated this many rows at a time, which bounds
+                    the memory used by validation of large dataframes.
     """
 
+    def __init__(
+        self,
+        description,
+        validation_fn,
+        resulting_exception,
+        raise_or_typecheck=True,
+        name=None,
+        max_reported_rows=None,
+        chunk_size=None,
+    ):
+        super(ColumnConstraintWithMetadata, self).__init__(
+            description,
+            validation_fn,
+            resulting_exception,
+            raise_or_typecheck=raise_or_typecheck,
+            name=name,
+        )
+        self.max_reported_rows = check.opt_int_param(max_reported_rows, "max_reported_rows")
+        self.chunk_size = check.opt_int_param(chunk_size, "chunk_size")
+        if self.chunk_size is not None:
+            check.invariant(self.chunk_size > 0, "chunk_size must be > 0")
+
+    def _get_valid_mask(self, column_data):
+        if _is_vectorized(self.validation_fn):
+            res = self.validation_fn(column_data)
+            mask = res[0] if isinstance(res, tuple) else res
+        else:
+            mask = column_data.apply(lambda x: self.validation_fn(x)[0])
+        return np.asarray(mask, dtype=bool)
+
+    def _get_offending_rows(self, column_data):
+        """Returns the labels and values of the reported offending rows of a column, along with the
+        total number of offending rows."""
+        chunk_size = self.chunk_size or max(len(column_data), 1)
+        offending_rows = []
+        offending_values = []
+        num_offending = 0
+        for start in range(0, len(column_data), chunk_size):
+            chunk = column_data.iloc[start : start + chunk_size]
+            positions = np.flatnonzero(~self._get_valid_mask(chunk))
+            num_offending += len(positions)
+            if self.max_reported_rows is not None:
+                positions = positions[: max(self.max_reported_rows - len(offending_rows), 0)]
+            if len(positions) > 0:
+                reported = chunk.iloc[positions]
+                offending_rows.extend("row " + str(i) for i in reported.index)
+                offending_values.extend(reported.tolist())
+        return offending_rows, offending_values, num_offending
+
     def validate(self, data, *columns, **kwargs):
         if len(columns) == 0:
             columns = data.columns
 
         columns = [column for column in columns if column in data.columns]
-        relevant_data = data[list(columns)]
         offending = {}
         offending_values = {}
+        unreported_offending = {}
         # TODO:  grab metadata from here
-        inverse_validation = lambda x: not self.validation_fn(x)[0]
         for column in columns:
-            results = relevant_data[relevant_data[column].apply(inverse_validation)]
-            if len(results.index.tolist()) > 0:
-                offending[column] = ["row " + str(i) for i in (results.index.tolist())]
-                offending_values[column] = results[column].tolist()
+            rows, values, num_offending = self._get_offending_rows(data[column])
+            if num_offending > 0:
+                offending[column] = rows
+                offending_values[column] = values
+                if num_offending > len(rows):
+                    unreported_offending[column] = num_offending - len(rows)
         if len(offending) == 0:
             if not self.raise_or_typecheck:
                 return TypeCheck(success=True)
@@ -488,6 +561,10 @@ def validate(self, data, *columns, **kwargs):
                 "actual": offending_values,
                 "offending": offending,
             }
+            # only passed when rows were left out, so that resulting exceptions that do not take
+            # it keep working
+            if unreported_offending:
+                metadict["unreported_offending"] = unreported_offending
             exc = self.resulting_exception(
                 constraint_name=self.name, constraint_description=self.description, **metadict
             )
@@ -517,6 +594,10 @@ class MultiColumnConstraintWithMetadata(ColumnConstraintWithMetadata):
         type_for_internal (Optional[type]): what type to use for internal validators.  Subclass of
                                             ConstraintWithMetadata
         name (Optional[str]): what to call the constraint, defaults to the class name.
+        max_reported_rows (Optional[int]): how many offending rows to report per column and function,
+                                           when type_for_internal is a ColumnConstraintWithMetadata.
+        chunk_size (Optional[int]): how many rows to validate at a time, when type_for_internal is a
+                                    ColumnConstraintWithMetadata.
     """
 
     def __init__(
@@ -527,23 +608,42 @@ def __init__(
         raise_or_typecheck=True,
         type_for_internal=ColumnConstraintWithMetadata,
         name=None,
+        max_reported_rows=None,
+        chunk_size=None,
     ):
         # TODO:  support multiple descriptions
         self.column_to_fn_dict = check.dict_param(
             fn_and_columns_dict, "fn_and_columns_dict", key_type=str
         )
 
+        internal_kwargs = {}
+        if issubclass(type_for_internal, ColumnConstraintWithMetadata):
+            internal_kwargs = {"max_reported_rows": max_reported_rows, "chunk_size": chunk_size}
+        # built once up front rather than on every validation
+        column_to_validators = {
+            column: [
+                (
+                    fn,
+                    type_for_internal(
+                        fn.__doc__,
+                        fn,
+                        ColumnWithMetadataException,
+                        raise_or_typecheck=False,
+                        **internal_kwargs,
+                    ),
+                )
+                for fn in fn_arr
+            ]
+            for column, fn_arr in self.column_to_fn_dict.items()
+        }
+
         def validation_fn(data, *args, **kwargs):
             metadict = defaultdict(dict)
             truthparam = True
-            for column, fn_arr in self.column_to_fn_dict.items():
+            for column, validators in column_to_validators.items():
                 if column not in data.columns:
                     continue
-                for fn in fn_arr:
-                    # TODO:  do this more effectively
-                    new_validator = type_for_internal(
-                        fn.__doc__, fn, ColumnWithMetadataException, raise_or_typecheck=False
-                    )
+                for fn, new_validator in validators:
                     result = new_validator.validate(
                         DataFrame(data[column]), column, *args, **kwargs
                     )
@@ -682,17 +782,55 @@ def nonnull(func):
             the column validator you want to error on nulls
     """
 
-    @wraps(func)
-    def nvalidator(val):
-        origval = func(val)
-        nval = non_null_validation(val)
-        return origval[0] and nval[0], {}
+    if _is_vectorized(func):
+
+        @wraps(func)
+        def nvalidator(column):
+            origval = func(column)
+            mask = origval[0] if isinstance(origval, tuple) else origval
+            return np.asarray(mask, dtype=bool) & column.notnull().to_numpy(), {}
+
+    else:
+
+        @wraps(func)
+        def nvalidator(val):
+            origval = func(val)
+            nval = non_null_validation(val)
+            return origval[0] and nval[0], {}
 
     nvalidator.__doc__ += " and ensures no values are null"
 
     return nvalidator
 
 
+def vectorized(func):
+    """
+    decorator for column validation functions that validate a whole column at once
+    The decorated function takes a column (pd.Series) and returns a boolean mask that is True for
+    valid values, either on its own or as the first element of a tuple with a metadata dict. This
+    avoids calling a python function on every value of large columns.
+    Usage:
+        pass decorated functions as column validators to
+        :py:class:'~dagster_pandas.constraints.ColumnConstraintWithMetadata'
+        or :py:class:'~dagster_pandas.constraints.MultiColumnConstraintWithMetadata'
+    Example:
+        .. code-block:: python
+            @vectorized
+            def positive_validation_fn(column):
+                '''checks whether values are positive'''
+                return column > 0, {}
+    Args:
+        func (Callable[[pd.Series], Union[pd.Series, Tuple[pd.Series, dict]]]):
+            the column validator to run on whole columns
+    """
+    func.is_vectorized = True
+    return func
+
+
+def _is_vectorized(func):
+    return getattr(func, "is_vectorized", False)
+
+
 def column_range_validation_factory(minim=None, maxim=None, ignore_missing_vals=False):
     """
     factory for validators testing if column values are within a range
@@ -864,7 +1002,15 @@ def dtype_in_set_validation_fn(x):
 
 
 class ColumnRangeConstraintWithMetadata(ColumnConstraintWithMetadata):
-    def __init__(self, minim=None, maxim=None, columns=None, raise_or_typecheck=True):
+    def __init__(
+        self,
+        minim=None,
+        maxim=None,
+        columns=None,
+        raise_or_typecheck=True,
+        max_reported_rows=None,
+        chunk_size=None,
+    ):
         self.name = self.__class__.__name__
 
         description = "Confirms values are between {} and {}".format(minim, maxim)
@@ -873,6 +1019,8 @@ def __init__(self, minim=None, maxim=None, columns=None, raise_or_typecheck=True
             validation_fn=column_range_validation_factory(minim=minim, maxim=maxim),
             resulting_exception=ColumnWithMetadataException,
             raise_or_typecheck=raise_or_typecheck,
+            max_reported_rows=max_reported_rows,
+            chunk_size=chunk_size,
         )
         self.columns = columns
 
@@ -10,6 +10,8 @@
     MultiColumnConstraintWithMetadata,
     MultiConstraintWithMetadata,
     StrictColumnsWithMetadata,
+    nonnull,
+    vectorized,
 )
 from pandas import DataFrame
 
@@ -201,3 +203,102 @@ def test_range_constraint():
     assert {"bar": [3], "baz": [4]} == val["actual"]
     range_val = ColumnRangeConstraintWithMetadata(raise_or_typecheck=False)
     assert range_val.validate(df).success
+
+
+def test_vectorized_column_constraint():
+    @vectorized
+    def column_num_validation_function(column):
+        """checks values greater than 3"""
+        return (column >= 3, {})
+
+    df = DataFrame({"foo": [1, 2], "bar": [3, 2], "baz": [1, 4]})
+    column_val = ColumnConstraintWithMetadata(
+        "Confirms values greater than 3",
+        column_num_validation_function,
+        ColumnWithMetadataException,
+        raise_or_typecheck=False,
+    )
+    val = column_val.validate(df, *df.columns).metadata_entries[0].entry_data.data
+    assert {"foo": ["row 0", "row 1"], "bar": ["row 1"], "baz": ["row 0"]} == val["offending"]
+    assert {"foo": [1, 2], "bar": [2], "baz": [1]} == val["actual"]
+
+    nonnull_val = ColumnConstraintWithMetadata(
+        "Confirms values greater than 3 and not null",
+        nonnull(column_num_validation_function),
+        ColumnWithMetadataException,
+        raise_or_typecheck=False,
+    )
+    df = DataFrame({"foo": [3, None, 4]})
+    val = nonnull_val.validate(df).metadata_entries[0].entry_data.data
+    assert {"foo": ["row 1"]} == val["offending"]
+
+
+def test_chunked_column_constraint():
+    @vectorized
+    def even_validation_function(column):
+        """checks values are even"""
+        return column % 2 == 0
+
+    def scalar_even_validation_function(value):
+        """checks values are even"""
+        return (value % 2 == 0, {})
+
+    df = DataFrame({"foo": list(range(10))}, index=list(range(10, 20)))
+    for validation_fn in [even_validation_function, scalar_even_validation_function]:
+        for chunk_size in [None, 1, 3, 20]:
+            column_val = ColumnConstraintWithMetadata(
+                "Confirms values are even",
+                validation_fn,
+                ColumnWithMetadataException,
+                raise_or_typecheck=False,
+                chunk_size=chunk_size,
+            )
+            val = column_val.validate(df).metadata_entries[0].entry_data.data
+            assert {"foo": ["row 11", "row 13", "row 15", "row 17", "row 19"]} == val["offending"]
+            assert {"foo": [1, 3, 5, 7, 9]} == val["actual"]
+
+
+def test_truncated_offending_rows():
+    @vectorized
+    def even_validation_function(column):
+        """checks values are even"""
+        return column % 2 == 0
+
+    df = DataFrame({"foo": list(range(10)), "bar": [0, 1] + [0] * 8})
+    column_val = ColumnConstraintWithMetadata(
+        "Confirms values are even",
+        even_validation_function,
+        ColumnWithMetadataException,
+        raise_or_typecheck=False,
+        max_reported_rows=2,
+        chunk_size=3,
+    )
+    val = column_val.validate(df).metadata_entries[0].entry_data.data
+    assert {"foo": ["row 1", "row 3"], "bar": ["row 1"]} == val["offending"]
+    assert {"foo": [1, 3], "bar": [1]} == val["actual"]
+    assert {"foo": 3} == val["unreported_offending"]
+
+    # all offending rows are reported by default
+    column_val = ColumnConstraintWithMetadata(
+        "Confirms values are even",
+        even_validation_function,
+        ColumnWithMetadataException,
+        raise_or_typecheck=False,
+    )
+    val = column_val.validate(df).metadata_entries[0].entry_data.data
+    assert {"foo": ["row 1", "row 3", "row 5", "row 7", "row 9"], "bar": ["row 1"]} == val[
+        "offending"
+    ]
+    assert "unreported_offending" not in val
+
+    multi_column_val = MultiColumnConstraintWithMetadata(
+        "Confirms values are even",
+        {"foo": [even_validation_function]},
+        ColumnWithMetadataException,
+        raise_or_typecheck=False,
+        max_reported_rows=1,
+    )
+    val = multi_column_val.validate(df).metadata_entries[0].entry_data.data
+    assert {"foo": {"even_validation_function": ["row 1"]}} == val["offending"]
+    assert {"foo": {"even_validation_function": [1]}} == val["actual"]
+    assert {"foo": {"even_validation_function": 4}} == val["unreported_offending"]
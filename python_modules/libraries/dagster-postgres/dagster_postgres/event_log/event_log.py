@@ -13,6 +13,7 @@
 )
 from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._core.storage.event_log.migration import ASSET_KEY_INDEX_COLS
+from dagster._core.storage.event_log.sql_event_log import EVENT_INSERT_BATCH_SIZE
 from dagster._core.storage.sql import (
     check_alembic_revision,
     create_engine,
@@ -23,6 +24,7 @@
 
 from ..utils import (
     create_pg_connection,
+    create_pg_engine,
     pg_alembic_config,
     pg_statement_timeout,
     pg_url_from_config,
@@ -54,7 +56,9 @@ class PostgresEventLogStorage(SqlEventLogStorage, ConfigurableClass):
 
     """
 
-    def __init__(self, postgres_url, should_autocreate_tables=True, inst_data=None):
+    def __init__(
+        self, postgres_url, should_autocreate_tables=True, inst_data=None, pool_config=None
+    ):
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self.postgres_url = check.str_param(postgres_url, "postgres_url")
         self.should_autocreate_tables = check.bool_param(
@@ -63,11 +67,14 @@ def __init__(self, postgres_url, should_autocreate_tables=True, inst_data=None):
 
         self._disposed = False
 
-        # Default to not holding any connections open to prevent accumulating connections per DagsterInstance
-        self._engine = create_engine(
-            self.postgres_url, isolation_level="AUTOCOMMIT", poolclass=db.pool.NullPool
+        self.pool_config = check.opt_nullable_mapping_param(
+            pool_config, "pool_config", key_type=str
         )
 
+        # Default to not holding any connections open to prevent accumulating connections per
+        # DagsterInstance, unless a connection pool is configured
+        self._engine = create_pg_engine(self.postgres_url, self.pool_config)
+
         # lazy init
         self._event_watcher: Optional[PostgresEventWatcher] = None
 
@@ -118,6 +125,7 @@ def from_config_value(inst_data, config_value):
             inst_data=inst_data,
             postgres_url=pg_url_from_config(config_value),
             should_autocreate_tables=config_value.get("should_autocreate_tables", True),
+            pool_config=config_value.get("pool"),
         )
 
     @staticmethod
@@ -138,30 +146,49 @@ def store_event(self, event):
             event (EventLogEntry): The event to store.
         """
         check.inst_param(event, "event", EventLogEntry)
-        insert_event_statement = self.prepare_insert_event(event)  # from SqlEventLogStorage.py
+        self.store_events([event])
+
+    def store_events(self, events):
+        """Store a batch of events, using multi-row inserts over a single connection.
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
         with self._connect() as conn:
-            result = conn.execute(
-                insert_event_statement.returning(
-                    SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.id
+            for i in range(0, len(events), EVENT_INSERT_BATCH_SIZE):
+                conn.execute(
+                    self._insert_and_notify_statement(events[i : i + EVENT_INSERT_BATCH_SIZE])
                 )
-            )
-            res = result.fetchone()
-            result.close()
-            conn.execute(
-                """NOTIFY {channel}, %s; """.format(channel=CHANNEL_NAME),
-                (res[0] + "_" + str(res[1]),),
-            )
 
-        if (
-            event.is_dagster_event
-            and (
-                event.dagster_event.is_step_materialization
-                or event.dagster_event.is_asset_observation
-                or event.dagster_event.is_asset_materialization_planned
-            )
-            and event.dagster_event.asset_key
-        ):
-            self.store_asset_event(event)
+        for event in events:
+            if (
+                event.is_dagster_event
+                and (
+                    event.dagster_event.is_step_materialization
+                    or event.dagster_event.is_asset_observation
+                    or event.dagster_event.is_asset_materialization_planned
+                )
+                and event.dagster_event.asset_key
+            ):
+                self.store_asset_event(event)
+
+    def _insert_and_notify_statement(self, events):
+        # Insert the events and NOTIFY the watchers of each new row in a single statement, so that a
+        # batch costs one round-trip, and its notifications are delivered together when the
+        # statement's transaction commits
+        inserted = (
+            self.prepare_insert_event_batch(events)  # from SqlEventLogStorage.py
+            .returning(SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.id)
+            .cte("inserted_events")
+        )
+        return db.select(
+            [
+                db.func.pg_notify(
+                    CHANNEL_NAME,
+                    inserted.c.run_id + "_" + db.cast(inserted.c.id, db.Text),
+                )
+            ]
+        ).select_from(inserted)
 
     def store_asset_event(self, event):
         check.inst_param(event, "event", EventLogEntry)
@@ -213,6 +240,8 @@ def store_asset_event(self, event):
                 query = query.on_conflict_do_nothing()
             conn.execute(query)
 
+        self._update_asset_partitions_index(event)
+
     def _connect(self):
         return create_pg_connection(self._engine)
 
@@ -1,3 +1,4 @@
+from contextlib import contextmanager
 from typing import Dict
 
 import sqlalchemy as db
@@ -22,6 +23,7 @@
 
 from ..utils import (
     create_pg_connection,
+    create_pg_engine,
     pg_alembic_config,
     pg_statement_timeout,
     pg_url_from_config,
@@ -49,20 +51,23 @@ class PostgresRunStorage(SqlRunStorage, ConfigurableClass):
     :py:class:`~dagster.IntSource` and can be configured from environment variables.
     """
 
-    def __init__(self, postgres_url, should_autocreate_tables=True, inst_data=None):
+    def __init__(
+        self, postgres_url, should_autocreate_tables=True, inst_data=None, pool_config=None
+    ):
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self.postgres_url = postgres_url
         self.should_autocreate_tables = check.bool_param(
             should_autocreate_tables, "should_autocreate_tables"
         )
 
-        # Default to not holding any connections open to prevent accumulating connections per DagsterInstance
-        self._engine = create_engine(
-            self.postgres_url,
-            isolation_level="AUTOCOMMIT",
-            poolclass=db.pool.NullPool,
+        self.pool_config = check.opt_nullable_mapping_param(
+            pool_config, "pool_config", key_type=str
         )
 
+        # Default to not holding any connections open to prevent accumulating connections per
+        # DagsterInstance, unless a connection pool is configured
+        self._engine = create_pg_engine(self.postgres_url, self.pool_config)
+
         self._index_migration_cache = {}
         table_names = retry_pg_connection_fn(lambda: db.inspect(self._engine).get_table_names())
 
@@ -108,6 +113,7 @@ def from_config_value(inst_data, config_value):
             inst_data=inst_data,
             postgres_url=pg_url_from_config(config_value),
             should_autocreate_tables=config_value.get("should_autocreate_tables", True),
+            pool_config=config_value.get("pool"),
         )
 
     @staticmethod
@@ -124,6 +130,13 @@ def create_clean_storage(postgres_url, should_autocreate_tables=True):
     def connect(self):
         return create_pg_connection(self._engine)
 
+    @contextmanager
+    def _connect_for_transaction(self):
+        # the engine autocommits every statement, so begin transactions on a connection that
+        # doesn't; the isolation level is reset when the connection is released
+        with self.connect() as conn:
+            yield conn.execution_options(isolation_level="READ COMMITTED")
+
     def upgrade(self):
         with self.connect() as conn:
             run_alembic_upgrade(pg_alembic_config(__file__), conn)
@@ -140,6 +153,19 @@ def mark_index_built(self, migration_name):
         if migration_name in self._index_migration_cache:
             del self._index_migration_cache[migration_name]
 
+    def _run_priority_column(self, priority_tag_column):
+        # postgres raises an error when casting a malformed integer, so only cast values that are
+        # integers, and treat any other value as priority 0
+        return db.case(
+            [
+                (
+                    priority_tag_column.op("~")(r"^\s*[-+]?[0-9]{1,9}\s*$"),
+                    db.cast(priority_tag_column, db.Integer),
+                )
+            ],
+            else_=0,
+        )
+
     def add_daemon_heartbeat(self, daemon_heartbeat):
         with self.connect() as conn:
 
@@ -15,6 +15,7 @@
 
 from ..utils import (
     create_pg_connection,
+    create_pg_engine,
     pg_alembic_config,
     pg_statement_timeout,
     pg_url_from_config,
@@ -42,18 +43,23 @@ class PostgresScheduleStorage(SqlScheduleStorage, ConfigurableClass):
     :py:class:`~dagster.IntSource` and can be configured from environment variables.
     """
 
-    def __init__(self, postgres_url, should_autocreate_tables=True, inst_data=None):
+    def __init__(
+        self, postgres_url, should_autocreate_tables=True, inst_data=None, pool_config=None
+    ):
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self.postgres_url = postgres_url
         self.should_autocreate_tables = check.bool_param(
             should_autocreate_tables, "should_autocreate_tables"
         )
 
-        # Default to not holding any connections open to prevent accumulating connections per DagsterInstance
-        self._engine = create_engine(
-            self.postgres_url, isolation_level="AUTOCOMMIT", poolclass=db.pool.NullPool
+        self.pool_config = check.opt_nullable_mapping_param(
+            pool_config, "pool_config", key_type=str
         )
 
+        # Default to not holding any connections open to prevent accumulating connections per
+        # DagsterInstance, unless a connection pool is configured
+        self._engine = create_pg_engine(self.postgres_url, self.pool_config)
+
         table_names = retry_pg_connection_fn(lambda: db.inspect(self._engine).get_table_names())
 
         # Stamp and create tables if the main table does not exist (we can't check alembic
@@ -97,6 +103,7 @@ def from_config_value(inst_data, config_value):
             inst_data=inst_data,
             postgres_url=pg_url_from_config(config_value),
             should_autocreate_tables=config_value.get("should_autocreate_tables", True),
+            pool_config=config_value.get("pool"),
         )
 
     @staticmethod
@@ -33,15 +33,26 @@ class DagsterPostgresStorage(DagsterStorage, ConfigurableClass):
     :py:class:`~dagster.IntSource` and can be configured from environment variables.
     """
 
-    def __init__(self, postgres_url, should_autocreate_tables=True, inst_data=None):
+    def __init__(
+        self, postgres_url, should_autocreate_tables=True, inst_data=None, pool_config=None
+    ):
         self.postgres_url = postgres_url
         self.should_autocreate_tables = check.bool_param(
             should_autocreate_tables, "should_autocreate_tables"
         )
+        self.pool_config = check.opt_nullable_mapping_param(
+            pool_config, "pool_config", key_type=str
+        )
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
-        self._run_storage = PostgresRunStorage(postgres_url, should_autocreate_tables)
-        self._event_log_storage = PostgresEventLogStorage(postgres_url, should_autocreate_tables)
-        self._schedule_storage = PostgresScheduleStorage(postgres_url, should_autocreate_tables)
+        self._run_storage = PostgresRunStorage(
+            postgres_url, should_autocreate_tables, pool_config=self.pool_config
+        )
+        self._event_log_storage = PostgresEventLogStorage(
+            postgres_url, should_autocreate_tables, pool_config=self.pool_config
+        )
+        self._schedule_storage = PostgresScheduleStorage(
+            postgres_url, should_autocreate_tables, pool_config=self.pool_config
+        )
         super().__init__()
 
     @property
@@ -58,6 +69,7 @@ def from_config_value(inst_data, config_value):
             inst_data=inst_data,
             postgres_url=pg_url_from_config(config_value),
             should_autocreate_tables=config_value.get("should_autocreate_tables", True),
+            pool_config=config_value.get("pool"),
         )
 
     @property
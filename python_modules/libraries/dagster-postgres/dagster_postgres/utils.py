@@ -1,6 +1,9 @@
 import logging
+import os
+import threading
 import time
 from contextlib import contextmanager
+from typing import Dict, Mapping, Optional, Tuple
 from urllib.parse import quote, urlencode
 
 import psycopg2
@@ -10,13 +13,21 @@
 from dagster import _check as check
 from dagster._core.definitions.policy import Backoff, Jitter, calculate_delay
 from dagster._core.storage.config import pg_config  # pylint: disable=unused-import
-from dagster._core.storage.sql import get_alembic_config
+from dagster._core.storage.sql import create_engine, get_alembic_config
 
 
 class DagsterPostgresException(Exception):
     pass
 
 
+# Pooled engines are shared by all of the storages in a process that connect to the same database
+# with the same pool settings, so that `pool_size` caps the connections held open by the process
+# rather than by each storage. Keyed by pid so that forked processes never reuse the connections
+# of their parent.
+_POOLED_ENGINES: Dict[Tuple, sqlalchemy.engine.Engine] = {}
+_POOLED_ENGINES_LOCK = threading.Lock()
+
+
 def get_conn(conn_string):
     conn = psycopg2.connect(conn_string)
     conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
@@ -130,6 +141,35 @@ def wait_for_connection(conn_string, retry_limit=5, retry_wait=0.2):
     return True
 
 
+def create_pg_engine(
+    postgres_url: str, pool_config: Optional[Mapping[str, int]] = None
+) -> sqlalchemy.engine.Engine:
+    """Create the engine used by a postgres storage.
+
+    Without a pool config, connections are not held open between queries, to prevent accumulating
+    connections per DagsterInstance. With one, a process-wide QueuePool is used, checking
+    connections with a pre-ping before handing them out.
+    """
+    check.str_param(postgres_url, "postgres_url")
+    if pool_config is None:
+        return create_engine(
+            postgres_url, isolation_level="AUTOCOMMIT", poolclass=sqlalchemy.pool.NullPool
+        )
+
+    pool_config = check.mapping_param(pool_config, "pool_config", key_type=str)
+    key = (os.getpid(), postgres_url, tuple(sorted(pool_config.items())))
+    with _POOLED_ENGINES_LOCK:
+        if key not in _POOLED_ENGINES:
+            _POOLED_ENGINES[key] = create_engine(
+                postgres_url,
+                isolation_level="AUTOCOMMIT",
+                poolclass=sqlalchemy.pool.QueuePool,
+                pool_pre_ping=True,
+                **pool_config,
+            )
+        return _POOLED_ENGINES[key]
+
+
 def pg_alembic_config(dunder_file, script_location=None):
     return get_alembic_config(
         dunder_file, config_path="../alembic/alembic.ini", script_location=script_location
@@ -115,3 +115,16 @@ def test_load_from_config(self, hostname):
                 from_explicit = explicit_instance._event_storage
 
                 assert from_url.postgres_url == from_explicit.postgres_url
+
+
+class TestPooledPostgresEventLogStorage(TestEventLogStorage):
+    __test__ = True
+
+    @pytest.fixture(scope="function", name="storage")
+    def event_log_storage(self, conn_string):  # pylint: disable=arguments-renamed
+        PostgresEventLogStorage.create_clean_storage(conn_string).dispose()
+        storage = PostgresEventLogStorage(conn_string, pool_config={"pool_size": 2})
+        try:
+            yield storage
+        finally:
+            storage.dispose()
@@ -187,6 +187,47 @@ def test_connection_leak(hostname, conn_string):
     tempdir.cleanup()
 
 
+def test_pooled_connections(hostname, conn_string):
+    num_instances = 20
+    config = yaml.safe_load(unified_pg_config(hostname))
+    config["storage"]["postgres"]["pool"] = {"pool_size": 2}
+
+    with get_conn(conn_string).cursor() as curs:
+        curs.execute("SELECT count(*) from pg_stat_activity")
+        baseline = curs.fetchall()[0][0]
+
+    tempdir = tempfile.TemporaryDirectory()
+    copies = []
+    for _ in range(num_instances):
+        instance = DagsterInstance.from_ref(InstanceRef.from_dir(tempdir.name, overrides=config))
+        instance.get_runs()
+        instance.all_asset_keys()
+        instance.all_instigator_state()
+        copies.append(instance)
+
+    # pylint: disable=protected-access
+    engines = {
+        storage._engine
+        for instance in copies
+        for storage in [instance._run_storage, instance._event_storage, instance._schedule_storage]
+    }
+    # pylint: enable=protected-access
+    assert len(engines) == 1
+
+    with get_conn(conn_string).cursor() as curs:
+        curs.execute("SELECT count(*) from pg_stat_activity")
+        res = curs.fetchall()
+
+    # the pool caps the connections held open by this process, regardless of the number of
+    # instances and storages
+    assert res[0][0] <= baseline + 2
+
+    for copy in copies:
+        copy.dispose()
+
+    tempdir.cleanup()
+
+
 def test_statement_timeouts(hostname):
     with instance_for_test(overrides=yaml.safe_load(full_pg_config(hostname))) as instance:
         instance.optimize_for_dagit(statement_timeout=500)  # 500ms
@@ -4,6 +4,7 @@
 from dagster_tests.core_tests.storage_tests.utils.run_storage import TestRunStorage
 
 from dagster._core.test_utils import environ, instance_for_test
+from dagster._core.utils import make_new_run_id
 
 
 class TestPostgresRunStorage(TestRunStorage):
@@ -15,6 +16,20 @@ def run_storage(self, conn_string):  # pylint: disable=arguments-renamed
         assert storage
         return storage
 
+    def test_add_runs_rolls_back_runs_when_tags_fail(self, storage):
+        run_id = make_new_run_id()
+        # postgres can't store a NUL character, so the runs are inserted before the tags fail
+        with pytest.raises(ValueError):
+            storage.add_runs(
+                [
+                    TestRunStorage.build_run(
+                        run_id=run_id, pipeline_name="some_pipeline", tags={"foo": "bar\x00"}
+                    )
+                ]
+            )
+        assert storage.get_run_by_id(run_id) is None
+        assert storage.get_runs_count() == 0
+
     def test_load_from_config(self, hostname):
         url_cfg = """
           run_storage: